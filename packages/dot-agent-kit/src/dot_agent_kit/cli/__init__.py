@@ -1,3 +1,5 @@
+import importlib
+
 import click
 
 from dot_agent_kit.cli.output import user_output
@@ -7,63 +9,61 @@ from dot_agent_kit.version import __version__
 CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])
 
 
+# Command name -> (module, attribute). Modules are imported only when their
+# command is looked up, so e.g. `dot-agent run <kit> <hook>` doesn't pay for
+# importing every other command group.
+_LAZY_COMMANDS: dict[str, tuple[str, str]] = {
+    "artifact": ("dot_agent_kit.commands.artifact.group", "artifact_group"),
+    "check": ("dot_agent_kit.commands.check", "check"),
+    "command": ("dot_agent_kit.commands.command", "command"),
+    "hook": ("dot_agent_kit.commands.hook.group", "hook_group"),
+    "init": ("dot_agent_kit.commands.init", "init"),
+    "kit": ("dot_agent_kit.commands.kit.group", "kit_group"),
+    "kit-command": ("dot_agent_kit.commands.kit_command.group", "kit_command_group"),
+    "md": ("dot_agent_kit.commands.md.group", "md_group"),
+    "status": ("dot_agent_kit.commands.status", "status"),
+    "st": ("dot_agent_kit.commands.status", "st"),
+}
+
+
 class LazyGroup(click.Group):
     """Click Group that lazily loads commands."""
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._commands_registered = False
-
     def list_commands(self, ctx):
-        """List available commands, registering them if needed."""
-        if not self._commands_registered:
-            self._register_commands()
-        return super().list_commands(ctx)
+        """List available commands without importing them."""
+        return sorted({*_LAZY_COMMANDS, "run", *self.commands})
 
     def get_command(self, ctx, cmd_name):
-        """Get a command by name, registering if needed."""
-        if not self._commands_registered:
-            self._register_commands()
+        """Get a command by name, importing only that command's module."""
+        if cmd_name not in self.commands:
+            self._register_command(cmd_name)
         return super().get_command(ctx, cmd_name)
 
-    def _register_commands(self) -> None:
-        """Register all commands with the CLI group."""
-        if self._commands_registered:
+    def _register_command(self, cmd_name: str) -> None:
+        """Import and register a single command, if it is known."""
+        if cmd_name == "run":
+            from dot_agent_kit.commands.kit_command.group import (
+                KitCommandGroup,
+                kit_command_group,
+            )
+
+            # Add 'run' as an alias for 'kit-command' for backwards compatibility
+            # Users can use either 'dot-agent run' or 'dot-agent kit-command'
+            run_alias = KitCommandGroup(
+                name="run",
+                help="(Alias for kit-command) Run kit cli commands from bundled kits.",
+            )
+            # Share the registry so kits registered on first access appear in both
+            run_alias.commands = kit_command_group.commands
+            self.add_command(run_alias)
             return
 
-        from dot_agent_kit.commands import check
-        from dot_agent_kit.commands.artifact.group import artifact_group
-        from dot_agent_kit.commands.command import command
-        from dot_agent_kit.commands.hook.group import hook_group
-        from dot_agent_kit.commands.init import init
-        from dot_agent_kit.commands.kit.group import kit_group
-        from dot_agent_kit.commands.kit_command.group import kit_command_group
-        from dot_agent_kit.commands.md.group import md_group
-        from dot_agent_kit.commands.status import st, status
-
-        self.add_command(check.check)
-        self.add_command(command)
-        self.add_command(init)
-        self.add_command(status)
-        self.add_command(st)
-
-        # Register command groups
-        self.add_command(artifact_group)
-        self.add_command(hook_group)
-        self.add_command(kit_group)
-        self.add_command(kit_command_group)
-        self.add_command(md_group)
-
-        # Add 'run' as an alias for 'kit-command' for backwards compatibility
-        # Users can use either 'dot-agent run' or 'dot-agent kit-command'
-        run_alias = click.Group(
-            name="run",
-            help="(Alias for kit-command) Run kit cli commands from bundled kits.",
-            commands=kit_command_group.commands,
-        )
-        self.add_command(run_alias)
-
-        self._commands_registered = True
+        target = _LAZY_COMMANDS.get(cmd_name)
+        if target is None:
+            return
+        module_name, attribute = target
+        command = getattr(importlib.import_module(module_name), attribute)
+        self.add_command(command, name=cmd_name)
 
 
 @click.command(cls=LazyGroup, invoke_without_command=True, context_settings=CONTEXT_SETTINGS)
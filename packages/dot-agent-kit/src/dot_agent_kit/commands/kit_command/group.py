@@ -1,4 +1,10 @@
-"""Run commands from bundled kits."""
+"""Run commands from bundled kits.
+
+Kit groups are registered from the kit index (see dot_agent_kit.io.kit_index)
+the first time the group is accessed, and a kit's commands are imported only
+when they are looked up. Invoking a single kit command therefore imports that
+command's module and nothing else from the kit.
+"""
 
 import importlib
 import traceback
@@ -8,8 +14,9 @@ from typing import Any
 import click
 
 from dot_agent_kit.cli.output import user_output
+from dot_agent_kit.io.kit_index import KitIndexError, get_kit_index_path, load_kit_index
 from dot_agent_kit.io.manifest import load_kit_manifest
-from dot_agent_kit.models.kit import KitManifest
+from dot_agent_kit.models.kit import KitCliCommandDefinition, KitManifest
 from dot_agent_kit.sources.bundled import BundledKitSource
 
 # Path configuration for kit loading
@@ -20,7 +27,21 @@ KITS_DATA_DIR = Path(__file__).parent.parent.parent / "data" / "kits"
 KITS_MODULE_PREFIX = "dot_agent_kit.data.kits"
 
 
-@click.group()
+class KitCommandGroup(click.Group):
+    """Click group that registers kit groups on first access."""
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List kits, registering them if needed."""
+        _ensure_kit_commands_loaded()
+        return super().list_commands(ctx)
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Get a kit group by name, registering kits if needed."""
+        _ensure_kit_commands_loaded()
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(cls=KitCommandGroup)
 @click.pass_context
 def kit_command_group(ctx: click.Context) -> None:
     """Run kit cli commands from bundled kits.
@@ -37,8 +58,10 @@ class LazyKitGroup(click.Group):
         self,
         kit_name: str,
         kit_dir: Path,
-        manifest: KitManifest,
+        manifest: KitManifest | None = None,
         debug: bool = False,
+        *,
+        command_table: dict[str, tuple[str, str]] | None = None,
         **kwargs: Any,
     ) -> None:
         """Initialize lazy kit group.
@@ -46,14 +69,17 @@ class LazyKitGroup(click.Group):
         Args:
             kit_name: Internal kit directory name
             kit_dir: Path to kit directory
-            manifest: Kit manifest
+            manifest: Kit manifest, or None to parse kit_dir/kit.yaml on demand
             debug: Whether to show full tracebacks
+            command_table: Command name -> (path, description) from the kit
+                index; lets single commands load without parsing the manifest
             **kwargs: Additional arguments passed to click.Group
         """
         super().__init__(**kwargs)
         self._kit_name = kit_name
         self._kit_dir = kit_dir
         self._manifest = manifest
+        self._command_table = command_table
         self._debug = debug
         self._loaded = False
 
@@ -64,149 +90,134 @@ class LazyKitGroup(click.Group):
         return super().list_commands(ctx)
 
     def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
-        """Get a command by name, loading commands if needed."""
-        if not self._loaded:
-            self._load_commands(ctx)
+        """Get a command by name, importing only that command if possible."""
+        if cmd_name in self.commands or self._loaded:
+            return super().get_command(ctx, cmd_name)
+
+        if self._command_table is not None:
+            entry = self._command_table.get(cmd_name)
+            if entry is None:
+                return None
+            path, description = entry
+            command_def = KitCliCommandDefinition(name=cmd_name, path=path, description=description)
+            self._load_command(command_def, self._get_debug(ctx))
+            return super().get_command(ctx, cmd_name)
+
+        self._load_commands(ctx)
         return super().get_command(ctx, cmd_name)
 
+    @property
+    def manifest(self) -> KitManifest:
+        """The kit manifest, parsed from kit.yaml on first access if not given."""
+        if self._manifest is None:
+            self._manifest = load_kit_manifest(self._kit_dir / "kit.yaml")
+        return self._manifest
+
+    def _get_debug(self, ctx: click.Context) -> bool:
+        # Get debug flag from context if available
+        if ctx.obj and hasattr(ctx.obj, "debug"):
+            return ctx.obj.debug
+        return self._debug
+
     def _load_commands(self, ctx: click.Context) -> None:
         """Load all commands for this kit."""
         if self._loaded:
             return
 
         self._loaded = True
+        debug = self._get_debug(ctx)
 
-        # Get debug flag from context if available
-        debug = self._debug
-        if ctx.obj and hasattr(ctx.obj, "debug"):
-            debug = ctx.obj.debug
-
-        # Track successful command loads for validation
-        commands_before = len(self.commands)
-
-        for command_def in self._manifest.kit_cli_commands:
-            # Validate command definition
-            validation_errors = command_def.validate()
-            if validation_errors:
-                kit_name = self._manifest.name
-                cmd_name = command_def.name
-                error_msg = f"Invalid command '{cmd_name}' in kit '{kit_name}':\n"
-                for error in validation_errors:
-                    error_msg += f"  - {error}\n"
-                user_output(error_msg)
-                if debug:
-                    raise click.ClickException(error_msg)
-                continue
-
-            # Check that command file exists
-            command_file = self._kit_dir / command_def.path
-            if not command_file.exists():
-                error_msg = (
-                    f"Warning: Command file not found for '{command_def.name}' "
-                    f"in kit '{self._manifest.name}': {command_file}\n"
-                )
-                user_output(error_msg)
-                if debug:
-                    raise click.ClickException(error_msg)
-                continue
-
-            # Convert path to module path using pathlib
-            command_path = Path(command_def.path)
-            module_parts = command_path.with_suffix("").parts
-            module_path_str = ".".join(module_parts)
-            full_module_path = f"{KITS_MODULE_PREFIX}.{self._kit_name}.{module_path_str}"
-
-            # Import the module
-            try:
-                module = importlib.import_module(full_module_path)
-            except ImportError as e:
-                error_msg = (
-                    f"Warning: Failed to import command '{command_def.name}' "
-                    f"from kit '{self._manifest.name}': {e}\n"
-                )
-                user_output(error_msg)
-                if debug:
-                    user_output(traceback.format_exc())
-                continue
-
-            # Get the command function (convert hyphenated name to snake_case)
-            function_name = command_def.name.replace("-", "_")
-            if not hasattr(module, function_name):
-                error_msg = (
-                    f"Warning: Command '{command_def.name}' in kit '{self._manifest.name}' "
-                    f"does not have expected function '{function_name}' "
-                    f"in module {full_module_path}\n"
-                )
-                user_output(error_msg)
-                if debug:
-                    raise click.ClickException(error_msg)
-                continue
-
-            command_func = getattr(module, function_name)
-
-            # Add the command to the kit's group
-            self.add_command(command_func, name=command_def.name)
+        for command_def in self.manifest.kit_cli_commands:
+            # Commands imported individually by get_command are already registered
+            if command_def.name not in self.commands:
+                self._load_command(command_def, debug)
 
         # Validate that at least one command was successfully loaded
-        commands_loaded = len(self.commands) - commands_before
+        commands_loaded = sum(
+            1 for command_def in self.manifest.kit_cli_commands if command_def.name in self.commands
+        )
         if commands_loaded == 0:
             warning = (
-                f"Warning: Kit '{self._manifest.name}' loaded 0 commands "
-                f"(all {len(self._manifest.kit_cli_commands)} command(s) failed to load)\n"
+                f"Warning: Kit '{self.manifest.name}' loaded 0 commands "
+                f"(all {len(self.manifest.kit_cli_commands)} command(s) failed to load)\n"
             )
             user_output(warning)
 
+    def _load_command(self, command_def: KitCliCommandDefinition, debug: bool) -> None:
+        """Import a single command and add it to the group, reporting failures."""
+        kit_label = self._manifest.name if self._manifest is not None else self.name
+
+        # Validate command definition
+        validation_errors = command_def.validate()
+        if validation_errors:
+            cmd_name = command_def.name
+            error_msg = f"Invalid command '{cmd_name}' in kit '{kit_label}':\n"
+            for error in validation_errors:
+                error_msg += f"  - {error}\n"
+            user_output(error_msg)
+            if debug:
+                raise click.ClickException(error_msg)
+            return
 
-def _load_single_kit_commands(
-    kit_name: str, kit_dir: Path, manifest: KitManifest, debug: bool = False
-) -> click.Group | None:
-    """Load commands for a single kit with error isolation.
+        # Check that command file exists
+        command_file = self._kit_dir / command_def.path
+        if not command_file.exists():
+            error_msg = (
+                f"Warning: Command file not found for '{command_def.name}' "
+                f"in kit '{kit_label}': {command_file}\n"
+            )
+            user_output(error_msg)
+            if debug:
+                raise click.ClickException(error_msg)
+            return
 
-    Args:
-        kit_name: Internal kit directory name
-        kit_dir: Path to kit directory
-        manifest: Kit manifest
-        debug: Whether to show full tracebacks
+        # Convert path to module path using pathlib
+        command_path = Path(command_def.path)
+        module_parts = command_path.with_suffix("").parts
+        module_path_str = ".".join(module_parts)
+        full_module_path = f"{KITS_MODULE_PREFIX}.{self._kit_name}.{module_path_str}"
 
-    Returns:
-        Click group for kit, or None if kit failed to load
-    """
-    try:
-        # Skip kits without kit cli commands (silently - this is expected)
-        if not manifest.kit_cli_commands:
-            return None
+        # Import the module
+        try:
+            module = importlib.import_module(full_module_path)
+        except ImportError as e:
+            error_msg = (
+                f"Warning: Failed to import command '{command_def.name}' "
+                f"from kit '{kit_label}': {e}\n"
+            )
+            user_output(error_msg)
+            if debug:
+                user_output(traceback.format_exc())
+            return
 
-        # Validate kit directory exists
-        if not kit_dir.exists():
-            error_msg = f"Warning: Kit directory not found: {kit_dir}\n"
+        # Get the command function (convert hyphenated name to snake_case)
+        function_name = command_def.name.replace("-", "_")
+        if not hasattr(module, function_name):
+            error_msg = (
+                f"Warning: Command '{command_def.name}' in kit '{kit_label}' "
+                f"does not have expected function '{function_name}' "
+                f"in module {full_module_path}\n"
+            )
             user_output(error_msg)
             if debug:
                 raise click.ClickException(error_msg)
-            return None
-
-        # Create lazy loading group for this kit
-        kit_group = LazyKitGroup(
-            kit_name=kit_name,
-            kit_dir=kit_dir,
-            manifest=manifest,
-            debug=debug,
-            name=manifest.name,
-            help=manifest.description,
-        )
+            return
 
-        return kit_group
+        command_func = getattr(module, function_name)
 
-    except Exception as e:
-        error_msg = f"Warning: Failed to load kit '{manifest.name}': {e}\n"
-        user_output(error_msg)
-        if debug:
-            user_output(traceback.format_exc())
-            raise
-        return None
+        # Add the command to the kit's group
+        self.add_command(command_func, name=command_def.name)
 
 
 def _load_kit_commands() -> None:
-    """Dynamically load commands from all kits with commands."""
+    """Register a lazy group for every bundled kit with kit cli commands.
+
+    Kits are registered from the kit index, so manifests are only parsed
+    when they changed since the index was last written.
+    """
+    global _kit_commands_loaded
+    _kit_commands_loaded = True
+
     source = BundledKitSource()
     available_kits = source.list_available()
 
@@ -215,35 +226,40 @@ def _load_kit_commands() -> None:
         user_output(f"Warning: Kits data directory not found: {KITS_DATA_DIR}\n")
         return
 
-    for kit_name in available_kits:
-        try:
-            kit_dir = KITS_DATA_DIR / kit_name
-            manifest_path = kit_dir / "kit.yaml"
-
-            if not manifest_path.exists():
-                continue
+    for result in load_kit_index(KITS_DATA_DIR, available_kits, get_kit_index_path()):
+        # Isolate individual kit failures - continue processing other kits
+        if isinstance(result, KitIndexError):
+            user_output(f"Warning: {result}\n")
+            continue
 
-            manifest = load_kit_manifest(manifest_path)
+        # Skip kits without kit cli commands (silently - this is expected)
+        if not result.commands:
+            continue
 
-            # Load kit commands with error isolation
-            kit_group = _load_single_kit_commands(
-                kit_name=kit_name, kit_dir=kit_dir, manifest=manifest, debug=False
+        try:
+            kit_group = LazyKitGroup(
+                kit_name=result.kit_name,
+                kit_dir=result.manifest_path.parent,
+                command_table=result.commands,
+                name=result.name,
+                help=result.description,
             )
 
-            # Skip if kit failed to load or has no commands
-            if kit_group is None:
-                continue
-
             # Add the kit's group to the kit_command group
             kit_command_group.add_command(kit_group)
 
         except Exception as e:
-            # Isolate individual kit failures - continue processing other kits
-            error_msg = f"Warning: Failed to load kit '{kit_name}': {e}\n"
+            error_msg = f"Warning: Failed to load kit '{result.kit_name}': {e}\n"
             user_output(error_msg)
-            # Note: Debug mode tracebacks handled by _load_single_kit_commands
             continue
 
 
-# Load all kit commands when module is imported
-_load_kit_commands()
+# Kits are registered on first access to the group rather than at import,
+# so importing this module stays cheap for commands that never use it
+_kit_commands_loaded = False
+
+
+def _ensure_kit_commands_loaded() -> None:
+    """Register kit groups once per process."""
+    if not _kit_commands_loaded:
+        _load_kit_commands()
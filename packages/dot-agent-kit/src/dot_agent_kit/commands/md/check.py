@@ -13,6 +13,7 @@ import subprocess
 from pathlib import Path
 
 import click
+from erk_shared.git.layout import read_git_layout
 
 from dot_agent_kit.cli.output import user_output
 from dot_agent_kit.io.link_validation import BrokenLink, validate_links_in_file
@@ -128,14 +129,17 @@ def check_command(*, check_links: bool, exclude: tuple[str, ...]) -> None:
     - 1: Violations found
     """
     # Find repository root
-    result = subprocess.run(
-        ["git", "rev-parse", "--show-toplevel"],
-        check=True,
-        capture_output=True,
-        text=True,
-    )
-    repo_root_str = result.stdout.strip()
-    repo_root_path = Path(repo_root_str)
+    layout = read_git_layout(Path.cwd())
+    if layout is not None:
+        repo_root_path = layout.worktree_root
+    else:
+        result = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        repo_root_path = Path(result.stdout.strip())
 
     if not repo_root_path.exists():
         user_output(click.style("✗ Error: Repository root not found", fg="red"))
@@ -13,6 +13,7 @@ from pathlib import Path
 
 import click
 from erk_shared.git.abc import Git
+from erk_shared.git.layout import read_git_layout
 from erk_shared.github.abc import GitHub
 from erk_shared.github.issues import GitHubIssues, RealGitHubIssues
 
@@ -106,7 +107,8 @@ def create_context(*, debug: bool) -> DotAgentContext:
     Called once at CLI entry point to create the context for the entire
     command execution.
 
-    Detects repository root using git rev-parse. Exits with error if not in a git repository.
+    Detects repository root from the .git layout (see read_git_layout),
+    falling back to git rev-parse. Exits with error if not in a git repository.
 
     Args:
         debug: If True, enable debug mode (full stack traces in error handling)
@@ -121,20 +123,26 @@ def create_context(*, debug: bool) -> DotAgentContext:
     from erk_shared.git.real import RealGit
     from erk_shared.github.real import RealGitHub
 
-    # Detect repo root using git rev-parse
-    result = subprocess.run(
-        ["git", "rev-parse", "--show-toplevel"],
-        capture_output=True,
-        text=True,
-        check=False,
-    )
+    cwd = Path.cwd()
 
-    if result.returncode != 0:
-        click.echo("Error: Not in a git repository", err=True)
-        raise SystemExit(1)
+    # Detect repo root from the .git layout, asking git only for setups it
+    # doesn't model
+    layout = read_git_layout(cwd)
+    if layout is not None:
+        repo_root = layout.worktree_root
+    else:
+        result = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
 
-    repo_root = Path(result.stdout.strip())
-    cwd = Path.cwd()
+        if result.returncode != 0:
+            click.echo("Error: Not in a git repository", err=True)
+            raise SystemExit(1)
+
+        repo_root = Path(result.stdout.strip())
 
     return DotAgentContext(
         github_issues=RealGitHubIssues(),
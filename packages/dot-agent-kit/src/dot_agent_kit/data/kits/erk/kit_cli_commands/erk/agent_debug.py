@@ -16,6 +16,8 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
+from dot_agent_kit.data.kits.erk.session_index import default_session_index
+
 
 def get_session_id_from_env() -> str | None:
     """Extract session ID from SESSION_CONTEXT environment variable.
@@ -45,39 +47,19 @@ def find_project_dir_for_session(session_id: str) -> Path | None:
     Agent logs are stored in:
     ~/.claude/projects/<project-path-with-session>/agent-<agent-id>.jsonl
 
+    Uses the persistent session index, so only project directories that
+    changed since the last lookup are scanned.
+
     Args:
         session_id: Session ID to search for
 
     Returns:
         Path to project directory if found, None otherwise
     """
-    claude_dir = Path.home() / ".claude" / "projects"
-    if not claude_dir.exists():
+    location = default_session_index().lookup(session_id)
+    if location is None:
         return None
-
-    # Search for directories containing the session ID
-    for project_dir in claude_dir.iterdir():
-        if not project_dir.is_dir():
-            continue
-
-        # Check if any JSONL file in this directory contains the session ID
-        for jsonl_file in project_dir.glob("*.jsonl"):
-            if not jsonl_file.exists():
-                continue
-
-            # Read first few lines to check for session ID
-            try:
-                lines = jsonl_file.read_text(encoding="utf-8").splitlines()[:10]
-                for line in lines:
-                    if not line.strip():
-                        continue
-                    entry = json.loads(line)
-                    if entry.get("sessionId") == session_id:
-                        return project_dir
-            except (json.JSONDecodeError, OSError):
-                continue
-
-    return None
+    return location.project_dir
 
 
 def discover_agent_logs(project_dir: Path) -> list[Path]:
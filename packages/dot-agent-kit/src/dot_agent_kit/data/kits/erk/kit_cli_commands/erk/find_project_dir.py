@@ -61,6 +61,8 @@ from pathlib import Path
 
 import click
 
+from dot_agent_kit.data.kits.erk.session_index import SessionIndex, get_index_path
+
 
 @dataclass
 class ProjectInfo:
@@ -145,24 +147,20 @@ def find_project_info(path: Path) -> ProjectInfo | ProjectError:
             },
         )
 
-    # Find all session logs (main sessions and agent logs)
-    session_logs = []
+    # Find all session logs (main sessions and agent logs); the index only
+    # re-lists the directory when its mtime changed
+    session_logs = SessionIndex(projects_dir, get_index_path()).project_logs(encoded_path)
     latest_session: tuple[str, float] | None = None
 
-    for log_file in project_dir.iterdir():
-        if log_file.is_file() and log_file.suffix == ".jsonl":
-            session_logs.append(log_file.name)
-
-            # Track latest main session (not agent logs)
-            if not log_file.name.startswith("agent-"):
-                mtime = log_file.stat().st_mtime
-                if latest_session is None or mtime > latest_session[1]:
-                    # Extract session ID (filename without .jsonl)
-                    session_id = log_file.stem
-                    latest_session = (session_id, mtime)
-
-    # Sort logs for consistent output
-    session_logs.sort()
+    for log_name in session_logs:
+        # Track latest main session (not agent logs). Appends don't change the
+        # directory mtime, so log mtimes are always read fresh.
+        if not log_name.startswith("agent-"):
+            mtime = (project_dir / log_name).stat().st_mtime
+            if latest_session is None or mtime > latest_session[1]:
+                # Extract session ID (filename without .jsonl)
+                session_id = log_name.removesuffix(".jsonl")
+                latest_session = (session_id, mtime)
 
     return ProjectInfo(
         success=True,
@@ -4,20 +4,79 @@ Session Log Preprocessor
 
 Compresses JSONL session logs to XML format by removing metadata and deduplicating messages.
 This command is invoked via dot-agent run erk preprocess-session <log-path>.
+
+Session logs can be hundreds of megabytes, so the pipeline is built from
+generators: lines are read and decoded one at a time, every filter passes
+entries through as it goes, and XML is written to the output incrementally.
+Only the few leading entries needed to classify a session as empty or warmup
+are ever held at once.
 """
 
+import hashlib
+import io
+import itertools
 import json
+import sys
 import tempfile
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from pathlib import Path
+from typing import IO
 
 import click
 
+# Markers identifying command documentation blocks that get deduplicated
+_DOC_MARKERS = [
+    "/erk:plan-save-issue",
+    "/erk:plan-implement",
+    "/gt:submit-branch",
+    "/gt:pr-update",
+    "command-message>",
+    "command-name>",
+]
+
+
+@dataclass
+class LogReadStats:
+    """Counters filled in while a log file is streamed.
+
+    Attributes:
+        total_entries: Entries decoded from the file
+        skipped_entries: Entries dropped by the session ID filter
+        chars_read: Characters read from the file, including blank lines
+    """
+
+    total_entries: int = 0
+    skipped_entries: int = 0
+    chars_read: int = 0
+
 
 def escape_xml(text: str) -> str:
     """Minimal XML escaping for special characters."""
     return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
 
 
+def _user_text(entry: dict) -> str:
+    """Get the text of a user entry, joining text blocks with spaces."""
+    content = entry.get("message", {}).get("content", "")
+    if isinstance(content, list):
+        text_parts = []
+        for block in content:
+            if isinstance(block, dict) and block.get("type") == "text":
+                text_parts.append(block.get("text", ""))
+        content = " ".join(text_parts)
+    return str(content)
+
+
+def _has_assistant_text(entry: dict) -> bool:
+    """Check whether an assistant entry contains non-blank text."""
+    content_blocks = entry.get("message", {}).get("content", [])
+    for block in content_blocks:
+        if block.get("type") == "text" and block.get("text", "").strip():
+            return True
+    return False
+
+
 def is_empty_session(entries: list[dict]) -> bool:
     """Check if session contains only metadata with no meaningful content.
 
@@ -41,22 +100,11 @@ def is_empty_session(entries: list[dict]) -> bool:
     for entry in entries:
         entry_type = entry.get("type")
         if entry_type == "user":
-            content = entry.get("message", {}).get("content", "")
-            if isinstance(content, list):
-                text_parts = []
-                for block in content:
-                    if isinstance(block, dict) and block.get("type") == "text":
-                        text_parts.append(block.get("text", ""))
-                content = " ".join(text_parts)
-            if content and len(str(content).strip()) > 0:
+            if _user_text(entry).strip():
                 has_user_message = True
-
         elif entry_type == "assistant":
-            content_blocks = entry.get("message", {}).get("content", [])
-            for block in content_blocks:
-                if block.get("type") == "text" and block.get("text", "").strip():
-                    has_assistant_response = True
-                    break
+            if _has_assistant_text(entry):
+                has_assistant_response = True
 
     # Session is empty if it lacks meaningful interaction
     return not (has_user_message and has_assistant_response)
@@ -82,22 +130,57 @@ def is_warmup_session(entries: list[dict]) -> bool:
     # Look for warmup keyword in first user message
     for entry in entries:
         if entry.get("type") == "user":
-            content = entry.get("message", {}).get("content", "")
-            if isinstance(content, list):
-                text_parts = []
-                for block in content:
-                    if isinstance(block, dict) and block.get("type") == "text":
-                        text_parts.append(block.get("text", ""))
-                content = " ".join(text_parts)
-
-            content_lower = str(content).lower()
-            if "warmup" in content_lower:
-                return True
-            break
+            return "warmup" in _user_text(entry).lower()
 
     return False
 
 
+def screen_session(entries: Iterable[dict]) -> tuple[str | None, Iterator[dict]]:
+    """Classify a session as empty or warmup without materializing it.
+
+    Reads entries only until the answer is known - usually the first few -
+    and hands back an iterator that replays them followed by the rest.
+    Gives the same verdicts as is_empty_session and is_warmup_session.
+
+    Args:
+        entries: Session entries, typically a lazy stream
+
+    Returns:
+        Tuple of ("empty", "warmup" or None, iterator over all entries).
+        When a reason is returned the iterator should not be used.
+    """
+    iterator = iter(entries)
+    buffered: list[dict] = []
+    has_user_message = False
+    has_assistant_response = False
+    is_warmup: bool | None = None
+
+    for entry in iterator:
+        buffered.append(entry)
+        entry_type = entry.get("type")
+        if entry_type == "user":
+            text = _user_text(entry)
+            if is_warmup is None:
+                is_warmup = "warmup" in text.lower()
+            if text.strip():
+                has_user_message = True
+        elif entry_type == "assistant":
+            if _has_assistant_text(entry):
+                has_assistant_response = True
+
+        # Once non-empty, more entries can't change either verdict
+        if len(buffered) >= 3 and has_user_message and has_assistant_response:
+            if is_warmup:
+                return "warmup", iter(())
+            return None, itertools.chain(buffered, iterator)
+
+    if is_empty_session(buffered):
+        return "empty", iter(())
+    if is_warmup_session(buffered):
+        return "warmup", iter(())
+    return None, iter(buffered)
+
+
 def deduplicate_documentation_blocks(entries: list[dict]) -> list[dict]:
     """Replace duplicate command documentation blocks with marker text.
 
@@ -111,73 +194,50 @@ def deduplicate_documentation_blocks(entries: list[dict]) -> list[dict]:
     Returns:
         Modified entries with duplicate documentation replaced by markers
     """
-    import hashlib
+    return list(iter_deduplicated_documentation_blocks(entries))
+
 
-    seen_docs: dict[str, int] = {}  # hash -> first occurrence count
+def iter_deduplicated_documentation_blocks(entries: Iterable[dict]) -> Iterator[dict]:
+    """Streaming form of deduplicate_documentation_blocks."""
     occurrence_counter: dict[str, int] = {}  # hash -> current occurrence
-    deduplicated = []
 
     for entry in entries:
-        if entry.get("type") == "user":
-            content = entry.get("message", {}).get("content", "")
-            if isinstance(content, list):
-                text_parts = []
-                for block in content:
-                    if isinstance(block, dict) and block.get("type") == "text":
-                        text_parts.append(block.get("text", ""))
-                content = " ".join(text_parts)
-
-            content_str = str(content)
-
-            # Detect command documentation by markers
-            is_doc = any(
-                marker in content_str
-                for marker in [
-                    "/erk:plan-save-issue",
-                    "/erk:plan-implement",
-                    "/gt:submit-branch",
-                    "/gt:pr-update",
-                    "command-message>",
-                    "command-name>",
-                ]
-            )
+        if entry.get("type") != "user":
+            yield entry
+            continue
 
-            if is_doc and len(content_str) > 500:
-                # Hash the content
-                content_hash = hashlib.sha256(content_str.encode()).hexdigest()[:16]
+        content_str = _user_text(entry)
 
-                if content_hash not in seen_docs:
-                    # First occurrence - keep it
-                    seen_docs[content_hash] = 1
-                    occurrence_counter[content_hash] = 1
-                    deduplicated.append(entry)
-                else:
-                    # Duplicate - replace with marker
-                    occurrence_counter[content_hash] += 1
-                    occurrence_num = occurrence_counter[content_hash]
-
-                    # Create marker entry
-                    marker_entry = entry.copy()
-                    marker_content = (
-                        f"[Duplicate command documentation block omitted - "
-                        f"hash {content_hash}, occurrence #{occurrence_num}]"
-                    )
-
-                    # Preserve structure
-                    if isinstance(entry.get("message", {}).get("content"), list):
-                        marker_entry["message"] = {
-                            "content": [{"type": "text", "text": marker_content}]
-                        }
-                    else:
-                        marker_entry["message"] = {"content": marker_content}
-
-                    deduplicated.append(marker_entry)
-            else:
-                deduplicated.append(entry)
+        # Detect command documentation by markers
+        is_doc = any(marker in content_str for marker in _DOC_MARKERS)
+        if not is_doc or len(content_str) <= 500:
+            yield entry
+            continue
+
+        content_hash = hashlib.sha256(content_str.encode()).hexdigest()[:16]
+        if content_hash not in occurrence_counter:
+            # First occurrence - keep it
+            occurrence_counter[content_hash] = 1
+            yield entry
+            continue
+
+        # Duplicate - replace with marker
+        occurrence_counter[content_hash] += 1
+        occurrence_num = occurrence_counter[content_hash]
+
+        marker_entry = entry.copy()
+        marker_content = (
+            f"[Duplicate command documentation block omitted - "
+            f"hash {content_hash}, occurrence #{occurrence_num}]"
+        )
+
+        # Preserve structure
+        if isinstance(entry.get("message", {}).get("content"), list):
+            marker_entry["message"] = {"content": [{"type": "text", "text": marker_content}]}
         else:
-            deduplicated.append(entry)
+            marker_entry["message"] = {"content": marker_content}
 
-    return deduplicated
+        yield marker_entry
 
 
 def truncate_parameter_value(value: str, max_length: int = 200) -> str:
@@ -226,8 +286,11 @@ def truncate_tool_parameters(entries: list[dict]) -> list[dict]:
     Returns:
         Modified entries with truncated parameters
     """
-    truncated = []
+    return list(iter_truncated_tool_parameters(entries))
+
 
+def iter_truncated_tool_parameters(entries: Iterable[dict]) -> Iterator[dict]:
+    """Streaming form of truncate_tool_parameters."""
     for entry in entries:
         if entry.get("type") == "assistant":
             message = entry.get("message", {})
@@ -257,11 +320,9 @@ def truncate_tool_parameters(entries: list[dict]) -> list[dict]:
             modified_entry = entry.copy()
             modified_entry["message"] = message.copy()
             modified_entry["message"]["content"] = modified_blocks
-            truncated.append(modified_entry)
+            yield modified_entry
         else:
-            truncated.append(entry)
-
-    return truncated
+            yield entry
 
 
 def prune_tool_result_content(result_text: str) -> str:
@@ -348,7 +409,11 @@ def is_log_discovery_operation(entry: dict) -> bool:
 
 def deduplicate_assistant_messages(entries: list[dict]) -> list[dict]:
     """Remove duplicate assistant text when tool_use present."""
-    deduplicated = []
+    return list(iter_deduplicated_assistant_messages(entries))
+
+
+def iter_deduplicated_assistant_messages(entries: Iterable[dict]) -> Iterator[dict]:
+    """Streaming form of deduplicate_assistant_messages."""
     prev_assistant_text = None
 
     for entry in entries:
@@ -368,9 +433,24 @@ def deduplicate_assistant_messages(entries: list[dict]) -> list[dict]:
 
             prev_assistant_text = current_text
 
-        deduplicated.append(entry)
+        yield entry
+
+
+def compress_entries(entries: Iterable[dict], enable_filtering: bool) -> Iterator[dict]:
+    """Chain the per-entry compression filters lazily.
+
+    Args:
+        entries: Session entries, typically a lazy stream
+        enable_filtering: Whether to apply the optional optimization filters
 
-    return deduplicated
+    Returns:
+        Iterator over compressed entries
+    """
+    if enable_filtering:
+        entries = iter_deduplicated_documentation_blocks(entries)
+        entries = iter_truncated_tool_parameters(entries)
+    # Standard deduplication is always enabled
+    return iter_deduplicated_assistant_messages(entries)
 
 
 def generate_compressed_xml(
@@ -386,87 +466,127 @@ def generate_compressed_xml(
     Returns:
         XML string representation of the session
     """
-    xml_lines = ["<session>"]
+    buffer = io.StringIO()
+    write_compressed_xml(entries, buffer, source_label=source_label, enable_pruning=enable_pruning)
+    return buffer.getvalue()
 
+
+def write_compressed_xml(
+    entries: Iterable[dict],
+    out: IO[str],
+    source_label: str | None = None,
+    enable_pruning: bool = True,
+) -> int:
+    """Write coarse-grained XML for entries to a stream as they arrive.
+
+    Produces exactly the text generate_compressed_xml returns.
+
+    Args:
+        entries: Session entries, typically a lazy stream
+        out: Stream to write to
+        source_label: Optional label for agent logs
+        enable_pruning: Whether to prune tool results (default: True)
+
+    Returns:
+        Number of characters written
+    """
+    out.write("<session>")
+    chars_written = len("<session>")
+    for line in _iter_xml_body_lines(entries, source_label, enable_pruning):
+        out.write("\n")
+        out.write(line)
+        chars_written += 1 + len(line)
+    out.write("\n</session>")
+    return chars_written + len("\n</session>")
+
+
+def _iter_xml_body_lines(
+    entries: Iterable[dict], source_label: str | None, enable_pruning: bool
+) -> Iterator[str]:
+    """Yield the XML lines between <session> and </session>."""
     # Add source label if provided (for agent logs)
     if source_label:
-        xml_lines.append(f'  <meta source="{escape_xml(source_label)}" />')
-
-    # Extract session metadata once (from first entry with gitBranch)
-    for entry in entries:
-        # Check in the original entry structure (before filtering)
+        yield f'  <meta source="{escape_xml(source_label)}" />'
+
+    # Session metadata comes from the first entry with gitBranch and precedes
+    # all messages, so hold entries back only until that entry is seen
+    iterator = iter(entries)
+    held: list[dict] = []
+    for entry in iterator:
+        held.append(entry)
         if "gitBranch" in entry:
-            branch = entry["gitBranch"]
-            xml_lines.append(f'  <meta branch="{escape_xml(branch)}" />')
+            yield f'  <meta branch="{escape_xml(entry["gitBranch"])}" />'
             break
 
-    for entry in entries:
-        entry_type = entry["type"]
-        message = entry.get("message", {})
-
-        if entry_type == "user":
-            # Extract user content
-            content = message.get("content", "")
-            if isinstance(content, list):
-                # Handle list of content blocks
-                text_parts = []
-                for block in content:
-                    if isinstance(block, dict) and block.get("type") == "text":
-                        text_parts.append(block.get("text", ""))
-                    elif isinstance(block, str):
-                        text_parts.append(block)
-                content = "\n".join(text_parts)
-            xml_lines.append(f"  <user>{escape_xml(content)}</user>")
+    for entry in itertools.chain(held, iterator):
+        yield from _iter_entry_xml_lines(entry, enable_pruning)
 
-        elif entry_type == "assistant":
-            # Extract text and tool uses
-            content_blocks = message.get("content", [])
-            for content in content_blocks:
-                if content.get("type") == "text":
-                    text = content.get("text", "")
-                    if text.strip():  # Only include non-empty text
-                        xml_lines.append(f"  <assistant>{escape_xml(text)}</assistant>")
-                elif content.get("type") == "tool_use":
-                    tool_name = content.get("name", "")
-                    tool_id = content.get("id", "")
-                    escaped_name = escape_xml(tool_name)
-                    escaped_id = escape_xml(tool_id)
-                    xml_lines.append(f'  <tool_use name="{escaped_name}" id="{escaped_id}">')
-                    input_params = content.get("input", {})
-                    for key, value in input_params.items():
-                        escaped_key = escape_xml(key)
-                        escaped_value = escape_xml(str(value))
-                        xml_lines.append(f'    <param name="{escaped_key}">{escaped_value}</param>')
-                    xml_lines.append("  </tool_use>")
 
-        elif entry_type == "tool_result":
-            # Handle tool results - apply pruning if enabled
-            content_blocks = message.get("content", [])
-            tool_use_id = message.get("tool_use_id", "")
+def _iter_entry_xml_lines(entry: dict, enable_pruning: bool) -> Iterator[str]:
+    """Yield the XML lines for a single entry."""
+    entry_type = entry["type"]
+    message = entry.get("message", {})
 
-            # Extract result content
-            result_parts = []
-            for block in content_blocks:
-                if isinstance(block, dict):
-                    if block.get("type") == "text":
-                        result_parts.append(block.get("text", ""))
-                    elif "text" in block:
-                        result_parts.append(block["text"])
+    if entry_type == "user":
+        # Extract user content
+        content = message.get("content", "")
+        if isinstance(content, list):
+            # Handle list of content blocks
+            text_parts = []
+            for block in content:
+                if isinstance(block, dict) and block.get("type") == "text":
+                    text_parts.append(block.get("text", ""))
                 elif isinstance(block, str):
-                    result_parts.append(block)
-
-            result_text = "\n".join(result_parts)
-
-            # Apply pruning if enabled
-            if enable_pruning:
-                result_text = prune_tool_result_content(result_text)
-
-            xml_lines.append(f'  <tool_result tool="{escape_xml(tool_use_id)}">')
-            xml_lines.append(escape_xml(result_text))
-            xml_lines.append("  </tool_result>")
-
-    xml_lines.append("</session>")
-    return "\n".join(xml_lines)
+                    text_parts.append(block)
+            content = "\n".join(text_parts)
+        yield f"  <user>{escape_xml(content)}</user>"
+
+    elif entry_type == "assistant":
+        # Extract text and tool uses
+        content_blocks = message.get("content", [])
+        for content in content_blocks:
+            if content.get("type") == "text":
+                text = content.get("text", "")
+                if text.strip():  # Only include non-empty text
+                    yield f"  <assistant>{escape_xml(text)}</assistant>"
+            elif content.get("type") == "tool_use":
+                tool_name = content.get("name", "")
+                tool_id = content.get("id", "")
+                escaped_name = escape_xml(tool_name)
+                escaped_id = escape_xml(tool_id)
+                yield f'  <tool_use name="{escaped_name}" id="{escaped_id}">'
+                input_params = content.get("input", {})
+                for key, value in input_params.items():
+                    escaped_key = escape_xml(key)
+                    escaped_value = escape_xml(str(value))
+                    yield f'    <param name="{escaped_key}">{escaped_value}</param>'
+                yield "  </tool_use>"
+
+    elif entry_type == "tool_result":
+        # Handle tool results - apply pruning if enabled
+        content_blocks = message.get("content", [])
+        tool_use_id = message.get("tool_use_id", "")
+
+        # Extract result content
+        result_parts = []
+        for block in content_blocks:
+            if isinstance(block, dict):
+                if block.get("type") == "text":
+                    result_parts.append(block.get("text", ""))
+                elif "text" in block:
+                    result_parts.append(block["text"])
+            elif isinstance(block, str):
+                result_parts.append(block)
+
+        result_text = "\n".join(result_parts)
+
+        # Apply pruning if enabled
+        if enable_pruning:
+            result_text = prune_tool_result_content(result_text)
+
+        yield f'  <tool_result tool="{escape_xml(tool_use_id)}">'
+        yield escape_xml(result_text)
+        yield "  </tool_result>"
 
 
 def process_log_file(
@@ -486,23 +606,69 @@ def process_log_file(
     Returns:
         Tuple of (filtered entries, total entries count, skipped entries count)
     """
-    entries = []
-    total_entries = 0
-    skipped_entries = 0
+    stats = LogReadStats()
+    entries = list(
+        iter_log_entries(
+            log_path, session_id=session_id, enable_filtering=enable_filtering, stats=stats
+        )
+    )
+    return entries, stats.total_entries, stats.skipped_entries
 
-    for line in log_path.read_text(encoding="utf-8").splitlines():
-        if not line.strip():
-            continue
 
+def iter_log_lines(log_path: Path, stats: LogReadStats | None = None) -> Iterator[str]:
+    """Yield the non-blank lines of a JSONL file without reading it whole.
+
+    Args:
+        log_path: Path to the JSONL log file
+        stats: Optional counters; chars_read is updated as lines are read
+    """
+    with log_path.open(encoding="utf-8") as f:
+        for line in f:
+            if stats is not None:
+                stats.chars_read += len(line)
+            if not line.strip():
+                continue
+            yield line
+
+
+def read_first_line(log_path: Path) -> str:
+    """Read only the first line of a file (empty string for an empty file)."""
+    with log_path.open(encoding="utf-8") as f:
+        return f.readline()
+
+
+def iter_log_entries(
+    log_path: Path,
+    session_id: str | None = None,
+    enable_filtering: bool = True,
+    stats: LogReadStats | None = None,
+) -> Iterator[dict]:
+    """Stream filtered entries from a JSONL log file.
+
+    Each line is decoded only when the consumer asks for the next entry.
+
+    Args:
+        log_path: Path to the JSONL log file
+        session_id: Optional session ID to filter entries by
+        enable_filtering: Whether to apply optimization filters (default: True)
+        stats: Optional counters updated as the file is consumed
+
+    Yields:
+        Entries reduced to type, message and gitBranch
+    """
+    if stats is None:
+        stats = LogReadStats()
+
+    for line in iter_log_lines(log_path, stats):
         entry = json.loads(line)
-        total_entries += 1
+        stats.total_entries += 1
 
         # Filter by session ID if provided
         if session_id is not None:
             entry_session = entry.get("sessionId")
             # Include if sessionId matches OR if sessionId field missing (backward compat)
             if entry_session is not None and entry_session != session_id:
-                skipped_entries += 1
+                stats.skipped_entries += 1
                 continue
 
         # Filter out noise entries
@@ -527,9 +693,7 @@ def process_log_file(
         if "usage" in filtered["message"]:
             del filtered["message"]["usage"]
 
-        entries.append(filtered)
-
-    return entries, total_entries, skipped_entries
+        yield filtered
 
 
 def discover_agent_logs(session_log_path: Path) -> list[Path]:
@@ -562,8 +726,9 @@ def discover_planning_agent_logs(session_log_path: Path, parent_session_id: str)
     # Step 1: Find all Task tool invocations with subagent_type="Plan"
     plan_task_timestamps: list[float] = []
 
-    for line in session_log_path.read_text(encoding="utf-8").splitlines():
-        if not line.strip():
+    for line in iter_log_lines(session_log_path):
+        # Only assistant messages can hold Task invocations; skip decoding the rest
+        if '"Task"' not in line:
             continue
 
         entry = json.loads(line)
@@ -596,10 +761,10 @@ def discover_planning_agent_logs(session_log_path: Path, parent_session_id: str)
     planning_agent_logs: list[Path] = []
 
     for agent_log in all_agent_logs:
-        # Read first entry to check sessionId and timestamp
+        # Read only the first entry to check sessionId and timestamp
         if not agent_log.exists():
             continue
-        first_line = agent_log.read_text(encoding="utf-8").splitlines()[0]
+        first_line = read_first_line(agent_log)
         if not first_line.strip():
             continue
 
@@ -672,76 +837,59 @@ def preprocess_session(
     """
     enable_filtering = not no_filtering
 
-    # Process main session log
-    entries, total_entries, skipped_entries = process_log_file(
-        log_path, session_id=session_id, enable_filtering=enable_filtering
+    # Stream the main session log
+    main_stats = LogReadStats()
+    entries = iter_log_entries(
+        log_path, session_id=session_id, enable_filtering=enable_filtering, stats=main_stats
     )
 
-    # Apply filtering operations if enabled
+    # Check for empty/warmup sessions if filtering is enabled
     if enable_filtering:
-        # Check for empty/warmup sessions
-        if is_empty_session(entries):
+        skip_reason, entries = screen_session(entries)
+        if skip_reason == "empty":
             click.echo("⚠️  Empty session detected - skipping output", err=True)
             return
-
-        if is_warmup_session(entries):
+        if skip_reason == "warmup":
             click.echo("⚠️  Warmup session detected - skipping output", err=True)
             return
 
-        # Apply documentation deduplication
-        entries = deduplicate_documentation_blocks(entries)
-
-        # Apply parameter truncation
-        entries = truncate_tool_parameters(entries)
+    agent_logs = discover_agent_logs(log_path) if include_agents else []
 
-    # Apply standard deduplication (always enabled)
-    entries = deduplicate_assistant_messages(entries)
+    temp_file: Path | None = None
+    if stdout:
+        # Output XML directly to stdout
+        compressed_size = _write_sessions(
+            sys.stdout, entries, agent_logs, session_id, enable_filtering
+        )
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+    else:
+        # Write to temp file and print path (backward compatible)
+        # Use NamedTemporaryFile to avoid conflicts when multiple tests use same filename
+        filename_session_id = log_path.stem  # Extract session ID from filename
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            encoding="utf-8",
+            prefix=f"session-{filename_session_id}-",
+            suffix="-compressed.xml",
+            delete=False,
+            dir=tempfile.gettempdir(),
+        ) as f:
+            compressed_size = _write_sessions(f, entries, agent_logs, session_id, enable_filtering)
+            temp_file = Path(f.name)
 
     # Show diagnostic output if filtering by session ID
     if session_id is not None:
         click.echo(f"✅ Filtered JSONL by session ID: {session_id[:8]}...", err=True)
         click.echo(
-            f"📊 Included {total_entries - skipped_entries} entries, "
-            f"skipped {skipped_entries} entries",
+            f"📊 Included {main_stats.total_entries - main_stats.skipped_entries} entries, "
+            f"skipped {main_stats.skipped_entries} entries",
             err=True,
         )
 
-    # Generate main session XML
-    xml_sections = [generate_compressed_xml(entries, enable_pruning=enable_filtering)]
-
-    # Discover and process agent logs if requested
-    if include_agents:
-        agent_logs = discover_agent_logs(log_path)
-        for agent_log in agent_logs:
-            agent_entries, agent_total, agent_skipped = process_log_file(
-                agent_log, session_id=session_id, enable_filtering=enable_filtering
-            )
-
-            # Apply filtering for agent logs
-            if enable_filtering:
-                if is_empty_session(agent_entries):
-                    continue
-                if is_warmup_session(agent_entries):
-                    continue
-                agent_entries = deduplicate_documentation_blocks(agent_entries)
-                agent_entries = truncate_tool_parameters(agent_entries)
-
-            agent_entries = deduplicate_assistant_messages(agent_entries)
-
-            # Generate XML with source label
-            source_label = f"agent-{agent_log.stem.replace('agent-', '')}"
-            agent_xml = generate_compressed_xml(
-                agent_entries, source_label=source_label, enable_pruning=enable_filtering
-            )
-            xml_sections.append(agent_xml)
-
-    # Combine all XML sections
-    xml_content = "\n\n".join(xml_sections)
-
-    # Calculate compression metrics (only when filtering is enabled)
+    # Report compression metrics (only when filtering is enabled)
     if enable_filtering:
-        original_size = sum(len(log_path.read_text(encoding="utf-8")) for _ in [log_path])
-        compressed_size = len(xml_content)
+        original_size = main_stats.chars_read
         if original_size > 0:
             reduction_pct = ((original_size - compressed_size) / original_size) * 100
             stats_msg = (
@@ -751,27 +899,50 @@ def preprocess_session(
             # Route stats to stderr when stdout contains XML
             click.echo(stats_msg, err=True)
 
-    if stdout:
-        # Output XML directly to stdout
-        click.echo(xml_content)
-    else:
-        # Write to temp file and print path (backward compatible)
-        # Use NamedTemporaryFile to avoid conflicts when multiple tests use same filename
-        filename_session_id = log_path.stem  # Extract session ID from filename
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            encoding="utf-8",
-            prefix=f"session-{filename_session_id}-",
-            suffix="-compressed.xml",
-            delete=False,
-            dir=tempfile.gettempdir(),
-        ) as f:
-            f.write(xml_content)
-            temp_file = Path(f.name)
-
+    if temp_file is not None:
         # Print path to stdout for command capture
         click.echo(str(temp_file))
 
 
+def _write_sessions(
+    out: IO[str],
+    entries: Iterator[dict],
+    agent_logs: list[Path],
+    session_id: str | None,
+    enable_filtering: bool,
+) -> int:
+    """Write the main session XML followed by one section per agent log.
+
+    Returns:
+        Number of characters written
+    """
+    chars_written = write_compressed_xml(
+        compress_entries(entries, enable_filtering), out, enable_pruning=enable_filtering
+    )
+
+    for agent_log in agent_logs:
+        agent_entries = iter_log_entries(
+            agent_log, session_id=session_id, enable_filtering=enable_filtering
+        )
+
+        # Skip empty/warmup agent logs when filtering
+        if enable_filtering:
+            skip_reason, agent_entries = screen_session(agent_entries)
+            if skip_reason is not None:
+                continue
+
+        # Generate XML with source label
+        source_label = f"agent-{agent_log.stem.replace('agent-', '')}"
+        out.write("\n\n")
+        chars_written += 2 + write_compressed_xml(
+            compress_entries(agent_entries, enable_filtering),
+            out,
+            source_label=source_label,
+            enable_pruning=enable_filtering,
+        )
+
+    return chars_written
+
+
 if __name__ == "__main__":
     preprocess_session()
@@ -8,15 +8,19 @@ This command is invoked via dot-agent run erk session-id-injector-hook.
 
 import json
 import sys
+from pathlib import Path
 
 import click
 
+from dot_agent_kit.data.kits.erk.session_index import default_session_index
+
 
 @click.command(name="session-id-injector-hook")
 def session_id_injector_hook() -> None:
     """Inject session ID into conversation context when relevant."""
     # Attempt to read session context from stdin (if Claude Code provides it)
     session_id = None
+    transcript_path = None
 
     try:
         # Check if stdin has data (non-blocking)
@@ -25,10 +29,20 @@ def session_id_injector_hook() -> None:
             if stdin_data:
                 context = json.loads(stdin_data)
                 session_id = context.get("session_id")
+                transcript_path = context.get("transcript_path")
     except (json.JSONDecodeError, Exception):
         # If stdin reading fails, continue without session ID
         pass
 
+    # Record where this session's log lives so later lookups by session ID
+    # (e.g. debug-agent) don't have to scan ~/.claude/projects/
+    if session_id and transcript_path:
+        try:
+            default_session_index().record(session_id, Path(transcript_path))
+        except OSError:
+            # Hooks must never fail the prompt over a cache write
+            pass
+
     # Output session ID if available
     if session_id:
         click.echo("<reminder>")
@@ -0,0 +1,308 @@
+"""Persistent index of Claude Code session logs by session ID.
+
+Finding the project directory for a session used to mean opening every
+*.jsonl under ~/.claude/projects/ and parsing its first lines. This module
+keeps that result on disk: for each project directory, the directory's
+mtime and, for each log in it, the log's mtime and the session IDs it
+belongs to. On lookup only directories whose mtime changed are re-listed,
+and only new or modified logs in them are re-read. A miss falls back to a
+full rebuild, so the index can never hide a session that exists.
+
+All functions follow LBYL (Look Before You Leap) patterns and handle
+errors explicitly at boundaries.
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+INDEX_FORMAT_VERSION = 1
+
+# Number of leading lines read from a log when looking for sessionId fields
+_HEAD_LINES = 10
+
+# file name -> [mtime_ns, session IDs]
+FileEntry = list[Any]
+
+
+def get_projects_dir() -> Path:
+    """Return the Claude Code projects directory path.
+
+    Returns:
+        Path to ~/.claude/projects/
+    """
+    return Path.home() / ".claude" / "projects"
+
+
+def get_index_path() -> Path:
+    """Return the session index file path.
+
+    Returns:
+        Path to ~/.cache/erk/claude-session-index.json
+    """
+    return Path.home() / ".cache" / "erk" / "claude-session-index.json"
+
+
+@dataclass(frozen=True)
+class SessionLocation:
+    """Where a session's log lives."""
+
+    session_id: str
+    project_dir: Path
+    log_path: Path
+    mtime_ns: int
+
+
+def read_session_ids(log_path: Path) -> list[str]:
+    """Get the session IDs a log belongs to.
+
+    Main session logs are named <session-id>.jsonl; any log may also carry
+    sessionId fields in its leading entries (agent logs always do).
+
+    Args:
+        log_path: Path to a *.jsonl log
+
+    Returns:
+        Session IDs in first-seen order
+    """
+    session_ids: list[str] = []
+    if not log_path.name.startswith("agent-"):
+        session_ids.append(log_path.stem)
+
+    # Error boundary: Claude Code may be writing the log concurrently
+    try:
+        with log_path.open(encoding="utf-8") as f:
+            for _ in range(_HEAD_LINES):
+                line = f.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if not isinstance(entry, dict):
+                    continue
+                session_id = entry.get("sessionId")
+                if isinstance(session_id, str) and session_id not in session_ids:
+                    session_ids.append(session_id)
+    except (OSError, UnicodeDecodeError):
+        return session_ids
+
+    return session_ids
+
+
+class SessionIndex:
+    """Incrementally maintained session ID -> log location index."""
+
+    def __init__(self, projects_dir: Path, index_path: Path) -> None:
+        """Create an index.
+
+        Args:
+            projects_dir: Claude Code projects directory to index
+            index_path: File the index is persisted to (created on first save)
+        """
+        self._projects_dir = projects_dir
+        self._index_path = index_path
+        self._dirs: dict[str, dict[str, Any]] | None = None
+        self._pinned: dict[str, str] = {}
+        self._dirty = False
+
+    def lookup(self, session_id: str) -> SessionLocation | None:
+        """Find the log for a session.
+
+        Checks logs recorded by the session-id hook first, then refreshes the
+        directories that changed, then falls back to a full rebuild.
+
+        Args:
+            session_id: Session ID to look up
+
+        Returns:
+            Location of the session's log, or None if no log references it
+        """
+        self._load()
+
+        pinned = self._pinned.get(session_id)
+        if pinned is not None:
+            location = self._location(session_id, self._projects_dir / pinned)
+            if location is not None:
+                return location
+
+        self.refresh()
+        location = self._find(session_id)
+        if location is None:
+            self.rebuild()
+            location = self._find(session_id)
+        return location
+
+    def project_logs(self, project_dir_name: str) -> list[str]:
+        """Get the *.jsonl file names in one project directory, sorted.
+
+        Only that directory is refreshed, and only if its mtime changed.
+
+        Args:
+            project_dir_name: Encoded project directory name
+
+        Returns:
+            Log file names, empty if the directory doesn't exist
+        """
+        dirs = self._load()
+        project_dir = self._projects_dir / project_dir_name
+        if not project_dir.is_dir():
+            return []
+        self._refresh_dir(dirs, project_dir)
+        self._save()
+        return sorted(dirs[project_dir_name]["files"])
+
+    def record(self, session_id: str, log_path: Path) -> None:
+        """Remember a session's log path, as reported by Claude Code.
+
+        Args:
+            session_id: Session ID
+            log_path: The session's transcript path, inside the projects directory
+        """
+        if not log_path.is_relative_to(self._projects_dir):
+            return
+        relative = str(log_path.relative_to(self._projects_dir))
+        self._load()
+        if self._pinned.get(session_id) == relative:
+            return
+        self._pinned[session_id] = relative
+        self._dirty = True
+        self._save()
+
+    def refresh(self) -> None:
+        """Re-scan project directories whose mtime changed since the last scan."""
+        dirs = self._load()
+        if not self._projects_dir.is_dir():
+            if dirs:
+                dirs.clear()
+                self._dirty = True
+            self._save()
+            return
+
+        with os.scandir(self._projects_dir) as entries:
+            project_dirs = [Path(entry.path) for entry in entries if entry.is_dir()]
+
+        seen: set[str] = set()
+        for project_dir in project_dirs:
+            seen.add(project_dir.name)
+            self._refresh_dir(dirs, project_dir)
+
+        for name in [name for name in dirs if name not in seen]:
+            del dirs[name]
+            self._dirty = True
+        self._save()
+
+    def rebuild(self) -> None:
+        """Re-scan every project directory and re-read every log."""
+        self._load()
+        self._dirs = {}
+        self._dirty = True
+        self.refresh()
+
+    def _refresh_dir(self, dirs: dict[str, dict[str, Any]], project_dir: Path) -> None:
+        dir_mtime = project_dir.stat().st_mtime_ns
+        stored = dirs.get(project_dir.name)
+        if stored is not None and stored["mtime_ns"] == dir_mtime:
+            return
+
+        old_files: dict[str, FileEntry] = stored["files"] if stored is not None else {}
+        files: dict[str, FileEntry] = {}
+        with os.scandir(project_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".jsonl") or not entry.is_file():
+                    continue
+                file_mtime = entry.stat().st_mtime_ns
+                old = old_files.get(entry.name)
+                if old is not None and old[0] == file_mtime:
+                    files[entry.name] = old
+                else:
+                    files[entry.name] = [file_mtime, read_session_ids(Path(entry.path))]
+
+        dirs[project_dir.name] = {"mtime_ns": dir_mtime, "files": files}
+        self._dirty = True
+
+    def _find(self, session_id: str) -> SessionLocation | None:
+        dirs = self._load()
+        fallback: SessionLocation | None = None
+        for dir_name, dir_entry in dirs.items():
+            for file_name, (mtime_ns, session_ids) in dir_entry["files"].items():
+                if session_id not in session_ids:
+                    continue
+                location = SessionLocation(
+                    session_id=session_id,
+                    project_dir=self._projects_dir / dir_name,
+                    log_path=self._projects_dir / dir_name / file_name,
+                    mtime_ns=mtime_ns,
+                )
+                # Prefer the session's own main log over agent logs mentioning it
+                if file_name == f"{session_id}.jsonl":
+                    return location
+                if fallback is None:
+                    fallback = location
+        return fallback
+
+    def _location(self, session_id: str, log_path: Path) -> SessionLocation | None:
+        if not log_path.is_file():
+            return None
+        return SessionLocation(
+            session_id=session_id,
+            project_dir=log_path.parent,
+            log_path=log_path,
+            mtime_ns=log_path.stat().st_mtime_ns,
+        )
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._dirs is None:
+            self._dirs = self._read_index()
+        return self._dirs
+
+    def _read_index(self) -> dict[str, dict[str, Any]]:
+        """Read the persisted index, or {} when it is missing or unusable."""
+        if not self._index_path.exists():
+            return {}
+
+        # Error boundary: a corrupt or concurrently replaced index is a miss
+        try:
+            data = json.loads(self._index_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+        if not isinstance(data, dict) or data.get("version") != INDEX_FORMAT_VERSION:
+            return {}
+        if data.get("projects_dir") != str(self._projects_dir):
+            return {}
+        dirs = data.get("dirs")
+        pinned = data.get("pinned")
+        if not isinstance(dirs, dict) or not isinstance(pinned, dict):
+            return {}
+
+        self._pinned = pinned
+        return dirs
+
+    def _save(self) -> None:
+        if not self._dirty:
+            return
+        content = json.dumps(
+            {
+                "version": INDEX_FORMAT_VERSION,
+                "projects_dir": str(self._projects_dir),
+                "dirs": self._dirs,
+                "pinned": self._pinned,
+            },
+            separators=(",", ":"),
+        )
+        self._index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._index_path.with_name(f".{self._index_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(content, encoding="utf-8")
+        os.replace(tmp_path, self._index_path)
+        self._dirty = False
+
+
+def default_session_index() -> SessionIndex:
+    """Create the index for the current user's Claude Code projects."""
+    return SessionIndex(get_projects_dir(), get_index_path())
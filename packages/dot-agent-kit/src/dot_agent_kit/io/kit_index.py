@@ -0,0 +1,177 @@
+"""Compact index of bundled kit manifests for fast CLI startup.
+
+Registering the `dot-agent run` kit groups only needs each kit's name,
+description and kit cli command table, but getting them used to mean
+YAML-parsing every kit.yaml on every invocation - including the hooks that
+run on every Claude prompt. The index stores exactly those fields, keyed by
+each manifest's (mtime_ns, size) stamp, in the user cache directory. When a
+stamp still matches, the kit is registered without opening its manifest;
+otherwise only that manifest is re-parsed.
+
+This module deliberately avoids importing yaml or the manifest models at
+module level so that a warm index costs one small JSON read.
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+KIT_INDEX_FORMAT_VERSION = 1
+
+
+def get_kit_index_path() -> Path:
+    """Return the kit index cache file path.
+
+    Returns:
+        Path to ~/.cache/dot-agent/kit-index.json
+    """
+    return Path.home() / ".cache" / "dot-agent" / "kit-index.json"
+
+
+@dataclass(frozen=True)
+class KitIndexEntry:
+    """The parts of a kit manifest needed to register its commands.
+
+    Attributes:
+        kit_name: Kit directory name (used for module paths)
+        name: Kit name from the manifest (used as the group name)
+        description: Kit description (used as the group help)
+        manifest_path: Path to kit.yaml
+        commands: Kit cli command name -> (path, description), in manifest order
+    """
+
+    kit_name: str
+    name: str
+    description: str
+    manifest_path: Path
+    commands: dict[str, tuple[str, str]]
+
+
+class KitIndexError(Exception):
+    """Raised when a kit's manifest cannot be indexed."""
+
+    def __init__(self, kit_name: str, cause: Exception) -> None:
+        super().__init__(f"Failed to load kit '{kit_name}': {cause}")
+        self.kit_name = kit_name
+        self.cause = cause
+
+
+def _stamp(path: Path) -> list[int]:
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _entry_from_manifest(kit_name: str, manifest_path: Path) -> KitIndexEntry:
+    # Imported here: parsing is the slow path the index exists to avoid
+    from dot_agent_kit.io.manifest import load_kit_manifest
+
+    manifest = load_kit_manifest(manifest_path)
+    return KitIndexEntry(
+        kit_name=kit_name,
+        name=manifest.name,
+        description=manifest.description,
+        manifest_path=manifest_path,
+        commands={
+            command.name: (command.path, command.description)
+            for command in manifest.kit_cli_commands
+        },
+    )
+
+
+def _encode(entry: KitIndexEntry, stamp: list[int]) -> dict[str, Any]:
+    return {
+        "stamp": stamp,
+        "name": entry.name,
+        "description": entry.description,
+        "commands": [[name, path, desc] for name, (path, desc) in entry.commands.items()],
+    }
+
+
+def _decode(kit_name: str, manifest_path: Path, data: dict[str, Any]) -> KitIndexEntry:
+    return KitIndexEntry(
+        kit_name=kit_name,
+        name=data["name"],
+        description=data["description"],
+        manifest_path=manifest_path,
+        commands={name: (path, desc) for name, path, desc in data["commands"]},
+    )
+
+
+def _read_cache(index_path: Path) -> dict[str, Any]:
+    if not index_path.exists():
+        return {}
+
+    # Error boundary: a corrupt or concurrently replaced cache is a miss
+    try:
+        data = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+    if not isinstance(data, dict) or data.get("version") != KIT_INDEX_FORMAT_VERSION:
+        return {}
+    return data["manifests"]
+
+
+def _write_cache(index_path: Path, manifests: dict[str, Any]) -> None:
+    content = json.dumps(
+        {"version": KIT_INDEX_FORMAT_VERSION, "manifests": manifests}, separators=(",", ":")
+    )
+    # Error boundary: the cache is an optimization; a read-only home must not
+    # break the CLI
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = index_path.with_name(f".{index_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(content, encoding="utf-8")
+        os.replace(tmp_path, index_path)
+    except OSError:
+        return
+
+
+def load_kit_index(
+    kits_dir: Path, kit_names: list[str], index_path: Path
+) -> list[KitIndexEntry | KitIndexError]:
+    """Get index entries for kits, re-parsing only manifests that changed.
+
+    Args:
+        kits_dir: Directory containing kit directories
+        kit_names: Kit directory names to index, in registration order
+        index_path: Cache file for the index
+
+    Returns:
+        One result per kit that has a kit.yaml: its entry, or the error that
+        prevented parsing it (failed kits are not cached, so they are retried)
+    """
+    cached = _read_cache(index_path)
+    manifests: dict[str, Any] = {}
+    results: list[KitIndexEntry | KitIndexError] = []
+    changed = False
+
+    for kit_name in kit_names:
+        manifest_path = kits_dir / kit_name / "kit.yaml"
+        if not manifest_path.exists():
+            continue
+
+        key = str(manifest_path)
+        stamp = _stamp(manifest_path)
+        data = cached.get(key)
+        if data is not None and data["stamp"] == stamp:
+            manifests[key] = data
+            results.append(_decode(kit_name, manifest_path, data))
+            continue
+
+        changed = True
+        # Error boundary: one malformed manifest must not hide the other kits
+        try:
+            entry = _entry_from_manifest(kit_name, manifest_path)
+        except Exception as e:
+            results.append(KitIndexError(kit_name, e))
+            continue
+        manifests[key] = _encode(entry, stamp)
+        results.append(entry)
+
+    if changed or manifests.keys() != cached.keys():
+        _write_cache(index_path, manifests)
+
+    return results
@@ -2,14 +2,17 @@
 
 from pathlib import Path
 
-import yaml
-
-from dot_agent_kit.hooks.models import HookDefinition
 from dot_agent_kit.models.kit import KitCliCommandDefinition, KitManifest
 
 
 def load_kit_manifest(manifest_path: Path) -> KitManifest:
     """Load kit.yaml manifest file."""
+    # Imported here so that importing this module (e.g. via the kit command
+    # group on every hook invocation) doesn't load yaml and pydantic
+    import yaml
+
+    from dot_agent_kit.hooks.models import HookDefinition
+
     with open(manifest_path, encoding="utf-8") as f:
         data = yaml.safe_load(f)
 
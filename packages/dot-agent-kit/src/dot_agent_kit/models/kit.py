@@ -2,8 +2,11 @@
 
 import re
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
-from dot_agent_kit.hooks.models import HookDefinition
+if TYPE_CHECKING:
+    # Runtime import would load pydantic for every kit command lookup
+    from dot_agent_kit.hooks.models import HookDefinition
 
 
 @dataclass(frozen=True)
@@ -61,7 +64,7 @@ class KitManifest:
     artifacts: dict[str, list[str]]  # type -> paths
     license: str | None = None
     homepage: str | None = None
-    hooks: list[HookDefinition] = field(default_factory=list)
+    hooks: list["HookDefinition"] = field(default_factory=list)
     kit_cli_commands: list[KitCliCommandDefinition] = field(default_factory=list)
 
     def validate_namespace_pattern(self) -> list[str]:
@@ -1,13 +1,16 @@
 """Tests for kit command loading with error isolation and lazy loading."""
 
 from pathlib import Path
+from types import SimpleNamespace
 
 import click
 import pytest
 
+from dot_agent_kit.commands.kit_command import group as group_module
 from dot_agent_kit.commands.kit_command.group import (
     LazyKitGroup,
-    _load_single_kit_commands,
+    _load_kit_commands,
+    kit_command_group,
 )
 from dot_agent_kit.models.kit import KitCliCommandDefinition, KitManifest
 
@@ -31,193 +34,172 @@ def valid_manifest() -> KitManifest:
 
 
 @pytest.fixture
-def empty_manifest() -> KitManifest:
-    """Create a kit manifest with no kit cli commands."""
-    return KitManifest(
-        name="empty-kit",
-        version="1.0.0",
-        description="Empty kit",
-        artifacts={},
-        kit_cli_commands=[],
-    )
+def kits_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A kits directory that kit registration reads through the kit index."""
+    kits_dir = tmp_path / "kits"
+    kits_dir.mkdir()
 
+    class DirectorySource:
+        def list_available(self) -> list[str]:
+            return sorted(path.name for path in kits_dir.iterdir())
 
-@pytest.fixture
-def invalid_command_manifest() -> KitManifest:
-    """Create a manifest with invalid kit cli command definition."""
-    return KitManifest(
-        name="invalid-kit",
-        version="1.0.0",
-        description="Invalid kit",
-        artifacts={},
-        kit_cli_commands=[
-            KitCliCommandDefinition(
-                name="INVALID_NAME",  # Uppercase not allowed
-                path="kit_cli_commands/invalid-kit/test.py",
-                description="Invalid command",
-            )
-        ],
-    )
+    monkeypatch.setattr(group_module, "BundledKitSource", DirectorySource)
+    monkeypatch.setattr(group_module, "KITS_DATA_DIR", kits_dir)
+    monkeypatch.setattr(group_module, "get_kit_index_path", lambda: tmp_path / "kit-index.json")
+    monkeypatch.setattr(kit_command_group, "commands", {})
+    return kits_dir
 
 
-def test_load_valid_kit(tmp_path: Path, valid_manifest: KitManifest) -> None:
-    """Test loading a valid kit with all commands successfully."""
-    kit_dir = tmp_path / "test-kit"
+def _write_kit(
+    kits_dir: Path, kit_name: str, commands: list[tuple[str, str]], files: list[str]
+) -> None:
+    """Write a kit.yaml with the given (name, path) commands, and empty command files."""
+    kit_dir = kits_dir / kit_name
     kit_dir.mkdir()
-    commands_dir = kit_dir / "kit_cli_commands" / "test-kit"
-    commands_dir.mkdir(parents=True)
-
-    # Create the command file
-    (commands_dir / "test_command.py").write_text(
-        """import click
-
-@click.command()
-def test_command():
-    '''Test command.'''
-    click.echo('Hello')
-""",
-        encoding="utf-8",
-    )
+    manifest = f"name: {kit_name}\nversion: 1.0.0\ndescription: Test kit\n"
+    if commands:
+        manifest += "kit_cli_commands:\n"
+        for name, path in commands:
+            manifest += f"  - name: {name}\n    path: {path}\n    description: Test\n"
+    (kit_dir / "kit.yaml").write_text(manifest, encoding="utf-8")
+    for relative_path in files:
+        file_path = kit_dir / relative_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.touch()
+
+
+def _register_kit(
+    kits_dir: Path, kit_name: str, commands: list[tuple[str, str]], files: list[str]
+) -> LazyKitGroup:
+    """Write a kit, register kits as the CLI does, and return the kit's group."""
+    _write_kit(kits_dir, kit_name, commands, files)
+    _load_kit_commands()
+    kit_group = kit_command_group.commands[kit_name]
+    assert isinstance(kit_group, LazyKitGroup)
+    return kit_group
 
-    kit_group = _load_single_kit_commands(
-        kit_name="test-kit", kit_dir=kit_dir, manifest=valid_manifest, debug=False
-    )
 
-    assert kit_group is not None
-    assert isinstance(kit_group, LazyKitGroup)
-    assert kit_group.name == "test-kit"
+@pytest.fixture
+def imported_modules(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record kit command imports, answering them with a module of commands.
 
+    Kits under tmp_path aren't importable under dot_agent_kit.data.kits, so
+    imports return a namespace holding a command named after the module.
+    """
+    imported: list[str] = []
 
-def test_load_kit_with_invalid_command_name(
-    tmp_path: Path, invalid_command_manifest: KitManifest
-) -> None:
-    """Test loading kit with invalid command name logs error and continues."""
-    kit_dir = tmp_path / "invalid-kit"
-    kit_dir.mkdir()
+    def fake_import_module(name: str) -> SimpleNamespace:
+        imported.append(name)
+        function_name = name.rsplit(".", 1)[-1]
+        return SimpleNamespace(**{function_name: click.Command(function_name)})
 
-    kit_group = _load_single_kit_commands(
-        kit_name="invalid-kit",
-        kit_dir=kit_dir,
-        manifest=invalid_command_manifest,
-        debug=False,
+    monkeypatch.setattr(
+        group_module, "importlib", SimpleNamespace(import_module=fake_import_module)
     )
+    return imported
 
-    # Kit group is created but commands won't load
-    assert kit_group is not None
 
+def _context() -> click.Context:
+    return click.Context(click.Command("test"))
 
-def test_load_kit_with_missing_file(tmp_path: Path, valid_manifest: KitManifest) -> None:
-    """Test loading kit when command file doesn't exist."""
-    kit_dir = tmp_path / "test-kit"
-    kit_dir.mkdir()
-    # Note: NOT creating the commands directory or file
 
-    kit_group = _load_single_kit_commands(
-        kit_name="test-kit", kit_dir=kit_dir, manifest=valid_manifest, debug=False
+def test_load_valid_kit(kits_dir: Path, imported_modules: list[str]) -> None:
+    """A kit from the index is registered and its command imported on lookup."""
+    kit_group = _register_kit(
+        kits_dir,
+        "test-kit",
+        [("test-command", "kit_cli_commands/test-kit/test_command.py")],
+        ["kit_cli_commands/test-kit/test_command.py"],
     )
 
-    # Kit group is created but command won't load
-    assert kit_group is not None
+    assert kit_group.name == "test-kit"
+    assert imported_modules == []
+    assert kit_group.get_command(_context(), "test-command") is not None
+    assert imported_modules == [
+        "dot_agent_kit.data.kits.test-kit.kit_cli_commands.test-kit.test_command"
+    ]
 
 
-def test_load_kit_with_import_error(tmp_path: Path) -> None:
-    """Test loading kit when Python import fails."""
-    kit_dir = tmp_path / "test-kit"
-    kit_dir.mkdir()
-    commands_dir = kit_dir / "kit_cli_commands" / "test-kit"
-    commands_dir.mkdir(parents=True)
-
-    # Create a file with a syntax error
-    (commands_dir / "test_command.py").write_text(
-        """import click
-
-this is not valid python syntax!!!
-""",
-        encoding="utf-8",
+def test_load_kit_with_invalid_command_name(
+    kits_dir: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """An invalid command name is reported and the command isn't registered."""
+    kit_group = _register_kit(
+        kits_dir, "invalid-kit", [("INVALID_NAME", "kit_cli_commands/invalid-kit/test.py")], []
     )
 
-    manifest = KitManifest(
-        name="test-kit",
-        version="1.0.0",
-        description="Test kit",
-        artifacts={},
-        kit_cli_commands=[
-            KitCliCommandDefinition(
-                name="test-command",
-                path="kit_cli_commands/test-kit/test_command.py",
-                description="Test command",
-            )
-        ],
-    )
+    assert kit_group.get_command(_context(), "INVALID_NAME") is None
+    assert "Invalid command 'INVALID_NAME'" in capsys.readouterr().err
+
 
-    kit_group = _load_single_kit_commands(
-        kit_name="test-kit", kit_dir=kit_dir, manifest=manifest, debug=False
+def test_load_kit_with_missing_file(kits_dir: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """A command whose file doesn't exist is reported and not registered."""
+    kit_group = _register_kit(
+        kits_dir, "test-kit", [("test-command", "kit_cli_commands/test-kit/test_command.py")], []
     )
 
-    # Kit group is created but command won't load
-    assert kit_group is not None
+    assert kit_group.get_command(_context(), "test-command") is None
+    assert "Command file not found for 'test-command'" in capsys.readouterr().err
 
 
-def test_load_kit_with_missing_function(tmp_path: Path) -> None:
-    """Test loading kit when function not found in module."""
-    kit_dir = tmp_path / "test-kit"
-    kit_dir.mkdir()
-    commands_dir = kit_dir / "kit_cli_commands" / "test-kit"
-    commands_dir.mkdir(parents=True)
+def test_load_kit_with_import_error(
+    kits_dir: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """A command module that fails to import is reported and not registered."""
 
-    # Create file without the expected function
-    (commands_dir / "test_command.py").write_text(
-        """import click
+    def failing_import(name: str) -> None:
+        raise ImportError(f"No module named {name!r}")
 
-# Missing the test_command function!
-""",
-        encoding="utf-8",
+    monkeypatch.setattr(group_module, "importlib", SimpleNamespace(import_module=failing_import))
+    kit_group = _register_kit(
+        kits_dir,
+        "test-kit",
+        [("test-command", "kit_cli_commands/test-kit/test_command.py")],
+        ["kit_cli_commands/test-kit/test_command.py"],
     )
 
-    manifest = KitManifest(
-        name="test-kit",
-        version="1.0.0",
-        description="Test kit",
-        artifacts={},
-        kit_cli_commands=[
-            KitCliCommandDefinition(
-                name="test-command",
-                path="kit_cli_commands/test-kit/test_command.py",
-                description="Test command",
-            )
-        ],
-    )
+    assert kit_group.get_command(_context(), "test-command") is None
+    assert "Failed to import command 'test-command'" in capsys.readouterr().err
 
-    kit_group = _load_single_kit_commands(
-        kit_name="test-kit", kit_dir=kit_dir, manifest=manifest, debug=False
+
+def test_load_kit_with_missing_function(
+    kits_dir: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """A command module without the expected function is reported."""
+    monkeypatch.setattr(
+        group_module, "importlib", SimpleNamespace(import_module=lambda name: SimpleNamespace())
+    )
+    kit_group = _register_kit(
+        kits_dir,
+        "test-kit",
+        [("test-command", "kit_cli_commands/test-kit/test_command.py")],
+        ["kit_cli_commands/test-kit/test_command.py"],
     )
 
-    # Kit group is created but command won't load
-    assert kit_group is not None
+    assert kit_group.get_command(_context(), "test-command") is None
+    assert "does not have expected function 'test_command'" in capsys.readouterr().err
 
 
-def test_empty_kit_not_registered(tmp_path: Path, empty_manifest: KitManifest) -> None:
-    """Test that kits with no commands return None."""
-    kit_dir = tmp_path / "empty-kit"
-    kit_dir.mkdir()
+def test_empty_kit_not_registered(kits_dir: Path) -> None:
+    """Kits without kit cli commands get no group."""
+    _write_kit(kits_dir, "empty-kit", [], [])
 
-    kit_group = _load_single_kit_commands(
-        kit_name="empty-kit", kit_dir=kit_dir, manifest=empty_manifest, debug=False
-    )
+    _load_kit_commands()
 
-    assert kit_group is None
+    assert "empty-kit" not in kit_command_group.commands
 
 
-def test_kit_directory_missing(tmp_path: Path, valid_manifest: KitManifest) -> None:
-    """Test loading kit when kit directory doesn't exist."""
-    kit_dir = tmp_path / "nonexistent-kit"
-    # Note: NOT creating the directory
+def test_kit_without_manifest_not_registered(kits_dir: Path) -> None:
+    """A kit directory without kit.yaml is skipped."""
+    (kits_dir / "no-manifest-kit").mkdir()
 
-    kit_group = _load_single_kit_commands(
-        kit_name="nonexistent-kit", kit_dir=kit_dir, manifest=valid_manifest, debug=False
-    )
+    _load_kit_commands()
 
-    assert kit_group is None
+    assert "no-manifest-kit" not in kit_command_group.commands
 
 
 def test_lazy_loading_defers_import(tmp_path: Path, valid_manifest: KitManifest) -> None:
@@ -299,82 +281,32 @@ def test_debug_flag_shows_traceback(tmp_path: Path) -> None:
         kit_group._load_commands(ctx)
 
 
-def test_path_construction_simple(tmp_path: Path) -> None:
-    """Test path construction for simple single-level path."""
-    kit_dir = tmp_path / "test-kit"
-    kit_dir.mkdir()
-    commands_dir = kit_dir / "kit_cli_commands" / "test-kit"
-    commands_dir.mkdir(parents=True)
-
-    (commands_dir / "simple.py").write_text(
-        """import click
-
-@click.command()
-def simple():
-    '''Simple command.'''
-    pass
-""",
-        encoding="utf-8",
+def test_path_construction_simple(kits_dir: Path, imported_modules: list[str]) -> None:
+    """A single-level command path maps to a module under the kit."""
+    kit_group = _register_kit(
+        kits_dir,
+        "test-kit",
+        [("simple", "kit_cli_commands/test-kit/simple.py")],
+        ["kit_cli_commands/test-kit/simple.py"],
     )
 
-    manifest = KitManifest(
-        name="test-kit",
-        version="1.0.0",
-        description="Test kit",
-        artifacts={},
-        kit_cli_commands=[
-            KitCliCommandDefinition(
-                name="simple",
-                path="kit_cli_commands/test-kit/simple.py",
-                description="Simple command",
-            )
-        ],
-    )
-
-    kit_group = _load_single_kit_commands(
-        kit_name="test-kit", kit_dir=kit_dir, manifest=manifest, debug=False
-    )
-
-    assert kit_group is not None
-
-
-def test_path_construction_nested(tmp_path: Path) -> None:
-    """Test path construction for nested multi-level path."""
-    kit_dir = tmp_path / "test-kit"
-    kit_dir.mkdir()
-    nested_dir = kit_dir / "kit_cli_commands" / "test-kit" / "a" / "b" / "c"
-    nested_dir.mkdir(parents=True)
+    assert kit_group.get_command(_context(), "simple") is not None
+    assert imported_modules == ["dot_agent_kit.data.kits.test-kit.kit_cli_commands.test-kit.simple"]
 
-    (nested_dir / "nested.py").write_text(
-        """import click
 
-@click.command()
-def nested():
-    '''Nested command.'''
-    pass
-""",
-        encoding="utf-8",
+def test_path_construction_nested(kits_dir: Path, imported_modules: list[str]) -> None:
+    """A nested command path maps to a dotted module path."""
+    kit_group = _register_kit(
+        kits_dir,
+        "test-kit",
+        [("nested", "kit_cli_commands/test-kit/a/b/c/nested.py")],
+        ["kit_cli_commands/test-kit/a/b/c/nested.py"],
     )
 
-    manifest = KitManifest(
-        name="test-kit",
-        version="1.0.0",
-        description="Test kit",
-        artifacts={},
-        kit_cli_commands=[
-            KitCliCommandDefinition(
-                name="nested",
-                path="kit_cli_commands/test-kit/a/b/c/nested.py",
-                description="Nested command",
-            )
-        ],
-    )
-
-    kit_group = _load_single_kit_commands(
-        kit_name="test-kit", kit_dir=kit_dir, manifest=manifest, debug=False
-    )
-
-    assert kit_group is not None
+    assert kit_group.get_command(_context(), "nested") is not None
+    assert imported_modules == [
+        "dot_agent_kit.data.kits.test-kit.kit_cli_commands.test-kit.a.b.c.nested"
+    ]
 
 
 def test_all_commands_fail_to_load_shows_warning(
@@ -495,6 +427,7 @@ kit_cli_commands:
 
     monkeypatch.setattr(group_module, "BundledKitSource", MockSource)
     monkeypatch.setattr(group_module, "KITS_DATA_DIR", kits_dir)
+    monkeypatch.setattr(group_module, "get_kit_index_path", lambda: tmp_path / "kit-index.json")
 
     # Clear any previously loaded commands
     kit_command_group.commands.clear()
@@ -558,6 +491,7 @@ def test_command():
 
     monkeypatch.setattr(group_module, "BundledKitSource", MockSource)
     monkeypatch.setattr(group_module, "KITS_DATA_DIR", kits_dir)
+    monkeypatch.setattr(group_module, "get_kit_index_path", lambda: tmp_path / "kit-index.json")
 
     # Simulate add_command failure for kit1
     original_add_command = kit_command_group.add_command
@@ -581,3 +515,47 @@ def test_command():
 
     # kit2 should have been loaded despite kit1 failure
     assert "kit2" in kit_command_group.commands
+
+
+def test_command_table_imports_only_requested_command(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """With a command table, get_command imports one command without reading a manifest."""
+    from types import SimpleNamespace
+
+    from dot_agent_kit.commands.kit_command import group as group_module
+
+    kit_dir = tmp_path / "test-kit"
+    commands_dir = kit_dir / "kit_cli_commands" / "test-kit"
+    commands_dir.mkdir(parents=True)
+    (commands_dir / "wanted.py").touch()
+    (commands_dir / "other.py").touch()
+
+    imported: list[str] = []
+
+    def fake_import_module(name: str) -> SimpleNamespace:
+        imported.append(name)
+        return SimpleNamespace(wanted=click.Command("wanted"), other=click.Command("other"))
+
+    monkeypatch.setattr(group_module.importlib, "import_module", fake_import_module)
+
+    kit_group = LazyKitGroup(
+        kit_name="test-kit",
+        kit_dir=kit_dir,
+        command_table={
+            "wanted": ("kit_cli_commands/test-kit/wanted.py", "Wanted"),
+            "other": ("kit_cli_commands/test-kit/other.py", "Other"),
+        },
+        name="test-kit",
+        help="Test kit",
+    )
+    ctx = click.Context(click.Command("test"))
+
+    command = kit_group.get_command(ctx, "wanted")
+
+    assert command is not None
+    assert imported == [
+        "dot_agent_kit.data.kits.test-kit.kit_cli_commands.test-kit.wanted",
+    ]
+    assert list(kit_group.commands) == ["wanted"]
+    assert kit_group._manifest is None
@@ -0,0 +1,129 @@
+"""Tests for the cached kit manifest index."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from dot_agent_kit.io import kit_index
+from dot_agent_kit.io.kit_index import KitIndexEntry, KitIndexError, load_kit_index
+
+
+def _write_manifest(kits_dir: Path, kit_name: str, description: str) -> Path:
+    kit_dir = kits_dir / kit_name
+    kit_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = kit_dir / "kit.yaml"
+    manifest_path.write_text(
+        f"""name: {kit_name}
+version: 1.0.0
+description: {description}
+kit_cli_commands:
+  - name: first
+    path: kit_cli_commands/{kit_name}/first.py
+    description: First command
+  - name: second
+    path: kit_cli_commands/{kit_name}/second.py
+    description: Second command
+""",
+        encoding="utf-8",
+    )
+    return manifest_path
+
+
+def _fail_parse(kit_name: str, manifest_path: Path) -> KitIndexEntry:
+    raise AssertionError(f"unexpected parse of {manifest_path}")
+
+
+def test_load_kit_index_reads_command_table(tmp_path: Path) -> None:
+    """Entries carry the kit's name, description and commands in manifest order."""
+    kits_dir = tmp_path / "kits"
+    _write_manifest(kits_dir, "kit-a", "Kit A")
+    (kits_dir / "no-manifest").mkdir()
+
+    results = load_kit_index(kits_dir, ["kit-a", "no-manifest"], tmp_path / "index.json")
+
+    assert len(results) == 1
+    entry = results[0]
+    assert isinstance(entry, KitIndexEntry)
+    assert entry.name == "kit-a"
+    assert entry.description == "Kit A"
+    assert entry.manifest_path == kits_dir / "kit-a" / "kit.yaml"
+    assert entry.commands == {
+        "first": ("kit_cli_commands/kit-a/first.py", "First command"),
+        "second": ("kit_cli_commands/kit-a/second.py", "Second command"),
+    }
+    assert list(entry.commands) == ["first", "second"]
+
+
+def test_cached_entries_skip_manifest_parsing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Unchanged manifests are served from the index file."""
+    kits_dir = tmp_path / "kits"
+    _write_manifest(kits_dir, "kit-a", "Kit A")
+    index_path = tmp_path / "index.json"
+    first = load_kit_index(kits_dir, ["kit-a"], index_path)
+
+    monkeypatch.setattr(kit_index, "_entry_from_manifest", _fail_parse)
+
+    assert load_kit_index(kits_dir, ["kit-a"], index_path) == first
+
+
+def test_changed_manifest_is_reparsed(tmp_path: Path) -> None:
+    """A manifest whose stamp changed is parsed again."""
+    kits_dir = tmp_path / "kits"
+    manifest_path = _write_manifest(kits_dir, "kit-a", "Kit A")
+    index_path = tmp_path / "index.json"
+    load_kit_index(kits_dir, ["kit-a"], index_path)
+
+    _write_manifest(kits_dir, "kit-a", "Kit A, revised")
+    stat = manifest_path.stat()
+    os.utime(manifest_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    results = load_kit_index(kits_dir, ["kit-a"], index_path)
+
+    assert isinstance(results[0], KitIndexEntry)
+    assert results[0].description == "Kit A, revised"
+
+
+def test_invalid_manifest_is_reported_and_not_cached(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A manifest that fails to parse yields an error without hiding other kits."""
+    kits_dir = tmp_path / "kits"
+    _write_manifest(kits_dir, "good", "Good kit")
+    bad_dir = kits_dir / "bad"
+    bad_dir.mkdir()
+    (bad_dir / "kit.yaml").write_text("name: [unclosed\n", encoding="utf-8")
+    index_path = tmp_path / "index.json"
+
+    results = load_kit_index(kits_dir, ["bad", "good"], index_path)
+
+    assert isinstance(results[0], KitIndexError)
+    assert results[0].kit_name == "bad"
+    assert isinstance(results[1], KitIndexEntry)
+
+    calls: list[str] = []
+    original = kit_index._entry_from_manifest
+
+    def tracking(kit_name: str, manifest_path: Path) -> KitIndexEntry:
+        calls.append(kit_name)
+        return original(kit_name, manifest_path)
+
+    monkeypatch.setattr(kit_index, "_entry_from_manifest", tracking)
+    load_kit_index(kits_dir, ["bad", "good"], index_path)
+
+    assert calls == ["bad"]
+
+
+def test_corrupt_index_is_treated_as_empty(tmp_path: Path) -> None:
+    """An unreadable index file is rebuilt from the manifests."""
+    kits_dir = tmp_path / "kits"
+    _write_manifest(kits_dir, "kit-a", "Kit A")
+    index_path = tmp_path / "index.json"
+    index_path.write_text("{not json", encoding="utf-8")
+
+    results = load_kit_index(kits_dir, ["kit-a"], index_path)
+
+    assert isinstance(results[0], KitIndexEntry)
+    assert "kit-a" in index_path.read_text(encoding="utf-8")
@@ -4,9 +4,21 @@ import subprocess
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
 from click.testing import CliRunner
 
 from dot_agent_kit.cli import cli
+from dot_agent_kit.commands.md import check as check_module
+
+
+@pytest.fixture(autouse=True)
+def _resolve_repo_root_with_git(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Route repo root detection through the mocked `git rev-parse`.
+
+    Otherwise the .git layout of the working directory (this repository)
+    would be found without running git.
+    """
+    monkeypatch.setattr(check_module, "read_git_layout", lambda start: None)
 
 
 def test_check_passes_with_valid_files(tmp_path: Path) -> None:
@@ -537,3 +549,22 @@ def test_check_finds_all_markdown_files(tmp_path: Path) -> None:
     assert result.exit_code == 1
     assert "Broken @ references:" in result.output
     assert "@nonexistent.md" in result.output
+
+
+def test_check_finds_repo_root_without_git(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """The repo root comes from the .git layout when it can be read directly."""
+    from erk_shared.git.layout import read_git_layout
+
+    monkeypatch.setattr(check_module, "read_git_layout", read_git_layout)
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main\n", encoding="utf-8")
+    (tmp_path / "AGENTS.md").write_text("# Standards", encoding="utf-8")
+    (tmp_path / "CLAUDE.md").write_text("@AGENTS.md", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+
+    with patch("subprocess.run") as mock_run:
+        result = CliRunner().invoke(cli, ["md", "check"])
+
+    assert result.exit_code == 0
+    assert "CLAUDE.md files checked: 1" in result.output
+    mock_run.assert_not_called()
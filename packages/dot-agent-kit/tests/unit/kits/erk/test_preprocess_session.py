@@ -3,7 +3,9 @@
 Tests all functions in preprocess_session.py with real session data fixtures.
 """
 
+import io
 import json
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
@@ -19,11 +21,14 @@ from dot_agent_kit.data.kits.erk.kit_cli_commands.erk.preprocess_session import
     is_empty_session,
     is_log_discovery_operation,
     is_warmup_session,
+    iter_log_entries,
     preprocess_session,
     process_log_file,
     prune_tool_result_content,
+    screen_session,
     truncate_parameter_value,
     truncate_tool_parameters,
+    write_compressed_xml,
 )
 
 from . import fixtures
@@ -992,3 +997,117 @@ def test_preprocess_session_backward_compatibility(tmp_path: Path) -> None:
 
         # Should NOT output XML to stdout
         assert "<session>" not in result.output
+
+
+# ============================================================================
+# 10. Streaming Pipeline Tests
+# ============================================================================
+
+
+def _user(text: str) -> dict:
+    return {"type": "user", "message": {"content": text}}
+
+
+def _assistant(text: str) -> dict:
+    return {"type": "assistant", "message": {"content": [{"type": "text", "text": text}]}}
+
+
+def test_iter_log_entries_decodes_lazily(tmp_path: Path) -> None:
+    """Lines are decoded only as entries are consumed."""
+    log_file = tmp_path / "session.jsonl"
+    log_file.write_text(
+        json.dumps(_user("first")) + "\n\n" + json.dumps(_user("second")) + "\n{invalid json}",
+        encoding="utf-8",
+    )
+
+    entries = iter_log_entries(log_file)
+
+    assert next(entries)["message"]["content"] == "first"
+    assert next(entries)["message"]["content"] == "second"
+    with pytest.raises(json.JSONDecodeError):
+        next(entries)
+
+
+def test_screen_session_matches_list_checks() -> None:
+    """screen_session gives the same verdicts as is_empty_session/is_warmup_session."""
+    sessions = [
+        [],
+        [_user("hi"), _assistant("hello")],
+        [_user("hi"), _assistant(" "), _user("still there?")],
+        [_user("warmup"), _assistant("ready"), _user("ok")],
+        [_user("hi"), _assistant("hello"), _user("bye"), _assistant("later")],
+    ]
+
+    for entries in sessions:
+        expected = None
+        if is_empty_session(entries):
+            expected = "empty"
+        elif is_warmup_session(entries):
+            expected = "warmup"
+
+        reason, remaining = screen_session(iter(entries))
+
+        assert reason == expected
+        if reason is None:
+            assert list(remaining) == entries
+
+
+def test_screen_session_stops_reading_once_decided() -> None:
+    """A meaningful session is classified from its first entries only."""
+    consumed: list[dict] = []
+
+    def stream() -> Iterator[dict]:
+        for entry in [_user("hi"), _assistant("hello"), _user("more")] * 1000:
+            consumed.append(entry)
+            yield entry
+
+    reason, remaining = screen_session(stream())
+
+    assert reason is None
+    assert len(consumed) == 3
+    assert sum(1 for _ in remaining) == 3000
+
+
+def test_write_compressed_xml_matches_generate(tmp_path: Path) -> None:
+    """Streaming XML output is identical to generate_compressed_xml, including late gitBranch."""
+    entries = [
+        _user("hi"),
+        {**_assistant("hello"), "gitBranch": "feature"},
+        _user("bye"),
+    ]
+    out = io.StringIO()
+
+    written = write_compressed_xml(iter(entries), out, source_label="agent-1")
+
+    expected = generate_compressed_xml(entries, source_label="agent-1")
+    assert out.getvalue() == expected
+    assert written == len(expected)
+    assert expected.index('<meta branch="feature" />') < expected.index("<user>hi</user>")
+
+
+def test_discover_planning_agent_logs_reads_only_first_line(tmp_path: Path) -> None:
+    """Agent logs are matched on their first line; later lines are never parsed."""
+    session_log = tmp_path / "session-123.jsonl"
+    session_log.write_text(
+        json.dumps(
+            {
+                "type": "assistant",
+                "message": {
+                    "content": [
+                        {"type": "tool_use", "name": "Task", "input": {"subagent_type": "Plan"}}
+                    ],
+                    "timestamp": 1000.0,
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+    agent_log = tmp_path / "agent-abc.jsonl"
+    agent_log.write_text(
+        json.dumps({"sessionId": "session-123", "message": {"timestamp": 1000.2}})
+        + "\n{not json at all",
+        encoding="utf-8",
+    )
+    (tmp_path / "agent-empty.jsonl").write_text("", encoding="utf-8")
+
+    assert discover_planning_agent_logs(session_log, "session-123") == [agent_log]
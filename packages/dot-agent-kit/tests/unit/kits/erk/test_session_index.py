@@ -0,0 +1,178 @@
+"""Unit tests for the persistent Claude Code session index."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from dot_agent_kit.data.kits.erk import session_index
+from dot_agent_kit.data.kits.erk.kit_cli_commands.erk.session_id_injector_hook import (
+    session_id_injector_hook,
+)
+from dot_agent_kit.data.kits.erk.session_index import SessionIndex, read_session_ids
+
+
+def _write_log(path: Path, *session_ids: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lines = [json.dumps({"sessionId": sid, "type": "user"}) for sid in session_ids]
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _index(tmp_path: Path) -> SessionIndex:
+    return SessionIndex(tmp_path / "projects", tmp_path / "cache" / "index.json")
+
+
+def test_read_session_ids_uses_file_name_and_leading_entries(tmp_path: Path) -> None:
+    """Main logs are keyed by file name and by sessionId fields; agent logs by fields only."""
+    main_log = tmp_path / "abc.jsonl"
+    _write_log(main_log, "abc", "parent")
+    agent_log = tmp_path / "agent-1.jsonl"
+    _write_log(agent_log, "abc")
+
+    assert read_session_ids(main_log) == ["abc", "parent"]
+    assert read_session_ids(agent_log) == ["abc"]
+
+
+def test_lookup_finds_session_and_prefers_main_log(tmp_path: Path) -> None:
+    """A session's own log wins over agent logs that mention it."""
+    project = tmp_path / "projects" / "-repo"
+    _write_log(project / "agent-1.jsonl", "s1")
+    _write_log(project / "s1.jsonl", "s1")
+
+    location = _index(tmp_path).lookup("s1")
+
+    assert location is not None
+    assert location.project_dir == project
+    assert location.log_path == project / "s1.jsonl"
+    assert _index(tmp_path).lookup("missing") is None
+
+
+def test_lookup_reuses_persisted_index(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A fresh index instance answers from disk without re-reading unchanged logs."""
+    project = tmp_path / "projects" / "-repo"
+    _write_log(project / "log.jsonl", "s1")
+    assert _index(tmp_path).lookup("s1") is not None
+
+    def fail(log_path: Path) -> list[str]:
+        raise AssertionError(f"unexpected read of {log_path}")
+
+    monkeypatch.setattr(session_index, "read_session_ids", fail)
+
+    location = _index(tmp_path).lookup("s1")
+
+    assert location is not None
+    assert location.project_dir == project
+
+
+def test_lookup_rescans_only_changed_directories(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """New logs are found by re-listing just the directory whose mtime changed."""
+    changed = tmp_path / "projects" / "-changed"
+    unchanged = tmp_path / "projects" / "-unchanged"
+    _write_log(changed / "old.jsonl", "s-old")
+    _write_log(unchanged / "other.jsonl", "s-other")
+    _index(tmp_path).lookup("s-old")
+
+    _write_log(changed / "new.jsonl", "s-new")
+    _bump_mtime(changed)
+    reads: list[Path] = []
+    original = session_index.read_session_ids
+
+    def tracking(log_path: Path) -> list[str]:
+        reads.append(log_path)
+        return original(log_path)
+
+    monkeypatch.setattr(session_index, "read_session_ids", tracking)
+
+    location = _index(tmp_path).lookup("s-new")
+
+    assert location is not None
+    assert location.project_dir == changed
+    assert reads == [changed / "new.jsonl"]
+
+
+def test_lookup_miss_falls_back_to_full_rebuild(tmp_path: Path) -> None:
+    """Sessions hidden from the incremental scan are found by a rebuild."""
+    project = tmp_path / "projects" / "-repo"
+    log = project / "log.jsonl"
+    _write_log(log, "s1")
+    _index(tmp_path).lookup("s1")
+
+    # Rewriting a file leaves the directory mtime alone
+    _write_log(log, "s1", "s2")
+    _bump_mtime(log)
+
+    location = _index(tmp_path).lookup("s2")
+
+    assert location is not None
+    assert location.log_path == log
+
+
+def test_recorded_session_skips_scanning(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Sessions recorded by the hook resolve directly; stale records are ignored."""
+    project = tmp_path / "projects" / "-repo"
+    log = project / "s1.jsonl"
+    _write_log(log, "s1")
+    _index(tmp_path).record("s1", log)
+    _index(tmp_path).record("gone", project / "gone.jsonl")
+
+    def fail(self: SessionIndex) -> None:
+        raise AssertionError("unexpected scan")
+
+    monkeypatch.setattr(SessionIndex, "refresh", fail)
+
+    location = _index(tmp_path).lookup("s1")
+    assert location is not None
+    assert location.log_path == log
+
+    with pytest.raises(AssertionError, match="unexpected scan"):
+        _index(tmp_path).lookup("gone")
+
+
+def test_project_logs_lists_one_directory(tmp_path: Path) -> None:
+    """project_logs returns sorted *.jsonl names for a single project."""
+    project = tmp_path / "projects" / "-repo"
+    _write_log(project / "b.jsonl", "b")
+    _write_log(project / "agent-a.jsonl", "b")
+    (project / "notes.txt").write_text("x", encoding="utf-8")
+
+    assert _index(tmp_path).project_logs("-repo") == ["agent-a.jsonl", "b.jsonl"]
+    assert _index(tmp_path).project_logs("-missing") == []
+
+
+def test_corrupt_index_is_rebuilt(tmp_path: Path) -> None:
+    """An unreadable index file is treated as empty."""
+    _write_log(tmp_path / "projects" / "-repo" / "s1.jsonl", "s1")
+    index_path = tmp_path / "cache" / "index.json"
+    index_path.parent.mkdir(parents=True)
+    index_path.write_text("{not json", encoding="utf-8")
+
+    assert _index(tmp_path).lookup("s1") is not None
+
+
+def test_session_id_injector_hook_records_transcript(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The hook records the transcript path Claude Code reports for the session."""
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    transcript = tmp_path / ".claude" / "projects" / "-repo" / "s1.jsonl"
+    _write_log(transcript, "s1")
+
+    result = CliRunner().invoke(
+        session_id_injector_hook,
+        input=json.dumps({"session_id": "s1", "transcript_path": str(transcript)}),
+    )
+
+    assert result.exit_code == 0
+    assert "session_id=s1" in result.output
+    location = session_index.default_session_index().lookup("s1")
+    assert location is not None
+    assert location.log_path == transcript
@@ -11,10 +11,10 @@ Import from submodules:
 - impl_folder: IssueReference, read_issue_reference, etc.
 - naming: sanitize_worktree_name, generate_filename_from_title
 - output.output: user_output, machine_output, format_duration
-- subprocess_utils: run_subprocess_with_context
+- subprocess_utils: run_subprocess, run_subprocess_with_context
 - integrations.graphite.*: Graphite, RealGraphite, FakeGraphite, etc.
 - integrations.time.*: Time, RealTime
-- integrations.parallel.*: ParallelTaskRunner, RealParallelTaskRunner
+- integrations.parallel.*: ParallelTaskRunner, RealParallelTaskRunner, TaskScope
 """
 
 __version__ = "0.1.0"
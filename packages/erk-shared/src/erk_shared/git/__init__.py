@@ -3,4 +3,6 @@
 Import from submodules:
 - abc: Git, WorktreeInfo, find_worktree_for_branch
 - real: RealGit
+- layout: GitLayout, read_git_layout
+- plumbing: GitRefReader, PlumbingGit
 """
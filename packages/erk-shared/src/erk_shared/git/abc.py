@@ -350,6 +350,23 @@ class Git(ABC):
         """
         ...
 
+    @abstractmethod
+    def get_branch_heads(self, repo_root: Path, branches: list[str]) -> dict[str, str]:
+        """Get the commit SHAs at the heads of many local branches at once.
+
+        Bulk alternative to calling get_branch_head in a loop, for callers that
+        need heads for every tracked branch (e.g. Graphite metadata enrichment).
+
+        Args:
+            repo_root: Path to the git repository root
+            branches: Local branch names to query
+
+        Returns:
+            Mapping of branch name to commit SHA. Branches that don't exist
+            are omitted.
+        """
+        ...
+
     @abstractmethod
     def get_commit_message(self, repo_root: Path, commit_sha: str) -> str | None:
         """Get the commit message for a given commit SHA.
@@ -481,6 +498,20 @@ class Git(ABC):
         """
         ...
 
+    @abstractmethod
+    def get_all_branch_issues(self, repo_root: Path) -> dict[str, int]:
+        """Get every branch's GitHub issue number from git config at once.
+
+        Bulk alternative to calling get_branch_issue per branch.
+
+        Args:
+            repo_root: Path to the git repository root
+
+        Returns:
+            Mapping of branch name to issue number for branches that have one
+        """
+        ...
+
     @abstractmethod
     def fetch_pr_ref(self, repo_root: Path, remote: str, pr_number: int, local_branch: str) -> None:
         """Fetch a PR ref into a local branch.
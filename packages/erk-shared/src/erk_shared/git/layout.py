@@ -0,0 +1,163 @@
+"""Resolve a repository's layout from the .git file structure without running git.
+
+Every erk command starts by asking where the repository is. `git rev-parse`
+answers that, but costs a process spawn on every invocation, including the
+shell-integration hot path. For ordinary checkouts and linked worktrees the
+answer is fully determined by the file layout:
+
+- a main checkout has a `.git` directory
+- a linked worktree has a `.git` file containing `gitdir: <path>`, and that
+  per-worktree git directory has a `commondir` file pointing at the shared
+  `.git` directory
+
+Anything that changes how git discovers repositories (GIT_DIR and friends,
+core.worktree, bare repositories, per-worktree config) is not modelled here;
+read_git_layout returns None and callers fall back to asking git.
+"""
+
+import os
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+
+# Environment variables that change where git looks for the repository
+GIT_DISCOVERY_ENV_VARS = (
+    "GIT_DIR",
+    "GIT_COMMON_DIR",
+    "GIT_WORK_TREE",
+    "GIT_CEILING_DIRECTORIES",
+    "GIT_DISCOVERY_ACROSS_FILESYSTEM",
+)
+
+_GITDIR_PREFIX = "gitdir:"
+
+
+@dataclass(frozen=True)
+class GitLayout:
+    """Where a working tree's git data lives.
+
+    Attributes:
+        worktree_root: Top-level directory of the current working tree
+            (what `git rev-parse --show-toplevel` prints)
+        git_dir: Git directory of the current working tree; for linked
+            worktrees this is .git/worktrees/<name> in the main repository
+        common_dir: Git directory shared by all worktrees
+            (what `git rev-parse --git-common-dir` prints)
+    """
+
+    worktree_root: Path
+    git_dir: Path
+    common_dir: Path
+
+
+def has_git_discovery_overrides(environ: Mapping[str, str] | None = None) -> bool:
+    """Check whether the environment changes how git discovers repositories.
+
+    Args:
+        environ: Environment to inspect (defaults to os.environ)
+
+    Returns:
+        True if any GIT_DISCOVERY_ENV_VARS variable is set
+    """
+    env = environ if environ is not None else os.environ
+    return any(name in env for name in GIT_DISCOVERY_ENV_VARS)
+
+
+def read_git_layout(start: Path) -> GitLayout | None:
+    """Find the working tree containing `start` by walking up to its `.git` entry.
+
+    Args:
+        start: Directory to start searching from
+
+    Returns:
+        The layout, or None if it can't be determined from the file layout
+        alone: not inside a working tree, inside a git directory, git
+        discovery environment variables are set, or the repository uses
+        core.worktree, core.bare or per-worktree config
+    """
+    if has_git_discovery_overrides():
+        return None
+
+    current = start.resolve()
+    for directory in [current, *current.parents]:
+        dot_git = directory / ".git"
+        if dot_git.is_dir():
+            git_dir = dot_git
+        elif dot_git.is_file():
+            resolved = _read_gitdir_file(dot_git)
+            if resolved is None:
+                return None
+            git_dir = resolved
+        else:
+            continue
+
+        if not (git_dir / "HEAD").is_file():
+            return None
+        # Inside the git directory itself there is no working tree
+        if current == git_dir or current.is_relative_to(git_dir):
+            return None
+
+        common_dir = _read_common_dir(git_dir)
+        if common_dir is None or _has_unsupported_config(git_dir, common_dir):
+            return None
+        return GitLayout(worktree_root=directory, git_dir=git_dir, common_dir=common_dir)
+
+    return None
+
+
+def _read_gitdir_file(dot_git: Path) -> Path | None:
+    content = dot_git.read_text(encoding="utf-8").strip()
+    if not content.startswith(_GITDIR_PREFIX):
+        return None
+    target = Path(content[len(_GITDIR_PREFIX) :].strip())
+    if not target.is_absolute():
+        target = dot_git.parent / target
+    if not target.is_dir():
+        return None
+    return target.resolve()
+
+
+def _read_common_dir(git_dir: Path) -> Path | None:
+    commondir_file = git_dir / "commondir"
+    if not commondir_file.is_file():
+        return git_dir
+
+    target = Path(commondir_file.read_text(encoding="utf-8").strip())
+    if not target.is_absolute():
+        target = git_dir / target
+    if not target.is_dir():
+        return None
+    return target.resolve()
+
+
+def _has_unsupported_config(git_dir: Path, common_dir: Path) -> bool:
+    # Per-worktree config can override anything below; leave it to git
+    if (git_dir / "config.worktree").exists():
+        return True
+
+    config_path = common_dir / "config"
+    if not config_path.is_file():
+        return False
+
+    in_core = False
+    for raw_line in config_path.read_text(encoding="utf-8").splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith(("#", ";")):
+            continue
+        if line.startswith("["):
+            section = line.lower()
+            # Included files may set anything; don't follow them
+            if section.startswith("[include"):
+                return True
+            in_core = section.startswith("[core]")
+            continue
+        if not in_core:
+            continue
+        key, _, value = line.partition("=")
+        key = key.strip().lower()
+        if key == "worktree":
+            return True
+        if key == "bare" and value.strip().lower() in ("", "true", "yes", "on", "1"):
+            return True
+
+    return False
@@ -0,0 +1,319 @@
+"""Read-only git plumbing reader backed by the .git directory layout.
+
+Listing worktrees, reading the current branch and resolving branch heads are
+the most frequent git queries erk makes, and each used to cost a `git`
+process. The answers live in a handful of small files:
+
+- `<common>/HEAD` and `<common>/worktrees/<name>/HEAD` hold each worktree's
+  checked-out ref; `<common>/worktrees/<name>/gitdir` points at the linked
+  worktree's `.git` file
+- loose refs are files under `<common>/refs/`, and everything else is in
+  `<common>/packed-refs`
+
+GitRefReader reads them directly. PlumbingGit layers it over RealGit: the
+read-heavy queries are answered from files, and anything the reader doesn't
+model (see read_git_layout, reftable repositories, revision expressions) is
+delegated to git. With `verify=True` every file-based answer is checked
+against git, which is how the integration tests keep the two in sync.
+"""
+
+import os
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from erk_shared.git.abc import WorktreeInfo
+from erk_shared.git.layout import GitLayout, read_git_layout
+from erk_shared.git.real import RealGit
+
+_SYMREF_PREFIX = "ref: "
+_HEADS_PREFIX = "refs/heads/"
+_MAX_SYMREF_DEPTH = 5
+
+# Names that are plain ref names, as opposed to revision expressions
+# (HEAD~1, main^{tree}, @{upstream}, a..b) that only git can evaluate
+_PLAIN_REF_NAME = re.compile(r"^(?!.*\.\.)(?!.*@\{)[A-Za-z0-9._/-]+$")
+
+
+@dataclass(frozen=True)
+class HeadState:
+    """What a worktree's HEAD points at.
+
+    Attributes:
+        branch: Checked-out branch name, or None if detached
+        sha: Commit SHA HEAD resolves to, or None for an unborn branch
+    """
+
+    branch: str | None
+    sha: str | None
+
+
+class PlumbingMismatchError(Exception):
+    """Raised in verify mode when a file-based answer disagrees with git."""
+
+    def __init__(self, operation: str, plumbing: object, git: object) -> None:
+        super().__init__(
+            f"{operation}: plumbing reader returned {plumbing!r}, git returned {git!r}"
+        )
+        self.operation = operation
+        self.plumbing = plumbing
+        self.git = git
+
+
+class GitRefReader:
+    """Reads refs and worktree metadata from a repository's common git directory."""
+
+    def __init__(self, common_dir: Path) -> None:
+        """Create a reader.
+
+        Args:
+            common_dir: The repository's shared git directory (usually <repo>/.git)
+        """
+        self._common_dir = common_dir
+        self._packed_stamp: tuple[int, int] | None = None
+        self._packed: dict[str, str] = {}
+
+    @property
+    def supported(self) -> bool:
+        """Whether refs are stored as files (reftable repositories are not)."""
+        return not (self._common_dir / "reftable").exists()
+
+    def resolve_ref(self, refname: str) -> str | None:
+        """Resolve a full ref name (e.g. refs/heads/main) to a SHA.
+
+        Loose refs take precedence over packed-refs, and symbolic refs are
+        followed.
+
+        Returns:
+            The SHA, or None if the ref doesn't exist
+        """
+        for _ in range(_MAX_SYMREF_DEPTH):
+            loose = self._common_dir / refname
+            if loose.is_file():
+                content = loose.read_text(encoding="utf-8").strip()
+                if content.startswith(_SYMREF_PREFIX):
+                    refname = content[len(_SYMREF_PREFIX) :].strip()
+                    continue
+                return content
+            return self._read_packed_refs().get(refname)
+        return None
+
+    def read_refs(self, prefix: str) -> dict[str, str]:
+        """Read every ref under a prefix, e.g. refs/heads/.
+
+        Args:
+            prefix: Ref name prefix ending in "/"
+
+        Returns:
+            Mapping of full ref name to SHA
+        """
+        refs = {
+            name: sha for name, sha in self._read_packed_refs().items() if name.startswith(prefix)
+        }
+
+        loose_root = self._common_dir / prefix
+        if not loose_root.is_dir():
+            return refs
+        for dirpath, _dirnames, filenames in os.walk(loose_root):
+            for filename in filenames:
+                refname = Path(dirpath, filename).relative_to(self._common_dir).as_posix()
+                sha = self.resolve_ref(refname)
+                if sha is not None:
+                    refs[refname] = sha
+        return refs
+
+    def read_head(self, git_dir: Path) -> HeadState | None:
+        """Read a worktree's HEAD.
+
+        Args:
+            git_dir: The worktree's git directory (common dir for the main worktree)
+
+        Returns:
+            HeadState, or None if HEAD is missing or points outside refs/heads/
+        """
+        head_file = git_dir / "HEAD"
+        if not head_file.is_file():
+            return None
+
+        content = head_file.read_text(encoding="utf-8").strip()
+        if not content.startswith(_SYMREF_PREFIX):
+            return HeadState(branch=None, sha=content)
+
+        refname = content[len(_SYMREF_PREFIX) :].strip()
+        if not refname.startswith(_HEADS_PREFIX):
+            return None
+        return HeadState(branch=refname[len(_HEADS_PREFIX) :], sha=self.resolve_ref(refname))
+
+    def list_worktrees(self) -> list[WorktreeInfo] | None:
+        """List worktrees in `git worktree list` order: main first, then by path.
+
+        Returns:
+            Worktrees, or None if the main worktree can't be located from the
+            common dir (bare repositories, separate git dirs)
+        """
+        if self._common_dir.name != ".git":
+            return None
+        main_head = self.read_head(self._common_dir)
+        main = WorktreeInfo(
+            path=self._common_dir.parent,
+            branch=main_head.branch if main_head is not None else None,
+            is_root=True,
+        )
+
+        linked: list[WorktreeInfo] = []
+        worktrees_dir = self._common_dir / "worktrees"
+        if worktrees_dir.is_dir():
+            for entry in worktrees_dir.iterdir():
+                gitdir_file = entry / "gitdir"
+                if not gitdir_file.is_file():
+                    continue
+                # The worktree's .git file, relative to this directory when
+                # the worktree was added with worktree.useRelativePaths
+                dot_git = os.path.normpath(entry / gitdir_file.read_text(encoding="utf-8").strip())
+                head = self.read_head(entry)
+                linked.append(
+                    WorktreeInfo(
+                        path=Path(dot_git.removesuffix("/.git")),
+                        branch=head.branch if head is not None else None,
+                    )
+                )
+
+        linked.sort(key=lambda worktree: str(worktree.path))
+        return [main, *linked]
+
+    def _read_packed_refs(self) -> dict[str, str]:
+        packed_path = self._common_dir / "packed-refs"
+        if not packed_path.is_file():
+            return {}
+
+        stat = packed_path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp == self._packed_stamp:
+            return self._packed
+
+        packed: dict[str, str] = {}
+        for line in packed_path.read_text(encoding="utf-8").splitlines():
+            # Header and peeled-tag lines
+            if not line or line.startswith(("#", "^")):
+                continue
+            sha, _, refname = line.partition(" ")
+            packed[refname] = sha
+
+        self._packed_stamp = stamp
+        self._packed = packed
+        return packed
+
+
+def _dwim_candidates(name: str) -> list[str]:
+    """Full ref names git tries for a short name, in precedence order."""
+    if name.startswith("refs/"):
+        return [name]
+    return [
+        f"refs/{name}",
+        f"refs/tags/{name}",
+        f"refs/heads/{name}",
+        f"refs/remotes/{name}",
+        f"refs/remotes/{name}/HEAD",
+    ]
+
+
+class PlumbingGit(RealGit):
+    """RealGit that answers read-heavy queries from the .git directory.
+
+    Selected with `git_backend = "plumbing"` in ~/.erk/config.toml.
+    list_worktrees, get_current_branch, get_branch_head, get_branch_heads,
+    is_branch_checked_out and find_worktree_for_branch run without spawning
+    git; every other operation, and any case the file reader can't answer
+    exactly, goes through RealGit.
+    """
+
+    def __init__(self, *, verify: bool = False) -> None:
+        """Create the plumbing-backed Git.
+
+        Args:
+            verify: Also ask git for every file-based answer and raise
+                PlumbingMismatchError if they differ (for tests)
+        """
+        self._verify = verify
+        self._readers: dict[Path, GitRefReader] = {}
+
+    def list_worktrees(self, repo_root: Path) -> list[WorktreeInfo]:
+        """List all worktrees in the repository."""
+        reader = self._reader(repo_root)
+        worktrees = reader.list_worktrees() if reader is not None else None
+        if worktrees is None:
+            return super().list_worktrees(repo_root)
+        return self._checked("list_worktrees", worktrees, super().list_worktrees, repo_root)
+
+    def get_current_branch(self, cwd: Path) -> str | None:
+        """Get the currently checked-out branch."""
+        layout = read_git_layout(cwd)
+        if layout is None:
+            return super().get_current_branch(cwd)
+        reader = self._reader_for_layout(layout)
+        head = reader.read_head(layout.git_dir) if reader is not None else None
+        if head is None:
+            return super().get_current_branch(cwd)
+        # Like `git rev-parse --abbrev-ref HEAD`: detached and unborn are None
+        branch = head.branch if head.sha is not None else None
+        return self._checked("get_current_branch", branch, super().get_current_branch, cwd)
+
+    def get_branch_head(self, repo_root: Path, branch: str) -> str | None:
+        """Get the commit SHA at the head of a branch.
+
+        Only plain ref names are resolved from files, using git's
+        refs/, tags, heads, remotes precedence. Revision expressions, pseudo
+        refs like HEAD, and names that match no ref (which may be SHAs) go to
+        git.
+        """
+        reader = self._reader(repo_root)
+        if reader is None or _PLAIN_REF_NAME.match(branch) is None or branch.isupper():
+            return super().get_branch_head(repo_root, branch)
+
+        for refname in _dwim_candidates(branch):
+            sha = reader.resolve_ref(refname)
+            if sha is not None:
+                return self._checked(
+                    "get_branch_head", sha, super().get_branch_head, repo_root, branch
+                )
+        return super().get_branch_head(repo_root, branch)
+
+    def get_branch_heads(self, repo_root: Path, branches: list[str]) -> dict[str, str]:
+        """Get commit SHAs for many local branches from loose and packed refs."""
+        reader = self._reader(repo_root)
+        if reader is None:
+            return super().get_branch_heads(repo_root, branches)
+
+        local = reader.read_refs(_HEADS_PREFIX)
+        heads = {
+            branch: local[_HEADS_PREFIX + branch]
+            for branch in branches
+            if _HEADS_PREFIX + branch in local
+        }
+        return self._checked(
+            "get_branch_heads", heads, super().get_branch_heads, repo_root, branches
+        )
+
+    def _reader(self, path: Path) -> GitRefReader | None:
+        layout = read_git_layout(path)
+        if layout is None:
+            return None
+        return self._reader_for_layout(layout)
+
+    def _reader_for_layout(self, layout: GitLayout) -> GitRefReader | None:
+        reader = self._readers.get(layout.common_dir)
+        if reader is None:
+            reader = GitRefReader(layout.common_dir)
+            self._readers[layout.common_dir] = reader
+        if not reader.supported:
+            return None
+        return reader
+
+    def _checked[T](self, operation: str, value: T, git_call: Callable[..., T], *args: object) -> T:
+        if not self._verify:
+            return value
+        expected = git_call(*args)
+        if value != expected:
+            raise PlumbingMismatchError(operation, value, expected)
+        return value
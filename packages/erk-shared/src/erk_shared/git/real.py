@@ -7,11 +7,11 @@ the main erk package and dot-agent-kit without circular dependencies.
 
 import os
 import re
-import subprocess
 from pathlib import Path
 
 from erk_shared.git.abc import BranchSyncInfo, Git, WorktreeInfo
-from erk_shared.subprocess_utils import run_subprocess_with_context
+from erk_shared.git.layout import read_git_layout
+from erk_shared.subprocess_utils import run_subprocess, run_subprocess_with_context
 
 
 class RealGit(Git):
@@ -59,7 +59,7 @@ class RealGit(Git):
 
     def get_current_branch(self, cwd: Path) -> str | None:
         """Get the currently checked-out branch."""
-        result = subprocess.run(
+        result = run_subprocess(
             ["git", "rev-parse", "--abbrev-ref", "HEAD"],
             cwd=cwd,
             capture_output=True,
@@ -79,7 +79,7 @@ class RealGit(Git):
         """Detect the default branch (main or master)."""
         # If trunk is explicitly configured, validate and use it
         if configured is not None:
-            result = subprocess.run(
+            result = run_subprocess(
                 ["git", "rev-parse", "--verify", configured],
                 cwd=repo_root,
                 capture_output=True,
@@ -95,7 +95,7 @@ class RealGit(Git):
             raise RuntimeError(error_msg)
 
         # Auto-detection: try remote HEAD first
-        result = subprocess.run(
+        result = run_subprocess(
             ["git", "symbolic-ref", "refs/remotes/origin/HEAD"],
             cwd=repo_root,
             capture_output=True,
@@ -110,7 +110,7 @@ class RealGit(Git):
 
         # Fallback: check master first, then main
         for candidate in ["master", "main"]:
-            result = subprocess.run(
+            result = run_subprocess(
                 ["git", "rev-parse", "--verify", candidate],
                 cwd=repo_root,
                 capture_output=True,
@@ -129,7 +129,7 @@ class RealGit(Git):
         checking for existence of common trunk branch names if detection fails.
         """
         # 1. Try git symbolic-ref to detect default branch
-        result = subprocess.run(
+        result = run_subprocess(
             ["git", "symbolic-ref", "refs/remotes/origin/HEAD"],
             cwd=repo_root,
             capture_output=True,
@@ -144,7 +144,7 @@ class RealGit(Git):
 
         # 2. Fallback: try 'main' then 'master', use first that exists
         for candidate in ["main", "master"]:
-            result = subprocess.run(
+            result = run_subprocess(
                 ["git", "show-ref", "--verify", f"refs/heads/{candidate}"],
                 cwd=repo_root,
                 capture_output=True,
@@ -184,8 +184,16 @@ class RealGit(Git):
         )
 
     def get_git_common_dir(self, cwd: Path) -> Path | None:
-        """Get the common git directory."""
-        result = subprocess.run(
+        """Get the common git directory.
+
+        Resolved from the .git file layout when possible; git is only run
+        for setups read_git_layout doesn't model.
+        """
+        layout = read_git_layout(cwd)
+        if layout is not None:
+            return layout.common_dir
+
+        result = run_subprocess(
             ["git", "rev-parse", "--git-common-dir"],
             cwd=cwd,
             capture_output=True,
@@ -203,7 +211,7 @@ class RealGit(Git):
 
     def has_staged_changes(self, repo_root: Path) -> bool:
         """Check if the repository has staged changes."""
-        result = subprocess.run(
+        result = run_subprocess(
             ["git", "diff", "--cached", "--quiet"],
             cwd=repo_root,
             capture_output=True,
@@ -217,7 +225,7 @@ class RealGit(Git):
 
     def has_uncommitted_changes(self, cwd: Path) -> bool:
         """Check if a worktree has uncommitted changes."""
-        result = subprocess.run(
+        result = run_subprocess(
             ["git", "status", "--porcelain"],
             cwd=cwd,
             capture_output=True,
@@ -235,7 +243,7 @@ class RealGit(Git):
             return False
 
         # Check for uncommitted changes using diff-index (respects git config)
-        result = subprocess.run(
+        result = run_subprocess(
             ["git", "-C", str(worktree_path), "diff-index", "--quiet", "HEAD"],
             capture_output=True,
             text=True,
@@ -248,7 +256,7 @@ class RealGit(Git):
             return False
 
         # Check for untracked files
-        result = subprocess.run(
+        result = run_subprocess(
             ["git", "-C", str(worktree_path), "ls-files", "--others", "--exclude-standard"],
             capture_output=True,
             text=True,
@@ -399,7 +407,7 @@ class RealGit(Git):
 
     def get_branch_head(self, repo_root: Path, branch: str) -> str | None:
         """Get the commit SHA at the head of a branch."""
-        result = subprocess.run(
+        result = run_subprocess(
             ["git", "rev-parse", branch],
             cwd=repo_root,
             capture_output=True,
@@ -411,9 +419,33 @@ class RealGit(Git):
 
         return result.stdout.strip()
 
+    def get_branch_heads(self, repo_root: Path, branches: list[str]) -> dict[str, str]:
+        """Get commit SHAs for many local branches via a single git for-each-ref."""
+        if not branches:
+            return {}
+
+        result = run_subprocess(
+            ["git", "for-each-ref", "--format=%(objectname) %(refname)", "refs/heads/"],
+            cwd=repo_root,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if result.returncode != 0:
+            return {}
+
+        wanted = set(branches)
+        heads: dict[str, str] = {}
+        for line in result.stdout.splitlines():
+            sha, _, refname = line.partition(" ")
+            branch = refname.removeprefix("refs/heads/")
+            if branch in wanted:
+                heads[branch] = sha
+        return heads
+
     def get_commit_message(self, repo_root: Path, commit_sha: str) -> str | None:
         """Get the first line of commit message for a given commit SHA."""
-        result = subprocess.run(
+        result = run_subprocess(
             ["git", "log", "-1", "--format=%s", commit_sha],
             cwd=repo_root,
             capture_output=True,
@@ -461,7 +493,7 @@ class RealGit(Git):
     def get_ahead_behind(self, cwd: Path, branch: str) -> tuple[int, int]:
         """Get number of commits ahead and behind tracking branch."""
         # Check if branch has upstream
-        result = subprocess.run(
+        result = run_subprocess(
             ["git", "rev-parse", "--abbrev-ref", f"{branch}@{{upstream}}"],
             cwd=cwd,
             capture_output=True,
@@ -492,7 +524,7 @@ class RealGit(Git):
 
     def get_all_branch_sync_info(self, repo_root: Path) -> dict[str, BranchSyncInfo]:
         """Get sync status for all local branches via git for-each-ref."""
-        result = subprocess.run(
+        result = run_subprocess(
             [
                 "git",
                 "for-each-ref",
@@ -590,7 +622,7 @@ class RealGit(Git):
 
     def branch_exists_on_remote(self, repo_root: Path, remote: str, branch: str) -> bool:
         """Check if a branch exists on a remote."""
-        result = subprocess.run(
+        result = run_subprocess(
             ["git", "ls-remote", remote, branch],
             cwd=repo_root,
             capture_output=True,
@@ -614,7 +646,7 @@ class RealGit(Git):
         We cannot check if the config key exists beforehandwithout duplicating
         git's logic.
         """
-        result = subprocess.run(
+        result = run_subprocess(
             ["git", "config", f"branch.{branch}.issue"],
             cwd=repo_root,
             capture_output=True,
@@ -633,6 +665,28 @@ class RealGit(Git):
             # Config value exists but is not a valid integer
             return None
 
+    def get_all_branch_issues(self, repo_root: Path) -> dict[str, int]:
+        """Get all branch.<branch>.issue values via a single git config call."""
+        result = run_subprocess(
+            ["git", "config", "--get-regexp", r"^branch\..*\.issue$"],
+            cwd=repo_root,
+            capture_output=True,
+            text=True,
+            check=False,  # LBYL: exit code 1 means no matching keys
+        )
+        if result.returncode != 0:
+            return {}
+
+        issues: dict[str, int] = {}
+        for line in result.stdout.splitlines():
+            key, _, value = line.partition(" ")
+            branch = key.removeprefix("branch.").removesuffix(".issue")
+            value = value.strip()
+            # Skip values that are not valid integers, matching get_branch_issue
+            if value.isdigit():
+                issues[branch] = int(value)
+        return issues
+
     def fetch_pr_ref(self, repo_root: Path, remote: str, pr_number: int, local_branch: str) -> None:
         """Fetch a PR ref into a local branch.
 
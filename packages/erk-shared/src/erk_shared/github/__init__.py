@@ -6,5 +6,8 @@ Import from submodules:
 - metadata_blocks: PLAN_METADATA_MARKER_END, PLAN_METADATA_MARKER_START, etc.
 - parsing: _parse_github_pr_url
 - issues: GitHubIssues, RealGitHubIssues, FakeGitHubIssues, etc.
+- http_client: GitHubHttpClient, GitHubHttpError, resolve_github_token
+- repo_identity: RepoIdentityResolver, parse_github_remote_url
+- response_cache: GitHubResponseCache, CacheMode
 - real: RealGitHub
 """
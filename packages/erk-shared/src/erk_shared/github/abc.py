@@ -226,6 +226,25 @@ class GitHub(ABC):
         """
         ...
 
+    @abstractmethod
+    def find_workflow_run(self, repo_root: Path, run_id: str) -> WorkflowRun | None:
+        """Look up a workflow run by ID, telling a missing run from a failed lookup.
+
+        get_workflow_run returns None on any failure. Use this where treating
+        a network or rate-limit error as "no such run" would be wrong.
+
+        Args:
+            repo_root: Repository root directory
+            run_id: GitHub Actions run ID
+
+        Returns:
+            WorkflowRun, or None if GitHub reports that the run doesn't exist
+
+        Raises:
+            RuntimeError: If the lookup fails for any other reason
+        """
+        ...
+
     @abstractmethod
     def get_run_logs(self, repo_root: Path, run_id: str) -> str:
         """Get logs for a workflow run.
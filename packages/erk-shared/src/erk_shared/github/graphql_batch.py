@@ -0,0 +1,214 @@
+"""Chunked, concurrent execution of aliased GraphQL batch queries.
+
+Batch lookups (CI status of every PR, closing PRs of every issue, comments of
+every issue) select one aliased field per item under `repository`. A single
+query for hundreds of items runs into GitHub's node and complexity limits and
+timeouts, and each nested connection only returns its first page.
+run_graphql_batch() instead:
+
+- splits the items into chunks of at most chunk_size, one query per chunk
+- runs the chunk queries concurrently on a ParallelTaskRunner
+- follows the cursor of a nested connection while it has more pages,
+  merging the nodes of later pages into the first
+- merges every chunk into a single alias -> node mapping
+
+Given a GitHubRateBudget, chunks get smaller and fewer run at once as the
+GraphQL points run low or after a secondary rate limit.
+"""
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+
+from erk_shared.github.rate_budget import GitHubRateBudget
+from erk_shared.integrations.parallel.abc import ParallelTaskRunner
+from erk_shared.integrations.parallel.cancellation import current_task_scope
+
+# Each chunk query gets this long once a worker starts it
+_CHUNK_TIMEOUT_SECONDS = 60.0
+
+
+@dataclass(frozen=True)
+class NestedConnection:
+    """A connection inside every batched node that may span several pages.
+
+    The connection must select `pageInfo { hasNextPage endCursor }`, or
+    `pageInfo { hasPreviousPage startCursor }` when paged backward with `last`.
+
+    Attributes:
+        path: Keys and list indexes leading from an aliased node to the connection
+        build_page_query: Builds a query for the next page of the connection of
+            each alias, given alias -> cursor. It must select the connection
+            under the same alias and path as the original query.
+        backward: Whether the connection is paged with last/before, in which
+            case earlier pages are prepended
+    """
+
+    path: tuple[str | int, ...]
+    build_page_query: Callable[[dict[str, str]], str]
+    backward: bool = False
+
+
+def run_graphql_batch[T](
+    items: Sequence[T],
+    build_query: Callable[[list[T]], str],
+    execute: Callable[[str], dict[str, Any]],
+    *,
+    runner: ParallelTaskRunner,
+    chunk_size: int,
+    nested: NestedConnection | None = None,
+    budget: GitHubRateBudget | None = None,
+) -> dict[str, Any]:
+    """Run an aliased batch query in chunks and merge the results.
+
+    A single chunk, or any chunks requested from inside a runner task, run on
+    the calling thread so nested fan-out can't starve the shared worker pool.
+
+    Args:
+        items: Items to look up, one alias each
+        build_query: Builds the query for a chunk of items, with the aliased
+            fields directly under `repository`
+        execute: Runs a query and returns the full response (with "data")
+        runner: Worker pool the chunks run on
+        chunk_size: Maximum number of items per query
+        nested: Connection of each node to follow past its first page
+        budget: Rate-limit budget that scales chunk size and concurrency down
+
+    Returns:
+        Mapping of alias -> node of every chunk (None for items GitHub didn't return)
+
+    Raises:
+        RuntimeError: If a chunk query misses its deadline
+        Exception: The first error raised by execute for any chunk
+    """
+    if budget is not None:
+        chunk_size = budget.chunk_size(chunk_size)
+    chunks = [list(items[i : i + chunk_size]) for i in range(0, len(items), chunk_size)]
+    nodes = _execute_all([build_query(chunk) for chunk in chunks], execute, runner, budget)
+    if nested is None:
+        return nodes
+
+    pending = [alias for alias, node in nodes.items() if _next_cursor(node, nested) is not None]
+    while pending:
+        page_queries = []
+        for i in range(0, len(pending), chunk_size):
+            cursors: dict[str, str] = {}
+            for alias in pending[i : i + chunk_size]:
+                cursor = _next_cursor(nodes[alias], nested)
+                if cursor is not None:
+                    cursors[alias] = cursor
+            page_queries.append(nested.build_page_query(cursors))
+
+        pages = _execute_all(page_queries, execute, runner, budget)
+        pending = []
+        for alias, page in pages.items():
+            connection = _connection(nodes.get(alias), nested.path)
+            page_connection = _connection(page, nested.path)
+            if connection is None or page_connection is None:
+                continue
+            if nested.backward:
+                connection["nodes"] = page_connection["nodes"] + connection["nodes"]
+            else:
+                connection["nodes"] = connection["nodes"] + page_connection["nodes"]
+            connection["pageInfo"] = page_connection["pageInfo"]
+            if _next_cursor(nodes[alias], nested) is not None:
+                pending.append(alias)
+
+    return nodes
+
+
+def _execute_all(
+    queries: list[str],
+    execute: Callable[[str], dict[str, Any]],
+    runner: ParallelTaskRunner,
+    budget: GitHubRateBudget | None,
+) -> dict[str, Any]:
+    """Execute queries, concurrently when worthwhile, and merge their repository fields.
+
+    With a budget, queries run in waves no larger than its current concurrency,
+    re-read before each wave so throttling takes effect mid-batch.
+    """
+    responses: list[dict[str, Any]] = []
+    start = 0
+    while start < len(queries):
+        concurrency = budget.max_concurrency() if budget is not None else None
+        end = len(queries) if concurrency is None else start + concurrency
+        responses.extend(_execute_wave(queries[start:end], execute, runner, start))
+        start = end
+
+    merged: dict[str, Any] = {}
+    for response in responses:
+        repository = response["data"]["repository"]
+        if repository is not None:
+            merged.update(repository)
+    return merged
+
+
+def _execute_wave(
+    queries: list[str],
+    execute: Callable[[str], dict[str, Any]],
+    runner: ParallelTaskRunner,
+    first_index: int,
+) -> list[dict[str, Any]]:
+    """Execute queries at once on the runner, or inline when that gains nothing."""
+    if len(queries) <= 1 or current_task_scope() is not None:
+        return [execute(query) for query in queries]
+
+    tasks: dict[str, Callable[[], object]] = {
+        f"graphql-batch-{first_index + index}": partial(_execute_capturing_error, execute, query)
+        for index, query in enumerate(queries)
+    }
+    results = runner.run_parallel(tasks, _CHUNK_TIMEOUT_SECONDS)
+
+    responses = []
+    for name, result in results.items():
+        if isinstance(result, Exception):
+            raise result
+        if not isinstance(result, dict):
+            raise RuntimeError(
+                f"GraphQL batch query '{name}' timed out after {_CHUNK_TIMEOUT_SECONDS:.0f}s"
+            )
+        responses.append(result)
+    return responses
+
+
+def _execute_capturing_error(
+    execute: Callable[[str], dict[str, Any]], query: str
+) -> dict[str, Any] | Exception:
+    # Error boundary: the runner turns failures into None; keep the exception
+    # so it is re-raised to the caller like an unchunked query's would be
+    try:
+        return execute(query)
+    except Exception as e:
+        return e
+
+
+def _connection(node: Any, path: tuple[str | int, ...]) -> dict[str, Any] | None:
+    """Follow path from a node to a connection, or None if any step is missing."""
+    current: object = node
+    for step in path:
+        if isinstance(step, int):
+            if not isinstance(current, list) or step >= len(current):
+                return None
+            items: list[Any] = current
+            current = items[step]
+        else:
+            if not isinstance(current, dict) or step not in current:
+                return None
+            fields: dict[str, Any] = current
+            current = fields[step]
+    if not isinstance(current, dict) or "nodes" not in current or "pageInfo" not in current:
+        return None
+    return current
+
+
+def _next_cursor(node: Any, nested: NestedConnection) -> str | None:
+    """Cursor of the connection's next page, or None when it is complete."""
+    connection = _connection(node, nested.path)
+    if connection is None:
+        return None
+    page_info = connection["pageInfo"]
+    if nested.backward:
+        return page_info["startCursor"] if page_info.get("hasPreviousPage") else None
+    return page_info["endCursor"] if page_info.get("hasNextPage") else None
@@ -0,0 +1,330 @@
+"""Minimal GitHub API client over pooled keep-alive HTTP connections.
+
+Every gh CLI invocation pays ~150-300ms of process startup before any network
+work, and opens a fresh TLS connection. This client reads the token once and
+reuses connections across requests, so a command making a dozen API calls pays
+for one TLS handshake instead of a dozen process spawns.
+
+Only the standard library is used (http.client), keeping erk-shared free of
+third-party HTTP dependencies.
+"""
+
+import http.client
+import json
+import os
+import shutil
+import subprocess
+import threading
+from datetime import UTC, datetime
+from typing import Any
+from urllib.parse import urlencode, urlsplit
+
+from erk_shared.github.rate_budget import GitHubRateBudget
+
+DEFAULT_API_URL = "https://api.github.com"
+
+# Errors that mean a pooled keep-alive connection was closed by the server
+# between requests. The request is retried once on a fresh connection, unless
+# the server may already have received it (see _IDEMPOTENT_METHODS).
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+# Methods that can be sent again after the connection dropped while waiting
+# for the response. Any other request may already have taken effect (an issue
+# created, a workflow dispatched), so it fails instead of running twice.
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+
+
+class GitHubHttpError(RuntimeError):
+    """Raised when a GitHub API request fails.
+
+    Subclasses RuntimeError so callers written against the gh CLI backend
+    (which raises RuntimeError on command failure) handle both uniformly.
+
+    Attributes:
+        status: HTTP status code, or None for connection-level failures
+    """
+
+    def __init__(self, message: str, status: int | None) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def resolve_github_token() -> str | None:
+    """Find a GitHub API token without prompting.
+
+    Checks GH_TOKEN and GITHUB_TOKEN (the variables gh itself honors), then
+    asks `gh auth token` for the token gh has stored.
+
+    Returns:
+        The token, or None if no token is available
+    """
+    for env_var in ("GH_TOKEN", "GITHUB_TOKEN"):
+        token = os.environ.get(env_var, "").strip()
+        if token:
+            return token
+
+    if shutil.which("gh") is None:
+        return None
+
+    result = subprocess.run(
+        ["gh", "auth", "token"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        return None
+    token = result.stdout.strip()
+    return token if token else None
+
+
+class GitHubHttpClient:
+    """GitHub REST/GraphQL client that reuses keep-alive connections.
+
+    Thread-safe: idle connections are kept in a small pool, and concurrent
+    callers (e.g. ParallelTaskRunner workers) each borrow their own connection.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        *,
+        api_url: str = DEFAULT_API_URL,
+        timeout: float = 30.0,
+        max_idle_connections: int = 4,
+        budget: GitHubRateBudget | None = None,
+    ) -> None:
+        """Create a client.
+
+        Args:
+            token: GitHub API token sent as a bearer token
+            api_url: API base URL (http:// is accepted for local test servers)
+            timeout: Socket timeout in seconds for each request
+            max_idle_connections: Idle connections kept open for reuse
+            budget: Rate-limit budget that REST requests are recorded in and
+                that retries requests rejected by a secondary rate limit
+        """
+        parts = urlsplit(api_url)
+        self._token = token
+        self._scheme = parts.scheme
+        self._host = parts.hostname or ""
+        self._port = parts.port
+        self._base_path = parts.path.rstrip("/")
+        self._timeout = timeout
+        self._max_idle_connections = max_idle_connections
+        self._budget = budget
+        self._idle: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        self._connections_opened = 0
+        self._requests_sent = 0
+
+    @property
+    def connections_opened(self) -> int:
+        """Number of connections opened so far (for debug output and tests)."""
+        return self._connections_opened
+
+    @property
+    def requests_sent(self) -> int:
+        """Number of requests sent so far (for debug output and tests)."""
+        return self._requests_sent
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        query: dict[str, str | int] | None = None,
+        body: dict[str, Any] | None = None,
+    ) -> Any:
+        """Send a REST request and return the decoded JSON response.
+
+        Args:
+            method: HTTP method (GET, POST, PATCH, PUT, DELETE)
+            path: API path, e.g. "/repos/owner/name/issues"
+            query: Optional query string parameters
+            body: Optional JSON request body
+
+        Returns:
+            Decoded JSON body, or None for empty responses (e.g. 204 No Content)
+
+        Raises:
+            GitHubHttpError: On HTTP error status or connection failure
+        """
+        url = self._base_path + path
+        if query:
+            url += "?" + urlencode(query)
+
+        headers = {
+            "Accept": "application/vnd.github+json",
+            "Authorization": f"Bearer {self._token}",
+            "User-Agent": "erk",
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+        payload: bytes | None = None
+        if body is not None:
+            payload = json.dumps(body).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+
+        if self._budget is None:
+            status, data = self._send_checked(method, path, url, payload, headers)
+        else:
+            status, data = self._budget.with_backoff(
+                lambda: self._send_checked(method, path, url, payload, headers)
+            )
+        if not data:
+            return None
+
+        # Error boundary: json offers no way to validate a document before parsing
+        try:
+            return json.loads(data)
+        except json.JSONDecodeError as e:
+            raise GitHubHttpError(
+                f"GitHub API {method} {path} returned invalid JSON", status
+            ) from e
+
+    def graphql(self, query: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Execute a GraphQL query.
+
+        Returns the full response (including "data"), matching the shape of
+        `gh api graphql` output. Partial results with per-field errors are
+        returned as-is; a response with errors and no data raises.
+
+        Raises:
+            GitHubHttpError: On HTTP failure or a response with no data
+        """
+        body: dict[str, Any] = {"query": query}
+        if variables is not None:
+            body["variables"] = variables
+
+        response = self.request("POST", "/graphql", body=body)
+        if not isinstance(response, dict):
+            raise GitHubHttpError("GitHub GraphQL API returned a non-object response", None)
+        if response.get("data") is None and response.get("errors"):
+            messages = "; ".join(str(error.get("message")) for error in response["errors"])
+            raise GitHubHttpError(f"GitHub GraphQL query failed: {messages}", None)
+        return response
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle = self._idle
+            self._idle = []
+        for connection in idle:
+            connection.close()
+
+    def _send_checked(
+        self, method: str, path: str, url: str, payload: bytes | None, headers: dict[str, str]
+    ) -> tuple[int, bytes]:
+        """Send a request, raising GitHubHttpError on an HTTP error status."""
+        status, data = self._send(method, url, payload, headers)
+        if status >= 400:
+            raise GitHubHttpError(
+                f"GitHub API {method} {path} failed with HTTP {status}: {_error_message(data)}",
+                status,
+            )
+        return status, data
+
+    def _send(
+        self, method: str, url: str, payload: bytes | None, headers: dict[str, str]
+    ) -> tuple[int, bytes]:
+        connection, reused = self._acquire()
+
+        # Error boundary: socket errors are the only signal that a pooled
+        # connection went stale or the network is unavailable.
+        try:
+            written = False
+            try:
+                connection.request(method, url, body=payload, headers=headers)
+                written = True
+                status, data = self._read_response(connection)
+            except _STALE_CONNECTION_ERRORS:
+                connection.close()
+                if not reused or (written and method not in _IDEMPOTENT_METHODS):
+                    raise
+                connection = self._open()
+                connection.request(method, url, body=payload, headers=headers)
+                status, data = self._read_response(connection)
+        except OSError as e:
+            connection.close()
+            raise GitHubHttpError(f"GitHub API {method} {url} failed: {e}", None) from e
+        except http.client.HTTPException as e:
+            connection.close()
+            raise GitHubHttpError(f"GitHub API {method} {url} failed: {e!r}", None) from e
+
+        self._release(connection)
+        return status, data
+
+    def _read_response(self, connection: http.client.HTTPConnection) -> tuple[int, bytes]:
+        response = connection.getresponse()
+        # Always drain the body so the connection can be reused
+        data = response.read()
+        with self._lock:
+            self._requests_sent += 1
+        self._record_rate_limit(response)
+        if response.will_close:
+            connection.close()
+        return response.status, data
+
+    def _record_rate_limit(self, response: http.client.HTTPResponse) -> None:
+        """Record the REST limit reported in a response's X-RateLimit headers.
+
+        GraphQL responses report the graphql resource, which the budget records
+        from the rateLimit field of the response body instead.
+        """
+        if self._budget is None or response.getheader("x-ratelimit-resource") != "core":
+            return
+        limit = response.getheader("x-ratelimit-limit")
+        remaining = response.getheader("x-ratelimit-remaining")
+        reset = response.getheader("x-ratelimit-reset")
+        if limit is None or remaining is None or reset is None:
+            return
+        if not (limit.isdigit() and remaining.isdigit() and reset.isdigit()):
+            return
+        self._budget.record_rest(
+            limit=int(limit),
+            remaining=int(remaining),
+            reset_at=datetime.fromtimestamp(int(reset), tz=UTC),
+        )
+
+    def _acquire(self) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+        return self._open(), False
+
+    def _release(self, connection: http.client.HTTPConnection) -> None:
+        if connection.sock is None:
+            # Server asked to close; nothing to pool
+            return
+        with self._lock:
+            if len(self._idle) < self._max_idle_connections:
+                self._idle.append(connection)
+                return
+        connection.close()
+
+    def _open(self) -> http.client.HTTPConnection:
+        with self._lock:
+            self._connections_opened += 1
+        if self._scheme == "http":
+            return http.client.HTTPConnection(self._host, self._port, timeout=self._timeout)
+        return http.client.HTTPSConnection(self._host, self._port, timeout=self._timeout)
+
+
+def _error_message(data: bytes) -> str:
+    """Extract GitHub's error message from a response body, if it has one."""
+    if not data:
+        return "no message"
+
+    # Error boundary: error bodies from proxies or GitHub's edge may be HTML
+    try:
+        decoded = json.loads(data)
+    except json.JSONDecodeError:
+        return data[:200].decode("utf-8", errors="replace")
+
+    if isinstance(decoded, dict) and isinstance(decoded.get("message"), str):
+        return decoded["message"]
+    return "no message"
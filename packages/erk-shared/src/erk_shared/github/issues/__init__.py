@@ -1,19 +1,48 @@
 """GitHub issues integration for erk plan storage.
 
 This package provides an abstract interface and implementations for GitHub issue operations.
+
+The implementations are imported on first attribute access: importing the
+package (or its abc module, as every ErkContext user does) must not load the
+HTTP client and plan metadata parsers that only the real integrations need.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from erk_shared.github.issues.abc import GitHubIssues
-from erk_shared.github.issues.dry_run import DryRunGitHubIssues
-from erk_shared.github.issues.fake import FakeGitHubIssues
-from erk_shared.github.issues.real import RealGitHubIssues
 from erk_shared.github.issues.types import CreateIssueResult, IssueInfo
 
+if TYPE_CHECKING:
+    from erk_shared.github.issues.caching import CachingGitHubIssues
+    from erk_shared.github.issues.dry_run import DryRunGitHubIssues
+    from erk_shared.github.issues.fake import FakeGitHubIssues
+    from erk_shared.github.issues.http import HttpGitHubIssues
+    from erk_shared.github.issues.real import RealGitHubIssues
+
+_LAZY_EXPORTS = {
+    "CachingGitHubIssues": "erk_shared.github.issues.caching",
+    "DryRunGitHubIssues": "erk_shared.github.issues.dry_run",
+    "FakeGitHubIssues": "erk_shared.github.issues.fake",
+    "HttpGitHubIssues": "erk_shared.github.issues.http",
+    "RealGitHubIssues": "erk_shared.github.issues.real",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
+
+
 __all__ = [
+    "CachingGitHubIssues",
     "CreateIssueResult",
     "DryRunGitHubIssues",
     "FakeGitHubIssues",
     "GitHubIssues",
+    "HttpGitHubIssues",
     "IssueInfo",
     "RealGitHubIssues",
 ]
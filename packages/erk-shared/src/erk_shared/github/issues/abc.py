@@ -3,7 +3,7 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
 
-from erk_shared.github.issues.types import CreateIssueResult, IssueInfo
+from erk_shared.github.issues.types import CreateIssueResult, IssueInfo, IssuesWithLinkedPRs
 
 
 class GitHubIssues(ABC):
@@ -100,6 +100,36 @@ class GitHubIssues(ABC):
         """
         ...
 
+    @abstractmethod
+    def list_issues_with_linked_prs(
+        self,
+        repo_root: Path,
+        *,
+        labels: list[str] | None,
+        state: str | None,
+        limit: int | None,
+        include_linked_prs: bool,
+    ) -> IssuesWithLinkedPRs:
+        """Query issues together with the PRs that will close them.
+
+        Unlike list_issues, the listing is paginated to completion: limit None
+        returns every matching issue rather than gh's default page.
+
+        Args:
+            repo_root: Repository root directory
+            labels: Filter by labels (all labels must match)
+            state: Filter by state ("open", "closed", or "all"; None = open)
+            limit: Maximum number of issues to return (None = no limit)
+            include_linked_prs: If False, skip closing PRs (pr_linkages is empty)
+
+        Returns:
+            IssuesWithLinkedPRs with the matching issues, newest first
+
+        Raises:
+            RuntimeError: If the GitHub request fails
+        """
+        ...
+
     @abstractmethod
     def get_issue_comments(self, repo_root: Path, number: int) -> list[str]:
         """Fetch all comment bodies for an issue.
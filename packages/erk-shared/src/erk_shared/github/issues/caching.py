@@ -0,0 +1,249 @@
+"""Caching wrapper for GitHub issues operations."""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from erk_shared.github.issues.abc import GitHubIssues
+from erk_shared.github.issues.types import CreateIssueResult, IssueInfo, IssuesWithLinkedPRs
+from erk_shared.github.response_cache import (
+    GitHubResponseCache,
+    decode_pull_request,
+    encode_pull_request,
+)
+from erk_shared.github.types import PullRequestInfo
+
+
+def encode_issue(issue: IssueInfo) -> dict[str, Any]:
+    """Encode IssueInfo as a JSON-compatible dict for the response cache."""
+    return {
+        "number": issue.number,
+        "title": issue.title,
+        "body": issue.body,
+        "state": issue.state,
+        "url": issue.url,
+        "labels": issue.labels,
+        "assignees": issue.assignees,
+        "created_at": issue.created_at.isoformat(),
+        "updated_at": issue.updated_at.isoformat(),
+    }
+
+
+def decode_issue(data: dict[str, Any]) -> IssueInfo:
+    """Decode IssueInfo from encode_issue() output."""
+    return IssueInfo(
+        number=data["number"],
+        title=data["title"],
+        body=data["body"],
+        state=data["state"],
+        url=data["url"],
+        labels=data["labels"],
+        assignees=data["assignees"],
+        created_at=datetime.fromisoformat(data["created_at"]),
+        updated_at=datetime.fromisoformat(data["updated_at"]),
+    )
+
+
+class CachingGitHubIssues(GitHubIssues):
+    """Wrapper that serves issue list/comment reads from a GitHubResponseCache.
+
+    Read operations used by listing commands are looked up in the cache and
+    stored on miss. Every write operation delegates to the wrapped implementation
+    and then invalidates cached issue data, so erk never shows its own stale writes.
+
+    get_issue() is deliberately not cached: it precedes read-modify-write updates
+    of plan metadata, where a stale body would clobber concurrent updates.
+
+    Usage:
+        cache = GitHubResponseCache(repo_dir / "cache" / "github", RealTime())
+        issues = CachingGitHubIssues(RealGitHubIssues(), cache)
+
+        # Dry-run composes on top as usual
+        issues = DryRunGitHubIssues(issues)
+    """
+
+    def __init__(self, wrapped: GitHubIssues, cache: GitHubResponseCache) -> None:
+        """Create a caching wrapper around a GitHubIssues implementation.
+
+        Args:
+            wrapped: The GitHubIssues implementation to wrap
+            cache: Response cache shared with the GitHub wrapper
+        """
+        self._wrapped = wrapped
+        self._cache = cache
+
+    # Write operations: delegate, then invalidate cached issue data
+
+    def create_issue(
+        self, repo_root: Path, title: str, body: str, labels: list[str]
+    ) -> CreateIssueResult:
+        """Create issue and invalidate cached issue data."""
+        result = self._wrapped.create_issue(repo_root, title, body, labels)
+        self._cache.invalidate("issue_bodies")
+        return result
+
+    def add_comment(self, repo_root: Path, number: int, body: str) -> None:
+        """Add comment and invalidate cached issue data."""
+        self._wrapped.add_comment(repo_root, number, body)
+        self._cache.invalidate("issue_bodies")
+
+    def update_issue_body(self, repo_root: Path, number: int, body: str) -> None:
+        """Update issue body and invalidate cached issue data."""
+        self._wrapped.update_issue_body(repo_root, number, body)
+        self._cache.invalidate("issue_bodies")
+
+    def ensure_label_exists(
+        self,
+        repo_root: Path,
+        label: str,
+        description: str,
+        color: str,
+    ) -> None:
+        """Ensure label exists (labels are not cached, no invalidation needed)."""
+        self._wrapped.ensure_label_exists(repo_root, label, description, color)
+
+    def ensure_label_on_issue(self, repo_root: Path, issue_number: int, label: str) -> None:
+        """Add label and invalidate cached issue data."""
+        self._wrapped.ensure_label_on_issue(repo_root, issue_number, label)
+        self._cache.invalidate("issue_bodies")
+
+    def remove_label_from_issue(self, repo_root: Path, issue_number: int, label: str) -> None:
+        """Remove label and invalidate cached issue data."""
+        self._wrapped.remove_label_from_issue(repo_root, issue_number, label)
+        self._cache.invalidate("issue_bodies")
+
+    def close_issue(self, repo_root: Path, number: int) -> None:
+        """Close issue and invalidate cached issue data."""
+        self._wrapped.close_issue(repo_root, number)
+        self._cache.invalidate("issue_bodies")
+
+    # Read operations: served from cache when fresh
+
+    def get_issue(self, repo_root: Path, number: int) -> IssueInfo:
+        """Fetch issue (never cached, see class docstring)."""
+        return self._wrapped.get_issue(repo_root, number)
+
+    def list_issues(
+        self,
+        repo_root: Path,
+        labels: list[str] | None = None,
+        state: str | None = None,
+        limit: int | None = None,
+    ) -> list[IssueInfo]:
+        """List issues, served from cache when fresh."""
+        params = {"labels": sorted(labels) if labels else None, "state": state, "limit": limit}
+        entry = self._cache.get("issue_bodies", repo_root, "list_issues", params)
+        if entry is not None:
+            return [decode_issue(issue) for issue in entry.payload]
+
+        issues = self._wrapped.list_issues(repo_root, labels=labels, state=state, limit=limit)
+        self._cache.put(
+            "issue_bodies",
+            repo_root,
+            "list_issues",
+            params,
+            [encode_issue(issue) for issue in issues],
+        )
+        return issues
+
+    def list_issues_with_linked_prs(
+        self,
+        repo_root: Path,
+        *,
+        labels: list[str] | None,
+        state: str | None,
+        limit: int | None,
+        include_linked_prs: bool,
+    ) -> IssuesWithLinkedPRs:
+        """List issues with their closing PRs, served from cache when fresh.
+
+        Issues and PR linkages are stored as separate entries so each keeps the
+        TTL and invalidation of its data class; the cache is only used when
+        every entry needed is fresh.
+        """
+        params = {"labels": sorted(labels) if labels else None, "state": state, "limit": limit}
+        operation = "list_issues_with_linked_prs"
+        issues_entry = self._cache.get("issue_bodies", repo_root, operation, params)
+        linkages_entry = None
+        if include_linked_prs:
+            linkages_entry = self._cache.get("pr_state", repo_root, operation, params)
+        if issues_entry is not None and (linkages_entry is not None or not include_linked_prs):
+            pr_linkages: dict[int, list[PullRequestInfo]] = {}
+            if linkages_entry is not None:
+                pr_linkages = {
+                    int(number): [decode_pull_request(pr) for pr in prs]
+                    for number, prs in linkages_entry.payload.items()
+                    if prs
+                }
+            return IssuesWithLinkedPRs(
+                issues=[decode_issue(issue) for issue in issues_entry.payload],
+                pr_linkages=pr_linkages,
+            )
+
+        result = self._wrapped.list_issues_with_linked_prs(
+            repo_root,
+            labels=labels,
+            state=state,
+            limit=limit,
+            include_linked_prs=include_linked_prs,
+        )
+        self._cache.put(
+            "issue_bodies",
+            repo_root,
+            operation,
+            params,
+            [encode_issue(issue) for issue in result.issues],
+        )
+        if include_linked_prs:
+            # Every listed issue gets a key, so issues without linked PRs still
+            # make a non-empty (storable) payload
+            self._cache.put(
+                "pr_state",
+                repo_root,
+                operation,
+                params,
+                {
+                    str(issue.number): [
+                        encode_pull_request(pr) for pr in result.pr_linkages.get(issue.number, [])
+                    ]
+                    for issue in result.issues
+                },
+            )
+        return result
+
+    def get_issue_comments(self, repo_root: Path, number: int) -> list[str]:
+        """Fetch issue comments, served from cache when fresh."""
+        params = {"number": number}
+        entry = self._cache.get("issue_bodies", repo_root, "get_issue_comments", params)
+        if entry is not None:
+            return list(entry.payload)
+
+        comments = self._wrapped.get_issue_comments(repo_root, number)
+        self._cache.put("issue_bodies", repo_root, "get_issue_comments", params, comments)
+        return comments
+
+    def get_multiple_issue_comments(
+        self, repo_root: Path, issue_numbers: list[int]
+    ) -> dict[int, list[str]]:
+        """Fetch comments for multiple issues, served from cache when fresh."""
+        if not issue_numbers:
+            return {}
+
+        params = {"issue_numbers": sorted(issue_numbers)}
+        entry = self._cache.get("issue_bodies", repo_root, "get_multiple_issue_comments", params)
+        if entry is not None:
+            return {int(number): comments for number, comments in entry.payload.items()}
+
+        comments_by_issue = self._wrapped.get_multiple_issue_comments(repo_root, issue_numbers)
+        self._cache.put(
+            "issue_bodies",
+            repo_root,
+            "get_multiple_issue_comments",
+            params,
+            {str(number): comments for number, comments in comments_by_issue.items()},
+        )
+        return comments_by_issue
+
+    def get_current_username(self) -> str | None:
+        """Get current username (not repository data, never cached)."""
+        return self._wrapped.get_current_username()
@@ -3,7 +3,7 @@
 from pathlib import Path
 
 from erk_shared.github.issues.abc import GitHubIssues
-from erk_shared.github.issues.types import CreateIssueResult, IssueInfo
+from erk_shared.github.issues.types import CreateIssueResult, IssueInfo, IssuesWithLinkedPRs
 
 
 class DryRunGitHubIssues(GitHubIssues):
@@ -53,6 +53,24 @@ class DryRunGitHubIssues(GitHubIssues):
         """Delegate read operation to wrapped implementation."""
         return self._wrapped.list_issues(repo_root, labels=labels, state=state, limit=limit)
 
+    def list_issues_with_linked_prs(
+        self,
+        repo_root: Path,
+        *,
+        labels: list[str] | None,
+        state: str | None,
+        limit: int | None,
+        include_linked_prs: bool,
+    ) -> IssuesWithLinkedPRs:
+        """Delegate read operation to wrapped implementation."""
+        return self._wrapped.list_issues_with_linked_prs(
+            repo_root,
+            labels=labels,
+            state=state,
+            limit=limit,
+            include_linked_prs=include_linked_prs,
+        )
+
     def get_issue_comments(self, repo_root: Path, number: int) -> list[str]:
         """Delegate read operation to wrapped implementation."""
         return self._wrapped.get_issue_comments(repo_root, number)
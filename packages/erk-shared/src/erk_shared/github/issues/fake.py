@@ -4,7 +4,8 @@ from datetime import UTC, datetime
 from pathlib import Path
 
 from erk_shared.github.issues.abc import GitHubIssues
-from erk_shared.github.issues.types import CreateIssueResult, IssueInfo
+from erk_shared.github.issues.types import CreateIssueResult, IssueInfo, IssuesWithLinkedPRs
+from erk_shared.github.types import PullRequestInfo
 
 
 class FakeGitHubIssues(GitHubIssues):
@@ -21,6 +22,7 @@ class FakeGitHubIssues(GitHubIssues):
         labels: set[str] | None = None,
         comments: dict[int, list[str]] | None = None,
         username: str | None = "testuser",
+        pr_linkages: dict[int, list[PullRequestInfo]] | None = None,
     ) -> None:
         """Create FakeGitHubIssues with pre-configured state.
 
@@ -31,12 +33,15 @@ class FakeGitHubIssues(GitHubIssues):
             comments: Mapping of issue number -> list of comment bodies
             username: GitHub username to return (default: "testuser", None means
                 not authenticated)
+            pr_linkages: Mapping of issue number -> closing PRs for
+                list_issues_with_linked_prs()
         """
         self._issues = issues or {}
         self._next_issue_number = next_issue_number
         self._labels = labels or set()
         self._comments = comments or {}
         self._username = username
+        self._pr_linkages = pr_linkages or {}
         self._created_issues: list[tuple[str, str, list[str]]] = []
         self._added_comments: list[tuple[int, str]] = []
         self._created_labels: list[tuple[str, str, str]] = []
@@ -182,6 +187,29 @@ class FakeGitHubIssues(GitHubIssues):
 
         return issues
 
+    def list_issues_with_linked_prs(
+        self,
+        repo_root: Path,
+        *,
+        labels: list[str] | None,
+        state: str | None,
+        limit: int | None,
+        include_linked_prs: bool,
+    ) -> IssuesWithLinkedPRs:
+        """Query issues from fake storage with their pre-configured closing PRs.
+
+        Filters like list_issues().
+        """
+        issues = self.list_issues(repo_root, labels=labels, state=state, limit=limit)
+        pr_linkages: dict[int, list[PullRequestInfo]] = {}
+        if include_linked_prs:
+            pr_linkages = {
+                issue.number: self._pr_linkages[issue.number]
+                for issue in issues
+                if issue.number in self._pr_linkages
+            }
+        return IssuesWithLinkedPRs(issues=issues, pr_linkages=pr_linkages)
+
     def get_issue_comments(self, repo_root: Path, number: int) -> list[str]:
         """Get comments for issue from fake storage.
 
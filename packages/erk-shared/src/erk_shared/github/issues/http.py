@@ -0,0 +1,213 @@
+"""GitHub issues implementation over the GitHub HTTP API."""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+from urllib.parse import quote
+
+from erk_shared.github.http_client import GitHubHttpClient, GitHubHttpError
+from erk_shared.github.issues.real import RealGitHubIssues
+from erk_shared.github.issues.types import CreateIssueResult, IssueInfo
+from erk_shared.github.rate_budget import GitHubRateBudget
+from erk_shared.github.repo_identity import RepoIdentityResolver
+from erk_shared.integrations.parallel.abc import ParallelTaskRunner
+
+# gh issue list returns 30 issues when no --limit is given; match it
+_DEFAULT_LIST_LIMIT = 30
+_MAX_PER_PAGE = 100
+
+
+class HttpGitHubIssues(RealGitHubIssues):
+    """GitHub issues over pooled keep-alive HTTP instead of one gh process per call.
+
+    Every operation maps to a single REST or GraphQL request on a shared
+    GitHubHttpClient. Errors surface as GitHubHttpError, a RuntimeError subclass,
+    matching the gh-based implementation's contract.
+    """
+
+    def __init__(
+        self,
+        client: GitHubHttpClient,
+        identity_resolver: RepoIdentityResolver,
+        runner: ParallelTaskRunner | None = None,
+        budget: GitHubRateBudget | None = None,
+    ) -> None:
+        """Initialize HttpGitHubIssues.
+
+        Args:
+            client: HTTP client shared with the GitHub implementation
+            identity_resolver: Source of the repository owner/name for API paths
+            runner: Worker pool for chunked batch queries
+            budget: Rate-limit budget shared with the client
+        """
+        super().__init__(identity_resolver, runner, budget)
+        self._client = client
+
+    def _repo_path(self, repo_root: Path) -> str:
+        identity = self._identity_resolver.resolve(repo_root)
+        return f"/repos/{identity.owner}/{identity.name}"
+
+    def create_issue(
+        self, repo_root: Path, title: str, body: str, labels: list[str]
+    ) -> CreateIssueResult:
+        """Create a new GitHub issue via the REST API."""
+        data = self._client.request(
+            "POST",
+            f"{self._repo_path(repo_root)}/issues",
+            body={"title": title, "body": body, "labels": labels},
+        )
+        return CreateIssueResult(number=data["number"], url=data["html_url"])
+
+    def get_issue(self, repo_root: Path, number: int) -> IssueInfo:
+        """Fetch issue data via the REST API."""
+        data = self._client.request("GET", f"{self._repo_path(repo_root)}/issues/{number}")
+        return _parse_rest_issue(data)
+
+    def add_comment(self, repo_root: Path, number: int, body: str) -> None:
+        """Add comment to issue via the REST API."""
+        self._client.request(
+            "POST",
+            f"{self._repo_path(repo_root)}/issues/{number}/comments",
+            body={"body": body},
+        )
+
+    def update_issue_body(self, repo_root: Path, number: int, body: str) -> None:
+        """Update issue body via the REST API."""
+        self._client.request(
+            "PATCH", f"{self._repo_path(repo_root)}/issues/{number}", body={"body": body}
+        )
+
+    def list_issues(
+        self,
+        repo_root: Path,
+        labels: list[str] | None = None,
+        state: str | None = None,
+        limit: int | None = None,
+    ) -> list[IssueInfo]:
+        """Query issues via the REST API.
+
+        The REST issues endpoint also returns pull requests; those are skipped
+        to match `gh issue list`.
+        """
+        target = limit if limit is not None else _DEFAULT_LIST_LIMIT
+        per_page = min(target, _MAX_PER_PAGE)
+        query: dict[str, str | int] = {"per_page": per_page}
+        if labels:
+            query["labels"] = ",".join(labels)
+        if state:
+            query["state"] = state
+
+        issues: list[IssueInfo] = []
+        page = 1
+        while len(issues) < target:
+            data = self._client.request(
+                "GET", f"{self._repo_path(repo_root)}/issues", query={**query, "page": page}
+            )
+            for item in data:
+                if "pull_request" in item:
+                    continue
+                issues.append(_parse_rest_issue(item))
+            if len(data) < per_page:
+                break
+            page += 1
+
+        return issues[:target]
+
+    def get_issue_comments(self, repo_root: Path, number: int) -> list[str]:
+        """Fetch all comment bodies for an issue via the REST API."""
+        comments: list[str] = []
+        page = 1
+        while True:
+            data = self._client.request(
+                "GET",
+                f"{self._repo_path(repo_root)}/issues/{number}/comments",
+                query={"per_page": _MAX_PER_PAGE, "page": page},
+            )
+            comments.extend(comment["body"] for comment in data)
+            if len(data) < _MAX_PER_PAGE:
+                return comments
+            page += 1
+
+    def _send_graphql(self, query: str, repo_root: Path) -> dict[str, Any]:
+        """Send a GraphQL query over the shared HTTP connection."""
+        return self._client.graphql(query)
+
+    def ensure_label_exists(
+        self,
+        repo_root: Path,
+        label: str,
+        description: str,
+        color: str,
+    ) -> None:
+        """Ensure label exists in repository, creating it if needed."""
+        labels_path = f"{self._repo_path(repo_root)}/labels"
+
+        # Error boundary: the API reports a missing label only as HTTP 404
+        try:
+            self._client.request("GET", f"{labels_path}/{quote(label, safe='')}")
+            return
+        except GitHubHttpError as e:
+            if e.status != 404:
+                raise
+
+        self._client.request(
+            "POST",
+            labels_path,
+            body={"name": label, "description": description, "color": color},
+        )
+
+    def ensure_label_on_issue(self, repo_root: Path, issue_number: int, label: str) -> None:
+        """Ensure label is present on issue via the REST API (idempotent)."""
+        self._client.request(
+            "POST",
+            f"{self._repo_path(repo_root)}/issues/{issue_number}/labels",
+            body={"labels": [label]},
+        )
+
+    def remove_label_from_issue(self, repo_root: Path, issue_number: int, label: str) -> None:
+        """Remove label from issue via the REST API.
+
+        A label that isn't on the issue is treated as already removed, matching gh.
+        """
+        path = f"{self._repo_path(repo_root)}/issues/{issue_number}/labels/{quote(label, safe='')}"
+
+        # Error boundary: the API reports an absent label only as HTTP 404
+        try:
+            self._client.request("DELETE", path)
+        except GitHubHttpError as e:
+            if e.status != 404:
+                raise
+
+    def close_issue(self, repo_root: Path, number: int) -> None:
+        """Close issue via the REST API."""
+        self._client.request(
+            "PATCH", f"{self._repo_path(repo_root)}/issues/{number}", body={"state": "closed"}
+        )
+
+    def get_current_username(self) -> str | None:
+        """Get current GitHub username via the REST API.
+
+        Returns:
+            GitHub username if authenticated, None otherwise
+        """
+        # Error boundary: an invalid or expired token is only detectable by asking
+        try:
+            data = self._client.request("GET", "/user")
+        except GitHubHttpError:
+            return None
+        return data["login"]
+
+
+def _parse_rest_issue(data: dict[str, Any]) -> IssueInfo:
+    """Convert a REST API issue object into IssueInfo (gh CLI conventions)."""
+    return IssueInfo(
+        number=data["number"],
+        title=data["title"],
+        body=data.get("body") or "",
+        state=data["state"].upper(),
+        url=data["html_url"],
+        labels=[label["name"] for label in data.get("labels", [])],
+        assignees=[assignee["login"] for assignee in data.get("assignees", [])],
+        created_at=datetime.fromisoformat(data["created_at"].replace("Z", "+00:00")),
+        updated_at=datetime.fromisoformat(data["updated_at"].replace("Z", "+00:00")),
+    )
@@ -1,13 +1,27 @@
 """Production implementation of GitHub issues using gh CLI."""
 
 import json
-import subprocess
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
+from erk_shared.github.graphql_batch import NestedConnection, run_graphql_batch
 from erk_shared.github.issues.abc import GitHubIssues
-from erk_shared.github.issues.types import CreateIssueResult, IssueInfo
-from erk_shared.subprocess_utils import execute_gh_command
+from erk_shared.github.issues.types import CreateIssueResult, IssueInfo, IssuesWithLinkedPRs
+from erk_shared.github.parsing import closing_prs_timeline_selection, parse_closing_prs
+from erk_shared.github.rate_budget import GitHubRateBudget
+from erk_shared.github.repo_identity import RepoIdentityResolver
+from erk_shared.github.types import PullRequestInfo, RepoIdentity
+from erk_shared.integrations.parallel.abc import ParallelTaskRunner
+from erk_shared.integrations.parallel.real import RealParallelTaskRunner
+from erk_shared.integrations.time.real import RealTime
+from erk_shared.subprocess_utils import execute_gh_command, run_subprocess
+
+# GraphQL connections return at most 100 nodes per page
+_ISSUE_PAGE_SIZE = 100
+
+# Issues per aliased comments query, each selecting up to 100 comments
+_COMMENTS_CHUNK_SIZE = 50
 
 
 class RealGitHubIssues(GitHubIssues):
@@ -16,8 +30,31 @@ class RealGitHubIssues(GitHubIssues):
     All GitHub issue operations execute actual gh commands via subprocess.
     """
 
-    def __init__(self) -> None:
-        """Initialize RealGitHubIssues."""
+    def __init__(
+        self,
+        identity_resolver: RepoIdentityResolver | None = None,
+        runner: ParallelTaskRunner | None = None,
+        budget: GitHubRateBudget | None = None,
+    ) -> None:
+        """Initialize RealGitHubIssues.
+
+        Args:
+            identity_resolver: Source of the repository owner/name for GraphQL
+                queries. If None, it is resolved via gh on first use.
+            runner: Worker pool for chunked batch queries. If None, a private
+                pool is created.
+            budget: Rate-limit budget that GraphQL queries are recorded in and
+                batch queries are throttled by. If None, a private budget is used.
+        """
+        if identity_resolver is None:
+            identity_resolver = RepoIdentityResolver(identity=None, cache_path=None)
+        self._identity_resolver = identity_resolver
+        if runner is None:
+            runner = RealParallelTaskRunner()
+        self._runner = runner
+        if budget is None:
+            budget = GitHubRateBudget(RealTime())
+        self._budget = budget
 
     def create_issue(
         self, repo_root: Path, title: str, body: str, labels: list[str]
@@ -136,6 +173,68 @@ class RealGitHubIssues(GitHubIssues):
             for issue in data
         ]
 
+    def list_issues_with_linked_prs(
+        self,
+        repo_root: Path,
+        *,
+        labels: list[str] | None,
+        state: str | None,
+        limit: int | None,
+        include_linked_prs: bool,
+    ) -> IssuesWithLinkedPRs:
+        """Query issues and their closing PRs with one GraphQL request per page.
+
+        Each page carries issue bodies, labels and timestamps together with the
+        cross-referencing PRs and their check rollup, and pages are followed by
+        cursor until limit is reached.
+
+        Note: Uses gh's native error handling - gh CLI raises RuntimeError
+        on failures (not installed, not authenticated).
+        """
+        identity = self._identity_resolver.resolve(repo_root)
+        required_labels = set(labels) if labels else set()
+
+        issues: list[IssueInfo] = []
+        pr_linkages: dict[int, list[PullRequestInfo]] = {}
+        cursor: str | None = None
+        while limit is None or len(issues) < limit:
+            # Pages can only be trimmed to the limit when no issues are filtered out
+            first = _ISSUE_PAGE_SIZE
+            if limit is not None and len(required_labels) <= 1:
+                first = min(_ISSUE_PAGE_SIZE, limit - len(issues))
+            query = _build_issue_list_query(
+                identity,
+                first=first,
+                labels=labels,
+                state=state,
+                after=cursor,
+                include_linked_prs=include_linked_prs,
+            )
+            data = self._execute_graphql(query, repo_root)
+            connection = data["data"]["repository"]["issues"]
+
+            for node in connection["nodes"]:
+                issue = _parse_graphql_issue(node)
+                # GraphQL matches any of the labels; gh requires all of them
+                if not required_labels.issubset(issue.labels):
+                    continue
+                issues.append(issue)
+                if include_linked_prs:
+                    prs = parse_closing_prs(node["timelineItems"]["nodes"], identity)
+                    if prs:
+                        pr_linkages[issue.number] = prs
+
+            page_info = connection["pageInfo"]
+            if not page_info["hasNextPage"]:
+                break
+            cursor = page_info["endCursor"]
+
+        if limit is not None:
+            issues = issues[:limit]
+            listed = {issue.number for issue in issues}
+            pr_linkages = {number: prs for number, prs in pr_linkages.items() if number in listed}
+        return IssuesWithLinkedPRs(issues=issues, pr_linkages=pr_linkages)
+
     def get_issue_comments(self, repo_root: Path, number: int) -> list[str]:
         """Fetch all comment bodies for an issue using gh CLI.
 
@@ -164,40 +263,41 @@ class RealGitHubIssues(GitHubIssues):
     def get_multiple_issue_comments(
         self, repo_root: Path, issue_numbers: list[int]
     ) -> dict[int, list[str]]:
-        """Fetch comments for multiple issues using GraphQL batch query.
+        """Fetch comments for multiple issues using GraphQL batch queries.
 
-        Uses GraphQL aliases to fetch all issue comments in a single API call,
-        dramatically improving performance (10-50x faster than individual calls).
+        Uses GraphQL aliases to fetch the comments of up to 50 issues per API
+        call, with the calls run concurrently, dramatically improving performance
+        (10-50x faster than individual calls). Issues with more than 100
+        comments get the rest from follow-up queries.
         """
         if not issue_numbers:
             return {}
 
-        # Get owner and repo name (GraphQL doesn't support {owner}/{repo} placeholders)
-        repo_info_cmd = ["gh", "repo", "view", "--json", "owner,name"]
-        repo_info_stdout = execute_gh_command(repo_info_cmd, repo_root)
-        repo_info = json.loads(repo_info_stdout)
-        owner = repo_info["owner"]["login"]
-        repo_name = repo_info["name"]
-
-        # Build GraphQL query with aliases for each issue
-        aliases = []
-        for i, num in enumerate(issue_numbers):
-            aliases.append(
-                f"issue{i}: issue(number: {num}) {{ "
-                f"number comments(first: 100) {{ nodes {{ body }} }} }}"
-            )
-
-        repo_query = f'repository(owner: "{owner}", name: "{repo_name}")'
-        query = f"query {{ {repo_query} {{ " + " ".join(aliases) + " } }"
-
-        cmd = ["gh", "api", "graphql", "-f", f"query={query}"]
-        stdout = execute_gh_command(cmd, repo_root)
-        data = json.loads(stdout)
+        # GraphQL doesn't support {owner}/{repo} placeholders
+        identity = self._identity_resolver.resolve(repo_root)
+
+        # Aliases are numbered by position, so chunks never reuse one
+        repository = run_graphql_batch(
+            list(enumerate(issue_numbers)),
+            lambda chunk: _build_comments_query(
+                {f"issue{i}": num for i, num in chunk}, identity, after=None
+            ),
+            lambda query: self._execute_graphql(query, repo_root),
+            runner=self._runner,
+            chunk_size=_COMMENTS_CHUNK_SIZE,
+            budget=self._budget,
+            nested=NestedConnection(
+                path=("comments",),
+                build_page_query=lambda cursors: _build_comments_query(
+                    {alias: issue_numbers[int(alias.removeprefix("issue"))] for alias in cursors},
+                    identity,
+                    after=cursors,
+                ),
+            ),
+        )
 
         # Parse results into dict[issue_number -> comments]
         result: dict[int, list[str]] = {}
-        repository = data.get("data", {}).get("repository", {})
-
         for i, num in enumerate(issue_numbers):
             issue_data = repository.get(f"issue{i}")
             if issue_data and issue_data.get("comments"):
@@ -210,6 +310,16 @@ class RealGitHubIssues(GitHubIssues):
 
         return result
 
+    def _execute_graphql(self, query: str, repo_root: Path) -> dict[str, Any]:
+        """Execute a GraphQL query, recording its cost in the rate-limit budget."""
+        return self._budget.run_graphql(query, lambda q: self._send_graphql(q, repo_root))
+
+    def _send_graphql(self, query: str, repo_root: Path) -> dict[str, Any]:
+        """Send a GraphQL query via gh CLI and return the parsed response."""
+        cmd = ["gh", "api", "graphql", "-f", f"query={query}"]
+        stdout = execute_gh_command(cmd, repo_root)
+        return json.loads(stdout)
+
     def ensure_label_exists(
         self,
         repo_root: Path,
@@ -283,7 +393,7 @@ class RealGitHubIssues(GitHubIssues):
         Returns:
             GitHub username if authenticated, None otherwise
         """
-        result = subprocess.run(
+        result = run_subprocess(
             ["gh", "api", "user", "--jq", ".login"],
             capture_output=True,
             text=True,
@@ -292,3 +402,84 @@ class RealGitHubIssues(GitHubIssues):
         if result.returncode != 0:
             return None
         return result.stdout.strip()
+
+
+def _build_issue_list_query(
+    identity: RepoIdentity,
+    *,
+    first: int,
+    labels: list[str] | None,
+    state: str | None,
+    after: str | None,
+    include_linked_prs: bool,
+) -> str:
+    """Build one page of the issue listing query, newest issues first."""
+    arguments = [
+        f"first: {first}",
+        "orderBy: {field: CREATED_AT, direction: DESC}",
+    ]
+    if labels:
+        arguments.append(f"labels: {json.dumps(labels)}")
+    # gh issue list lists open issues unless told otherwise
+    if state is None or state.lower() == "open":
+        arguments.append("states: [OPEN]")
+    elif state.lower() == "closed":
+        arguments.append("states: [CLOSED]")
+    if after is not None:
+        arguments.append(f"after: {json.dumps(after)}")
+
+    timeline = closing_prs_timeline_selection(after=None) if include_linked_prs else ""
+    return f"""query {{
+  repository(owner: {json.dumps(identity.owner)}, name: {json.dumps(identity.name)}) {{
+    issues({", ".join(arguments)}) {{
+      pageInfo {{ hasNextPage endCursor }}
+      nodes {{
+        number title body state url createdAt updatedAt
+        labels(first: 100) {{ nodes {{ name }} }}
+        assignees(first: 100) {{ nodes {{ login }} }}
+        {timeline}
+      }}
+    }}
+  }}
+}}"""
+
+
+def _parse_graphql_issue(node: dict[str, Any]) -> IssueInfo:
+    """Parse an Issue node of the issue listing query."""
+    return IssueInfo(
+        number=node["number"],
+        title=node["title"],
+        body=node["body"],
+        state=node["state"],
+        url=node["url"],
+        labels=[label["name"] for label in node["labels"]["nodes"]],
+        assignees=[assignee["login"] for assignee in node["assignees"]["nodes"]],
+        created_at=datetime.fromisoformat(node["createdAt"].replace("Z", "+00:00")),
+        updated_at=datetime.fromisoformat(node["updatedAt"].replace("Z", "+00:00")),
+    )
+
+
+def _build_comments_query(
+    issues: dict[str, int], identity: RepoIdentity, *, after: dict[str, str] | None
+) -> str:
+    """Build an aliased query for the comments of each issue.
+
+    Args:
+        issues: Mapping of alias -> issue number
+        identity: Repository owner/name
+        after: Mapping of alias -> cursor of the previous page, or None for the
+            first page of every issue
+    """
+    aliases = []
+    for alias, num in issues.items():
+        arguments = "first: 100"
+        if after is not None:
+            arguments += f", after: {json.dumps(after[alias])}"
+        aliases.append(
+            f"{alias}: issue(number: {num}) {{ "
+            f"number comments({arguments}) {{ "
+            f"pageInfo {{ hasNextPage endCursor }} nodes {{ body }} }} }}"
+        )
+
+    repo_query = f'repository(owner: "{identity.owner}", name: "{identity.name}")'
+    return f"query {{ {repo_query} {{ " + " ".join(aliases) + " } }"
@@ -3,6 +3,8 @@
 from dataclasses import dataclass
 from datetime import datetime
 
+from erk_shared.github.types import PullRequestInfo
+
 
 @dataclass(frozen=True)
 class IssueInfo:
@@ -30,3 +32,17 @@ class CreateIssueResult:
 
     number: int
     url: str
+
+
+@dataclass(frozen=True)
+class IssuesWithLinkedPRs:
+    """Issues listed together with the PRs that will close them.
+
+    Attributes:
+        issues: Matching issues, newest first
+        pr_linkages: Mapping of issue number -> closing PRs sorted by created_at
+            descending; issues without closing PRs are absent
+    """
+
+    issues: list[IssueInfo]
+    pr_linkages: dict[int, list[PullRequestInfo]]
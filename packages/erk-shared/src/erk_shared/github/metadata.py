@@ -10,6 +10,10 @@ import yaml
 
 logger = logging.getLogger(__name__)
 
+# libyaml's C loader when PyYAML was built with it; it parses several times
+# faster than the pure-Python SafeLoader and accepts the same documents
+_YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass(frozen=True)
 class MetadataBlock:
@@ -1035,7 +1039,7 @@ def parse_metadata_block_body(body: str) -> dict[str, Any]:
 
     # Parse YAML (strict - raises on error)
     try:
-        data = yaml.safe_load(yaml_content)
+        data = yaml.load(yaml_content, Loader=_YamlSafeLoader)
     except yaml.YAMLError as e:
         raise ValueError(f"Failed to parse YAML content: {e}") from e
 
@@ -1082,6 +1086,8 @@ def find_metadata_block(text: str, key: str) -> MetadataBlock | None:
     """
     Find a specific metadata block by key.
 
+    Only the YAML of blocks with a matching key is parsed.
+
     Args:
         text: Markdown text to search
         key: The metadata block key to find
@@ -1089,10 +1095,16 @@ def find_metadata_block(text: str, key: str) -> MetadataBlock | None:
     Returns:
         MetadataBlock if found, None otherwise
     """
-    blocks = parse_metadata_blocks(text)
-    for block in blocks:
-        if block.key == key:
-            return block
+    for raw_block in extract_raw_metadata_blocks(text):
+        if raw_block.key != key:
+            continue
+        try:
+            data = parse_metadata_block_body(raw_block.body)
+        except ValueError as e:
+            # Lenient like parse_metadata_blocks: skip bad blocks
+            logger.debug(f"Failed to parse metadata block '{raw_block.key}': {e}")
+            continue
+        return MetadataBlock(key=raw_block.key, data=data)
     return None
 
 
@@ -1420,6 +1432,46 @@ def update_plan_header_dispatch(
     return replace_metadata_block_in_body(issue_body, "plan-header", new_block_content)
 
 
+@dataclass(frozen=True)
+class PlanHeader:
+    """Fields of an issue's plan-header block.
+
+    Parse an issue body once with parse_plan_header and read every field from
+    the result, rather than calling an extract_plan_header_* function per field.
+    """
+
+    worktree_name: str | None
+    last_dispatched_run_id: str | None
+    last_dispatched_at: str | None
+    last_local_impl_at: str | None
+
+
+def parse_plan_header(issue_body: str) -> PlanHeader:
+    """Parse the plan-header block of an issue body.
+
+    Args:
+        issue_body: Issue body containing plan-header block
+
+    Returns:
+        PlanHeader; all fields are None if the block is missing or invalid
+    """
+    block = find_metadata_block(issue_body, "plan-header")
+    if block is None:
+        return PlanHeader(
+            worktree_name=None,
+            last_dispatched_run_id=None,
+            last_dispatched_at=None,
+            last_local_impl_at=None,
+        )
+
+    return PlanHeader(
+        worktree_name=block.data.get("worktree_name"),
+        last_dispatched_run_id=block.data.get("last_dispatched_run_id"),
+        last_dispatched_at=block.data.get("last_dispatched_at"),
+        last_local_impl_at=block.data.get("last_local_impl_at"),
+    )
+
+
 def extract_plan_header_dispatch_info(
     issue_body: str,
 ) -> tuple[str | None, str | None]:
@@ -1432,14 +1484,8 @@ def extract_plan_header_dispatch_info(
         Tuple of (last_dispatched_run_id, last_dispatched_at)
         Both are None if block not found or fields not present
     """
-    block = find_metadata_block(issue_body, "plan-header")
-    if block is None:
-        return (None, None)
-
-    run_id = block.data.get("last_dispatched_run_id")
-    dispatched_at = block.data.get("last_dispatched_at")
-
-    return (run_id, dispatched_at)
+    header = parse_plan_header(issue_body)
+    return (header.last_dispatched_run_id, header.last_dispatched_at)
 
 
 def extract_plan_header_worktree_name(issue_body: str) -> str | None:
@@ -1451,11 +1497,7 @@ def extract_plan_header_worktree_name(issue_body: str) -> str | None:
     Returns:
         worktree_name if found, None otherwise (indicates schema v1 or missing block)
     """
-    block = find_metadata_block(issue_body, "plan-header")
-    if block is None:
-        return None
-
-    return block.data.get("worktree_name")
+    return parse_plan_header(issue_body).worktree_name
 
 
 def update_plan_header_local_impl(
@@ -1549,8 +1591,4 @@ def extract_plan_header_local_impl_at(issue_body: str) -> str | None:
     Returns:
         last_local_impl_at ISO timestamp if found, None otherwise
     """
-    block = find_metadata_block(issue_body, "plan-header")
-    if block is None:
-        return None
-
-    return block.data.get("last_local_impl_at")
+    return parse_plan_header(issue_body).last_local_impl_at
@@ -3,8 +3,9 @@
 import json
 import re
 from pathlib import Path
+from typing import Any
 
-from erk_shared.github.types import PRInfo, PullRequestInfo
+from erk_shared.github.types import PRInfo, PullRequestInfo, RepoIdentity
 from erk_shared.subprocess_utils import run_subprocess_with_context
 
 
@@ -101,6 +102,127 @@ def parse_github_pr_status(json_str: str) -> PRInfo:
     return PRInfo(pr["state"], pr["number"], pr["title"])
 
 
+def closing_prs_timeline_selection(*, after: str | None) -> str:
+    """GraphQL selection on an Issue for the cross-referencing PRs that will close it.
+
+    Parse the resulting timelineItems nodes with parse_closing_prs().
+
+    Args:
+        after: Cursor of the previous page, or None for the first page
+
+    Returns:
+        timelineItems selection, including its pageInfo
+    """
+    after_argument = f", after: {json.dumps(after)}" if after is not None else ""
+    return f"""timelineItems(itemTypes: [CROSS_REFERENCED_EVENT], first: 20{after_argument}) {{
+  pageInfo {{
+    hasNextPage
+    endCursor
+  }}
+  nodes {{
+    ... on CrossReferencedEvent {{
+      willCloseTarget
+      source {{
+        ... on PullRequest {{
+          number
+          state
+          url
+          isDraft
+          title
+          createdAt
+          statusCheckRollup {{
+            state
+          }}
+          mergeable
+        }}
+      }}
+    }}
+  }}
+}}"""
+
+
+def parse_closing_prs(
+    timeline_nodes: list[dict[str, Any] | None], identity: RepoIdentity
+) -> list[PullRequestInfo]:
+    """Parse the PRs that will close an issue from its timeline nodes.
+
+    Processes CrossReferencedEvent nodes selected by closing_prs_timeline_selection()
+    and keeps PRs with willCloseTarget=true.
+
+    Args:
+        timeline_nodes: timelineItems.nodes of one issue
+        identity: Repository owner/name
+
+    Returns:
+        PRs sorted by created_at descending
+    """
+    # Collect PRs with timestamps for sorting
+    prs_with_timestamps: list[tuple[PullRequestInfo, str]] = []
+
+    for node in timeline_nodes:
+        if node is None:
+            continue
+
+        # Filter to only closing PRs
+        if not node.get("willCloseTarget"):
+            continue
+
+        source = node.get("source")
+        if source is None:
+            continue
+
+        # Extract required PR fields
+        pr_number = source.get("number")
+        state = source.get("state")
+        url = source.get("url")
+
+        # Skip if essential fields are missing (source may be Issue, not PR)
+        if pr_number is None or state is None or url is None:
+            continue
+
+        # Extract optional fields
+        is_draft = source.get("isDraft")
+        title = source.get("title")
+        created_at = source.get("createdAt")
+
+        # Parse checks status
+        checks_passing = None
+        status_rollup = source.get("statusCheckRollup")
+        if status_rollup is not None:
+            rollup_state = status_rollup.get("state")
+            if rollup_state == "SUCCESS":
+                checks_passing = True
+            elif rollup_state in ("FAILURE", "ERROR"):
+                checks_passing = False
+
+        # Parse conflicts status
+        has_conflicts = None
+        mergeable = source.get("mergeable")
+        if mergeable == "CONFLICTING":
+            has_conflicts = True
+        elif mergeable == "MERGEABLE":
+            has_conflicts = False
+
+        pr_info = PullRequestInfo(
+            number=pr_number,
+            state=state,
+            url=url,
+            is_draft=is_draft if is_draft is not None else False,
+            title=title,
+            checks_passing=checks_passing,
+            owner=identity.owner,
+            repo=identity.name,
+            has_conflicts=has_conflicts,
+        )
+
+        # Store with timestamp for sorting
+        if created_at:
+            prs_with_timestamps.append((pr_info, created_at))
+
+    prs_with_timestamps.sort(key=lambda x: x[1], reverse=True)
+    return [pr for pr, _ in prs_with_timestamps]
+
+
 def _determine_checks_status(check_rollup: list[dict]) -> bool | None:
     """Determine overall CI checks status.
 
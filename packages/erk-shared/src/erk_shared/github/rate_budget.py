@@ -0,0 +1,384 @@
+"""GitHub API rate-limit budget: tracking, adaptive batching and backoff.
+
+GitHub meters GraphQL in points (5,000 an hour for a user) and REST in
+requests. Bulk listings can use up the points, after which every query
+fails. One GitHubRateBudget is shared by the GitHub integrations of an erk
+invocation:
+
+- GraphQL queries request `rateLimit { cost remaining limit resetAt }`, and
+  the budget records what each query cost and what is left
+- REST responses of the HTTP backend are recorded from their X-RateLimit headers
+- batch queries use smaller chunks and fewer concurrent requests as the
+  budget runs low
+- requests rejected by a secondary rate limit are retried with exponential
+  backoff, and later batches run one query at a time
+- the invocation's consumption is appended to a GitHubBudgetLog, which
+  `erk admin github-budget` summarizes per command
+
+gh subcommands other than `gh api graphql` (pr list, run list, ...) don't
+expose rate-limit data, so they aren't recorded.
+"""
+
+import json
+import os
+import random
+import re
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from erk_shared.integrations.time.abc import Time
+from erk_shared.output.output import user_output
+
+RATE_LIMIT_SELECTION = "rateLimit { cost remaining limit resetAt }"
+
+# The first operation of a query document (fragments may precede it)
+_QUERY_OPERATION_PATTERN = re.compile(r"^(\s*query\b[^{]*\{)", re.MULTILINE)
+
+# Fractions of the hourly limit below which batches are throttled
+_LOW_BUDGET_FRACTION = 0.2
+_CRITICAL_BUDGET_FRACTION = 0.05
+_LOW_BUDGET_CONCURRENCY = 2
+
+_MAX_BACKOFF_RETRIES = 3
+_BACKOFF_BASE_SECONDS = 2.0
+
+# The log is compacted to the retention window once it grows past this size
+_MAX_LOG_BYTES = 1_000_000
+_LOG_RETENTION = timedelta(days=1)
+
+
+def with_rate_limit(query: str) -> str:
+    """Add the rateLimit selection to the query operation of a GraphQL document.
+
+    Mutations and documents that already select rateLimit are returned unchanged.
+    """
+    if "rateLimit" in query:
+        return query
+    return _QUERY_OPERATION_PATTERN.sub(rf"\1 {RATE_LIMIT_SELECTION}", query, count=1)
+
+
+def is_secondary_rate_limit(error: Exception) -> bool:
+    """Whether an error from gh or the HTTP client is a secondary rate limit."""
+    message = str(error).lower()
+    return "secondary rate limit" in message or "abuse detection" in message
+
+
+@dataclass(frozen=True)
+class RateLimitStatus:
+    """Most recently reported state of one rate-limit resource.
+
+    Attributes:
+        resource: "graphql" or "core" (REST)
+        limit: Points or requests per hour
+        remaining: Points or requests left until reset_at
+        reset_at: When the limit resets
+    """
+
+    resource: str
+    limit: int
+    remaining: int
+    reset_at: datetime
+
+
+@dataclass(frozen=True)
+class BudgetUsage:
+    """GitHub API consumption of one erk invocation.
+
+    Attributes:
+        command: Command that was run, e.g. "plan list"
+        recorded_at: When the invocation finished
+        graphql_queries: GraphQL queries sent
+        graphql_points: GraphQL points they cost
+        rest_requests: REST requests sent (HTTP backend only)
+        secondary_limit_hits: Requests rejected by a secondary rate limit
+        graphql_remaining: GraphQL points left afterwards, if known
+        graphql_limit: GraphQL points per hour, if known
+        graphql_reset_at: When the GraphQL points reset, if known
+    """
+
+    command: str
+    recorded_at: datetime
+    graphql_queries: int
+    graphql_points: int
+    rest_requests: int
+    secondary_limit_hits: int
+    graphql_remaining: int | None
+    graphql_limit: int | None
+    graphql_reset_at: datetime | None
+
+
+class GitHubRateBudget:
+    """Rate-limit state shared by the GitHub integrations of one invocation.
+
+    Thread-safe: batch queries record from worker threads.
+    """
+
+    def __init__(self, time: Time, log: "GitHubBudgetLog | None" = None) -> None:
+        """Create an empty budget.
+
+        Args:
+            time: Time abstraction for backoff sleeps and reset times
+            log: Where record_invocation() appends this invocation's usage
+        """
+        self._time = time
+        self._log = log
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._status: dict[str, RateLimitStatus] = {}
+        self._graphql_queries = 0
+        self._graphql_points = 0
+        self._rest_requests = 0
+        self._secondary_limit_hits = 0
+        self._warned_low = False
+
+    @property
+    def log(self) -> "GitHubBudgetLog | None":
+        """Log of past invocations' usage, if one is attached."""
+        return self._log
+
+    def status(self, resource: str) -> RateLimitStatus | None:
+        """Most recent state of a resource ("graphql" or "core"), if reported yet."""
+        with self._lock:
+            return self._status.get(resource)
+
+    def run_graphql(self, query: str, send: Callable[[str], dict[str, Any]]) -> dict[str, Any]:
+        """Send a GraphQL query with rate-limit accounting and backoff.
+
+        Args:
+            query: GraphQL document
+            send: Sends a document and returns the full response
+
+        Returns:
+            The response of send
+
+        Raises:
+            RuntimeError: If the GraphQL points are known to be used up
+        """
+        graphql = self.status("graphql")
+        if graphql is not None and graphql.remaining == 0 and graphql.reset_at > self._time.now():
+            raise RuntimeError(
+                "GitHub GraphQL rate limit exhausted; it resets at "
+                f"{graphql.reset_at.astimezone().strftime('%H:%M')}"
+            )
+
+        response = self.with_backoff(lambda: send(with_rate_limit(query)))
+        self._record_graphql(response)
+        return response
+
+    def with_backoff[T](self, send: Callable[[], T]) -> T:
+        """Call send, retrying with exponential backoff on secondary rate limits.
+
+        Nested calls (an HTTP request inside run_graphql) don't retry on their
+        own, so a request is never retried by two layers at once.
+        """
+        if getattr(self._local, "in_backoff", False):
+            return send()
+
+        self._local.in_backoff = True
+        try:
+            attempt = 0
+            while True:
+                # Error boundary: a secondary rate limit is only reported as a
+                # failed gh command or HTTP error
+                try:
+                    return send()
+                except RuntimeError as e:
+                    if not is_secondary_rate_limit(e) or attempt >= _MAX_BACKOFF_RETRIES:
+                        raise
+                with self._lock:
+                    self._secondary_limit_hits += 1
+                delay = _BACKOFF_BASE_SECONDS * 2**attempt
+                self._time.sleep(delay + random.uniform(0, delay / 2))
+                attempt += 1
+        finally:
+            self._local.in_backoff = False
+
+    def record_rest(self, *, limit: int, remaining: int, reset_at: datetime) -> None:
+        """Record one REST request and the core limit reported with its response."""
+        with self._lock:
+            self._rest_requests += 1
+            self._status["core"] = RateLimitStatus("core", limit, remaining, reset_at)
+
+    def chunk_size(self, preferred: int) -> int:
+        """Items per batch query given the GraphQL points left.
+
+        Smaller chunks lose less work when the points run out mid-batch.
+        """
+        fraction = self._graphql_fraction_remaining()
+        if fraction is None or fraction >= _LOW_BUDGET_FRACTION:
+            return preferred
+        if fraction >= _CRITICAL_BUDGET_FRACTION:
+            return max(1, preferred // 2)
+        return max(1, preferred // 4)
+
+    def max_concurrency(self) -> int | None:
+        """Batch queries to run at once, or None for no limit beyond the worker pool."""
+        with self._lock:
+            if self._secondary_limit_hits > 0:
+                return 1
+        fraction = self._graphql_fraction_remaining()
+        if fraction is None or fraction >= _LOW_BUDGET_FRACTION:
+            return None
+        if fraction >= _CRITICAL_BUDGET_FRACTION:
+            return _LOW_BUDGET_CONCURRENCY
+        return 1
+
+    def usage(self, command: str) -> BudgetUsage | None:
+        """This invocation's consumption so far, or None if it made no recorded calls."""
+        with self._lock:
+            if self._graphql_queries == 0 and self._rest_requests == 0:
+                return None
+            graphql = self._status.get("graphql")
+            return BudgetUsage(
+                command=command,
+                recorded_at=self._time.now(),
+                graphql_queries=self._graphql_queries,
+                graphql_points=self._graphql_points,
+                rest_requests=self._rest_requests,
+                secondary_limit_hits=self._secondary_limit_hits,
+                graphql_remaining=graphql.remaining if graphql is not None else None,
+                graphql_limit=graphql.limit if graphql is not None else None,
+                graphql_reset_at=graphql.reset_at if graphql is not None else None,
+            )
+
+    def record_invocation(self, command: str) -> None:
+        """Append this invocation's usage to the log, if any calls were recorded."""
+        if self._log is None:
+            return
+        usage = self.usage(command)
+        if usage is not None:
+            self._log.append(usage)
+
+    def _record_graphql(self, response: dict[str, Any]) -> None:
+        data = response.get("data")
+        rate_limit = data.get("rateLimit") if isinstance(data, dict) else None
+        with self._lock:
+            self._graphql_queries += 1
+            if not isinstance(rate_limit, dict):
+                return
+            self._graphql_points += rate_limit.get("cost") or 0
+            status = RateLimitStatus(
+                resource="graphql",
+                limit=rate_limit["limit"],
+                remaining=rate_limit["remaining"],
+                reset_at=_parse_datetime(rate_limit["resetAt"]),
+            )
+            self._status["graphql"] = status
+            warn = not self._warned_low and status.remaining < status.limit * _LOW_BUDGET_FRACTION
+            if warn:
+                self._warned_low = True
+
+        if warn:
+            user_output(
+                f"Warning: GitHub GraphQL budget low ({status.remaining}/{status.limit} "
+                f"points left, resets at {status.reset_at.astimezone().strftime('%H:%M')}); "
+                "batch queries are being throttled"
+            )
+
+    def _graphql_fraction_remaining(self) -> float | None:
+        graphql = self.status("graphql")
+        if graphql is None or graphql.limit <= 0:
+            return None
+        return graphql.remaining / graphql.limit
+
+
+class GitHubBudgetLog:
+    """Append-only JSON-lines log of the GitHub API usage of erk invocations.
+
+    The log is shared by every erk process of the user (GitHub limits are per
+    user). Lines are appended in a single write, and entries older than a day
+    are dropped when the file grows large, by replacing the file with a
+    rewritten copy.
+    """
+
+    def __init__(self, path: Path, time: Time) -> None:
+        """Create a log stored at path (created on first append).
+
+        Args:
+            path: JSON-lines file
+            time: Time abstraction used for the retention window
+        """
+        self._path = path
+        self._time = time
+
+    @property
+    def path(self) -> Path:
+        """File holding the log."""
+        return self._path
+
+    def append(self, usage: BudgetUsage) -> None:
+        """Append one invocation's usage."""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(_encode_usage(usage)) + "\n")
+
+        if self._path.stat().st_size > _MAX_LOG_BYTES:
+            recent = self.read(since=self._time.now() - _LOG_RETENTION)
+            content = "".join(json.dumps(_encode_usage(entry)) + "\n" for entry in recent)
+            # Replaced through a temporary file so that processes appending
+            # meanwhile never write into a half-rewritten file
+            tmp_path = self._path.with_name(f".{self._path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(content, encoding="utf-8")
+            os.replace(tmp_path, self._path)
+
+    def read(self, *, since: datetime) -> list[BudgetUsage]:
+        """Usage recorded at or after since, oldest first.
+
+        Unreadable lines (e.g. from a concurrent partial write) are skipped.
+        """
+        if not self._path.exists():
+            return []
+
+        entries: list[BudgetUsage] = []
+        for line in self._path.read_text(encoding="utf-8").splitlines():
+            usage = _decode_usage(line)
+            if usage is not None and usage.recorded_at >= since:
+                entries.append(usage)
+        return entries
+
+
+def _parse_datetime(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _encode_usage(usage: BudgetUsage) -> dict[str, Any]:
+    return {
+        "command": usage.command,
+        "recorded_at": usage.recorded_at.isoformat(),
+        "graphql_queries": usage.graphql_queries,
+        "graphql_points": usage.graphql_points,
+        "rest_requests": usage.rest_requests,
+        "secondary_limit_hits": usage.secondary_limit_hits,
+        "graphql_remaining": usage.graphql_remaining,
+        "graphql_limit": usage.graphql_limit,
+        "graphql_reset_at": (
+            usage.graphql_reset_at.isoformat() if usage.graphql_reset_at is not None else None
+        ),
+    }
+
+
+def _decode_usage(line: str) -> BudgetUsage | None:
+    # Error boundary: another process may be appending to the file
+    try:
+        data = json.loads(line)
+        return BudgetUsage(
+            command=data["command"],
+            recorded_at=datetime.fromisoformat(data["recorded_at"]),
+            graphql_queries=data["graphql_queries"],
+            graphql_points=data["graphql_points"],
+            rest_requests=data["rest_requests"],
+            secondary_limit_hits=data["secondary_limit_hits"],
+            graphql_remaining=data["graphql_remaining"],
+            graphql_limit=data["graphql_limit"],
+            graphql_reset_at=(
+                datetime.fromisoformat(data["graphql_reset_at"])
+                if data["graphql_reset_at"] is not None
+                else None
+            ),
+        )
+    except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+        return None
@@ -0,0 +1,165 @@
+"""Resolve a repository's GitHub owner/name without invoking gh.
+
+GraphQL queries must name the repository explicitly (they don't support gh's
+{owner}/{repo} placeholders). Asking gh for it costs a process spawn plus a
+network round-trip, so the identity is instead parsed from the origin remote URL
+in the repository's git config, once per erk invocation.
+
+Remotes that can't be parsed (SSH host aliases, insteadOf rewrites, GitHub
+Enterprise hosts) fall back to `gh repo view` once, and the answer is persisted
+to a per-repo cache file so later invocations skip gh entirely.
+"""
+
+import json
+import re
+from pathlib import Path
+
+from erk_shared.github.types import RepoIdentity
+from erk_shared.subprocess_utils import execute_gh_command
+
+_URL_REMOTE_PATTERN = re.compile(
+    r"^(?:https?|ssh|git)://(?:[^@/]+@)?github\.com(?::\d+)?/"
+    r"(?P<owner>[^/]+)/(?P<name>[^/]+?)(?:\.git)?/?$"
+)
+_SCP_REMOTE_PATTERN = re.compile(
+    r"^(?:[^@/]+@)?github\.com:(?P<owner>[^/]+)/(?P<name>[^/]+?)(?:\.git)?/?$"
+)
+_SECTION_PATTERN = re.compile(r'^\[\s*(?P<section>[^\s\]"]+)(?:\s+"(?P<subsection>[^"]*)")?\s*\]')
+
+
+def parse_github_remote_url(url: str) -> RepoIdentity | None:
+    """Parse owner/name from a github.com remote URL.
+
+    Supports https://, ssh://, git:// and scp-style (git@github.com:owner/repo)
+    remotes, with or without a trailing .git.
+
+    Args:
+        url: Remote URL as stored in git config
+
+    Returns:
+        RepoIdentity, or None if the URL doesn't point at github.com
+
+    Example:
+        >>> parse_github_remote_url("git@github.com:dagster-io/erk.git")
+        RepoIdentity(owner="dagster-io", name="erk")
+    """
+    stripped = url.strip()
+    match = _URL_REMOTE_PATTERN.match(stripped) or _SCP_REMOTE_PATTERN.match(stripped)
+    if match is None:
+        return None
+    return RepoIdentity(owner=match.group("owner"), name=match.group("name"))
+
+
+def read_git_remote_url(git_dir: Path, remote: str = "origin") -> str | None:
+    """Read a remote's URL directly from a git config file.
+
+    This is a minimal reader for the `[remote "<name>"] url = ...` entry. It does
+    not follow include directives or apply url.<base>.insteadOf rewrites; URLs
+    that depend on those simply fail to parse and take the gh fallback.
+
+    Args:
+        git_dir: The repository's common git directory (contains `config`)
+        remote: Remote name to look up
+
+    Returns:
+        The remote URL, or None if the config or the remote doesn't exist
+    """
+    config_path = git_dir / "config"
+    if not config_path.is_file():
+        return None
+
+    in_remote_section = False
+    for raw_line in config_path.read_text(encoding="utf-8").splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith(("#", ";")):
+            continue
+
+        section_match = _SECTION_PATTERN.match(line)
+        if section_match is not None:
+            in_remote_section = (
+                section_match.group("section").lower() == "remote"
+                and section_match.group("subsection") == remote
+            )
+            continue
+
+        if not in_remote_section or "=" not in line:
+            continue
+
+        key, _, value = line.partition("=")
+        if key.strip().lower() == "url":
+            return value.strip().strip('"')
+
+    return None
+
+
+def load_cached_repo_identity(cache_path: Path) -> RepoIdentity | None:
+    """Load a previously resolved identity from the per-repo cache file.
+
+    Returns None if the file is missing or malformed.
+    """
+    if not cache_path.is_file():
+        return None
+
+    # Error boundary: a partially written or hand-edited cache file must not
+    # break commands; it is simply re-resolved.
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        return None
+
+    if not isinstance(data, dict):
+        return None
+    owner = data.get("owner")
+    name = data.get("name")
+    if not isinstance(owner, str) or not isinstance(name, str):
+        return None
+    return RepoIdentity(owner=owner, name=name)
+
+
+def save_cached_repo_identity(cache_path: Path, identity: RepoIdentity) -> None:
+    """Persist a resolved identity to the per-repo cache file."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(
+        json.dumps({"owner": identity.owner, "name": identity.name}), encoding="utf-8"
+    )
+
+
+class RepoIdentityResolver:
+    """Provides the RepoIdentity for GraphQL queries, resolving via gh at most once.
+
+    Shared by RealGitHub and RealGitHubIssues so that, for a repository whose
+    remote couldn't be parsed, gh is asked at most once per invocation and the
+    answer is persisted to cache_path for later invocations.
+    """
+
+    def __init__(self, identity: RepoIdentity | None, cache_path: Path | None) -> None:
+        """Create a resolver.
+
+        Args:
+            identity: Identity already known from repo discovery, if any
+            cache_path: Where to persist an identity resolved via gh (None to skip)
+        """
+        self._identity = identity
+        self._cache_path = cache_path
+
+    @property
+    def identity(self) -> RepoIdentity | None:
+        """The identity if already known, without resolving it."""
+        return self._identity
+
+    def resolve(self, repo_root: Path) -> RepoIdentity:
+        """Get the identity, asking gh if it isn't known yet.
+
+        Raises:
+            RuntimeError: If gh fails (not installed, not authenticated, no remote)
+        """
+        if self._identity is not None:
+            return self._identity
+
+        stdout = execute_gh_command(["gh", "repo", "view", "--json", "owner,name"], repo_root)
+        data = json.loads(stdout)
+        identity = RepoIdentity(owner=data["owner"]["login"], name=data["name"])
+        if self._cache_path is not None:
+            save_cached_repo_identity(self._cache_path, identity)
+        self._identity = identity
+        return identity
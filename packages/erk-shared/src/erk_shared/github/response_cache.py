@@ -0,0 +1,309 @@
+"""Persistent on-disk cache for GitHub API responses.
+
+Every `erk plan list`, `erk run list` and `erk status` invocation would otherwise
+re-run the same gh list/GraphQL queries from scratch. This module stores decoded
+responses as small JSON files under the erk metadata directory so subsequent
+invocations within a data class's TTL skip the network entirely.
+
+Architecture:
+- GitHubResponseCache: Keyed file store with per-data-class TTLs and hit/miss counters
+- CacheMode: Per-invocation behavior (normal, refresh, disabled)
+- encode_*/decode_*: JSON codecs for the GitHub types stored in the cache
+
+The cache is consumed by the CachingGitHub/CachingGitHubIssues wrappers, which
+compose with the dry-run, printing and fake implementations like any other layer.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Literal, get_args
+
+from erk_shared.github.types import PullRequestInfo, WorkflowRun
+from erk_shared.integrations.time.abc import Time
+
+CacheDataClass = Literal["issue_bodies", "pr_state", "workflow_runs"]
+
+# Bump when the on-disk entry layout changes so stale files are ignored
+CACHE_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class CacheTTLs:
+    """Time-to-live (seconds) for each class of cached GitHub data.
+
+    Issue bodies change rarely and are re-validated on every write erk makes,
+    while PR and workflow run state changes continuously in CI-heavy repos.
+    """
+
+    issue_bodies: float = 300.0
+    pr_state: float = 60.0
+    workflow_runs: float = 30.0
+
+    def for_data_class(self, data_class: CacheDataClass) -> float:
+        """Get the TTL for a data class."""
+        if data_class == "issue_bodies":
+            return self.issue_bodies
+        if data_class == "pr_state":
+            return self.pr_state
+        return self.workflow_runs
+
+
+class CacheMode(Enum):
+    """How the response cache behaves for the current invocation."""
+
+    NORMAL = "normal"  # Serve fresh entries, store results on miss
+    REFRESH = "refresh"  # Never serve entries, but store fresh results
+    DISABLED = "disabled"  # Bypass the cache entirely
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """A cached response payload (already JSON-decoded)."""
+
+    payload: Any
+    stored_at: float
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Hit/miss counters for the current invocation."""
+
+    hits: int
+    misses: int
+    stores: int
+    invalidations: int
+
+
+class GitHubResponseCache:
+    """On-disk cache of GitHub responses keyed by (repo, operation, parameters).
+
+    Each entry is stored as `<data_class>-<sha256>.json` inside cache_dir so a
+    whole data class can be invalidated with a single glob after a mutation.
+    Unreadable or outdated entries are treated as misses.
+
+    Batch operations are keyed by their whole input set, so most entries are
+    never read again. The first store of each instance (i.e. once per erk
+    invocation) prunes expired, unreadable and outdated entries, which keeps
+    the directory bounded by what one TTL window of commands writes.
+
+    Empty payloads are not stored: the gh-backed implementations return
+    empty results when a request fails, so an empty answer can't be trusted
+    for a whole TTL.
+    """
+
+    def __init__(self, cache_dir: Path, time: Time, ttls: CacheTTLs | None = None) -> None:
+        """Create a response cache rooted at cache_dir.
+
+        Args:
+            cache_dir: Directory for cache entries (created lazily on first store)
+            time: Time abstraction used to stamp and expire entries
+            ttls: Per-data-class TTLs (defaults to CacheTTLs())
+        """
+        self._cache_dir = cache_dir
+        self._time = time
+        self._ttls = ttls if ttls is not None else CacheTTLs()
+        self._mode = CacheMode.NORMAL
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._invalidations = 0
+        self._pruned = False
+
+    @property
+    def cache_dir(self) -> Path:
+        """Directory holding the cache entries."""
+        return self._cache_dir
+
+    @property
+    def mode(self) -> CacheMode:
+        """Current cache mode."""
+        return self._mode
+
+    def set_mode(self, mode: CacheMode) -> None:
+        """Change the cache mode (e.g. from --no-cache/--refresh flags)."""
+        self._mode = mode
+
+    def get(
+        self,
+        data_class: CacheDataClass,
+        repo_root: Path,
+        operation: str,
+        params: dict[str, Any],
+    ) -> CacheEntry | None:
+        """Look up a fresh entry.
+
+        Args:
+            data_class: Class of data, which determines the TTL
+            repo_root: Repository the request was made against
+            operation: Name of the GitHub operation (e.g. "list_issues")
+            params: JSON-serializable request parameters
+
+        Returns:
+            CacheEntry if a fresh entry exists and the mode allows reads, None otherwise
+        """
+        if self._mode == CacheMode.DISABLED:
+            return None
+        if self._mode == CacheMode.REFRESH:
+            self._misses += 1
+            return None
+
+        entry_path = self._entry_path(data_class, repo_root, operation, params)
+        entry = self._read_entry(entry_path)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        age = self._time.now().timestamp() - entry.stored_at
+        if age < 0 or age > self._ttls.for_data_class(data_class):
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        return entry
+
+    def put(
+        self,
+        data_class: CacheDataClass,
+        repo_root: Path,
+        operation: str,
+        params: dict[str, Any],
+        payload: Any,
+    ) -> None:
+        """Store a JSON-serializable payload.
+
+        Writes go through a temporary file and os.replace() so concurrent erk
+        processes never observe a partially written entry. Empty payloads are
+        skipped (see the class docstring).
+        """
+        if self._mode == CacheMode.DISABLED or not payload:
+            return
+        if not self._pruned:
+            self._pruned = True
+            self.prune_expired()
+
+        entry_path = self._entry_path(data_class, repo_root, operation, params)
+        content = json.dumps(
+            {
+                "version": CACHE_FORMAT_VERSION,
+                "stored_at": self._time.now().timestamp(),
+                "payload": payload,
+            }
+        )
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = entry_path.with_name(f".{entry_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(content, encoding="utf-8")
+        os.replace(tmp_path, entry_path)
+        self._stores += 1
+
+    def invalidate(self, data_class: CacheDataClass) -> None:
+        """Drop every entry of a data class (called after mutating operations)."""
+        if not self._cache_dir.exists():
+            return
+        for entry_path in self._cache_dir.glob(f"{data_class}-*.json"):
+            entry_path.unlink(missing_ok=True)
+        self._invalidations += 1
+
+    def prune_expired(self) -> None:
+        """Delete entries past their data class's TTL, and unusable ones."""
+        if not self._cache_dir.exists():
+            return
+        now = self._time.now().timestamp()
+        for data_class in get_args(CacheDataClass):
+            ttl = self._ttls.for_data_class(data_class)
+            for entry_path in self._cache_dir.glob(f"{data_class}-*.json"):
+                entry = self._read_entry(entry_path)
+                if entry is None or now - entry.stored_at > ttl:
+                    entry_path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Drop every entry regardless of data class."""
+        if not self._cache_dir.exists():
+            return
+        for entry_path in self._cache_dir.glob("*.json"):
+            entry_path.unlink(missing_ok=True)
+
+    def stats(self) -> CacheStats:
+        """Get hit/miss counters for this invocation."""
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            stores=self._stores,
+            invalidations=self._invalidations,
+        )
+
+    def format_stats(self) -> str:
+        """Format counters as a single line for debug output."""
+        stats = self.stats()
+        return (
+            f"github cache ({self._mode.value}): {stats.hits} hits, {stats.misses} misses, "
+            f"{stats.stores} stores, {stats.invalidations} invalidations"
+        )
+
+    def _entry_path(
+        self,
+        data_class: CacheDataClass,
+        repo_root: Path,
+        operation: str,
+        params: dict[str, Any],
+    ) -> Path:
+        key = json.dumps([str(repo_root), operation, params], sort_keys=True)
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+        return self._cache_dir / f"{data_class}-{digest}.json"
+
+    def _read_entry(self, entry_path: Path) -> CacheEntry | None:
+        if not entry_path.exists():
+            return None
+
+        # Error boundary: another process may be replacing or pruning the file,
+        # and a truncated write from an older erk version must not break commands.
+        try:
+            data = json.loads(entry_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        if not isinstance(data, dict) or data.get("version") != CACHE_FORMAT_VERSION:
+            return None
+        stored_at = data.get("stored_at")
+        if not isinstance(stored_at, int | float) or "payload" not in data:
+            return None
+        return CacheEntry(payload=data["payload"], stored_at=float(stored_at))
+
+
+# ============================================================================
+# JSON codecs for cached GitHub types
+# ============================================================================
+
+
+def _encode_datetime(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def _decode_datetime(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value is not None else None
+
+
+def encode_pull_request(pr: PullRequestInfo) -> dict[str, Any]:
+    """Encode PullRequestInfo as a JSON-compatible dict."""
+    return asdict(pr)
+
+
+def decode_pull_request(data: dict[str, Any]) -> PullRequestInfo:
+    """Decode PullRequestInfo from encode_pull_request() output."""
+    return PullRequestInfo(**data)
+
+
+def encode_workflow_run(run: WorkflowRun) -> dict[str, Any]:
+    """Encode WorkflowRun as a JSON-compatible dict."""
+    data = asdict(run)
+    data["created_at"] = _encode_datetime(run.created_at)
+    return data
+
+
+def decode_workflow_run(data: dict[str, Any]) -> WorkflowRun:
+    """Decode WorkflowRun from encode_workflow_run() output."""
+    return WorkflowRun(**{**data, "created_at": _decode_datetime(data.get("created_at"))})
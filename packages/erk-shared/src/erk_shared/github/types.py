@@ -66,3 +66,16 @@ class PRCheckoutInfo:
     head_ref_name: str  # Branch name in source repo
     is_cross_repository: bool  # True if from a fork
     state: str  # OPEN, CLOSED, MERGED
+
+
+@dataclass(frozen=True)
+class RepoIdentity:
+    """GitHub repository identity (owner/name) used to address GraphQL queries."""
+
+    owner: str  # GitHub repo owner (e.g., "dagster-io")
+    name: str  # GitHub repo name (e.g., "erk")
+
+    @property
+    def full_name(self) -> str:
+        """Repository in owner/name form."""
+        return f"{self.owner}/{self.name}"
@@ -8,4 +8,5 @@ Import from submodules:
 - dry_run: DryRunGraphite
 - printing: PrintingGraphite
 - parsing: parse_graphite_cache, parse_graphite_pr_info, read_graphite_json_file
+- snapshot: GraphiteMetadataSnapshot
 """
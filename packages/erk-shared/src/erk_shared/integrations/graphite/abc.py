@@ -5,6 +5,7 @@ from pathlib import Path
 
 from erk_shared.git.abc import Git
 from erk_shared.github.types import PullRequestInfo
+from erk_shared.integrations.graphite.stack_graph import StackGraph
 from erk_shared.integrations.graphite.types import BranchMetadata
 
 
@@ -201,6 +202,22 @@ class Graphite(ABC):
         """
         ...
 
+    def get_stack_graph(self, git_ops: Git, repo_root: Path) -> StackGraph:
+        """Get the indexed parent/child graph of all gt-tracked branches.
+
+        Stack-aware commands should query this graph rather than re-deriving
+        relationships from get_all_branches(). The default implementation
+        builds a fresh graph; RealGraphite builds it once per instance.
+
+        Args:
+            git_ops: Git instance for accessing git common directory and branch heads
+            repo_root: Repository root directory
+
+        Returns:
+            StackGraph over get_all_branches() (empty if Graphite isn't set up)
+        """
+        return StackGraph(self.get_all_branches(git_ops, repo_root))
+
     def get_parent_branch(self, git_ops: Git, repo_root: Path, branch: str) -> str | None:
         """Get parent branch name for a given branch.
 
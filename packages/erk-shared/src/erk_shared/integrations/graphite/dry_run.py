@@ -5,6 +5,7 @@ from pathlib import Path
 from erk_shared.git.abc import Git
 from erk_shared.github.types import PullRequestInfo
 from erk_shared.integrations.graphite.abc import Graphite
+from erk_shared.integrations.graphite.stack_graph import StackGraph
 from erk_shared.integrations.graphite.types import BranchMetadata
 
 
@@ -48,6 +49,10 @@ class DryRunGraphite(Graphite):
         """Get branch stack (read-only operation, delegates to wrapped)."""
         return self._wrapped.get_branch_stack(git_ops, repo_root, branch)
 
+    def get_stack_graph(self, git_ops: Git, repo_root: Path) -> StackGraph:
+        """Get stack graph (read-only, delegates to wrapped)."""
+        return self._wrapped.get_stack_graph(git_ops, repo_root)
+
     # Destructive operations: print dry-run message instead of executing
 
     def sync(self, repo_root: Path, *, force: bool, quiet: bool) -> None:
@@ -9,6 +9,7 @@ from pathlib import Path
 from erk_shared.git.abc import Git
 from erk_shared.github.types import PullRequestInfo
 from erk_shared.integrations.graphite.abc import Graphite
+from erk_shared.integrations.graphite.stack_graph import StackGraph
 from erk_shared.integrations.graphite.types import BranchMetadata
 
 
@@ -120,32 +121,8 @@ class FakeGraphite(Graphite):
         if branch not in self._branches:
             return None
 
-        # Build stack from branch metadata (simplified version)
-        ancestors: list[str] = []
-        current = branch
-        while current in self._branches:
-            ancestors.append(current)
-            parent = self._branches[current].parent
-            if parent is None or parent not in self._branches:
-                break
-            current = parent
-
-        ancestors.reverse()
-
-        # Add descendants
-        descendants: list[str] = []
-        current = branch
-        while current in self._branches:
-            children = self._branches[current].children
-            if not children:
-                break
-            first_child = children[0]
-            if first_child not in self._branches:
-                break
-            descendants.append(first_child)
-            current = first_child
-
-        return ancestors + descendants
+        # Build stack from branch metadata
+        return StackGraph(self._branches).stack(branch)
 
     def track_branch(self, cwd: Path, branch_name: str, parent_branch: str) -> None:
         """Fake track_branch operation.
@@ -41,16 +41,15 @@ def read_graphite_json_file(file_path: Path, description: str) -> dict[str, Any]
         raise
 
 
-def parse_graphite_pr_info(json_str: str) -> dict[str, PullRequestInfo]:
-    """Parse Graphite's .graphite_pr_info JSON into PullRequestInfo objects.
+def parse_graphite_pr_info(data: dict[str, Any]) -> dict[str, PullRequestInfo]:
+    """Parse Graphite's .graphite_pr_info data into PullRequestInfo objects.
 
     Args:
-        json_str: JSON string from .graphite_pr_info file
+        data: Decoded JSON from .graphite_pr_info (see read_graphite_json_file)
 
     Returns:
         Mapping of branch name to PullRequestInfo
     """
-    data = json.loads(json_str)
     prs = {}
 
     for pr in data.get("prInfos", []):
@@ -78,18 +77,17 @@ def parse_graphite_pr_info(json_str: str) -> dict[str, PullRequestInfo]:
 
 
 def parse_graphite_cache(
-    json_str: str, git_branch_heads: dict[str, str]
+    cache_data: dict[str, Any], git_branch_heads: dict[str, str]
 ) -> dict[str, BranchMetadata]:
-    """Parse Graphite's .graphite_cache_persist JSON into BranchMetadata objects.
+    """Parse Graphite's .graphite_cache_persist data into BranchMetadata objects.
 
     Args:
-        json_str: JSON string from .graphite_cache_persist file
+        cache_data: Decoded JSON from .graphite_cache_persist (see read_graphite_json_file)
         git_branch_heads: Mapping of branch name to commit SHA from git
 
     Returns:
         Mapping of branch name to BranchMetadata
     """
-    cache_data = json.loads(json_str)
     branches_data: list[tuple[str, dict[str, object]]] = cache_data.get("branches", [])
 
     result = {}
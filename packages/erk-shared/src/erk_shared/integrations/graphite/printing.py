@@ -5,6 +5,7 @@ from pathlib import Path
 from erk_shared.git.abc import Git
 from erk_shared.github.types import PullRequestInfo
 from erk_shared.integrations.graphite.abc import Graphite
+from erk_shared.integrations.graphite.stack_graph import StackGraph
 from erk_shared.integrations.graphite.types import BranchMetadata
 from erk_shared.printing.base import PrintingBase
 
@@ -44,6 +45,10 @@ class PrintingGraphite(PrintingBase, Graphite):
         """Get branch stack (read-only, no printing)."""
         return self._wrapped.get_branch_stack(git_ops, repo_root, branch)
 
+    def get_stack_graph(self, git_ops: Git, repo_root: Path) -> StackGraph:
+        """Get stack graph (read-only, no printing)."""
+        return self._wrapped.get_stack_graph(git_ops, repo_root)
+
     def get_parent_branch(self, git_ops: Git, repo_root: Path, branch: str) -> str | None:
         """Get parent branch (read-only, no printing)."""
         return self._wrapped.get_parent_branch(git_ops, repo_root, branch)
@@ -1,6 +1,5 @@
 """Production implementation of Graphite operations."""
 
-import json
 import subprocess
 import sys
 from pathlib import Path
@@ -14,9 +13,15 @@ from erk_shared.integrations.graphite.parsing import (
     parse_graphite_pr_info,
     read_graphite_json_file,
 )
+from erk_shared.integrations.graphite.snapshot import (
+    GraphiteMetadataSnapshot,
+    branches_fingerprint,
+    stamp_file,
+)
+from erk_shared.integrations.graphite.stack_graph import StackGraph
 from erk_shared.integrations.graphite.types import BranchMetadata
 from erk_shared.output.output import user_output
-from erk_shared.subprocess_utils import run_subprocess_with_context
+from erk_shared.subprocess_utils import run_subprocess, run_subprocess_with_context
 
 
 class RealGraphite(Graphite):
@@ -25,9 +30,16 @@ class RealGraphite(Graphite):
     All Graphite operations execute actual gt commands via subprocess.
     """
 
-    def __init__(self) -> None:
-        """Initialize with empty cache for get_all_branches."""
+    def __init__(self, snapshot: GraphiteMetadataSnapshot | None = None) -> None:
+        """Initialize with empty cache for get_all_branches.
+
+        Args:
+            snapshot: Optional on-disk snapshot that lets later erk invocations
+                skip re-parsing Graphite metadata that hasn't changed
+        """
         self._branches_cache: dict[str, BranchMetadata] | None = None
+        self._stack_graph: StackGraph | None = None
+        self._snapshot = snapshot
 
     def get_graphite_url(self, owner: str, repo: str, pr_number: int) -> str:
         """Get Graphite PR URL for a pull request.
@@ -80,6 +92,7 @@ class RealGraphite(Graphite):
 
         # Invalidate branches cache - gt sync modifies Graphite metadata
         self._branches_cache = None
+        self._stack_graph = None
 
     def restack(self, repo_root: Path, *, no_interactive: bool, quiet: bool) -> None:
         """Run gt restack to rebase the current stack.
@@ -116,6 +129,7 @@ class RealGraphite(Graphite):
 
         # Invalidate branches cache - gt restack modifies Graphite metadata
         self._branches_cache = None
+        self._stack_graph = None
 
     def get_prs_from_graphite(self, git_ops: Git, repo_root: Path) -> dict[str, PullRequestInfo]:
         """Get PR information from Graphite's .git/.graphite_pr_info file."""
@@ -127,10 +141,19 @@ class RealGraphite(Graphite):
         if not pr_info_file.exists():
             return {}
 
+        if self._snapshot is not None:
+            snapshot_prs = self._snapshot.load_pr_info(git_dir)
+            if snapshot_prs is not None:
+                return snapshot_prs
+
+        # Stamp before reading so a concurrent gt write invalidates the snapshot
+        pr_info_stamp = stamp_file(pr_info_file)
         data = read_graphite_json_file(pr_info_file, "Graphite PR info")
+        prs = parse_graphite_pr_info(data)
 
-        # parse_graphite_pr_info expects JSON string, so convert back
-        return parse_graphite_pr_info(json.dumps(data))
+        if self._snapshot is not None:
+            self._snapshot.save_pr_info(pr_info_stamp, prs)
+        return prs
 
     def get_all_branches(self, git_ops: Git, repo_root: Path) -> dict[str, BranchMetadata]:
         """Get all gt-tracked branches with metadata.
@@ -139,7 +162,9 @@ class RealGraphite(Graphite):
         Returns empty dict if cache doesn't exist or git operations fail.
 
         Results are cached for the lifetime of this instance to avoid redundant
-        file reads and git subprocess calls.
+        file reads and git subprocess calls. With a snapshot configured, they
+        are also reused across invocations until the Graphite cache file or a
+        tracked branch ref changes.
         """
         # Return cached result if available
         if self._branches_cache is not None:
@@ -155,70 +180,36 @@ class RealGraphite(Graphite):
             self._branches_cache = {}
             return self._branches_cache
 
+        if self._snapshot is not None:
+            snapshot_branches = self._snapshot.load_branches(git_dir)
+            if snapshot_branches is not None:
+                self._branches_cache = snapshot_branches
+                return self._branches_cache
+
+        # Stamp before reading so a concurrent gt write invalidates the snapshot
+        cache_stamp = stamp_file(cache_file)
         data = read_graphite_json_file(cache_file, "Graphite cache")
 
-        # Get all branch heads from git for enrichment
-        git_branch_heads = {}
+        # Get all branch heads from git for enrichment in a single git call
         branches_data = data.get("branches", [])
-        for branch_name, _ in branches_data:
-            if isinstance(branch_name, str):
-                commit_sha = git_ops.get_branch_head(repo_root, branch_name)
-                if commit_sha:
-                    git_branch_heads[branch_name] = commit_sha
-
-        # parse_graphite_cache expects JSON string, so convert back
-        self._branches_cache = parse_graphite_cache(json.dumps(data), git_branch_heads)
+        branch_names = [name for name, _ in branches_data if isinstance(name, str)]
+        fingerprint = branches_fingerprint(git_dir, cache_stamp, branch_names)
+        git_branch_heads = git_ops.get_branch_heads(repo_root, branch_names)
+
+        self._branches_cache = parse_graphite_cache(data, git_branch_heads)
+        if self._snapshot is not None:
+            self._snapshot.save_branches(fingerprint, self._branches_cache)
         return self._branches_cache
 
+    def get_stack_graph(self, git_ops: Git, repo_root: Path) -> StackGraph:
+        """Get the indexed branch graph, built once per instance from get_all_branches."""
+        if self._stack_graph is None:
+            self._stack_graph = StackGraph(self.get_all_branches(git_ops, repo_root))
+        return self._stack_graph
+
     def get_branch_stack(self, git_ops: Git, repo_root: Path, branch: str) -> list[str] | None:
         """Get the linear graphite stack for a given branch."""
-        # Get all branch metadata
-        all_branches = self.get_all_branches(git_ops, repo_root)
-        if not all_branches:
-            return None
-
-        # Check if the requested branch exists
-        if branch not in all_branches:
-            return None
-
-        # Build parent-child map for traversal
-        branch_info: dict[str, dict[str, str | list[str] | None]] = {}
-        for name, metadata in all_branches.items():
-            branch_info[name] = {
-                "parent": metadata.parent,
-                "children": metadata.children,
-            }
-
-        # Traverse DOWN to collect ancestors (current → parent → ... → trunk)
-        ancestors: list[str] = []
-        current = branch
-        while current in branch_info:
-            ancestors.append(current)
-            parent = branch_info[current]["parent"]
-            if parent is None or parent not in branch_info:
-                break
-            current = parent
-
-        # Reverse to get [trunk, ..., parent, current]
-        ancestors.reverse()
-
-        # Traverse UP to collect descendants (current → child → ... → leaf)
-        descendants: list[str] = []
-        current = branch
-        while True:
-            children = branch_info[current]["children"]
-            if not children:
-                break
-            # Follow the first child for linear stack
-            first_child = children[0]
-            if first_child not in branch_info:
-                break
-            descendants.append(first_child)
-            current = first_child
-
-        # Combine ancestors and descendants
-        # ancestors already contains the current branch
-        return ancestors + descendants
+        return self.get_stack_graph(git_ops, repo_root).stack(branch)
 
     def track_branch(self, cwd: Path, branch_name: str, parent_branch: str) -> None:
         """Track a branch with Graphite.
@@ -240,6 +231,7 @@ class RealGraphite(Graphite):
 
         # Invalidate branches cache - gt track modifies Graphite metadata
         self._branches_cache = None
+        self._stack_graph = None
 
     def submit_branch(self, repo_root: Path, branch_name: str, *, quiet: bool) -> None:
         """Submit (force-push) a branch to GitHub.
@@ -285,7 +277,7 @@ class RealGraphite(Graphite):
         Returns:
             Tuple of (is_authenticated, username, repo_info)
         """
-        result = subprocess.run(
+        result = run_subprocess(
             ["gt", "auth"],
             capture_output=True,
             text=True,
@@ -348,7 +340,7 @@ class RealGraphite(Graphite):
 
         # Use 120-second timeout for network operations
         try:
-            result = subprocess.run(
+            result = run_subprocess(
                 cmd,
                 cwd=repo_root,
                 timeout=120,
@@ -0,0 +1,156 @@
+"""Persisted parse results of Graphite's metadata files.
+
+RealGraphite's in-memory cache only lives for one process, so every erk
+command used to re-read and re-parse .graphite_cache_persist and
+.graphite_pr_info, and re-resolve every tracked branch head with git. This
+module stores the parsed result on disk together with a fingerprint of what
+it was derived from: the (mtime_ns, size) stamps of the Graphite file, of
+packed-refs and of each branch's loose ref. When every stamp still matches,
+the snapshot is returned without opening the Graphite file or running git.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from erk_shared.github.response_cache import decode_pull_request, encode_pull_request
+from erk_shared.github.types import PullRequestInfo
+from erk_shared.integrations.graphite.types import BranchMetadata
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+# [mtime_ns, size] of a file, or None when it doesn't exist
+FileStamp = list[int] | None
+
+
+def stamp_file(path: Path) -> FileStamp:
+    """Get the (mtime_ns, size) stamp of a file, or None if it doesn't exist."""
+    if not path.exists():
+        return None
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def branches_fingerprint(
+    git_dir: Path, cache_stamp: FileStamp, branch_names: list[str]
+) -> dict[str, Any]:
+    """Fingerprint everything get_all_branches output depends on.
+
+    Branch heads come from packed-refs or from loose refs under refs/heads;
+    stamping both catches commits, rebases and branch deletion.
+
+    Args:
+        git_dir: Git common directory holding the refs
+        cache_stamp: Stamp of .graphite_cache_persist, taken before reading it
+        branch_names: Branches listed in .graphite_cache_persist
+    """
+    return {
+        "cache": cache_stamp,
+        "packed_refs": stamp_file(git_dir / "packed-refs"),
+        "refs": {name: stamp_file(git_dir / "refs" / "heads" / name) for name in branch_names},
+    }
+
+
+class GraphiteMetadataSnapshot:
+    """On-disk snapshot of parsed Graphite branch and PR metadata.
+
+    Stores one file per Graphite source file in the given directory.
+    Corrupt, outdated or mismatched snapshots are treated as misses.
+    """
+
+    def __init__(self, snapshot_dir: Path) -> None:
+        """Create a snapshot store.
+
+        Args:
+            snapshot_dir: Directory for snapshot files (created on first save)
+        """
+        self._snapshot_dir = snapshot_dir
+
+    def load_branches(self, git_dir: Path) -> dict[str, BranchMetadata] | None:
+        """Get parsed branch metadata if nothing it depends on has changed.
+
+        Returns:
+            Branch metadata, or None when there is no valid snapshot
+        """
+        entry = self._read(self._branches_path)
+        if entry is None:
+            return None
+
+        stored_fingerprint = entry["fingerprint"]
+        branch_names = list(stored_fingerprint["refs"])
+        cache_stamp = stamp_file(git_dir / ".graphite_cache_persist")
+        if branches_fingerprint(git_dir, cache_stamp, branch_names) != stored_fingerprint:
+            return None
+
+        return {
+            name: BranchMetadata(
+                name=name,
+                parent=parent,
+                children=children,
+                is_trunk=is_trunk,
+                commit_sha=commit_sha,
+            )
+            for name, (parent, children, is_trunk, commit_sha) in entry["data"].items()
+        }
+
+    def save_branches(
+        self, fingerprint: dict[str, Any], branches: dict[str, BranchMetadata]
+    ) -> None:
+        """Store parsed branch metadata under a fingerprint from branches_fingerprint()."""
+        data = {
+            name: [meta.parent, meta.children, meta.is_trunk, meta.commit_sha]
+            for name, meta in branches.items()
+        }
+        self._write(self._branches_path, fingerprint, data)
+
+    def load_pr_info(self, git_dir: Path) -> dict[str, PullRequestInfo] | None:
+        """Get parsed PR info if .graphite_pr_info hasn't changed.
+
+        Returns:
+            PR info by branch, or None when there is no valid snapshot
+        """
+        entry = self._read(self._pr_info_path)
+        if entry is None:
+            return None
+        if stamp_file(git_dir / ".graphite_pr_info") != entry["fingerprint"]:
+            return None
+        return {branch: decode_pull_request(pr) for branch, pr in entry["data"].items()}
+
+    def save_pr_info(self, pr_info_stamp: FileStamp, prs: dict[str, PullRequestInfo]) -> None:
+        """Store parsed PR info under the stamp taken before .graphite_pr_info was read."""
+        data = {branch: encode_pull_request(pr) for branch, pr in prs.items()}
+        self._write(self._pr_info_path, pr_info_stamp, data)
+
+    @property
+    def _branches_path(self) -> Path:
+        return self._snapshot_dir / "graphite-branches.json"
+
+    @property
+    def _pr_info_path(self) -> Path:
+        return self._snapshot_dir / "graphite-pr-info.json"
+
+    def _read(self, path: Path) -> dict[str, Any] | None:
+        if not path.exists():
+            return None
+
+        # Error boundary: another process may be replacing the file, and a
+        # snapshot from an older erk version must not break commands.
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        if not isinstance(entry, dict) or entry.get("version") != SNAPSHOT_FORMAT_VERSION:
+            return None
+        return entry
+
+    def _write(self, path: Path, fingerprint: Any, data: dict[str, Any]) -> None:
+        content = json.dumps(
+            {"version": SNAPSHOT_FORMAT_VERSION, "fingerprint": fingerprint, "data": data},
+            separators=(",", ":"),
+        )
+        self._snapshot_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(content, encoding="utf-8")
+        os.replace(tmp_path, path)
@@ -0,0 +1,187 @@
+"""Indexed graph of gt-tracked branches for stack traversal."""
+
+from erk_shared.integrations.graphite.types import BranchMetadata
+
+
+class StackGraph:
+    """Parent/child adjacency of gt-tracked branches with precomputed stacks.
+
+    Built once from get_all_branches() output (see Graphite.get_stack_graph)
+    and shared by every stack-aware command in an invocation, instead of each
+    caller re-deriving relationships from the raw metadata.
+
+    Precomputed at construction:
+    - each branch's ancestor path from its root (usually trunk)
+    - each branch's depth, i.e. its distance from that root
+    - each branch's first-child chain up to a leaf
+
+    so parent/children/depth lookups are O(1), stack() is O(depth) and
+    in_same_stack() is O(1) after the first stack() query for a branch.
+
+    Parent links that point at untracked branches are treated as roots, and
+    cycles in malformed metadata are cut, matching the traversal rules of
+    Graphite.get_branch_stack.
+    """
+
+    def __init__(self, branches: dict[str, BranchMetadata]) -> None:
+        """Build the graph.
+
+        Args:
+            branches: Branch metadata from Graphite.get_all_branches()
+        """
+        self._branches = branches
+        self._parent: dict[str, str | None] = {}
+        self._children: dict[str, list[str]] = {}
+        for name, metadata in branches.items():
+            parent = metadata.parent
+            self._parent[name] = parent if parent in branches else None
+            self._children[name] = list(metadata.children)
+
+        self._path_from_root: dict[str, tuple[str, ...]] = {}
+        for name in branches:
+            self._resolve_path(name)
+
+        self._chain_to_leaf: dict[str, tuple[str, ...]] = {}
+        for name in branches:
+            self._resolve_chain(name)
+
+        self._stack_members: dict[str, frozenset[str]] = {}
+
+    @staticmethod
+    def empty() -> "StackGraph":
+        """Graph with no tracked branches."""
+        return StackGraph({})
+
+    def __contains__(self, branch: object) -> bool:
+        return branch in self._branches
+
+    def __len__(self) -> int:
+        return len(self._branches)
+
+    @property
+    def branches(self) -> dict[str, BranchMetadata]:
+        """The branch metadata this graph was built from."""
+        return self._branches
+
+    def parent(self, branch: str) -> str | None:
+        """Get the tracked parent of a branch (None for roots and untracked branches)."""
+        return self._parent.get(branch)
+
+    def children(self, branch: str) -> list[str]:
+        """Get the children Graphite records for a branch, in Graphite's order."""
+        return list(self._children.get(branch, []))
+
+    def depth(self, branch: str) -> int | None:
+        """Get the distance from the branch's root (trunk is depth 0).
+
+        Returns:
+            Depth, or None if the branch is not tracked
+        """
+        path = self._path_from_root.get(branch)
+        if path is None:
+            return None
+        return len(path) - 1
+
+    def root(self, branch: str) -> str | None:
+        """Get the root (usually trunk) the branch descends from."""
+        path = self._path_from_root.get(branch)
+        if path is None:
+            return None
+        return path[0]
+
+    def ancestors(self, branch: str) -> list[str]:
+        """Get the ancestors of a branch, nearest parent first."""
+        path = self._path_from_root.get(branch, ())
+        return list(reversed(path[:-1]))
+
+    def descendants(self, branch: str) -> list[str]:
+        """Get every tracked descendant of a branch (all children, not just the first)."""
+        result: list[str] = []
+        pending = list(reversed(self._children.get(branch, [])))
+        seen = {branch}
+        while pending:
+            current = pending.pop()
+            if current in seen or current not in self._branches:
+                continue
+            seen.add(current)
+            result.append(current)
+            pending.extend(reversed(self._children.get(current, [])))
+        return result
+
+    def stack(self, branch: str) -> list[str] | None:
+        """Get the linear stack for a branch, ordered trunk to leaf.
+
+        The stack is the branch's ancestors plus its first-child chain,
+        the same shape Graphite.get_branch_stack returns.
+
+        Returns:
+            Branch names from trunk to leaf, or None if the branch is not tracked
+        """
+        path = self._path_from_root.get(branch)
+        if path is None:
+            return None
+        return list(path) + list(self._chain_to_leaf[branch])
+
+    def in_same_stack(self, branch: str, other: str) -> bool:
+        """Check whether other appears in branch's linear stack."""
+        members = self._stack_members.get(branch)
+        if members is None:
+            stack = self.stack(branch)
+            if stack is None:
+                return False
+            members = frozenset(stack)
+            self._stack_members[branch] = members
+        return other in members
+
+    def _resolve_path(self, branch: str) -> tuple[str, ...]:
+        """Compute the root-to-branch path, memoizing every node on the way."""
+        cached = self._path_from_root.get(branch)
+        if cached is not None:
+            return cached
+
+        # Walk up iteratively to avoid recursion limits on deep stacks
+        walk: list[str] = []
+        on_walk: set[str] = set()
+        current: str | None = branch
+        while current is not None and current not in self._path_from_root:
+            if current in on_walk:
+                # Cycle in malformed metadata: treat the repeated node as a root
+                break
+            walk.append(current)
+            on_walk.add(current)
+            current = self._parent[current]
+
+        base: tuple[str, ...] = ()
+        if current is not None and current in self._path_from_root:
+            base = self._path_from_root[current]
+        for name in reversed(walk):
+            base = base + (name,)
+            self._path_from_root[name] = base
+        return self._path_from_root[branch]
+
+    def _resolve_chain(self, branch: str) -> tuple[str, ...]:
+        """Compute the first-child chain below a branch, memoizing every node."""
+        cached = self._chain_to_leaf.get(branch)
+        if cached is not None:
+            return cached
+
+        walk: list[str] = []
+        on_walk: set[str] = {branch}
+        current = branch
+        while current not in self._chain_to_leaf:
+            children = self._children[current]
+            # Like get_branch_stack, only the first child is followed, and
+            # only while it is tracked
+            if not children or children[0] not in self._branches or children[0] in on_walk:
+                self._chain_to_leaf[current] = ()
+                break
+            walk.append(current)
+            current = children[0]
+            on_walk.add(current)
+
+        chain = self._chain_to_leaf[current]
+        for name in reversed(walk):
+            child = self._children[name][0]
+            chain = (child,) + chain
+            self._chain_to_leaf[name] = chain
+        return self._chain_to_leaf[branch]
@@ -15,6 +15,7 @@ import json
 import subprocess
 from pathlib import Path
 
+from erk_shared.git.layout import read_git_layout
 from erk_shared.github.parsing import parse_gh_auth_status_output
 from erk_shared.integrations.graphite.abc import Graphite
 from erk_shared.integrations.graphite.real import RealGraphite
@@ -161,6 +162,10 @@ class RealGitGtKit(GitGtKit):
 
     def get_repository_root(self) -> str:
         """Get the absolute path to the repository root."""
+        layout = read_git_layout(Path.cwd())
+        if layout is not None:
+            return str(layout.worktree_root)
+
         result = subprocess.run(
             ["git", "rev-parse", "--show-toplevel"],
             capture_output=True,
@@ -199,6 +204,10 @@ class RealGitGtKit(GitGtKit):
         For regular repos, this is the .git directory.
         For worktrees, this is the shared .git directory.
         """
+        layout = read_git_layout(cwd)
+        if layout is not None:
+            return layout.common_dir
+
         result = subprocess.run(
             ["git", "rev-parse", "--git-common-dir"],
             cwd=cwd,
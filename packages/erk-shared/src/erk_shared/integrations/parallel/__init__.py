@@ -2,5 +2,6 @@
 
 Import from submodules:
 - abc: ParallelTaskRunner
-- real: RealParallelTaskRunner
+- real: RealParallelTaskRunner, TaskTiming
+- cancellation: TaskScope, TaskCancelledError, current_task_scope
 """
@@ -27,8 +27,16 @@ class ParallelTaskRunner(ABC):
 
         Args:
             tasks: Dictionary mapping task names to zero-argument callables
-            timeout_per_task: Maximum time (seconds) to wait for each task
+            timeout_per_task: Maximum time (seconds) each task may run once started
 
         Returns:
             Dictionary mapping task names to results (None for timeouts/failures)
         """
+
+    @abstractmethod
+    def format_timings(self) -> list[str]:
+        """Describe every task run so far, for debug output.
+
+        Returns:
+            One line per task with its outcome and timing
+        """
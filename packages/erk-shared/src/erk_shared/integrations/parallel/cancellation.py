@@ -0,0 +1,98 @@
+"""Cooperative cancellation for tasks run by a ParallelTaskRunner.
+
+A Python thread can't be stopped from outside. When a task misses its
+deadline the runner stops waiting for it and cancels its TaskScope instead:
+
+- child processes the task started through
+  erk_shared.subprocess_utils.run_subprocess are killed, so a hung `git` or
+  `gh` call returns immediately
+- starting another subprocess, or calling raise_if_cancelled(), raises
+  TaskCancelledError so the abandoned task unwinds instead of doing more work
+
+The scope of the running task is bound to the worker thread, so integration
+code needs no extra parameter to take part.
+"""
+
+import subprocess
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+class TaskCancelledError(Exception):
+    """Raised inside a task after its runner gave up on it."""
+
+
+class TaskScope:
+    """Cancellation state of one task and the child processes it started."""
+
+    def __init__(self, name: str) -> None:
+        """Create a scope for one task.
+
+        Args:
+            name: Task name, used in error messages
+        """
+        self.name = name
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._processes: set[subprocess.Popen[str]] = set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the runner gave up on the task."""
+        return self._cancelled
+
+    def raise_if_cancelled(self) -> None:
+        """Raise TaskCancelledError if the runner gave up on the task."""
+        if self._cancelled:
+            raise TaskCancelledError(f"Task '{self.name}' was cancelled")
+
+    def track(self, process: subprocess.Popen[str]) -> None:
+        """Register a child process to be killed if the task is cancelled.
+
+        A process started after cancellation is killed immediately.
+
+        Raises:
+            TaskCancelledError: If the task was already cancelled
+        """
+        with self._lock:
+            if not self._cancelled:
+                self._processes.add(process)
+                return
+        process.kill()
+        self.raise_if_cancelled()
+
+    def untrack(self, process: subprocess.Popen[str]) -> None:
+        """Forget a child process that has exited."""
+        with self._lock:
+            self._processes.discard(process)
+
+    def cancel(self) -> None:
+        """Mark the task cancelled and kill its running child processes."""
+        with self._lock:
+            self._cancelled = True
+            processes = list(self._processes)
+            self._processes.clear()
+        for process in processes:
+            # Kill is a no-op on a process that already exited but hasn't
+            # been reaped yet
+            process.kill()
+
+
+_local = threading.local()
+
+
+def current_task_scope() -> TaskScope | None:
+    """Scope of the task running on this thread, or None outside a runner."""
+    return getattr(_local, "scope", None)
+
+
+@contextmanager
+def task_scope(scope: TaskScope) -> Iterator[TaskScope]:
+    """Bind a task's scope to the current thread while it runs."""
+    previous = current_task_scope()
+    _local.scope = scope
+    try:
+        yield scope
+    finally:
+        _local.scope = previous
@@ -1,65 +1,215 @@
-"""Production implementation of parallel task execution using ThreadPoolExecutor."""
+"""Production implementation of parallel task execution on a reusable worker pool."""
 
-import logging
+import threading
+from collections import deque
 from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
+from dataclasses import dataclass
 
 from erk_shared.integrations.parallel.abc import ParallelTaskRunner
+from erk_shared.integrations.parallel.cancellation import TaskScope, task_scope
+from erk_shared.integrations.time.abc import Time
+from erk_shared.integrations.time.real import RealTime
 
-logger = logging.getLogger(__name__)
+DEFAULT_MAX_WORKERS = 8
+
+# Idle workers exit after this long so a discarded runner doesn't keep threads
+_IDLE_WORKER_SECONDS = 30.0
+
+
+@dataclass
+class _Task:
+    name: str
+    callable: Callable[[], object]
+    timeout: float
+    scope: TaskScope
+    queued_at: float
+    started_at: float | None = None
+    finished_at: float | None = None
+    result: object | None = None
+    error: str | None = None
+    abandoned: bool = False
+
+
+@dataclass(frozen=True)
+class TaskTiming:
+    """How one task went, for debug output.
+
+    Attributes:
+        name: Task name
+        outcome: "ok", "failed" or "timed out"
+        queued_seconds: Time between submission and a worker starting the task
+        run_seconds: Time the task ran (until abandoned, for timeouts)
+        error: Exception message for failed tasks
+    """
+
+    name: str
+    outcome: str
+    queued_seconds: float
+    run_seconds: float
+    error: str | None = None
+
+    def format(self) -> str:
+        """Format as a single debug line."""
+        line = (
+            f"Task '{self.name}': {self.outcome} after {self.run_seconds * 1000:.1f}ms "
+            f"(queued {self.queued_seconds * 1000:.1f}ms)"
+        )
+        if self.error is not None:
+            line += f": {self.error}"
+        return line
 
 
 class RealParallelTaskRunner(ParallelTaskRunner):
-    """Production implementation using ThreadPoolExecutor with actual timeouts.
+    """Production implementation running tasks on a long-lived pool of daemon threads.
 
-    Uses Python's concurrent.futures for parallel execution with wall-clock timeouts.
-    Tasks that exceed their timeout or raise exceptions gracefully degrade to None.
+    One runner is owned by the ErkContext and shared by every fan-out of an
+    invocation (status collectors, batched git or gh calls):
+
+    - Workers are started on demand, up to max_workers, and reused across
+      run_parallel calls; idle workers exit after a while.
+    - Each task gets its own deadline, counted from when a worker starts it,
+      so tasks queued behind others aren't penalized.
+    - When a task misses its deadline run_parallel stops waiting for it and
+      cancels its TaskScope, which kills the git/gh processes it started. Its
+      worker is written off and replaced, so the abandoned task can't hold up
+      later tasks or the exit of the process.
+    - Tasks that raise or time out degrade to None.
     """
 
+    def __init__(self, *, max_workers: int = DEFAULT_MAX_WORKERS, time: Time | None = None) -> None:
+        """Create a runner.
+
+        Args:
+            max_workers: Maximum number of tasks running at once
+            time: Clock that task deadlines and timings are measured on.
+                If None, RealTime() is used.
+
+        Raises:
+            ValueError: If max_workers is less than 1
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        self._max_workers = max_workers
+        self._time = time if time is not None else RealTime()
+        self._condition = threading.Condition()
+        self._queue: deque[_Task] = deque()
+        # Live workers not written off, and how many of them run a task
+        self._workers = 0
+        self._busy = 0
+        self._timings: list[TaskTiming] = []
+
     def run_parallel(
         self, tasks: dict[str, Callable[[], object]], timeout_per_task: float
     ) -> dict[str, object | None]:
-        """Execute tasks in parallel using ThreadPoolExecutor.
+        """Execute tasks on the worker pool, each with its own deadline.
 
-        Implementation details:
-        - Uses max 5 worker threads
-        - Total timeout = timeout_per_task * number of tasks
-        - Individual result retrieval timeout = 0.1s (should be immediate)
-        - TimeoutError or Exception → None result (graceful degradation)
+        Returns as soon as every task has finished or missed its deadline,
+        without waiting for abandoned tasks to unwind.
         """
-        results: dict[str, object | None] = {}
-
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            # Submit all tasks
-            futures = {}
-            for task_name, task_callable in tasks.items():
-                future = executor.submit(task_callable)
-                futures[future] = task_name
-
-            # Calculate total timeout for all tasks
-            total_timeout = timeout_per_task * len(futures) if futures else 1.0
-
-            try:
-                for future in as_completed(futures, timeout=total_timeout):
-                    task_name = futures[future]
-                    try:
-                        result = future.result(timeout=0.1)  # Should be immediate once complete
-                        results[task_name] = result
-                    except TimeoutError:
-                        # Error boundary: Task timeouts shouldn't fail entire operation
-                        logger.debug(f"Task '{task_name}' timed out after {timeout_per_task}s")
-                        results[task_name] = None
-                    except Exception as e:
-                        # Error boundary: Individual task failures shouldn't fail entire operation
-                        # This is an acceptable use of exception handling at error boundaries
-                        logger.debug(f"Task '{task_name}' failed: {e}")
-                        results[task_name] = None
-            except TimeoutError:
-                # Some tasks didn't complete in time
-                # Mark incomplete tasks as None
-                for future, task_name in futures.items():
-                    if future.running() or not future.done():
-                        logger.debug(f"Task '{task_name}' did not complete in time")
-                        results[task_name] = None
+        submitted_at = self._time.monotonic()
+        batch = [
+            _Task(name, task_callable, timeout_per_task, TaskScope(name), submitted_at)
+            for name, task_callable in tasks.items()
+        ]
+
+        with self._condition:
+            self._queue.extend(batch)
+            self._start_workers()
+            self._condition.notify_all()
+
+            while True:
+                now = self._time.monotonic()
+                deadlines: list[float] = []
+                for task in batch:
+                    if task.started_at is None or task.finished_at is not None or task.abandoned:
+                        continue
+                    deadline = task.started_at + task.timeout
+                    if now >= deadline:
+                        self._abandon(task)
+                    else:
+                        deadlines.append(deadline)
+
+                if all(task.finished_at is not None or task.abandoned for task in batch):
+                    break
+                self._condition.wait(min(deadlines) - now if deadlines else None)
+
+            finished_at = self._time.monotonic()
+            results: dict[str, object | None] = {}
+            for task in batch:
+                results[task.name] = None if task.abandoned else task.result
+                self._timings.append(_timing(task, finished_at))
 
         return results
+
+    def format_timings(self) -> list[str]:
+        """Describe every task run so far, for debug output."""
+        with self._condition:
+            return [timing.format() for timing in self._timings]
+
+    @property
+    def timings(self) -> list[TaskTiming]:
+        """Timing of every task run so far, in completion order of their batches."""
+        with self._condition:
+            return list(self._timings)
+
+    def _start_workers(self) -> None:
+        """Start workers for queued tasks no idle worker can take. Caller holds the lock."""
+        idle = self._workers - self._busy
+        wanted = min(len(self._queue) - idle, self._max_workers - self._workers)
+        for _ in range(wanted):
+            self._workers += 1
+            threading.Thread(target=self._work, name="erk-parallel-task", daemon=True).start()
+
+    def _abandon(self, task: _Task) -> None:
+        """Give up on a running task and replace its worker. Caller holds the lock."""
+        task.abandoned = True
+        self._workers -= 1
+        self._busy -= 1
+        task.scope.cancel()
+        self._start_workers()
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue:
+                    if not self._condition.wait(_IDLE_WORKER_SECONDS) and not self._queue:
+                        self._workers -= 1
+                        return
+                task = self._queue.popleft()
+                self._busy += 1
+                task.started_at = self._time.monotonic()
+                self._condition.notify_all()
+
+            with task_scope(task.scope):
+                # Error boundary: a failing task degrades to None instead of
+                # failing the whole batch
+                try:
+                    task.result = task.callable()
+                except Exception as e:
+                    task.error = str(e) or type(e).__name__
+
+            with self._condition:
+                task.finished_at = self._time.monotonic()
+                self._condition.notify_all()
+                if task.abandoned:
+                    # run_parallel already wrote this worker off and replaced it
+                    return
+                self._busy -= 1
+
+
+def _timing(task: _Task, now: float) -> TaskTiming:
+    started_at = task.started_at if task.started_at is not None else now
+    if task.abandoned:
+        outcome = "timed out"
+    elif task.error is not None:
+        outcome = "failed"
+    else:
+        outcome = "ok"
+    ended_at = task.finished_at if task.finished_at is not None and not task.abandoned else now
+    return TaskTiming(
+        name=task.name,
+        outcome=outcome,
+        queued_seconds=started_at - task.queued_at,
+        run_seconds=ended_at - started_at,
+        error=task.error if outcome == "failed" else None,
+    )
@@ -1,11 +1,12 @@
 """Time operations abstraction for testing.
 
-This module provides an ABC for time operations (sleep, etc.) to enable
-fast tests that don't actually sleep. Future extensions may include
-datetime.now() and other clock-related operations.
+This module provides an ABC for time operations (sleep, now, monotonic) to
+enable fast tests that don't actually sleep and deterministic tests that
+depend on the current wall-clock time or on elapsed durations.
 """
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 
 
 class Time(ABC):
@@ -19,3 +20,21 @@ class Time(ABC):
             seconds: Number of seconds to sleep
         """
         ...
+
+    @abstractmethod
+    def now(self) -> datetime:
+        """Get the current wall-clock time.
+
+        Returns:
+            Timezone-aware datetime in UTC
+        """
+        ...
+
+    @abstractmethod
+    def monotonic(self) -> float:
+        """Get a monotonic clock reading for measuring durations and deadlines.
+
+        Returns:
+            Seconds from an arbitrary origin; only differences are meaningful
+        """
+        ...
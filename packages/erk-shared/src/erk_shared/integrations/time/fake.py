@@ -1,9 +1,12 @@
 """Fake Time implementation for testing.
 
 FakeTime is an in-memory implementation that tracks sleep() calls without
-actually sleeping, enabling fast tests.
+actually sleeping, enabling fast tests. Its clocks only move when sleep()
+is called, so time-dependent logic is deterministic.
 """
 
+from datetime import UTC, datetime, timedelta
+
 from erk_shared.integrations.time.abc import Time
 
 
@@ -14,9 +17,18 @@ class FakeTime(Time):
     or captured during execution.
     """
 
-    def __init__(self) -> None:
-        """Create FakeTime with empty call tracking."""
+    def __init__(self, current_time: datetime | None = None) -> None:
+        """Create FakeTime with empty call tracking.
+
+        Args:
+            current_time: Initial value returned by now().
+                If None, uses 2024-01-01T00:00:00 UTC.
+        """
         self._sleep_calls: list[float] = []
+        if current_time is None:
+            current_time = datetime(2024, 1, 1, tzinfo=UTC)
+        self._current_time = current_time
+        self._monotonic = 0.0
 
     @property
     def sleep_calls(self) -> list[float]:
@@ -31,7 +43,28 @@ class FakeTime(Time):
     def sleep(self, seconds: float) -> None:
         """Track sleep call without actually sleeping.
 
+        Advances the fake clocks so that now() and monotonic() reflect the
+        simulated delay.
+
         Args:
             seconds: Number of seconds that would have been slept
         """
         self._sleep_calls.append(seconds)
+        self._current_time = self._current_time + timedelta(seconds=seconds)
+        self._monotonic += seconds
+
+    def now(self) -> datetime:
+        """Get the fake current time.
+
+        Returns:
+            The configured time, advanced by all sleep() calls so far
+        """
+        return self._current_time
+
+    def monotonic(self) -> float:
+        """Get the fake monotonic clock reading.
+
+        Returns:
+            Total seconds passed to sleep() so far, starting from 0.0
+        """
+        return self._monotonic
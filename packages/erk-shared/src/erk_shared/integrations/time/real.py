@@ -1,6 +1,7 @@
-"""Real time implementation using actual time.sleep()."""
+"""Real time implementation using actual time.sleep(), datetime.now() and time.monotonic()."""
 
 import time
+from datetime import UTC, datetime
 
 from erk_shared.integrations.time.abc import Time
 
@@ -15,3 +16,19 @@ class RealTime(Time):
             seconds: Number of seconds to sleep
         """
         time.sleep(seconds)
+
+    def now(self) -> datetime:
+        """Get the current wall-clock time in UTC.
+
+        Returns:
+            Timezone-aware datetime in UTC
+        """
+        return datetime.now(UTC)
+
+    def monotonic(self) -> float:
+        """Get the current reading of the system monotonic clock.
+
+        Returns:
+            Seconds from an arbitrary origin, as time.monotonic()
+        """
+        return time.monotonic()
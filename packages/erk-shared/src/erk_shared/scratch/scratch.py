@@ -9,16 +9,22 @@ import time
 import uuid
 from pathlib import Path
 
+from erk_shared.git.layout import read_git_layout
+
 
 def _get_repo_root() -> Path:
-    """Get the repository root via git rev-parse.
+    """Get the repository root from the .git layout, falling back to git rev-parse.
 
     Returns:
         Path to the git repository root.
 
     Raises:
-        RuntimeError: If not in a git repository or git is not available.
+        subprocess.CalledProcessError: If not in a git repository.
     """
+    layout = read_git_layout(Path.cwd())
+    if layout is not None:
+        return layout.worktree_root
+
     result = subprocess.run(
         ["git", "rev-parse", "--show-toplevel"],
         capture_output=True,
@@ -9,6 +9,61 @@ from collections.abc import Sequence
 from pathlib import Path
 from typing import IO, Any
 
+from erk_shared.integrations.parallel.cancellation import current_task_scope
+
+
+def run_subprocess(
+    cmd: Sequence[str], *, capture_output: bool = False, check: bool = False, **kwargs: Any
+) -> subprocess.CompletedProcess[Any]:
+    """subprocess.run that a ParallelTaskRunner can cancel.
+
+    Outside a runner task this is subprocess.run. Inside one, the child
+    process is registered with the task's TaskScope so it is killed when the
+    runner abandons the task, and no new process is started once it has.
+
+    Args:
+        cmd: Command and arguments to execute
+        capture_output: Whether to capture stdout/stderr
+        check: Whether to raise CalledProcessError on non-zero exit
+        **kwargs: Additional arguments accepted by subprocess.run (input,
+            timeout and everything subprocess.Popen takes)
+
+    Returns:
+        CompletedProcess instance
+
+    Raises:
+        TaskCancelledError: If the runner gave up on the current task
+    """
+    scope = current_task_scope()
+    if scope is None:
+        return subprocess.run(cmd, capture_output=capture_output, check=check, **kwargs)
+
+    scope.raise_if_cancelled()
+    input_data = kwargs.pop("input", None)
+    timeout = kwargs.pop("timeout", None)
+    if capture_output:
+        kwargs["stdout"] = subprocess.PIPE
+        kwargs["stderr"] = subprocess.PIPE
+    if input_data is not None:
+        kwargs["stdin"] = subprocess.PIPE
+
+    with subprocess.Popen(cmd, **kwargs) as process:
+        scope.track(process)
+        try:
+            stdout, stderr = process.communicate(input_data, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            raise
+        finally:
+            scope.untrack(process)
+
+    # A process killed by cancellation looks like an ordinary failure
+    scope.raise_if_cancelled()
+    returncode = process.returncode
+    if check and returncode != 0:
+        raise subprocess.CalledProcessError(returncode, process.args, output=stdout, stderr=stderr)
+    return subprocess.CompletedProcess(process.args, returncode, stdout, stderr)
+
 
 def run_subprocess_with_context(
     cmd: Sequence[str],
@@ -52,7 +107,7 @@ def run_subprocess_with_context(
             capture_output = False
 
         # Execute subprocess
-        result = subprocess.run(
+        result = run_subprocess(
             cmd,
             cwd=cwd,
             capture_output=capture_output,
@@ -107,7 +162,7 @@ def execute_gh_command(cmd: list[str], cwd: Path) -> str:
         FileNotFoundError: If gh is not installed
     """
     try:
-        result = subprocess.run(
+        result = run_subprocess(
             cmd,
             cwd=cwd,
             capture_output=True,
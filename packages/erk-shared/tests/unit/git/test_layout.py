@@ -0,0 +1,128 @@
+"""Tests for resolving repository layout from the .git file structure."""
+
+from pathlib import Path
+
+import pytest
+from erk_shared.git.layout import (
+    GIT_DISCOVERY_ENV_VARS,
+    GitLayout,
+    has_git_discovery_overrides,
+    read_git_layout,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_git_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    for name in GIT_DISCOVERY_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+
+
+def _make_git_dir(git_dir: Path, config: str = "[core]\n\tbare = false\n") -> None:
+    git_dir.mkdir(parents=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n", encoding="utf-8")
+    (git_dir / "config").write_text(config, encoding="utf-8")
+
+
+def _make_linked_worktree(repo: Path, worktree: Path, name: str) -> Path:
+    wt_git_dir = repo / ".git" / "worktrees" / name
+    wt_git_dir.mkdir(parents=True)
+    (wt_git_dir / "HEAD").write_text("ref: refs/heads/feature\n", encoding="utf-8")
+    (wt_git_dir / "commondir").write_text("../..\n", encoding="utf-8")
+    worktree.mkdir(parents=True)
+    (worktree / ".git").write_text(f"gitdir: {wt_git_dir}\n", encoding="utf-8")
+    return wt_git_dir
+
+
+def test_main_checkout_from_subdirectory(tmp_path: Path) -> None:
+    """A .git directory found up the tree is both the git dir and common dir."""
+    repo = tmp_path / "repo"
+    _make_git_dir(repo / ".git")
+    nested = repo / "src" / "pkg"
+    nested.mkdir(parents=True)
+
+    assert read_git_layout(nested) == GitLayout(
+        worktree_root=repo, git_dir=repo / ".git", common_dir=repo / ".git"
+    )
+
+
+def test_linked_worktree_follows_gitdir_and_commondir(tmp_path: Path) -> None:
+    """A .git file points at the per-worktree dir, whose commondir names the shared dir."""
+    repo = tmp_path / "repo"
+    _make_git_dir(repo / ".git")
+    worktree = tmp_path / "worktrees" / "feature"
+    wt_git_dir = _make_linked_worktree(repo, worktree, "feature")
+
+    assert read_git_layout(worktree) == GitLayout(
+        worktree_root=worktree, git_dir=wt_git_dir, common_dir=repo / ".git"
+    )
+
+
+def test_relative_gitdir_is_resolved_against_worktree(tmp_path: Path) -> None:
+    """Relative gitdir paths are relative to the directory containing the .git file."""
+    repo = tmp_path / "repo"
+    _make_git_dir(repo / ".git")
+    worktree = tmp_path / "feature"
+    _make_linked_worktree(repo, worktree, "feature")
+    (worktree / ".git").write_text("gitdir: ../repo/.git/worktrees/feature\n", encoding="utf-8")
+
+    layout = read_git_layout(worktree)
+
+    assert layout is not None
+    assert layout.common_dir == repo / ".git"
+
+
+def test_outside_repository_returns_none(tmp_path: Path) -> None:
+    """No .git entry up the tree means no layout."""
+    plain = tmp_path / "plain"
+    plain.mkdir()
+
+    assert read_git_layout(plain) is None
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        "[core]\n\tworktree = /elsewhere\n",
+        "[core]\n\tbare = true\n",
+        "[core]\n\tbare\n",
+        '[includeIf "gitdir:~/work/"]\n\tpath = work.gitconfig\n',
+    ],
+)
+def test_unsupported_config_falls_back(tmp_path: Path, config: str) -> None:
+    """Config that changes the working tree is left to git."""
+    repo = tmp_path / "repo"
+    _make_git_dir(repo / ".git", config)
+
+    assert read_git_layout(repo) is None
+
+
+def test_inside_git_dir_falls_back(tmp_path: Path) -> None:
+    """Directories inside .git have no working tree."""
+    repo = tmp_path / "repo"
+    _make_git_dir(repo / ".git")
+    hooks = repo / ".git" / "hooks"
+    hooks.mkdir()
+
+    assert read_git_layout(hooks) is None
+
+
+def test_malformed_git_file_falls_back(tmp_path: Path) -> None:
+    """A .git file that isn't a gitdir pointer, or points nowhere, is left to git."""
+    worktree = tmp_path / "wt"
+    worktree.mkdir()
+    (worktree / ".git").write_text("garbage\n", encoding="utf-8")
+    assert read_git_layout(worktree) is None
+
+    (worktree / ".git").write_text(f"gitdir: {tmp_path / 'missing'}\n", encoding="utf-8")
+    assert read_git_layout(worktree) is None
+
+
+def test_discovery_env_vars_fall_back(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """GIT_DIR and friends change discovery, so git is asked instead."""
+    repo = tmp_path / "repo"
+    _make_git_dir(repo / ".git")
+    monkeypatch.setenv("GIT_DIR", str(repo / ".git"))
+
+    assert has_git_discovery_overrides()
+    assert read_git_layout(repo) is None
+    assert not has_git_discovery_overrides({"HOME": "/home/user"})
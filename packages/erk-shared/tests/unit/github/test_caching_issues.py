@@ -0,0 +1,139 @@
+"""Tests for CachingGitHubIssues."""
+
+from datetime import UTC, datetime
+from pathlib import Path
+
+from erk_shared.github.issues import CachingGitHubIssues, FakeGitHubIssues
+from erk_shared.github.issues.types import IssueInfo, IssuesWithLinkedPRs
+from erk_shared.github.response_cache import CacheMode, GitHubResponseCache
+from erk_shared.github.types import PullRequestInfo
+from erk_shared.integrations.time.fake import FakeTime
+
+REPO_ROOT = Path("/fake/repo")
+
+
+def _issue(number: int, body: str) -> IssueInfo:
+    return IssueInfo(
+        number=number,
+        title=f"Issue {number}",
+        body=body,
+        state="OPEN",
+        url=f"https://github.com/owner/repo/issues/{number}",
+        labels=["erk-plan"],
+        assignees=[],
+        created_at=datetime(2024, 1, 1, tzinfo=UTC),
+        updated_at=datetime(2024, 1, 2, tzinfo=UTC),
+    )
+
+
+def test_list_issues_is_served_from_cache(tmp_path: Path) -> None:
+    fake = FakeGitHubIssues(issues={1: _issue(1, "original")})
+    issues = CachingGitHubIssues(fake, GitHubResponseCache(tmp_path, FakeTime()))
+
+    first = issues.list_issues(REPO_ROOT, labels=["erk-plan"])
+    # Mutate behind the cache's back: a cached read must not observe it
+    fake.update_issue_body(REPO_ROOT, 1, "changed")
+    second = issues.list_issues(REPO_ROOT, labels=["erk-plan"])
+
+    assert second == first
+    assert second[0].body == "original"
+
+
+def test_writes_through_wrapper_invalidate_cached_issues(tmp_path: Path) -> None:
+    fake = FakeGitHubIssues(issues={1: _issue(1, "original")})
+    issues = CachingGitHubIssues(fake, GitHubResponseCache(tmp_path, FakeTime()))
+
+    issues.list_issues(REPO_ROOT, labels=["erk-plan"])
+    issues.update_issue_body(REPO_ROOT, 1, "changed")
+
+    assert issues.list_issues(REPO_ROOT, labels=["erk-plan"])[0].body == "changed"
+
+
+def test_get_issue_is_never_cached(tmp_path: Path) -> None:
+    fake = FakeGitHubIssues(issues={1: _issue(1, "original")})
+    issues = CachingGitHubIssues(fake, GitHubResponseCache(tmp_path, FakeTime()))
+
+    issues.get_issue(REPO_ROOT, 1)
+    fake.update_issue_body(REPO_ROOT, 1, "changed")
+
+    assert issues.get_issue(REPO_ROOT, 1).body == "changed"
+
+
+def test_multiple_issue_comments_keep_int_keys(tmp_path: Path) -> None:
+    fake = FakeGitHubIssues(comments={1: ["a"], 2: ["b", "c"]})
+    issues = CachingGitHubIssues(fake, GitHubResponseCache(tmp_path, FakeTime()))
+
+    fetched = issues.get_multiple_issue_comments(REPO_ROOT, [2, 1])
+    cached = issues.get_multiple_issue_comments(REPO_ROOT, [1, 2])
+
+    assert cached == fetched
+    assert cached[2] == ["b", "c"]
+
+
+def test_disabled_cache_always_delegates(tmp_path: Path) -> None:
+    fake = FakeGitHubIssues(issues={1: _issue(1, "original")})
+    cache = GitHubResponseCache(tmp_path, FakeTime())
+    cache.set_mode(CacheMode.DISABLED)
+    issues = CachingGitHubIssues(fake, cache)
+
+    issues.list_issues(REPO_ROOT)
+    fake.update_issue_body(REPO_ROOT, 1, "changed")
+
+    assert issues.list_issues(REPO_ROOT)[0].body == "changed"
+
+
+def test_issues_with_linked_prs_refetch_when_linkages_expire(tmp_path: Path) -> None:
+    pr = PullRequestInfo(
+        number=10,
+        state="OPEN",
+        url="https://github.com/owner/repo/pull/10",
+        is_draft=False,
+        title="Fix",
+        checks_passing=None,
+        owner="owner",
+        repo="repo",
+    )
+    fake = FakeGitHubIssues(issues={1: _issue(1, "original")}, pr_linkages={1: [pr]})
+    time = FakeTime()
+    issues = CachingGitHubIssues(fake, GitHubResponseCache(tmp_path, time))
+
+    def list_plans() -> IssuesWithLinkedPRs:
+        return issues.list_issues_with_linked_prs(
+            REPO_ROOT, labels=["erk-plan"], state=None, limit=None, include_linked_prs=True
+        )
+
+    first = list_plans()
+    fake.update_issue_body(REPO_ROOT, 1, "changed")
+    assert list_plans() == first
+
+    # PR state expires long before issue bodies; the listing is refetched as a whole
+    time.sleep(120)
+    refetched = list_plans()
+    assert refetched.issues[0].body == "changed"
+    assert refetched.pr_linkages == {1: [pr]}
+
+
+def test_issues_without_linked_prs_are_served_from_cache(tmp_path: Path) -> None:
+    fake = FakeGitHubIssues(issues={1: _issue(1, "original")})
+    issues = CachingGitHubIssues(fake, GitHubResponseCache(tmp_path, FakeTime()))
+
+    def list_plans() -> IssuesWithLinkedPRs:
+        return issues.list_issues_with_linked_prs(
+            REPO_ROOT, labels=["erk-plan"], state=None, limit=None, include_linked_prs=True
+        )
+
+    first = list_plans()
+    fake.update_issue_body(REPO_ROOT, 1, "changed")
+
+    assert list_plans() == first
+    assert first.pr_linkages == {}
+
+
+def test_empty_listing_is_not_cached(tmp_path: Path) -> None:
+    fake = FakeGitHubIssues()
+    issues = CachingGitHubIssues(fake, GitHubResponseCache(tmp_path, FakeTime()))
+
+    assert issues.list_issues(REPO_ROOT, labels=["erk-plan"]) == []
+    fake.create_issue(REPO_ROOT, "Plan", "body", ["erk-plan"])
+
+    assert len(issues.list_issues(REPO_ROOT, labels=["erk-plan"])) == 1
@@ -0,0 +1,141 @@
+"""Tests for chunked execution of aliased GraphQL batch queries."""
+
+import re
+import threading
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+from erk_shared.github.graphql_batch import NestedConnection, run_graphql_batch
+from erk_shared.github.rate_budget import GitHubRateBudget
+from erk_shared.integrations.parallel.cancellation import TaskScope, task_scope
+from erk_shared.integrations.parallel.real import RealParallelTaskRunner
+from erk_shared.integrations.time.fake import FakeTime
+
+_ALIAS_PATTERN = re.compile(r"(issue_(\d+))(?:@(\w+))?")
+
+
+def _build_query(numbers: list[int]) -> str:
+    return " ".join(f"issue_{number}" for number in numbers)
+
+
+def _build_page_query(cursors: dict[str, str]) -> str:
+    return " ".join(f"{alias}@{cursor}" for alias, cursor in cursors.items())
+
+
+class _CommentServer:
+    """Answers the toy queries above: 3 comments per page, `count` comments per issue."""
+
+    def __init__(self, counts: dict[int, int]) -> None:
+        self.counts = counts
+        self.queries: list[str] = []
+        self.threads: set[str] = set()
+        self._lock = threading.Lock()
+
+    def execute(self, query: str) -> dict[str, Any]:
+        with self._lock:
+            self.queries.append(query)
+            self.threads.add(threading.current_thread().name)
+        repository: dict[str, Any] = {}
+        for alias, number, cursor in _ALIAS_PATTERN.findall(query):
+            count = self.counts.get(int(number))
+            if count is None:
+                repository[alias] = None
+                continue
+            start = int(cursor) if cursor else 0
+            end = min(start + 3, count)
+            repository[alias] = {
+                "comments": {
+                    "pageInfo": {"hasNextPage": end < count, "endCursor": str(end)},
+                    "nodes": [f"{number}-{i}" for i in range(start, end)],
+                }
+            }
+        return {"data": {"repository": repository}}
+
+
+def test_chunks_run_concurrently_and_merge() -> None:
+    server = _CommentServer({number: 1 for number in range(25)})
+
+    result = run_graphql_batch(
+        list(range(25)),
+        _build_query,
+        server.execute,
+        runner=RealParallelTaskRunner(max_workers=4),
+        chunk_size=10,
+    )
+
+    assert sorted(result) == sorted(f"issue_{number}" for number in range(25))
+    assert sorted(len(_ALIAS_PATTERN.findall(query)) for query in server.queries) == [5, 10, 10]
+    assert server.threads == {"erk-parallel-task"}
+
+
+def test_nested_connection_is_followed_to_the_last_page() -> None:
+    server = _CommentServer({1: 2, 2: 7, 3: 10})
+
+    result = run_graphql_batch(
+        [1, 2, 3, 4],
+        _build_query,
+        server.execute,
+        runner=RealParallelTaskRunner(max_workers=4),
+        chunk_size=2,
+        nested=NestedConnection(path=("comments",), build_page_query=_build_page_query),
+    )
+
+    assert result["issue_1"]["comments"]["nodes"] == ["1-0", "1-1"]
+    assert result["issue_2"]["comments"]["nodes"] == [f"2-{i}" for i in range(7)]
+    assert result["issue_3"]["comments"]["nodes"] == [f"3-{i}" for i in range(10)]
+    assert result["issue_3"]["comments"]["pageInfo"]["hasNextPage"] is False
+    assert result["issue_4"] is None
+
+
+def test_chunk_errors_propagate() -> None:
+    def execute(query: str) -> dict[str, Any]:
+        if "issue_3" in query:
+            raise RuntimeError("gh failed")
+        return {"data": {"repository": {}}}
+
+    with pytest.raises(RuntimeError, match="gh failed"):
+        run_graphql_batch(
+            [1, 2, 3, 4],
+            _build_query,
+            execute,
+            runner=RealParallelTaskRunner(max_workers=2),
+            chunk_size=1,
+        )
+
+
+def test_runs_inline_inside_a_runner_task() -> None:
+    """Chunks requested from a runner task don't queue behind it on the same pool."""
+    server = _CommentServer({number: 1 for number in range(4)})
+
+    with task_scope(TaskScope("outer")):
+        result = run_graphql_batch(
+            list(range(4)),
+            _build_query,
+            server.execute,
+            runner=RealParallelTaskRunner(max_workers=1),
+            chunk_size=1,
+        )
+
+    assert len(result) == 4
+    assert server.threads == {threading.current_thread().name}
+
+
+def test_low_budget_shrinks_chunks_and_runs_serially() -> None:
+    budget = GitHubRateBudget(FakeTime(datetime(2025, 1, 1, tzinfo=UTC)))
+    rate_limit = {"cost": 1, "remaining": 100, "limit": 5000, "resetAt": "2025-01-01T01:00:00Z"}
+    budget.run_graphql("query { a }", lambda q: {"data": {"rateLimit": rate_limit}})
+    server = _CommentServer({number: 1 for number in range(20)})
+
+    result = run_graphql_batch(
+        list(range(20)),
+        _build_query,
+        server.execute,
+        runner=RealParallelTaskRunner(max_workers=4),
+        chunk_size=20,
+        budget=budget,
+    )
+
+    assert len(result) == 20
+    assert [len(_ALIAS_PATTERN.findall(query)) for query in server.queries] == [5, 5, 5, 5]
+    assert server.threads == {threading.current_thread().name}
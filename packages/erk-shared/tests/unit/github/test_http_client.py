@@ -0,0 +1,286 @@
+"""Tests for GitHubHttpClient and HttpGitHubIssues against a local stub server."""
+
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from erk_shared.github.http_client import GitHubHttpClient, GitHubHttpError
+from erk_shared.github.issues.http import HttpGitHubIssues
+from erk_shared.github.repo_identity import RepoIdentityResolver
+from erk_shared.github.types import RepoIdentity
+
+# (method, path) -> (status, JSON body or None)
+Routes = dict[tuple[str, str], tuple[int, Any]]
+
+
+class _StubServer:
+    """Serves canned JSON responses and records every request it receives."""
+
+    def __init__(self) -> None:
+        self.routes: Routes = {}
+        # (method, path) -> number of requests to read and then hang up on
+        self.hang_ups: dict[tuple[str, str], int] = {}
+        self.requests: list[tuple[str, str, dict[str, list[str]], Any]] = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _handle(self) -> None:
+                parts = urlsplit(self.path)
+                length = int(self.headers.get("Content-Length", "0"))
+                body = json.loads(self.rfile.read(length)) if length else None
+                stub.requests.append((self.command, parts.path, parse_qs(parts.query), body))
+                if stub.hang_ups.get((self.command, parts.path), 0) > 0:
+                    stub.hang_ups[(self.command, parts.path)] -= 1
+                    self.close_connection = True
+                    return
+
+                status, payload = stub.routes.get((self.command, parts.path), (404, None))
+                if payload is None:
+                    payload = {"message": "Not Found"} if status == 404 else None
+                data = json.dumps(payload).encode() if payload is not None else b""
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = _handle
+            do_POST = _handle
+            do_PATCH = _handle
+            do_PUT = _handle
+            do_DELETE = _handle
+
+            def log_message(self, format: str, *args: object) -> None:
+                return
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread.is_alive():
+            self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def stub() -> Iterator[_StubServer]:
+    server = _StubServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+def _issue(number: int, *, pull_request: bool = False) -> dict[str, Any]:
+    issue: dict[str, Any] = {
+        "number": number,
+        "title": f"Issue {number}",
+        "body": None,
+        "state": "open",
+        "html_url": f"https://github.com/owner/repo/issues/{number}",
+        "labels": [{"name": "erk-plan"}],
+        "assignees": [{"login": "alice"}],
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-01-02T00:00:00Z",
+    }
+    if pull_request:
+        issue["pull_request"] = {"url": "https://api.github.com/..."}
+    return issue
+
+
+def _issues(stub: _StubServer) -> tuple[HttpGitHubIssues, GitHubHttpClient]:
+    client = GitHubHttpClient("token", api_url=stub.url)
+    resolver = RepoIdentityResolver(identity=RepoIdentity("owner", "repo"), cache_path=None)
+    return HttpGitHubIssues(client, resolver), client
+
+
+def test_client_reuses_one_connection(stub: _StubServer) -> None:
+    """Sequential requests share a single keep-alive connection."""
+    stub.routes[("GET", "/user")] = (200, {"login": "alice"})
+    client = GitHubHttpClient("token", api_url=stub.url)
+
+    for _ in range(5):
+        assert client.request("GET", "/user") == {"login": "alice"}
+
+    assert client.requests_sent == 5
+    assert client.connections_opened == 1
+    client.close()
+
+
+def test_client_raises_with_status_on_error(stub: _StubServer) -> None:
+    """HTTP error statuses raise GitHubHttpError carrying the status and message."""
+    client = GitHubHttpClient("token", api_url=stub.url)
+
+    with pytest.raises(GitHubHttpError, match="Not Found") as exc_info:
+        client.request("GET", "/missing")
+
+    assert exc_info.value.status == 404
+    # The error response was drained, so the connection stays reusable
+    stub.routes[("GET", "/user")] = (200, {"login": "alice"})
+    client.request("GET", "/user")
+    assert client.connections_opened == 1
+
+
+def test_client_empty_response_returns_none(stub: _StubServer) -> None:
+    """204 No Content decodes to None."""
+    stub.routes[("DELETE", "/thing")] = (204, None)
+    client = GitHubHttpClient("token", api_url=stub.url)
+
+    assert client.request("DELETE", "/thing") is None
+
+
+def test_client_connection_failure_raises() -> None:
+    """Connection-level failures raise GitHubHttpError with no status."""
+    server = _StubServer()
+    url = server.url
+    server.stop()
+    client = GitHubHttpClient("token", api_url=url, timeout=2.0)
+
+    with pytest.raises(GitHubHttpError) as exc_info:
+        client.request("GET", "/user")
+
+    assert exc_info.value.status is None
+
+
+def test_client_resends_get_after_stale_connection(stub: _StubServer) -> None:
+    """A GET whose pooled connection drops before the response is sent again."""
+    stub.routes[("GET", "/user")] = (200, {"login": "alice"})
+    client = GitHubHttpClient("token", api_url=stub.url)
+    client.request("GET", "/user")
+
+    stub.hang_ups[("GET", "/user")] = 1
+    assert client.request("GET", "/user") == {"login": "alice"}
+
+    assert len(stub.requests) == 3
+    assert client.connections_opened == 2
+
+
+def test_client_does_not_resend_post_after_stale_connection(stub: _StubServer) -> None:
+    """A POST the server may already have acted on fails instead of running twice."""
+    stub.routes[("GET", "/user")] = (200, {"login": "alice"})
+    stub.routes[("POST", "/repos/owner/repo/issues")] = (201, {"number": 1})
+    client = GitHubHttpClient("token", api_url=stub.url)
+    client.request("GET", "/user")
+
+    stub.hang_ups[("POST", "/repos/owner/repo/issues")] = 1
+    with pytest.raises(GitHubHttpError) as exc_info:
+        client.request("POST", "/repos/owner/repo/issues", body={"title": "Plan"})
+
+    assert exc_info.value.status is None
+    assert [(method, path) for method, path, _, _ in stub.requests].count(
+        ("POST", "/repos/owner/repo/issues")
+    ) == 1
+
+
+def test_graphql_returns_full_response(stub: _StubServer) -> None:
+    """GraphQL responses keep the gh api graphql shape."""
+    stub.routes[("POST", "/graphql")] = (200, {"data": {"viewer": {"login": "alice"}}})
+    client = GitHubHttpClient("token", api_url=stub.url)
+
+    result = client.graphql("query { viewer { login } }", {"x": 1})
+
+    assert result == {"data": {"viewer": {"login": "alice"}}}
+    assert stub.requests[0][3] == {"query": "query { viewer { login } }", "variables": {"x": 1}}
+
+
+def test_graphql_errors_without_data_raise(stub: _StubServer) -> None:
+    """A GraphQL response with only errors raises."""
+    stub.routes[("POST", "/graphql")] = (200, {"errors": [{"message": "Bad query"}]})
+    client = GitHubHttpClient("token", api_url=stub.url)
+
+    with pytest.raises(GitHubHttpError, match="Bad query"):
+        client.graphql("query { nope }")
+
+
+def test_issues_create_issue(stub: _StubServer) -> None:
+    """create_issue posts title, body, and labels to the repo issues endpoint."""
+    stub.routes[("POST", "/repos/owner/repo/issues")] = (
+        201,
+        {"number": 42, "html_url": "https://github.com/owner/repo/issues/42"},
+    )
+    issues, _ = _issues(stub)
+
+    result = issues.create_issue(Path("/repo"), "Title", "Body", ["erk-plan"])
+
+    assert result.number == 42
+    assert result.url == "https://github.com/owner/repo/issues/42"
+    assert stub.requests[0][3] == {"title": "Title", "body": "Body", "labels": ["erk-plan"]}
+
+
+def test_issues_get_issue_uses_gh_conventions(stub: _StubServer) -> None:
+    """REST issue fields are mapped to gh CLI conventions."""
+    stub.routes[("GET", "/repos/owner/repo/issues/7")] = (200, _issue(7))
+    issues, _ = _issues(stub)
+
+    info = issues.get_issue(Path("/repo"), 7)
+
+    assert info.state == "OPEN"
+    assert info.body == ""
+    assert info.labels == ["erk-plan"]
+    assert info.assignees == ["alice"]
+    assert info.url == "https://github.com/owner/repo/issues/7"
+
+
+def test_issues_list_issues_skips_pull_requests(stub: _StubServer) -> None:
+    """The REST issues endpoint includes PRs; list_issues drops them like gh does."""
+    stub.routes[("GET", "/repos/owner/repo/issues")] = (
+        200,
+        [_issue(1), _issue(2, pull_request=True), _issue(3)],
+    )
+    issues, _ = _issues(stub)
+
+    result = issues.list_issues(Path("/repo"), labels=["erk-plan"], state="open", limit=10)
+
+    assert [issue.number for issue in result] == [1, 3]
+    query = stub.requests[0][2]
+    assert query["labels"] == ["erk-plan"]
+    assert query["state"] == ["open"]
+
+
+def test_issues_ensure_label_exists_creates_missing_label(stub: _StubServer) -> None:
+    """A 404 on label lookup creates the label."""
+    stub.routes[("POST", "/repos/owner/repo/labels")] = (201, {"name": "erk-plan"})
+    issues, _ = _issues(stub)
+
+    issues.ensure_label_exists(Path("/repo"), "erk-plan", "Plans", "0E8A16")
+
+    assert [(method, path) for method, path, _, _ in stub.requests] == [
+        ("GET", "/repos/owner/repo/labels/erk-plan"),
+        ("POST", "/repos/owner/repo/labels"),
+    ]
+
+
+def test_issues_remove_absent_label_is_noop(stub: _StubServer) -> None:
+    """Removing a label that isn't on the issue succeeds."""
+    issues, _ = _issues(stub)
+
+    issues.remove_label_from_issue(Path("/repo"), 5, "erk-plan")
+
+
+def test_issues_share_connection_across_operations(stub: _StubServer) -> None:
+    """Several issue operations reuse the client's single connection."""
+    stub.routes[("GET", "/repos/owner/repo/issues/7")] = (200, _issue(7))
+    stub.routes[("POST", "/repos/owner/repo/issues/7/comments")] = (201, {"id": 1})
+    stub.routes[("PATCH", "/repos/owner/repo/issues/7")] = (200, _issue(7))
+    issues, client = _issues(stub)
+
+    issues.get_issue(Path("/repo"), 7)
+    issues.add_comment(Path("/repo"), 7, "hello")
+    issues.close_issue(Path("/repo"), 7)
+
+    assert client.requests_sent == 3
+    assert client.connections_opened == 1
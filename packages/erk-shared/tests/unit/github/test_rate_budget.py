@@ -0,0 +1,163 @@
+"""Tests for GitHub rate-limit budget tracking, throttling and backoff."""
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+from erk_shared.github import rate_budget
+from erk_shared.github.rate_budget import (
+    BudgetUsage,
+    GitHubBudgetLog,
+    GitHubRateBudget,
+    with_rate_limit,
+)
+from erk_shared.integrations.time.fake import FakeTime
+
+_NOW = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+
+
+def _response(*, cost: int, remaining: int, limit: int = 5000) -> dict[str, Any]:
+    return {
+        "data": {
+            "repository": {},
+            "rateLimit": {
+                "cost": cost,
+                "remaining": remaining,
+                "limit": limit,
+                "resetAt": "2025-01-01T13:00:00Z",
+            },
+        }
+    }
+
+
+def _usage(command: str, recorded_at: datetime) -> BudgetUsage:
+    return BudgetUsage(
+        command=command,
+        recorded_at=recorded_at,
+        graphql_queries=2,
+        graphql_points=3,
+        rest_requests=1,
+        secondary_limit_hits=0,
+        graphql_remaining=4000,
+        graphql_limit=5000,
+        graphql_reset_at=_NOW + timedelta(hours=1),
+    )
+
+
+def test_rate_limit_is_selected_in_the_query_operation() -> None:
+    query = "fragment F on Issue { title }\n\nquery {\n  repository { id }\n}"
+
+    assert with_rate_limit(query) == (
+        "fragment F on Issue { title }\n\nquery { rateLimit { cost remaining limit resetAt }\n"
+        "  repository { id }\n}"
+    )
+    assert with_rate_limit("mutation { addComment { id } }") == "mutation { addComment { id } }"
+
+
+def test_graphql_cost_is_recorded() -> None:
+    budget = GitHubRateBudget(FakeTime(_NOW))
+    sent: list[str] = []
+
+    def send(query: str) -> dict[str, Any]:
+        sent.append(query)
+        return _response(cost=2, remaining=4990)
+
+    budget.run_graphql("query { viewer { login } }", send)
+    budget.run_graphql("query { viewer { login } }", send)
+
+    assert all("rateLimit" in query for query in sent)
+    usage = budget.usage("plan list")
+    assert usage is not None
+    assert (usage.graphql_queries, usage.graphql_points, usage.graphql_remaining) == (2, 4, 4990)
+
+
+def test_batches_are_throttled_as_the_budget_runs_low() -> None:
+    budget = GitHubRateBudget(FakeTime(_NOW))
+    assert (budget.chunk_size(50), budget.max_concurrency()) == (50, None)
+
+    budget.run_graphql("query { a }", lambda q: _response(cost=1, remaining=900))
+    assert (budget.chunk_size(50), budget.max_concurrency()) == (25, 2)
+
+    budget.run_graphql("query { a }", lambda q: _response(cost=1, remaining=100))
+    assert (budget.chunk_size(50), budget.max_concurrency()) == (12, 1)
+
+
+def test_exhausted_budget_fails_fast() -> None:
+    budget = GitHubRateBudget(FakeTime(_NOW))
+    budget.run_graphql("query { a }", lambda q: _response(cost=1, remaining=0))
+
+    with pytest.raises(RuntimeError, match="rate limit exhausted"):
+        budget.run_graphql("query { a }", lambda q: _response(cost=1, remaining=0))
+
+
+def test_secondary_rate_limit_is_retried_with_backoff() -> None:
+    time = FakeTime(_NOW)
+    budget = GitHubRateBudget(time)
+    attempts: list[str] = []
+
+    def send(query: str) -> dict[str, Any]:
+        attempts.append(query)
+        if len(attempts) < 3:
+            raise RuntimeError("You have exceeded a secondary rate limit")
+        return _response(cost=1, remaining=4000)
+
+    budget.run_graphql("query { a }", send)
+
+    assert len(attempts) == 3
+    assert len(time.sleep_calls) == 2
+    assert 2.0 <= time.sleep_calls[0] <= 3.0
+    assert 4.0 <= time.sleep_calls[1] <= 6.0
+    assert budget.max_concurrency() == 1
+    usage = budget.usage("run list")
+    assert usage is not None
+    assert usage.secondary_limit_hits == 2
+
+
+def test_other_errors_are_not_retried() -> None:
+    time = FakeTime(_NOW)
+    budget = GitHubRateBudget(time)
+
+    def send(query: str) -> dict[str, Any]:
+        raise RuntimeError("Could not resolve to an Issue")
+
+    with pytest.raises(RuntimeError, match="Could not resolve"):
+        budget.run_graphql("query { a }", send)
+    assert time.sleep_calls == []
+
+
+def test_invocation_usage_is_logged(tmp_path: Path) -> None:
+    time = FakeTime(_NOW)
+    log = GitHubBudgetLog(tmp_path / "github-budget.jsonl", time)
+    budget = GitHubRateBudget(time, log)
+
+    budget.record_invocation("wt list")
+    assert log.read(since=_NOW - timedelta(days=1)) == []
+
+    budget.record_rest(limit=5000, remaining=4999, reset_at=_NOW + timedelta(hours=1))
+    budget.record_invocation("wt list")
+
+    entries = log.read(since=_NOW - timedelta(days=1))
+    assert [(entry.command, entry.rest_requests) for entry in entries] == [("wt list", 1)]
+
+
+def test_log_read_skips_old_and_unreadable_entries(tmp_path: Path) -> None:
+    path = tmp_path / "github-budget.jsonl"
+    log = GitHubBudgetLog(path, FakeTime(_NOW))
+    log.append(_usage("plan list", _NOW - timedelta(days=2)))
+    with path.open("a", encoding="utf-8") as f:
+        f.write('{"command": "trunc\n')
+    log.append(_usage("submit", _NOW))
+
+    assert [entry.command for entry in log.read(since=_NOW - timedelta(days=1))] == ["submit"]
+
+
+def test_large_log_is_compacted_in_place(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(rate_budget, "_MAX_LOG_BYTES", 1)
+    path = tmp_path / "github-budget.jsonl"
+    log = GitHubBudgetLog(path, FakeTime(_NOW))
+    log.append(_usage("plan list", _NOW - timedelta(days=2)))
+    log.append(_usage("submit", _NOW))
+
+    assert [entry.command for entry in log.read(since=_NOW - timedelta(days=3))] == ["submit"]
+    assert [p.name for p in tmp_path.iterdir()] == ["github-budget.jsonl"]
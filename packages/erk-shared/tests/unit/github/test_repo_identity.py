@@ -0,0 +1,93 @@
+"""Tests for offline repository identity resolution."""
+
+from pathlib import Path
+
+import pytest
+from erk_shared.github.repo_identity import (
+    RepoIdentityResolver,
+    load_cached_repo_identity,
+    parse_github_remote_url,
+    read_git_remote_url,
+    save_cached_repo_identity,
+)
+from erk_shared.github.types import RepoIdentity
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://github.com/dagster-io/erk.git",
+        "https://github.com/dagster-io/erk",
+        "https://token@github.com/dagster-io/erk.git",
+        "git@github.com:dagster-io/erk.git",
+        "git@github.com:dagster-io/erk",
+        "ssh://git@github.com/dagster-io/erk.git",
+        "ssh://git@github.com:22/dagster-io/erk.git",
+        "git://github.com/dagster-io/erk.git",
+    ],
+)
+def test_parse_github_remote_url_supported_forms(url: str) -> None:
+    assert parse_github_remote_url(url) == RepoIdentity(owner="dagster-io", name="erk")
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "git@work-alias:dagster-io/erk.git",  # SSH host alias
+        "https://github.example.com/dagster-io/erk.git",  # Enterprise host
+        "/local/path/to/repo.git",
+        "https://github.com/dagster-io",
+    ],
+)
+def test_parse_github_remote_url_unsupported_forms(url: str) -> None:
+    assert parse_github_remote_url(url) is None
+
+
+def test_read_git_remote_url_finds_origin(tmp_path: Path) -> None:
+    (tmp_path / "config").write_text(
+        """[core]
+\trepositoryformatversion = 0
+[remote "upstream"]
+\turl = https://github.com/other/erk.git
+[remote "origin"]
+\t# comment
+\turl = git@github.com:dagster-io/erk.git
+\tfetch = +refs/heads/*:refs/remotes/origin/*
+""",
+        encoding="utf-8",
+    )
+
+    assert read_git_remote_url(tmp_path) == "git@github.com:dagster-io/erk.git"
+    assert read_git_remote_url(tmp_path, "upstream") == "https://github.com/other/erk.git"
+
+
+def test_read_git_remote_url_missing_remote_or_config(tmp_path: Path) -> None:
+    assert read_git_remote_url(tmp_path) is None
+
+    (tmp_path / "config").write_text("[core]\n\tbare = false\n", encoding="utf-8")
+
+    assert read_git_remote_url(tmp_path) is None
+
+
+def test_cached_identity_round_trips(tmp_path: Path) -> None:
+    cache_path = tmp_path / "repos" / "erk" / "repo-identity.json"
+    identity = RepoIdentity(owner="dagster-io", name="erk")
+
+    save_cached_repo_identity(cache_path, identity)
+
+    assert load_cached_repo_identity(cache_path) == identity
+
+
+def test_load_cached_identity_ignores_malformed_file(tmp_path: Path) -> None:
+    cache_path = tmp_path / "repo-identity.json"
+    cache_path.write_text("{truncated", encoding="utf-8")
+
+    assert load_cached_repo_identity(cache_path) is None
+
+
+def test_resolver_returns_known_identity_without_gh() -> None:
+    identity = RepoIdentity(owner="dagster-io", name="erk")
+    resolver = RepoIdentityResolver(identity=identity, cache_path=None)
+
+    # A nonexistent repo root proves gh is never invoked
+    assert resolver.resolve(Path("/nonexistent/repo")) == identity
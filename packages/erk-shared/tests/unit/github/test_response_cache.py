@@ -0,0 +1,163 @@
+"""Tests for the persistent GitHub response cache."""
+
+from datetime import timedelta
+from pathlib import Path
+
+from erk_shared.github.response_cache import (
+    CacheMode,
+    CacheTTLs,
+    GitHubResponseCache,
+    decode_workflow_run,
+    encode_workflow_run,
+)
+from erk_shared.github.types import WorkflowRun
+from erk_shared.integrations.time.fake import FakeTime
+
+REPO_ROOT = Path("/fake/repo")
+
+
+def test_get_returns_stored_payload(tmp_path: Path) -> None:
+    cache = GitHubResponseCache(tmp_path, FakeTime())
+
+    cache.put("pr_state", REPO_ROOT, "get_prs_for_repo", {"include_checks": True}, {"a": 1})
+    entry = cache.get("pr_state", REPO_ROOT, "get_prs_for_repo", {"include_checks": True})
+
+    assert entry is not None
+    assert entry.payload == {"a": 1}
+    assert cache.stats().hits == 1
+
+
+def test_get_misses_on_different_params(tmp_path: Path) -> None:
+    cache = GitHubResponseCache(tmp_path, FakeTime())
+
+    cache.put("pr_state", REPO_ROOT, "get_prs_for_repo", {"include_checks": True}, {"a": 1})
+
+    assert cache.get("pr_state", REPO_ROOT, "get_prs_for_repo", {"include_checks": False}) is None
+    assert cache.stats().misses == 1
+
+
+def test_entries_persist_across_instances(tmp_path: Path) -> None:
+    time = FakeTime()
+    GitHubResponseCache(tmp_path, time).put("issue_bodies", REPO_ROOT, "op", {}, [1, 2])
+
+    entry = GitHubResponseCache(tmp_path, time).get("issue_bodies", REPO_ROOT, "op", {})
+
+    assert entry is not None
+    assert entry.payload == [1, 2]
+
+
+def test_entries_expire_after_data_class_ttl(tmp_path: Path) -> None:
+    time = FakeTime()
+    cache = GitHubResponseCache(tmp_path, time, CacheTTLs(pr_state=60.0, workflow_runs=10.0))
+    cache.put("pr_state", REPO_ROOT, "op", {}, "pr")
+    cache.put("workflow_runs", REPO_ROOT, "op", {}, "run")
+
+    time.sleep(30.0)
+
+    assert cache.get("pr_state", REPO_ROOT, "op", {}) is not None
+    assert cache.get("workflow_runs", REPO_ROOT, "op", {}) is None
+
+
+def test_entries_from_the_future_are_ignored(tmp_path: Path) -> None:
+    time = FakeTime()
+    GitHubResponseCache(tmp_path, time).put("pr_state", REPO_ROOT, "op", {}, "pr")
+
+    earlier = FakeTime(time.now() - timedelta(minutes=5))
+
+    assert GitHubResponseCache(tmp_path, earlier).get("pr_state", REPO_ROOT, "op", {}) is None
+
+
+def test_invalidate_drops_only_that_data_class(tmp_path: Path) -> None:
+    cache = GitHubResponseCache(tmp_path, FakeTime())
+    cache.put("pr_state", REPO_ROOT, "op", {}, "pr")
+    cache.put("issue_bodies", REPO_ROOT, "op", {}, "issue")
+
+    cache.invalidate("pr_state")
+
+    assert cache.get("pr_state", REPO_ROOT, "op", {}) is None
+    assert cache.get("issue_bodies", REPO_ROOT, "op", {}) is not None
+    assert cache.stats().invalidations == 1
+
+
+def test_refresh_mode_skips_reads_but_stores(tmp_path: Path) -> None:
+    cache = GitHubResponseCache(tmp_path, FakeTime())
+    cache.put("pr_state", REPO_ROOT, "op", {}, "old")
+
+    cache.set_mode(CacheMode.REFRESH)
+    assert cache.get("pr_state", REPO_ROOT, "op", {}) is None
+    cache.put("pr_state", REPO_ROOT, "op", {}, "new")
+
+    cache.set_mode(CacheMode.NORMAL)
+    entry = cache.get("pr_state", REPO_ROOT, "op", {})
+    assert entry is not None
+    assert entry.payload == "new"
+
+
+def test_disabled_mode_neither_reads_nor_writes(tmp_path: Path) -> None:
+    cache = GitHubResponseCache(tmp_path / "cache", FakeTime())
+    cache.set_mode(CacheMode.DISABLED)
+
+    cache.put("pr_state", REPO_ROOT, "op", {}, "pr")
+
+    assert cache.get("pr_state", REPO_ROOT, "op", {}) is None
+    assert not (tmp_path / "cache").exists()
+    assert cache.stats().misses == 0
+
+
+def test_corrupt_entry_is_a_miss(tmp_path: Path) -> None:
+    cache = GitHubResponseCache(tmp_path, FakeTime())
+    cache.put("pr_state", REPO_ROOT, "op", {}, "pr")
+    for entry_path in tmp_path.glob("pr_state-*.json"):
+        entry_path.write_text("{not json", encoding="utf-8")
+
+    assert cache.get("pr_state", REPO_ROOT, "op", {}) is None
+
+
+def test_first_store_prunes_expired_and_unusable_entries(tmp_path: Path) -> None:
+    time = FakeTime()
+    earlier = GitHubResponseCache(tmp_path, time, CacheTTLs(pr_state=60.0, workflow_runs=10.0))
+    earlier.put("pr_state", REPO_ROOT, "op", {"batch": 1}, "pr")
+    earlier.put("workflow_runs", REPO_ROOT, "op", {"batch": 1}, "run")
+    (tmp_path / "issue_bodies-corrupt.json").write_text("{not json", encoding="utf-8")
+
+    time.sleep(30.0)
+    later = GitHubResponseCache(tmp_path, time, CacheTTLs(pr_state=60.0, workflow_runs=10.0))
+    later.put("workflow_runs", REPO_ROOT, "op", {"batch": 2}, "run")
+
+    assert len(list(tmp_path.glob("pr_state-*.json"))) == 1
+    assert len(list(tmp_path.glob("workflow_runs-*.json"))) == 1
+    assert not (tmp_path / "issue_bodies-corrupt.json").exists()
+    assert later.get("workflow_runs", REPO_ROOT, "op", {"batch": 2}) is not None
+
+
+def test_empty_payloads_are_not_stored(tmp_path: Path) -> None:
+    cache = GitHubResponseCache(tmp_path, FakeTime())
+
+    cache.put("issue_bodies", REPO_ROOT, "op", {}, [])
+    cache.put("pr_state", REPO_ROOT, "op", {}, {})
+
+    assert cache.get("issue_bodies", REPO_ROOT, "op", {}) is None
+    assert cache.get("pr_state", REPO_ROOT, "op", {}) is None
+    assert cache.stats().stores == 0
+
+
+def test_format_stats() -> None:
+    cache = GitHubResponseCache(Path("/nonexistent"), FakeTime())
+
+    assert cache.format_stats() == (
+        "github cache (normal): 0 hits, 0 misses, 0 stores, 0 invalidations"
+    )
+
+
+def test_workflow_run_codec_round_trips() -> None:
+    run = WorkflowRun(
+        run_id="123",
+        status="completed",
+        conclusion="success",
+        branch="main",
+        head_sha="abc",
+        display_title="Plan",
+        created_at=FakeTime().now(),
+    )
+
+    assert decode_workflow_run(encode_workflow_run(run)) == run
@@ -0,0 +1,117 @@
+"""Tests for the reusable parallel task runner and task cancellation."""
+
+import threading
+
+import pytest
+from erk_shared.integrations.parallel.cancellation import (
+    TaskCancelledError,
+    TaskScope,
+    current_task_scope,
+    task_scope,
+)
+from erk_shared.integrations.parallel.real import RealParallelTaskRunner
+from erk_shared.integrations.time.fake import FakeTime
+from erk_shared.subprocess_utils import run_subprocess
+
+
+def test_results_and_failures() -> None:
+    """Results are returned by name; raising tasks degrade to None."""
+    runner = RealParallelTaskRunner(max_workers=2, time=FakeTime())
+
+    def fail() -> object:
+        raise ValueError("boom")
+
+    results = runner.run_parallel({"a": lambda: 1, "b": fail, "c": lambda: "x"}, 1.0)
+
+    assert results == {"a": 1, "b": None, "c": "x"}
+    outcomes = {timing.name: timing.outcome for timing in runner.timings}
+    assert outcomes == {"a": "ok", "b": "failed", "c": "ok"}
+    assert any("Task 'b': failed" in line and "boom" in line for line in runner.format_timings())
+
+
+def test_deadline_counts_from_task_start() -> None:
+    """Tasks queued behind others on a single worker are timed from their own start."""
+    time = FakeTime()
+    runner = RealParallelTaskRunner(max_workers=1, time=time)
+
+    def slow(value: int) -> int:
+        time.sleep(3.0)
+        return value
+
+    results = runner.run_parallel({"a": lambda: slow(1), "b": lambda: slow(2)}, 4.0)
+
+    assert results == {"a": 1, "b": 2}
+    timing_b = next(timing for timing in runner.timings if timing.name == "b")
+    assert timing_b.outcome == "ok"
+    assert timing_b.queued_seconds == 3.0
+    assert timing_b.run_seconds == 3.0
+
+
+def test_returns_without_waiting_for_abandoned_task() -> None:
+    """A hung task is abandoned at its deadline and its worker replaced."""
+    time = FakeTime()
+    runner = RealParallelTaskRunner(max_workers=1, time=time)
+    release = threading.Event()
+
+    def hung() -> object:
+        time.sleep(10.0)
+        return release.wait(10)
+
+    results = runner.run_parallel({"hung": hung}, 0.05)
+    assert results == {"hung": None}
+
+    # The single worker slot is free again for the next batch
+    assert runner.run_parallel({"next": lambda: "done"}, 1.0) == {"next": "done"}
+    assert [timing.outcome for timing in runner.timings] == ["timed out", "ok"]
+    release.set()
+
+
+def test_abandoned_task_child_process_is_killed() -> None:
+    """Cancelling a task kills the subprocess it is waiting on."""
+    time = FakeTime()
+    runner = RealParallelTaskRunner(max_workers=1, time=time)
+    unwound = threading.Event()
+    errors: list[BaseException] = []
+
+    def hung_git() -> object:
+        try:
+            time.sleep(1.0)
+            return run_subprocess(["sleep", "30"], capture_output=True, text=True)
+        except TaskCancelledError as e:
+            errors.append(e)
+            raise
+        finally:
+            unwound.set()
+
+    results = runner.run_parallel({"hung": hung_git}, 0.05)
+
+    assert results == {"hung": None}
+    assert unwound.wait(5)
+    assert len(errors) == 1
+
+
+def test_cancelled_scope_refuses_new_processes() -> None:
+    """An abandoned task can't start more subprocesses."""
+    scope = TaskScope("abandoned")
+    scope.cancel()
+
+    with task_scope(scope):
+        assert current_task_scope() is scope
+        with pytest.raises(TaskCancelledError):
+            run_subprocess(["true"])
+    assert current_task_scope() is None
+
+
+def test_run_subprocess_in_task_matches_subprocess_run() -> None:
+    """Inside a task, run_subprocess returns what subprocess.run would."""
+    with task_scope(TaskScope("task")):
+        result = run_subprocess(["cat"], input="hello", capture_output=True, text=True)
+
+    assert result.returncode == 0
+    assert result.stdout == "hello"
+
+
+def test_invalid_worker_count() -> None:
+    """A runner needs at least one worker."""
+    with pytest.raises(ValueError, match="max_workers"):
+        RealParallelTaskRunner(max_workers=0)
@@ -4,9 +4,29 @@ This package provides a Click-based CLI for managing git worktrees in a
 global worktrees directory. See `erk --help` for details.
 """
 
-from erk.cli.cli import cli
+import os
+import sys
 
 
 def main() -> None:
     """CLI entry point used by the `erk` console script."""
+    # Shell-integration requests go to the resident daemon when one is
+    # running, before click or any command is imported
+    if len(sys.argv) > 1 and sys.argv[1] == "__shell":
+        from erk.cli.shell_integration.client import forward_shell_request
+
+        exit_code = forward_shell_request(sys.argv[2:])
+        if exit_code is not None:
+            raise SystemExit(exit_code)
+
+    # Completion of worktree, branch and plan arguments is answered from the
+    # per-repo completion cache, also without importing the CLI
+    if "_ERK_COMPLETE" in os.environ:
+        from erk.cli.cached_completion import complete_from_cache
+
+        if complete_from_cache():
+            return
+
+    from erk.cli.cli import cli
+
     cli()
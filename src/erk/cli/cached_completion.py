@@ -0,0 +1,77 @@
+"""Shell completion fast path served from the per-repo completion cache.
+
+The scripts `erk completion <shell>` generates call erk with _ERK_COMPLETE
+set on every TAB. For the arguments listed in CACHED_ARGUMENTS the erk
+entry point answers from erk.core.completion_cache using only click's
+completion protocol classes, without importing the CLI, its commands or the
+integrations. Anything else (options, other arguments, a missing or stale
+cache) falls through to click's regular completion, whose completion
+functions rebuild the cache.
+"""
+
+import os
+from pathlib import Path
+
+from erk.core.completion_cache import CandidateKind, load_cached_candidates
+
+COMPLETE_VAR = "_ERK_COMPLETE"
+
+# Command paths whose first argument completes from the cache. Must match
+# the shell_complete functions on those arguments;
+# tests/unit/cli/test_cached_completion.py checks that they do.
+CACHED_ARGUMENTS: dict[tuple[str, ...], CandidateKind] = {
+    ("checkout",): "branches",
+    ("co",): "branches",
+    ("wt", "goto"): "worktrees",
+    ("wt", "delete"): "worktrees",
+    ("wt", "rename"): "worktrees",
+    ("stack", "move"): "worktrees",
+    ("plan", "check"): "plans",
+    ("plan", "close"): "plans",
+    ("plan", "get"): "plans",
+    ("plan", "log"): "plans",
+    ("submit",): "plans",
+}
+
+
+def complete_from_cache() -> bool:
+    """Answer a completion request from the cache if it targets a cached argument.
+
+    Returns:
+        True if the completions were printed, False if click must handle the
+        request
+    """
+    instruction = os.environ.get(COMPLETE_VAR, "")
+    shell, _, action = instruction.partition("_")
+    if action != "complete":
+        return False
+
+    # click's protocol classes, not the erk CLI
+    import click
+    from click.shell_completion import CompletionItem, get_completion_class
+
+    completion_class = get_completion_class(shell)
+    if completion_class is None:
+        return False
+    completion = completion_class(click.Command("erk"), {}, "erk", COMPLETE_VAR)
+    args, incomplete = completion.get_completion_args()
+
+    kind = CACHED_ARGUMENTS.get(tuple(args))
+    if kind is None or incomplete.startswith("-"):
+        return False
+    # Error boundary: from a deleted directory click's path reports nothing
+    try:
+        cwd = Path.cwd()
+    except FileNotFoundError:
+        return False
+    candidates = load_cached_candidates(cwd, kind)
+    if candidates is None:
+        return False
+
+    items = [
+        CompletionItem(candidate.value, help=candidate.help)
+        for candidate in candidates
+        if candidate.value.startswith(incomplete)
+    ]
+    click.echo("\n".join(completion.format_completion(item) for item in items))
+    return True
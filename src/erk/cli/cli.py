@@ -1,58 +1,150 @@
 import click
 
-from erk.cli.alias import register_with_aliases
-from erk.cli.commands.admin import admin_group
-from erk.cli.commands.checkout import checkout_cmd
-from erk.cli.commands.completion import completion_group
-from erk.cli.commands.config import config_group
-from erk.cli.commands.down import down_cmd
-from erk.cli.commands.implement import implement
-from erk.cli.commands.init import init_cmd
-from erk.cli.commands.plan import plan_group
-from erk.cli.commands.plan.list_cmd import list_plans
-from erk.cli.commands.pr import pr_group
-from erk.cli.commands.prepare_cwd_recovery import prepare_cwd_recovery_cmd
-from erk.cli.commands.run import run_group
-from erk.cli.commands.shell_integration import hidden_shell_cmd
-from erk.cli.commands.stack import stack_group
-from erk.cli.commands.submit import submit_cmd
-from erk.cli.commands.up import up_cmd
-from erk.cli.commands.wt import wt_group
-from erk.cli.help_formatter import GroupedCommandGroup
-from erk.core.context import create_context
+from erk.cli.debug import debug_log
+from erk.cli.lazy_group import LazyCommand, LazyGroupedCommandGroup
 
 CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])  # terse help flags
 
+# Top-level commands, imported only when dispatched (see erk.cli.lazy_group).
+# short_help, aliases and hidden must match the command definitions;
+# tests/unit/cli/test_lazy_group.py checks that they do.
+LAZY_COMMANDS = (
+    LazyCommand(
+        "admin",
+        "erk.cli.commands.admin:admin_group",
+        "Administrative commands for repository configuration.",
+    ),
+    LazyCommand(
+        "checkout",
+        "erk.cli.commands.checkout:checkout_cmd",
+        "Checkout BRANCH by finding and switching to its worktree.",
+        aliases=("co",),
+    ),
+    LazyCommand(
+        "completion",
+        "erk.cli.commands.completion:completion_group",
+        "Generate shell completion scripts.",
+    ),
+    LazyCommand("config", "erk.cli.commands.config:config_group", "Manage erk configuration."),
+    LazyCommand(
+        "down", "erk.cli.commands.down:down_cmd", "Move to parent branch in Graphite stack."
+    ),
+    LazyCommand(
+        "implement",
+        "erk.cli.commands.implement:implement",
+        "Create worktree from GitHub issue or plan file and execute implementation.",
+    ),
+    LazyCommand(
+        "init",
+        "erk.cli.commands.init:init_cmd",
+        "Initialize erk for this repo and scaffold config.toml.",
+    ),
+    LazyCommand(
+        "list",
+        "erk.cli.commands.plan.list_cmd:list_plans",
+        "List plans with optional filters.",
+        aliases=("ls",),
+    ),
+    LazyCommand("plan", "erk.cli.commands.plan:plan_group", "Manage implementation plans."),
+    LazyCommand("pr", "erk.cli.commands.pr:pr_group", "Manage pull requests."),
+    LazyCommand(
+        "run",
+        "erk.cli.commands.run:run_group",
+        "View GitHub Actions workflow runs for plan implementations.",
+    ),
+    LazyCommand("stack", "erk.cli.commands.stack:stack_group", "Manage Graphite stack operations."),
+    LazyCommand(
+        "submit",
+        "erk.cli.commands.submit:submit_cmd",
+        "Submit issue for remote AI implementation via GitHub Actions.",
+    ),
+    LazyCommand("up", "erk.cli.commands.up:up_cmd", "Move to child branch in Graphite stack."),
+    LazyCommand("wt", "erk.cli.commands.wt:wt_group", "Manage git worktrees."),
+    LazyCommand(
+        "__shell",
+        "erk.cli.commands.shell_integration:hidden_shell_cmd",
+        "Unified entry point for shell integration wrappers.",
+        hidden=True,
+    ),
+    LazyCommand(
+        "__prepare_cwd_recovery",
+        "erk.cli.commands.prepare_cwd_recovery:prepare_cwd_recovery_cmd",
+        "Emit a recovery script if we are inside a managed repository.",
+        hidden=True,
+    ),
+)
 
-@click.group(cls=GroupedCommandGroup, context_settings=CONTEXT_SETTINGS)
+
+# Where ErkGroup keeps the arguments it dispatched, for _command_label
+_DISPATCHED_ARGS_KEY = "erk.dispatched_args"
+
+
+class ErkGroup(LazyGroupedCommandGroup):
+    """Root group that remembers the arguments following its own options."""
+
+    def resolve_command(
+        self, ctx: click.Context, args: list[str]
+    ) -> tuple[str | None, click.Command | None, list[str]]:
+        ctx.meta[_DISPATCHED_ARGS_KEY] = list(args)
+        return super().resolve_command(ctx, args)
+
+
+@click.group(cls=ErkGroup, lazy_commands=LAZY_COMMANDS, context_settings=CONTEXT_SETTINGS)
 @click.version_option(package_name="erk")
 @click.pass_context
 def cli(ctx: click.Context) -> None:
     """Manage git worktrees in a global worktrees directory."""
     # Only create context if not already provided (e.g., by tests)
     if ctx.obj is None:
+        # Imported here: building the context needs the integrations, which
+        # --help and --version don't
+        from erk.core.context import create_context
+
         ctx.obj = create_context(dry_run=False)
 
+    erk_ctx = ctx.obj
+
+    def after_command() -> None:
+        resolved = erk_ctx.resolved_dependencies()
+        debug_log(f"Resolved dependencies: {', '.join(resolved)}")
+        for line in erk_ctx.cache_stats():
+            debug_log(line)
+        if "parallel_runner" in resolved:
+            for line in erk_ctx.parallel_runner.format_timings():
+                debug_log(line)
+        # GitHub API consumption is logged per command for `erk admin github-budget`
+        if "github_budget" in resolved and erk_ctx.github_budget is not None:
+            erk_ctx.github_budget.record_invocation(_command_label(ctx))
+
+    ctx.call_on_close(after_command)
+
+
+def _command_label(ctx: click.Context) -> str:
+    """Subcommand path of this invocation, e.g. "plan list".
+
+    By the time the root context closes its subcommand contexts are gone, so
+    the chain is resolved again from the arguments the root group dispatched
+    (see ErkGroup), the same way click resolved it. Aliases resolve to their
+    command's name.
+    """
+    args = ctx.meta.get(_DISPATCHED_ARGS_KEY)
+    if ctx.invoked_subcommand is None or args is None:
+        return ctx.invoked_subcommand or "erk"
 
-# Register all commands
-# Commands with @alias decorators use register_with_aliases() to auto-register aliases
-cli.add_command(admin_group)
-register_with_aliases(cli, checkout_cmd)  # Has @alias("co")
-cli.add_command(completion_group)
-cli.add_command(config_group)
-cli.add_command(down_cmd)
-cli.add_command(implement)
-cli.add_command(init_cmd)
-register_with_aliases(cli, list_plans, name="list")  # Has @alias("ls")
-cli.add_command(plan_group)
-cli.add_command(pr_group)
-cli.add_command(run_group)
-cli.add_command(stack_group)
-cli.add_command(submit_cmd)
-cli.add_command(up_cmd)
-cli.add_command(wt_group)
-cli.add_command(hidden_shell_cmd)
-cli.add_command(prepare_cwd_recovery_cmd)
+    names: list[str] = []
+    group_ctx = ctx
+    group = ctx.command
+    while isinstance(group, click.Group) and args:
+        name, command, args = group.resolve_command(group_ctx, args)
+        if command is None or command.name is None:
+            break
+        names.append(command.name)
+        if not isinstance(command, click.Group):
+            break
+        group_ctx = command.make_context(name, args, parent=group_ctx, resilient_parsing=True)
+        group = command
+        args = [*group_ctx._protected_args, *group_ctx.args]
+    return " ".join(names)
 
 
 def main() -> None:
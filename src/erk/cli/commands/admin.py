@@ -1,11 +1,25 @@
 """Admin commands for repository configuration."""
 
+import signal
+from dataclasses import dataclass
+from datetime import timedelta
 from typing import Literal
 
 import click
+from erk_shared.github.rate_budget import BudgetUsage
 from erk_shared.output.output import user_output
+from rich.console import Console
+from rich.table import Table
 
 from erk.cli.core import discover_repo_context
+from erk.cli.shell_integration.client import daemon_socket_path
+from erk.cli.shell_integration.daemon import (
+    DEFAULT_IDLE_TIMEOUT_SECONDS,
+    ShellDaemon,
+    daemon_status,
+    start_daemon,
+    stop_daemon,
+)
 from erk.core.context import ErkContext
 from erk.core.implementation_queue.github.real import RealGitHubAdmin
 
@@ -111,3 +125,175 @@ def github_pr_setting(ctx: ErkContext, action: Literal["enable", "disable"] | No
         except RuntimeError as e:
             user_output(click.style("Error: ", fg="red") + str(e))
             raise SystemExit(1) from e
+
+
+@admin_group.command("refresh-trunk")
+@click.pass_obj
+def refresh_trunk(ctx: ErkContext) -> None:
+    """Re-detect the trunk branch and update the cached value.
+
+    erk remembers the detected trunk branch per repository and re-detects it
+    when origin/HEAD, the main/master branches or [tool.erk] trunk_branch in
+    pyproject.toml change. Run this after changing the remote's default
+    branch in a way erk can't see (for example `git remote set-head` in a
+    repository whose refs aren't stored as files).
+    """
+    repo = discover_repo_context(ctx, ctx.cwd)
+
+    if ctx.git_cache is not None:
+        ctx.git_cache.invalidate(("get_trunk_branch",))
+    if ctx.trunk_resolver is not None:
+        trunk = ctx.trunk_resolver.refresh(ctx.git, repo.root)
+    else:
+        trunk = ctx.git.get_trunk_branch(repo.root)
+
+    user_output(f"Trunk branch: {click.style(trunk, fg='cyan', bold=True)}")
+
+
+@dataclass
+class _CommandBudget:
+    """GitHub API consumption of one command, summed over its invocations."""
+
+    command: str
+    invocations: int = 0
+    graphql_queries: int = 0
+    graphql_points: int = 0
+    rest_requests: int = 0
+    secondary_limit_hits: int = 0
+
+
+def _summarize_budget_usage(usages: list[BudgetUsage]) -> list[_CommandBudget]:
+    """Sum usage per command, heaviest GraphQL consumers first."""
+    by_command: dict[str, _CommandBudget] = {}
+    for usage in usages:
+        summary = by_command.setdefault(usage.command, _CommandBudget(usage.command))
+        summary.invocations += 1
+        summary.graphql_queries += usage.graphql_queries
+        summary.graphql_points += usage.graphql_points
+        summary.rest_requests += usage.rest_requests
+        summary.secondary_limit_hits += usage.secondary_limit_hits
+    return sorted(
+        by_command.values(), key=lambda s: (s.graphql_points, s.rest_requests), reverse=True
+    )
+
+
+@admin_group.command("github-budget")
+@click.pass_obj
+def github_budget(ctx: ErkContext) -> None:
+    """Show GitHub API consumption per erk command over the last day.
+
+    GitHub allows 5,000 GraphQL points an hour per user. erk records the
+    points and REST requests each invocation used (gh subcommands that don't
+    report rate limits aren't counted) and throttles batch queries when the
+    budget runs low. Use this to see which commands use it up.
+    """
+    budget = ctx.github_budget
+    if budget is None or budget.log is None:
+        user_output("GitHub budget tracking is not enabled")
+        return
+
+    usages = budget.log.read(since=ctx.time.now() - timedelta(days=1))
+    if not usages:
+        user_output("No GitHub API usage recorded in the last day")
+        return
+
+    table = Table(show_header=True, header_style="bold", box=None)
+    table.add_column("command", style="cyan", no_wrap=True)
+    table.add_column("runs", justify="right")
+    table.add_column("graphql queries", justify="right")
+    table.add_column("graphql points", justify="right")
+    table.add_column("rest requests", justify="right")
+    table.add_column("secondary limits", justify="right")
+    for summary in _summarize_budget_usage(usages):
+        table.add_row(
+            summary.command,
+            str(summary.invocations),
+            str(summary.graphql_queries),
+            str(summary.graphql_points),
+            str(summary.rest_requests),
+            str(summary.secondary_limit_hits) if summary.secondary_limit_hits else "-",
+        )
+
+    user_output(click.style("GitHub API usage in the last day", bold=True))
+    # Output table to stderr (consistent with user_output convention)
+    console = Console(stderr=True, force_terminal=True)
+    console.print(table)
+
+    # The most recent invocation that saw a rateLimit reports what is left
+    latest = next((u for u in reversed(usages) if u.graphql_remaining is not None), None)
+    if latest is not None and latest.graphql_reset_at is not None:
+        reset = latest.graphql_reset_at.astimezone().strftime("%H:%M")
+        user_output(
+            f"GraphQL budget: {latest.graphql_remaining}/{latest.graphql_limit} points left "
+            f"(as of {latest.recorded_at.astimezone().strftime('%H:%M')}, resets at {reset})"
+        )
+
+
+@admin_group.group("shell-daemon")
+def shell_daemon_group() -> None:
+    """Manage the resident daemon that serves shell-integration navigation.
+
+    While the daemon runs, `erk co`, `erk up`, `erk down` and other commands
+    invoked through the shell wrappers are answered by a warm process
+    instead of starting erk from scratch. Without a running daemon they run
+    in-process as usual. Set ERK_SHELL_DAEMON=0 to bypass a running daemon.
+    """
+    pass
+
+
+@shell_daemon_group.command("start")
+@click.option(
+    "--idle-timeout",
+    type=click.IntRange(min=1),
+    default=DEFAULT_IDLE_TIMEOUT_SECONDS,
+    show_default=True,
+    help="Seconds without requests before the daemon exits.",
+)
+@click.pass_obj
+def shell_daemon_start(ctx: ErkContext, idle_timeout: int) -> None:
+    """Start the daemon in the background."""
+    status = daemon_status()
+    if status is not None:
+        user_output(f"Shell daemon already running (pid {status['pid']})")
+        return
+
+    status = start_daemon(idle_timeout=idle_timeout, time=ctx.time)
+    if status is None:
+        user_output(click.style("Error: ", fg="red") + "Shell daemon did not start")
+        raise SystemExit(1)
+    user_output(click.style("✓", fg="green") + f" Shell daemon started (pid {status['pid']})")
+
+
+@shell_daemon_group.command("stop")
+def shell_daemon_stop() -> None:
+    """Stop the daemon."""
+    if stop_daemon():
+        user_output(click.style("✓", fg="green") + " Shell daemon stopped")
+    else:
+        user_output("Shell daemon is not running")
+
+
+@shell_daemon_group.command("status")
+def shell_daemon_status() -> None:
+    """Show whether the daemon is running and how its cache is doing."""
+    status = daemon_status()
+    if status is None:
+        user_output("Shell daemon is not running")
+        return
+    user_output(f"Shell daemon running (pid {status['pid']})")
+    user_output(f"Uptime: {status['uptime_seconds']}s")
+    user_output(f"Requests served: {status['requests']}")
+    user_output(status["git_cache"])
+
+
+@shell_daemon_group.command("run", hidden=True)
+@click.option("--idle-timeout", type=click.IntRange(min=1), default=DEFAULT_IDLE_TIMEOUT_SECONDS)
+@click.pass_obj
+def shell_daemon_run(ctx: ErkContext, idle_timeout: int) -> None:
+    """Run the daemon in the foreground (used by `start`)."""
+    if daemon_status() is not None:
+        user_output(click.style("Error: ", fg="red") + "Shell daemon already running")
+        raise SystemExit(1)
+    # Turn SIGTERM into KeyboardInterrupt so the socket is removed on the way out
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    ShellDaemon(daemon_socket_path(), idle_timeout=idle_timeout, time=ctx.time).serve()
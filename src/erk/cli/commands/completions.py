@@ -3,14 +3,21 @@
 Separated from navigation_helpers to avoid circular imports.
 """
 
+import subprocess
 from collections.abc import Generator
 from contextlib import contextmanager
 
 import click
+from click.shell_completion import CompletionItem
 
 from erk.cli.core import discover_repo_context
-from erk.core.context import create_context
-from erk.core.repo_discovery import ensure_erk_metadata_dir
+from erk.core.completion_cache import (
+    cached_plans,
+    load_or_refresh_completion_sets,
+    refresh_stale_completion_sets,
+)
+from erk.core.context import ErkContext, create_context
+from erk.core.repo_discovery import RepoContext, ensure_erk_metadata_dir
 
 
 @contextmanager
@@ -50,6 +57,9 @@ def complete_worktree_names(
 ) -> list[str]:
     """Shell completion for worktree names. Includes 'root' for the repository root.
 
+    Candidates come from the per-repo completion cache while it is current
+    (see erk.core.completion_cache), and refresh it otherwise.
+
     Uses shell_completion_error_boundary for graceful error handling.
 
     Args:
@@ -67,18 +77,10 @@ def complete_worktree_names(
         repo = discover_repo_context(erk_ctx, erk_ctx.cwd)
         ensure_erk_metadata_dir(repo)
 
-        names = ["root"] if "root".startswith(incomplete) else []
-
-        # Get worktree names from git_ops instead of filesystem iteration
-        worktrees = erk_ctx.git.list_worktrees(repo.root)
-        for wt in worktrees:
-            if wt.is_root:
-                continue  # Skip root worktree (already added as "root")
-            worktree_name = wt.path.name
-            if worktree_name.startswith(incomplete):
-                names.append(worktree_name)
-
-        return names
+        worktrees, _ = load_or_refresh_completion_sets(
+            erk_ctx.git, repo.root, erk_ctx.completion_cache_path
+        )
+        return [name for name in worktrees if name.startswith(incomplete)]
     return []
 
 
@@ -90,6 +92,7 @@ def complete_branch_names(
     Remote branch names have their remote prefix stripped
     (e.g., 'origin/feature' becomes 'feature').
     Duplicates are removed if a branch exists both locally and remotely.
+    Candidates come from the per-repo completion cache while it is current.
 
     Uses shell_completion_error_boundary for graceful error handling.
 
@@ -108,27 +111,10 @@ def complete_branch_names(
         repo = discover_repo_context(erk_ctx, erk_ctx.cwd)
         ensure_erk_metadata_dir(repo)
 
-        # Collect all branch names in a set for deduplication
-        branch_names = set()
-
-        # Add local branches
-        local_branches = erk_ctx.git.list_local_branches(repo.root)
-        branch_names.update(local_branches)
-
-        # Add remote branches with prefix stripped
-        remote_branches = erk_ctx.git.list_remote_branches(repo.root)
-        for remote_branch in remote_branches:
-            # Strip remote prefix (e.g., 'origin/feature' -> 'feature')
-            if "/" in remote_branch:
-                _, branch_name = remote_branch.split("/", 1)
-                branch_names.add(branch_name)
-            else:
-                # Fallback: if no slash, use as-is
-                branch_names.add(remote_branch)
-
-        # Filter by incomplete prefix and return sorted list
-        matching_branches = [name for name in branch_names if name.startswith(incomplete)]
-        return sorted(matching_branches)
+        _, branches = load_or_refresh_completion_sets(
+            erk_ctx.git, repo.root, erk_ctx.completion_cache_path
+        )
+        return [name for name in branches if name.startswith(incomplete)]
     return []
 
 
@@ -166,3 +152,62 @@ def complete_plan_files(
 
         return sorted(candidates)
     return []
+
+
+def complete_plan_numbers(
+    ctx: click.Context, param: click.Parameter | None, incomplete: str
+) -> list[CompletionItem]:
+    """Shell completion for plan issue numbers, with titles as help text.
+
+    Offers the plans recorded by the last `erk plan list` in this repository;
+    completion never queries GitHub.
+
+    Uses shell_completion_error_boundary for graceful error handling.
+
+    Args:
+        ctx: Click context
+        param: Click parameter (unused, but required by Click's completion protocol)
+        incomplete: Partial input string to complete
+    """
+    with shell_completion_error_boundary():
+        # During shell completion, ctx.obj may be None if the CLI group callback
+        # hasn't run yet. Create a default context in this case.
+        erk_ctx = ctx.find_root().obj
+        if erk_ctx is None:
+            erk_ctx = create_context(dry_run=False)
+
+        if erk_ctx.completion_cache_path is None:
+            return []
+        return [
+            CompletionItem(plan.value, help=plan.help)
+            for plan in cached_plans(erk_ctx.completion_cache_path)
+            if plan.value.startswith(incomplete)
+        ]
+    return []
+
+
+def refresh_completion_cache(erk_ctx: ErkContext) -> None:
+    """Refresh the completion cache after a command changed branches or worktrees.
+
+    Called by the commands that add, remove or rename branches or worktrees,
+    right after the change. Does nothing unless the repository's cache exists
+    and no longer matches its refs and worktree list.
+
+    The candidates are read uncached: the command's git read cache is cleared
+    first, since it may predate the change or miss changes made by gt and git
+    subprocesses that bypass it.
+
+    Args:
+        erk_ctx: Context of the command that made the change
+    """
+    cache_path = erk_ctx.completion_cache_path
+    if cache_path is None or not isinstance(erk_ctx.repo, RepoContext):
+        return
+    if erk_ctx.git_cache is not None:
+        erk_ctx.git_cache.clear()
+    # Error boundary: the command already succeeded; a failure to refresh
+    # completion candidates must not turn it into an error
+    try:
+        refresh_stale_completion_sets(erk_ctx.git, erk_ctx.repo.root, cache_path)
+    except (OSError, subprocess.CalledProcessError):
+        return
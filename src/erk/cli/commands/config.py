@@ -7,9 +7,19 @@ from erk_shared.output.output import machine_output, user_output
 from erk.cli.config import LoadedConfig
 from erk.cli.core import discover_repo_context
 from erk.cli.ensure import Ensure
-from erk.core.config_store import GlobalConfig
+from erk.core.config_store import GIT_BACKENDS, GITHUB_BACKENDS, GlobalConfig
 from erk.core.context import ErkContext, write_trunk_to_pyproject
 
+# Keys stored in the global ~/.erk/config.toml
+_GLOBAL_KEYS = (
+    "erk_root",
+    "use_graphite",
+    "show_pr_info",
+    "github_backend",
+    "git_backend",
+    "parallel_workers",
+)
+
 
 def _get_env_value(cfg: LoadedConfig, parts: list[str], key: str) -> None:
     """Handle env.* configuration keys.
@@ -60,6 +70,9 @@ def config_list(ctx: ErkContext) -> None:
         user_output(f"  erk_root={ctx.global_config.erk_root}")
         user_output(f"  use_graphite={str(ctx.global_config.use_graphite).lower()}")
         user_output(f"  show_pr_info={str(ctx.global_config.show_pr_info).lower()}")
+        user_output(f"  github_backend={ctx.global_config.github_backend}")
+        user_output(f"  git_backend={ctx.global_config.git_backend}")
+        user_output(f"  parallel_workers={ctx.global_config.parallel_workers}")
     else:
         user_output("  (not configured - run 'erk init' to create)")
 
@@ -100,7 +113,7 @@ def config_get(ctx: ErkContext, key: str) -> None:
     parts = key.split(".")
 
     # Handle global config keys
-    if parts[0] in ("erk_root", "use_graphite", "show_pr_info"):
+    if parts[0] in _GLOBAL_KEYS:
         if ctx.global_config is None:
             config_path = ctx.config_store.path()
             user_output(f"Global config not found at {config_path}")
@@ -112,6 +125,12 @@ def config_get(ctx: ErkContext, key: str) -> None:
             machine_output(str(ctx.global_config.use_graphite).lower())
         elif parts[0] == "show_pr_info":
             machine_output(str(ctx.global_config.show_pr_info).lower())
+        elif parts[0] == "github_backend":
+            machine_output(ctx.global_config.github_backend)
+        elif parts[0] == "git_backend":
+            machine_output(ctx.global_config.git_backend)
+        elif parts[0] == "parallel_workers":
+            machine_output(str(ctx.global_config.parallel_workers))
         return
 
     # Handle repo config keys
@@ -153,7 +172,7 @@ def config_set(ctx: ErkContext, key: str, value: str) -> None:
     parts = key.split(".")
 
     # Handle global config keys
-    if parts[0] in ("erk_root", "use_graphite", "show_pr_info"):
+    if parts[0] in _GLOBAL_KEYS:
         if ctx.global_config is None:
             config_path = ctx.config_store.path()
             user_output(f"Global config not found at {config_path}")
@@ -167,6 +186,9 @@ def config_set(ctx: ErkContext, key: str, value: str) -> None:
                 use_graphite=ctx.global_config.use_graphite,
                 shell_setup_complete=ctx.global_config.shell_setup_complete,
                 show_pr_info=ctx.global_config.show_pr_info,
+                github_backend=ctx.global_config.github_backend,
+                git_backend=ctx.global_config.git_backend,
+                parallel_workers=ctx.global_config.parallel_workers,
             )
         elif parts[0] == "use_graphite":
             if value.lower() not in ("true", "false"):
@@ -177,6 +199,9 @@ def config_set(ctx: ErkContext, key: str, value: str) -> None:
                 use_graphite=value.lower() == "true",
                 shell_setup_complete=ctx.global_config.shell_setup_complete,
                 show_pr_info=ctx.global_config.show_pr_info,
+                github_backend=ctx.global_config.github_backend,
+                git_backend=ctx.global_config.git_backend,
+                parallel_workers=ctx.global_config.parallel_workers,
             )
         elif parts[0] == "show_pr_info":
             if value.lower() not in ("true", "false"):
@@ -187,6 +212,48 @@ def config_set(ctx: ErkContext, key: str, value: str) -> None:
                 use_graphite=ctx.global_config.use_graphite,
                 shell_setup_complete=ctx.global_config.shell_setup_complete,
                 show_pr_info=value.lower() == "true",
+                github_backend=ctx.global_config.github_backend,
+                git_backend=ctx.global_config.git_backend,
+                parallel_workers=ctx.global_config.parallel_workers,
+            )
+        elif parts[0] == "github_backend":
+            if value not in GITHUB_BACKENDS:
+                user_output(f"Invalid github_backend: {value} (expected 'gh' or 'http')")
+                raise SystemExit(1)
+            new_config = GlobalConfig(
+                erk_root=ctx.global_config.erk_root,
+                use_graphite=ctx.global_config.use_graphite,
+                shell_setup_complete=ctx.global_config.shell_setup_complete,
+                show_pr_info=ctx.global_config.show_pr_info,
+                github_backend=value,
+                git_backend=ctx.global_config.git_backend,
+                parallel_workers=ctx.global_config.parallel_workers,
+            )
+        elif parts[0] == "git_backend":
+            if value not in GIT_BACKENDS:
+                user_output(f"Invalid git_backend: {value} (expected 'git' or 'plumbing')")
+                raise SystemExit(1)
+            new_config = GlobalConfig(
+                erk_root=ctx.global_config.erk_root,
+                use_graphite=ctx.global_config.use_graphite,
+                shell_setup_complete=ctx.global_config.shell_setup_complete,
+                show_pr_info=ctx.global_config.show_pr_info,
+                github_backend=ctx.global_config.github_backend,
+                git_backend=value,
+                parallel_workers=ctx.global_config.parallel_workers,
+            )
+        elif parts[0] == "parallel_workers":
+            if not value.isdigit() or int(value) < 1:
+                user_output(f"Invalid parallel_workers: {value} (expected a positive integer)")
+                raise SystemExit(1)
+            new_config = GlobalConfig(
+                erk_root=ctx.global_config.erk_root,
+                use_graphite=ctx.global_config.use_graphite,
+                shell_setup_complete=ctx.global_config.shell_setup_complete,
+                show_pr_info=ctx.global_config.show_pr_info,
+                github_backend=ctx.global_config.github_backend,
+                git_backend=ctx.global_config.git_backend,
+                parallel_workers=int(value),
             )
         else:
             user_output(f"Invalid key: {key}")
@@ -1,4 +1,3 @@
-import dataclasses
 from pathlib import Path
 
 import click
@@ -192,6 +191,9 @@ def init_cmd(
                 use_graphite=ctx.global_config.use_graphite,
                 shell_setup_complete=True,
                 show_pr_info=ctx.global_config.show_pr_info,
+                github_backend=ctx.global_config.github_backend,
+                git_backend=ctx.global_config.git_backend,
+                parallel_workers=ctx.global_config.parallel_workers,
             )
             try:
                 ctx.config_store.save(new_config)
@@ -235,7 +237,7 @@ def init_cmd(
         erk_root = erk_root.expanduser().resolve()
         config = create_and_save_global_config(ctx, erk_root, shell_setup_complete=False)
         # Update context with newly created config
-        ctx = dataclasses.replace(ctx, global_config=config)
+        ctx = ctx.with_global_config(config)
         user_output(f"Created global config at {config_path}")
         # Show graphite status on first init
         has_graphite = detect_graphite(ctx.shell)
@@ -320,6 +322,9 @@ def init_cmd(
                         use_graphite=fresh_config.use_graphite,
                         shell_setup_complete=True,
                         show_pr_info=fresh_config.show_pr_info,
+                        github_backend=fresh_config.github_backend,
+                        git_backend=fresh_config.git_backend,
+                        parallel_workers=fresh_config.parallel_workers,
                     )
                     try:
                         ctx.config_store.save(new_config)
@@ -5,6 +5,7 @@ from erk_shared.git.abc import WorktreeInfo
 from erk_shared.output.output import machine_output, user_output
 
 from erk.cli.activation import render_activation_script
+from erk.cli.commands.completions import refresh_completion_cache
 from erk.cli.commands.wt.create_cmd import ensure_worktree_for_branch
 from erk.cli.debug import debug_log
 from erk.cli.ensure import Ensure
@@ -84,6 +85,7 @@ def delete_branch_and_worktree(
 
     # Prune worktree metadata
     ctx.git.prune_worktrees(repo_root)
+    refresh_completion_cache(ctx)
 
 
 def activate_root_repo(ctx: ErkContext, repo: RepoContext, script: bool, command_name: str) -> None:
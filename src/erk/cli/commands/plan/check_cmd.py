@@ -10,6 +10,7 @@ from erk_shared.github.metadata import (
 )
 from erk_shared.output.output import user_output
 
+from erk.cli.commands.completions import complete_plan_numbers
 from erk.cli.core import discover_repo_context
 from erk.core.context import ErkContext
 from erk.core.repo_discovery import ensure_erk_metadata_dir
@@ -42,7 +43,7 @@ def _parse_identifier(identifier: str) -> int:
 
 
 @click.command("check")
-@click.argument("identifier", type=str)
+@click.argument("identifier", type=str, shell_complete=complete_plan_numbers)
 @click.pass_obj
 def check_plan(ctx: ErkContext, identifier: str) -> None:
     """Validate a plan's format against Schema v2 requirements.
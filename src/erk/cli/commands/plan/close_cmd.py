@@ -5,13 +5,14 @@ from urllib.parse import urlparse
 import click
 from erk_shared.output.output import user_output
 
+from erk.cli.commands.completions import complete_plan_numbers
 from erk.cli.core import discover_repo_context
 from erk.core.context import ErkContext
 from erk.core.repo_discovery import ensure_erk_metadata_dir
 
 
 @click.command("close")
-@click.argument("identifier", type=str)
+@click.argument("identifier", type=str, shell_complete=complete_plan_numbers)
 @click.pass_obj
 def close_plan(ctx: ErkContext, identifier: str) -> None:
     """Close a plan by issue number or GitHub URL.
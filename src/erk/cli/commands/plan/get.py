@@ -3,13 +3,14 @@
 import click
 from erk_shared.output.output import user_output
 
+from erk.cli.commands.completions import complete_plan_numbers
 from erk.cli.core import discover_repo_context
 from erk.core.context import ErkContext
 from erk.core.repo_discovery import ensure_erk_metadata_dir
 
 
 @click.command("get")
-@click.argument("identifier", type=str)
+@click.argument("identifier", type=str, shell_complete=complete_plan_numbers)
 @click.pass_obj
 def get_plan(ctx: ErkContext, identifier: str) -> None:
     """Fetch and display a plan by identifier.
@@ -5,18 +5,14 @@ from collections.abc import Callable
 import click
 from erk_shared.github.emoji import get_checks_status_emoji, get_pr_status_emoji
 from erk_shared.github.issues import IssueInfo
-from erk_shared.github.metadata import (
-    extract_plan_header_local_impl_at,
-    extract_plan_header_worktree_name,
-)
 from erk_shared.github.types import PullRequestInfo
-from erk_shared.impl_folder import read_issue_reference
 from erk_shared.output.output import user_output
 from rich.console import Console
 from rich.table import Table
 
 from erk.cli.alias import alias
-from erk.cli.core import discover_repo_context
+from erk.cli.core import apply_github_cache_flags, discover_repo_context, github_cache_options
+from erk.core.completion_cache import record_completion_plans
 from erk.core.context import ErkContext
 from erk.core.display_utils import (
     format_relative_time,
@@ -26,6 +22,7 @@ from erk.core.display_utils import (
 )
 from erk.core.plan_store.types import Plan, PlanState
 from erk.core.repo_discovery import ensure_erk_metadata_dir
+from erk.core.worktree_snapshot import collect_worktree_snapshot
 
 
 def _issue_to_plan(issue: IssueInfo) -> Plan:
@@ -186,6 +183,7 @@ def plan_list_options[**P, T](f: Callable[P, T]) -> Callable[P, T]:
         type=int,
         help="Maximum number of results to return",
     )(f)
+    f = github_cache_options(f)
     return f
 
 
@@ -231,6 +229,14 @@ def _list_plans_impl(
         user_output(click.style("Error: ", fg="red") + str(e))
         raise SystemExit(1) from e
 
+    # Unfiltered listings feed plan-number shell completion
+    completion_cache_path = ctx.completion_cache_path
+    if completion_cache_path is not None and not label and run_state is None and state != "closed":
+        record_completion_plans(
+            completion_cache_path,
+            [(issue.number, issue.title) for issue in plan_data.issues if issue.state == "OPEN"],
+        )
+
     # Convert IssueInfo to Plan objects
     plans = [_issue_to_plan(issue) for issue in plan_data.issues]
 
@@ -244,18 +250,10 @@ def _list_plans_impl(
     # Use pre-fetched data from PlanListService
     pr_linkages = plan_data.pr_linkages
     workflow_runs = plan_data.workflow_runs
+    plan_headers = plan_data.plan_headers
 
     # Build local worktree mapping from .impl/issue.json files
-    worktree_by_issue: dict[int, str] = {}
-    worktrees = ctx.git.list_worktrees(repo_root)
-    for worktree in worktrees:
-        impl_folder = worktree.path / ".impl"
-        if impl_folder.exists() and impl_folder.is_dir():
-            issue_ref = read_issue_reference(impl_folder)
-            if issue_ref is not None:
-                # If multiple worktrees have same issue, keep first found
-                if issue_ref.issue_number not in worktree_by_issue:
-                    worktree_by_issue[issue_ref.issue_number] = worktree.path.name
+    worktree_by_issue = collect_worktree_snapshot(ctx.git, repo_root).worktree_by_issue()
 
     # Apply run state filter if specified
     if run_state:
@@ -323,15 +321,17 @@ def _list_plans_impl(
             worktree_name = worktree_by_issue[issue_number]
             exists_locally = True
 
-        # Extract from issue body (schema v2 only) - worktree may or may not exist locally
-        if plan.body:
-            extracted = extract_plan_header_worktree_name(plan.body)
+        # Read from the issue body's plan header (schema v2 only), parsed once
+        # by PlanListService - worktree may or may not exist locally
+        plan_header = plan_headers.get(issue_number) if isinstance(issue_number, int) else None
+        if plan_header is not None:
+            extracted = plan_header.worktree_name
             if extracted:
                 # If we don't have a local name yet, use the one from issue body
                 if not worktree_name:
                     worktree_name = extracted
             # Extract last_local_impl_at timestamp
-            last_local_impl_at = extract_plan_header_local_impl_at(plan.body)
+            last_local_impl_at = plan_header.last_local_impl_at
 
         # Format the worktree cells
         worktree_name_cell = format_worktree_name_cell(worktree_name, exists_locally)
@@ -417,6 +417,8 @@ def list_plans(
     runs: bool,
     prs: bool,
     limit: int | None,
+    no_cache: bool,
+    refresh: bool,
 ) -> None:
     """List plans with optional filters.
 
@@ -428,5 +430,7 @@ def list_plans(
         erk plan list --run-state success --state open
         erk plan list --runs
         erk plan list --prs
+        erk plan list --refresh
     """
+    apply_github_cache_flags(ctx, no_cache=no_cache, refresh=refresh)
     _list_plans_impl(ctx, label, state, run_state, runs, prs, limit)
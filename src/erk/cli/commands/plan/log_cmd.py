@@ -9,6 +9,7 @@ import click
 from erk_shared.github.metadata import parse_metadata_blocks
 from erk_shared.output.output import user_output
 
+from erk.cli.commands.completions import complete_plan_numbers
 from erk.cli.core import discover_repo_context
 from erk.core.context import ErkContext
 from erk.core.repo_discovery import ensure_erk_metadata_dir
@@ -97,7 +98,7 @@ type EventExtractor = Callable[[dict], Event | None]
 
 
 @click.command("log")
-@click.argument("identifier", type=str)
+@click.argument("identifier", type=str, shell_complete=complete_plan_numbers)
 @click.option(
     "--json",
     "output_json",
@@ -8,6 +8,7 @@ from erk_shared.output.output import user_output
 
 from erk.cli.activation import render_activation_script
 from erk.cli.alias import alias
+from erk.cli.commands.completions import refresh_completion_cache
 from erk.cli.commands.pr.parse_pr_reference import parse_pr_reference
 from erk.cli.core import worktree_path_for
 from erk.cli.ensure import Ensure
@@ -124,6 +125,7 @@ def pr_checkout(ctx: ErkContext, pr_reference: str, script: bool) -> None:
         ref=None,
         create_branch=False,
     )
+    refresh_completion_cache(ctx)
 
     # Output based on mode
     if script:
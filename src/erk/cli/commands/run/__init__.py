@@ -4,6 +4,7 @@ import click
 
 from erk.cli.commands.run.list_cmd import list_runs
 from erk.cli.commands.run.logs_cmd import logs_run
+from erk.cli.commands.run.watch_cmd import watch_runs
 
 
 @click.group("run")
@@ -15,3 +16,4 @@ def run_group() -> None:
 # Register subcommands
 run_group.add_command(list_runs)
 run_group.add_command(logs_run)
+run_group.add_command(watch_runs)
@@ -9,7 +9,7 @@ from rich.table import Table
 from erk.cli.commands.plan.list_cmd import format_pr_cell, select_display_pr
 from erk.cli.commands.run.shared import extract_issue_number
 from erk.cli.constants import DISPATCH_WORKFLOW_NAME
-from erk.cli.core import discover_repo_context
+from erk.cli.core import apply_github_cache_flags, discover_repo_context, github_cache_options
 from erk.core.context import ErkContext
 from erk.core.display_utils import (
     format_submission_time,
@@ -182,7 +182,9 @@ def _list_runs(ctx: ErkContext, show_all: bool = False) -> None:
 
 @click.command("list")
 @click.option("--show-legacy", is_flag=True, help="Show all runs including legacy runs.")
+@github_cache_options
 @click.pass_obj
-def list_runs(ctx: ErkContext, show_legacy: bool) -> None:
+def list_runs(ctx: ErkContext, show_legacy: bool, no_cache: bool, refresh: bool) -> None:
     """List GitHub Actions workflow runs for plan implementations."""
+    apply_github_cache_flags(ctx, no_cache=no_cache, refresh=refresh)
     _list_runs(ctx, show_legacy)
@@ -1,5 +1,11 @@
 """Shared utilities for run commands."""
 
+import click
+from erk_shared.github.types import WorkflowRun
+from erk_shared.output.output import user_output
+
+from erk.core.services.run_watcher import WorkflowRunWatcher
+
 
 def extract_issue_number(display_title: str | None) -> int | None:
     """Extract issue number from display_title format '123:abc456'.
@@ -17,3 +23,68 @@ def extract_issue_number(display_title: str | None) -> int | None:
     if not first_part.isdigit():
         return None
     return int(first_part)
+
+
+def format_run_state(run: WorkflowRun) -> str:
+    """Format a run's status as a short colored word, e.g. "running" or "failure"."""
+    if run.status == "queued":
+        return click.style("queued", fg="yellow")
+    if run.status == "in_progress":
+        return click.style("running", fg="blue")
+    if run.status != "completed":
+        return run.status
+    if run.conclusion == "success":
+        return click.style("success", fg="green")
+    if run.conclusion == "failure":
+        return click.style("failure", fg="red")
+    return click.style(run.conclusion or "completed", fg="white", dim=True)
+
+
+def stream_run_transitions(watcher: WorkflowRunWatcher, timeout: float | None) -> bool:
+    """Print each status change of the watched runs as it is observed.
+
+    Args:
+        watcher: Watcher with its targets added
+        timeout: Seconds to watch before giving up, or None to watch until done
+
+    Returns:
+        True if a run was found for every target and each completed successfully
+    """
+    for transition in watcher.watch(timeout):
+        run = transition.run
+        label = f"run {run.run_id}"
+        if transition.target != run.run_id:
+            label = f"{transition.target} ({label})"
+        issue_number = extract_issue_number(run.display_title)
+        if issue_number is not None:
+            label = f"#{issue_number} {label}"
+
+        state = format_run_state(run)
+        if transition.previous is not None and transition.previous.run_id == run.run_id:
+            state = f"{format_run_state(transition.previous)} → {state}"
+        observed_at = transition.observed_at.astimezone().strftime("%H:%M:%S")
+        user_output(
+            f"{click.style(observed_at, dim=True)}  {click.style(label, fg='cyan')}  {state}"
+        )
+
+    not_found = watcher.not_found
+    if not_found:
+        user_output(
+            click.style("Error: ", fg="red") + f"No workflow run found for: {', '.join(not_found)}"
+        )
+
+    if not watcher.finished:
+        pending = [
+            target
+            for target, run in watcher.runs.items()
+            if run is None or run.status != "completed"
+        ]
+        user_output(
+            click.style("Timed out", fg="yellow")
+            + f" with {len(pending)} run(s) not yet completed: {', '.join(pending)}"
+        )
+        return False
+
+    if not_found:
+        return False
+    return all(run is not None and run.conclusion == "success" for run in watcher.runs.values())
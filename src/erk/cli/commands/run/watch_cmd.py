@@ -0,0 +1,78 @@
+"""Watch workflow runs command."""
+
+import click
+from erk_shared.github.response_cache import CacheMode
+from erk_shared.output.output import user_output
+
+from erk.cli.commands.run.shared import stream_run_transitions
+from erk.cli.constants import DISPATCH_WORKFLOW_NAME
+from erk.cli.core import discover_repo_context
+from erk.core.context import ErkContext
+from erk.core.services.run_watcher import WorkflowRunWatcher
+
+
+@click.command("watch")
+@click.argument("run_ids", nargs=-1)
+@click.option(
+    "--branch",
+    "branches",
+    multiple=True,
+    help="Watch the newest run on BRANCH (repeatable)",
+)
+@click.option(
+    "--workflow",
+    default=DISPATCH_WORKFLOW_NAME,
+    show_default=True,
+    help="Workflow file the runs belong to",
+)
+@click.option(
+    "--timeout",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Stop watching after this many seconds",
+)
+@click.pass_obj
+def watch_runs(
+    ctx: ErkContext,
+    run_ids: tuple[str, ...],
+    branches: tuple[str, ...],
+    workflow: str,
+    timeout: int | None,
+) -> None:
+    """Stream status changes of workflow runs until they complete.
+
+    Watches RUN_IDS and the newest run on each --branch. Without either,
+    watches every queued or running run of the workflow. All runs are checked
+    together, one request per tick, backing off while nothing changes.
+
+    A run ID GitHub doesn't know, or a branch on which no run appears within
+    five minutes, is reported and no longer watched.
+
+    Exits with status 1 if any run isn't found or doesn't succeed, or the
+    timeout is reached.
+    """
+    repo = discover_repo_context(ctx, ctx.cwd)
+
+    # Every tick must see GitHub's current state; fresh responses are still
+    # stored for later commands
+    if ctx.github_cache is not None:
+        ctx.github_cache.set_mode(CacheMode.REFRESH)
+
+    watcher = WorkflowRunWatcher(ctx.github, ctx.time, repo.root, workflow)
+    for run_id in run_ids:
+        watcher.watch_run(run_id)
+    for branch in branches:
+        watcher.watch_branch(branch)
+
+    if not watcher.targets:
+        runs = ctx.github.list_workflow_runs(repo.root, workflow)
+        active = [run for run in runs if run.status in ("queued", "in_progress")]
+        if not active:
+            user_output("No queued or running workflow runs")
+            return
+        for run in active:
+            watcher.watch_run(run.run_id)
+
+    user_output(f"Watching {len(watcher.targets)} workflow run(s)...")
+    if not stream_run_transitions(watcher, timeout):
+        raise SystemExit(1)
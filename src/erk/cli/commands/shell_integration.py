@@ -1,11 +1,11 @@
 import click
-from erk_shared.output.output import machine_output
 
 from erk.cli.shell_integration.handler import (
-    PASSTHROUGH_MARKER,
     ShellIntegrationResult,
     handle_shell_request,
+    write_shell_result,
 )
+from erk.core.context import ErkContext, create_context
 
 
 @click.command(
@@ -15,15 +15,12 @@ from erk.cli.shell_integration.handler import (
     context_settings={"ignore_unknown_options": True, "allow_interspersed_args": False},
 )
 @click.argument("args", nargs=-1, type=click.UNPROCESSED)
-def hidden_shell_cmd(args: tuple[str, ...]) -> None:
+@click.pass_obj
+def hidden_shell_cmd(ctx: ErkContext | None, args: tuple[str, ...]) -> None:
     """Unified entry point for shell integration wrappers."""
-    result: ShellIntegrationResult = handle_shell_request(args)
-
-    if result.passthrough:
-        machine_output(PASSTHROUGH_MARKER)
-        raise SystemExit(result.exit_code)
-
-    if result.script:
-        machine_output(result.script, nl=False)
-
+    # Reuse the context built by the erk group; invoked on its own there is none
+    if ctx is None:
+        ctx = create_context(dry_run=False)
+    result: ShellIntegrationResult = handle_shell_request(ctx, args)
+    write_shell_result(result)
     raise SystemExit(result.exit_code)
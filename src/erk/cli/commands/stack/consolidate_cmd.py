@@ -7,6 +7,7 @@ import click
 from erk_shared.output.output import user_output
 
 from erk.cli.activation import render_activation_script
+from erk.cli.commands.completions import refresh_completion_cache
 from erk.cli.core import discover_repo_context, worktree_path_for
 from erk.core.consolidation_utils import calculate_stack_range, create_consolidation_plan
 from erk.core.context import ErkContext, create_context
@@ -382,6 +383,7 @@ def consolidate_stack(
     # Prune stale worktree metadata after all removals
     # (explicit call now that remove_worktree no longer auto-prunes)
     ctx.git.prune_worktrees(repo.root)
+    refresh_completion_cache(ctx)
 
     user_output(f"\n{click.style('✅ Consolidation complete', fg='green', bold=True)}")
     user_output()
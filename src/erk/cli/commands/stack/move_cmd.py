@@ -5,7 +5,7 @@ from pathlib import Path
 import click
 from erk_shared.output.output import user_output
 
-from erk.cli.commands.completions import complete_worktree_names
+from erk.cli.commands.completions import complete_worktree_names, refresh_completion_cache
 from erk.cli.core import discover_repo_context, worktree_path_for
 from erk.cli.ensure import Ensure
 from erk.core.context import ErkContext
@@ -149,6 +149,7 @@ def execute_move(
         ctx.git.add_worktree(
             repo_root, target_wt, branch=source_branch, ref=None, create_branch=False
         )
+        refresh_completion_cache(ctx)
 
     # Check if fallback_ref is already checked out elsewhere, and detach it if needed
     fallback_wt = ctx.git.is_branch_checked_out(repo_root, fallback_ref)
@@ -1,27 +1,51 @@
 """Status command implementation."""
 
+from pathlib import Path
+
 import click
-from erk_shared.integrations.parallel.real import RealParallelTaskRunner
 
-from erk.cli.core import discover_repo_context
+from erk.cli.core import apply_github_cache_flags, discover_repo_context, github_cache_options
 from erk.cli.ensure import Ensure
 from erk.core.context import ErkContext
+from erk.core.worktree_utils import find_current_worktree
 from erk.status.collectors.git import GitStatusCollector
 from erk.status.collectors.github import GitHubPRCollector
 from erk.status.collectors.graphite import GraphiteStackCollector
 from erk.status.collectors.impl import PlanFileCollector
 from erk.status.orchestrator import StatusOrchestrator
 from erk.status.renderers.simple import SimpleRenderer
+from erk.status.renderers.table import TableRenderer
+
+# Per-task timeout for --all, whose shared PR fetch goes to GitHub rather
+# than Graphite's local cache
+_ALL_WORKTREES_TIMEOUT_SECONDS = 10.0
 
 
 @click.command("status")
+@click.option(
+    "--all",
+    "all_worktrees",
+    is_flag=True,
+    help="Show a status table of every worktree instead of the current one.",
+)
+@github_cache_options
 @click.pass_obj
-def status_cmd(ctx: ErkContext) -> None:
-    """Show comprehensive status of current worktree."""
+def status_cmd(ctx: ErkContext, all_worktrees: bool, no_cache: bool, refresh: bool) -> None:
+    """Show comprehensive status of current worktree.
+
+    With --all, shows git, stack, PR and plan status of every worktree in one
+    table, fetching repository-wide data once for all of them.
+    """
+    apply_github_cache_flags(ctx, no_cache=no_cache, refresh=refresh)
+
     # Discover repository context
     repo = discover_repo_context(ctx, ctx.cwd)
     current_dir = ctx.cwd.resolve()
 
+    if all_worktrees:
+        _show_all_worktrees(ctx, repo.root, current_dir)
+        return
+
     # Find which worktree we're in
     worktrees = ctx.git.list_worktrees(repo.root)
     current_worktree_path = None
@@ -48,7 +72,7 @@ def status_cmd(ctx: ErkContext) -> None:
     ]
 
     # Create orchestrator
-    orchestrator = StatusOrchestrator(collectors, runner=RealParallelTaskRunner())
+    orchestrator = StatusOrchestrator(collectors, runner=ctx.parallel_runner)
 
     # Collect status
     status = orchestrator.collect_status(ctx, current_worktree_path, repo.root)
@@ -56,3 +80,29 @@ def status_cmd(ctx: ErkContext) -> None:
     # Render status
     renderer = SimpleRenderer()
     renderer.render(status)
+
+
+def _show_all_worktrees(ctx: ErkContext, repo_root: Path, current_dir: Path) -> None:
+    """Collect and render the status of every worktree in the repository.
+
+    Args:
+        ctx: Erk context
+        repo_root: Repository root path
+        current_dir: Resolved current directory, to mark the current worktree
+    """
+    collectors = [
+        GitStatusCollector(),
+        GraphiteStackCollector(),
+        GitHubPRCollector(),
+        PlanFileCollector(),
+    ]
+    orchestrator = StatusOrchestrator(
+        collectors,
+        timeout_seconds=_ALL_WORKTREES_TIMEOUT_SECONDS,
+        runner=ctx.parallel_runner,
+    )
+    statuses = orchestrator.collect_all_status(ctx, repo_root)
+
+    current_worktree = find_current_worktree(ctx.git.list_worktrees(repo_root), current_dir)
+    current_path = current_worktree.path if current_worktree is not None else None
+    TableRenderer().render(statuses, current_path=current_path)
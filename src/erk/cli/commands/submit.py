@@ -4,10 +4,13 @@ from datetime import UTC, datetime
 
 import click
 from erk_shared.github.metadata import create_submission_queued_block, render_erk_issue_event
+from erk_shared.github.response_cache import CacheMode
 from erk_shared.naming import derive_branch_name_with_date
 from erk_shared.output.output import user_output
 from erk_shared.worker_impl_folder import create_worker_impl_folder
 
+from erk.cli.commands.completions import complete_plan_numbers
+from erk.cli.commands.run.shared import stream_run_transitions
 from erk.cli.constants import (
     DISPATCH_WORKFLOW_METADATA_NAME,
     DISPATCH_WORKFLOW_NAME,
@@ -17,6 +20,7 @@ from erk.cli.core import discover_repo_context
 from erk.cli.ensure import Ensure
 from erk.core.context import ErkContext
 from erk.core.repo_discovery import RepoContext
+from erk.core.services.run_watcher import WorkflowRunWatcher
 
 
 def _construct_workflow_run_url(issue_url: str, run_id: str) -> str:
@@ -72,9 +76,15 @@ def _construct_pr_url(issue_url: str, pr_number: int) -> str:
 
 
 @click.command("submit")
-@click.argument("issue_number", type=int)
+@click.argument("issue_number", type=int, shell_complete=complete_plan_numbers)
+@click.option(
+    "--wait",
+    is_flag=True,
+    default=False,
+    help="Stream the workflow run's status until it completes",
+)
 @click.pass_obj
-def submit_cmd(ctx: ErkContext, issue_number: int) -> None:
+def submit_cmd(ctx: ErkContext, issue_number: int, wait: bool) -> None:
     """Submit issue for remote AI implementation via GitHub Actions.
 
     Creates branch and draft PR locally (for correct commit attribution),
@@ -84,6 +94,9 @@ def submit_cmd(ctx: ErkContext, issue_number: int) -> None:
     - Pick up the existing branch and PR
     - Run the implementation
 
+    With --wait, streams the run's status changes (like `erk run watch`) and
+    exits with status 1 unless it succeeds.
+
     Arguments:
         ISSUE_NUMBER: GitHub issue number to submit for implementation
 
@@ -158,7 +171,7 @@ def submit_cmd(ctx: ErkContext, issue_number: int) -> None:
     user_output(f"Branch name: {click.style(branch_name, fg='cyan')}")
 
     # Step 3: Check if branch already exists on remote
-    trunk_branch = ctx.git.get_trunk_branch(repo.root)
+    trunk_branch = ctx.get_trunk_branch(repo.root)
     branch_exists = ctx.git.branch_exists_on_remote(repo.root, "origin", branch_name)
     pr_number: int | None = None
 
@@ -310,3 +323,13 @@ def submit_cmd(ctx: ErkContext, issue_number: int) -> None:
         user_output(f"  • View PR: {pr_url}")
     user_output(f"  • View workflow run: {workflow_url}")
     user_output("")
+
+    if wait:
+        # Every tick must see GitHub's current state
+        if ctx.github_cache is not None:
+            ctx.github_cache.set_mode(CacheMode.REFRESH)
+        watcher = WorkflowRunWatcher(ctx.github, ctx.time, repo.root, DISPATCH_WORKFLOW_NAME)
+        watcher.watch_run(run_id)
+        user_output("Waiting for the workflow run to complete...")
+        if not stream_run_transitions(watcher, timeout=None):
+            raise SystemExit(1)
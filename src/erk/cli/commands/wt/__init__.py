@@ -2,27 +2,46 @@
 
 import click
 
-from erk.cli.alias import register_with_aliases
-from erk.cli.commands.status import status_cmd
-from erk.cli.commands.wt.create_cmd import create_wt
-from erk.cli.commands.wt.current_cmd import current_wt
-from erk.cli.commands.wt.delete_cmd import delete_wt
-from erk.cli.commands.wt.goto_cmd import goto_wt
-from erk.cli.commands.wt.list_cmd import list_wt
-from erk.cli.commands.wt.rename_cmd import rename_wt
+from erk.cli.lazy_group import LazyCommand, LazyCommandGroup
 
+# Subcommands are imported on dispatch so that importing one of them (as the
+# navigation commands do for `wt create` helpers) doesn't load the rest
+WT_COMMANDS = (
+    LazyCommand(
+        "create",
+        "erk.cli.commands.wt.create_cmd:create_wt",
+        "Create a worktree and write a .env file.",
+    ),
+    LazyCommand(
+        "current",
+        "erk.cli.commands.wt.current_cmd:current_wt",
+        "Show current worktree name (hidden command for automation).",
+        hidden=True,
+    ),
+    LazyCommand(
+        "delete", "erk.cli.commands.wt.delete_cmd:delete_wt", "Delete the worktree directory."
+    ),
+    LazyCommand(
+        "goto", "erk.cli.commands.wt.goto_cmd:goto_wt", "Jump directly to a worktree by name."
+    ),
+    LazyCommand(
+        "list",
+        "erk.cli.commands.wt.list_cmd:list_wt",
+        "List worktrees with branch, PR, sync, and implementation info.",
+        aliases=("ls",),
+    ),
+    LazyCommand(
+        "rename", "erk.cli.commands.wt.rename_cmd:rename_wt", "Rename a worktree directory."
+    ),
+    LazyCommand(
+        "status",
+        "erk.cli.commands.status:status_cmd",
+        "Show comprehensive status of current worktree.",
+    ),
+)
 
-@click.group("wt")
+
+@click.group("wt", cls=LazyCommandGroup, lazy_commands=WT_COMMANDS)
 def wt_group() -> None:
     """Manage git worktrees."""
     pass
-
-
-# Register subcommands
-wt_group.add_command(create_wt)
-wt_group.add_command(current_wt)
-wt_group.add_command(delete_wt)
-wt_group.add_command(goto_wt)
-register_with_aliases(wt_group, list_wt)
-wt_group.add_command(rename_wt)
-wt_group.add_command(status_cmd)
@@ -17,6 +17,7 @@ from erk_shared.naming import (
 )
 from erk_shared.output.output import user_output
 
+from erk.cli.commands.completions import refresh_completion_cache
 from erk.cli.config import LoadedConfig
 from erk.cli.core import discover_repo_context, worktree_path_for
 from erk.cli.ensure import Ensure
@@ -95,7 +96,7 @@ def ensure_worktree_for_branch(
         return existing_path, False
 
     # Get trunk branch for validation
-    trunk_branch = ctx.git.get_trunk_branch(repo.root)
+    trunk_branch = ctx.get_trunk_branch(repo.root)
 
     # Validate that we're not trying to create worktree for trunk branch
     if branch == trunk_branch:
@@ -299,12 +300,16 @@ def add_worktree(
                     "Disable Graphite: erk config set use_graphite false",
                 ],
             )
+            # gt created and checked out the branch behind ctx.git's back
+            if ctx.git_cache is not None:
+                ctx.git_cache.clear()
             ctx.git.checkout_branch(cwd, original_branch)
             ctx.git.add_worktree(repo_root, path, branch=branch, ref=None, create_branch=False)
         else:
             ctx.git.add_worktree(repo_root, path, branch=branch, ref=ref, create_branch=True)
     else:
         ctx.git.add_worktree(repo_root, path, branch=None, ref=ref, create_branch=False)
+    refresh_completion_cache(ctx)
 
 
 def make_env_content(cfg: LoadedConfig, *, worktree_path: Path, repo_root: Path, name: str) -> str:
@@ -706,7 +711,7 @@ def create_wt(
     )
 
     cfg = ctx.local_config
-    trunk_branch = ctx.git.get_trunk_branch(repo.root)
+    trunk_branch = ctx.get_trunk_branch(repo.root)
 
     # Validate that name is not trunk branch (should use root worktree)
     if name == trunk_branch:
@@ -6,7 +6,7 @@ import click
 from erk_shared.git.abc import Git
 from erk_shared.output.output import user_output
 
-from erk.cli.commands.completions import complete_worktree_names
+from erk.cli.commands.completions import complete_worktree_names, refresh_completion_cache
 from erk.cli.core import (
     discover_repo_context,
     validate_worktree_name_for_deletion,
@@ -247,6 +247,8 @@ def _delete_worktree(
                 )
                 raise SystemExit(1) from None
 
+    refresh_completion_cache(ctx)
+
     if not dry_run:
         path_text = click.style(str(wt_path), fg="green")
         user_output(f"✅ {path_text}")
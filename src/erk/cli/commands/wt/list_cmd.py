@@ -5,7 +5,6 @@ from pathlib import Path
 import click
 from erk_shared.git.abc import BranchSyncInfo
 from erk_shared.github.types import PullRequestInfo
-from erk_shared.impl_folder import get_impl_path, read_issue_reference
 from rich.console import Console
 from rich.table import Table
 
@@ -14,6 +13,7 @@ from erk.cli.core import discover_repo_context
 from erk.core.context import ErkContext
 from erk.core.display_utils import get_pr_status_emoji
 from erk.core.repo_discovery import RepoContext
+from erk.core.worktree_snapshot import collect_worktree_snapshot
 from erk.core.worktree_utils import find_current_worktree
 
 
@@ -76,41 +76,6 @@ def _format_sync_from_batch(all_sync: dict[str, BranchSyncInfo], branch: str | N
     return " ".join(parts)
 
 
-def _get_impl_issue(
-    ctx: ErkContext, worktree_path: Path, branch: str | None = None
-) -> tuple[str | None, str | None]:
-    """Get impl issue number and URL from local sources.
-
-    Checks .impl/issue.json first, then git config fallback.
-
-    Args:
-        ctx: Erk context with git operations
-        worktree_path: Path to the worktree directory
-        branch: Optional branch name (avoids redundant git subprocess call if provided)
-
-    Returns:
-        Tuple of (issue number formatted as "#{number}", issue URL) or (None, None) if not found
-    """
-    # Try .impl/issue.json first
-    impl_path = get_impl_path(worktree_path, git_ops=ctx.git)
-    if impl_path is not None:
-        # impl_path points to plan.md, get the parent .impl/ directory
-        issue_ref = read_issue_reference(impl_path.parent)
-        if issue_ref is not None:
-            return f"#{issue_ref.issue_number}", issue_ref.issue_url
-
-    # Fallback to git config (no URL available from git config)
-    # If branch not provided, fetch it (for backwards compatibility)
-    if branch is None:
-        branch = ctx.git.get_current_branch(worktree_path)
-    if branch is not None:
-        issue_num = ctx.git.get_branch_issue(worktree_path, branch)
-        if issue_num is not None:
-            return f"#{issue_num}", None
-
-    return None, None
-
-
 def _format_pr_cell(
     pr: PullRequestInfo | None, *, use_graphite: bool, graphite_url: str | None
 ) -> str:
@@ -183,6 +148,9 @@ def _list_worktrees(ctx: ErkContext) -> None:
     # Fetch all branch sync info in a single git call (batch operation for performance)
     all_sync_info = ctx.git.get_all_branch_sync_info(repo.root)
 
+    # Collect impl issue links for all worktrees at once (batch operation for performance)
+    snapshot = collect_worktree_snapshot(ctx.git, repo.root, worktrees)
+
     # Determine which worktree the user is currently in
     wt_info = find_current_worktree(worktrees, current_dir)
     current_worktree_path = wt_info.path if wt_info is not None else None
@@ -232,7 +200,7 @@ def _list_worktrees(ctx: ErkContext) -> None:
         root_pr, use_graphite=use_graphite, graphite_url=root_graphite_url
     )
     root_sync = _format_sync_from_batch(all_sync_info, root_branch)
-    root_impl_text, root_impl_url = _get_impl_issue(ctx, repo.root, root_branch)
+    root_impl_text, root_impl_url = snapshot.impl_issue(repo.root, root_branch)
     root_impl_cell = _format_impl_cell(root_impl_text, root_impl_url)
 
     table.add_row(root_name, root_branch_display, root_pr_cell, root_sync, root_impl_cell)
@@ -265,7 +233,7 @@ def _list_worktrees(ctx: ErkContext) -> None:
         sync_cell = _format_sync_from_batch(all_sync_info, branch)
 
         # Impl issue
-        impl_text, impl_url = _get_impl_issue(ctx, wt.path, branch)
+        impl_text, impl_url = snapshot.impl_issue(wt.path, branch)
         impl_cell = _format_impl_cell(impl_text, impl_url)
 
         table.add_row(name_cell, branch_display, pr_cell, sync_cell, impl_cell)
@@ -2,7 +2,7 @@ import click
 from erk_shared.naming import sanitize_worktree_name
 from erk_shared.output.output import user_output
 
-from erk.cli.commands.completions import complete_worktree_names
+from erk.cli.commands.completions import complete_worktree_names, refresh_completion_cache
 from erk.cli.commands.wt.create_cmd import make_env_content
 from erk.cli.core import discover_repo_context, worktree_path_for
 from erk.cli.ensure import Ensure
@@ -48,6 +48,7 @@ def rename_wt(ctx: ErkContext, old_name: str, new_name: str, dry_run: bool) -> N
 
     # Move via git worktree move
     ctx.git.move_worktree(repo.root, old_path, new_path)
+    refresh_completion_cache(ctx)
 
     # Regenerate .env file with updated paths and name
     cfg = ctx.local_config
@@ -1,5 +1,9 @@
+from collections.abc import Callable
 from pathlib import Path
 
+import click
+from erk_shared.github.response_cache import CacheMode
+
 from erk.cli.ensure import Ensure
 from erk.core.context import ErkContext
 from erk.core.repo_discovery import RepoContext, discover_repo_or_sentinel
@@ -63,3 +67,45 @@ def validate_worktree_name_for_deletion(name: str) -> None:
         f"Cannot delete '{name}' - absolute paths not allowed",
     )
     Ensure.invariant("/" not in name, f"Cannot delete '{name}' - path separators not allowed")
+
+
+def github_cache_options[**P, T](f: Callable[P, T]) -> Callable[P, T]:
+    """Add --no-cache/--refresh options controlling the GitHub response cache.
+
+    Commands using this decorator must accept `no_cache` and `refresh` parameters
+    and pass them to apply_github_cache_flags().
+    """
+    f = click.option(
+        "--no-cache",
+        "no_cache",
+        is_flag=True,
+        default=False,
+        help="Bypass the GitHub response cache entirely",
+    )(f)
+    f = click.option(
+        "--refresh",
+        is_flag=True,
+        default=False,
+        help="Ignore cached GitHub responses and store fresh ones",
+    )(f)
+    return f
+
+
+def apply_github_cache_flags(ctx: ErkContext, *, no_cache: bool, refresh: bool) -> None:
+    """Enable the context's GitHub response cache, honoring --no-cache/--refresh.
+
+    The cache starts disabled so commands that act on PR or run state never
+    read stale responses; only read-only listing commands call this to opt in.
+
+    No-op when the context has no cache (outside a repository, or in tests).
+    Raises SystemExit(1) if both flags are given.
+    """
+    Ensure.invariant(not (no_cache and refresh), "--no-cache and --refresh are mutually exclusive")
+    if ctx.github_cache is None:
+        return
+    if no_cache:
+        ctx.github_cache.set_mode(CacheMode.DISABLED)
+    elif refresh:
+        ctx.github_cache.set_mode(CacheMode.REFRESH)
+    else:
+        ctx.github_cache.set_mode(CacheMode.NORMAL)
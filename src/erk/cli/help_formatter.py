@@ -14,6 +14,13 @@ class GroupedCommandGroup(click.Group):
     - Quick Access: Backward compatibility aliases
     """
 
+    def get_help_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Get the command whose metadata is shown in help listings.
+
+        Subclasses that defer importing commands can return a stand-in here.
+        """
+        return self.get_command(ctx, cmd_name)
+
     def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
         """Format commands into organized sections."""
         show_hidden = getattr(ctx, "show_hidden", False)
@@ -24,7 +31,7 @@ class GroupedCommandGroup(click.Group):
         alias_map: dict[str, str] = {}
 
         for subcommand in self.list_commands(ctx):
-            cmd = self.get_command(ctx, subcommand)
+            cmd = self.get_help_command(ctx, subcommand)
             if cmd is None:
                 continue
 
@@ -0,0 +1,145 @@
+"""Click group that imports subcommand modules only when they are dispatched.
+
+The erk shell wrapper runs erk on every navigation, so startup cost matters.
+Importing every command module up front pulls in rich, yaml, tomlkit and the
+GitHub integrations even for `erk up` or `erk --version`. LazyCommandGroup
+registers each subcommand's name, aliases and short help from a static table
+of LazyCommand entries and imports the implementing module the first time
+the command is looked up. Help output and shell completion are rendered from
+the table without importing anything.
+"""
+
+import importlib
+from dataclasses import dataclass
+from typing import Any
+
+import click
+from click.shell_completion import CompletionItem
+
+from erk.cli.alias import ALIAS_ATTR
+from erk.cli.help_formatter import GroupedCommandGroup
+
+
+def load_command(import_path: str) -> click.Command:
+    """Import a click command given as "<module>:<attribute>".
+
+    Raises:
+        TypeError: If the attribute is not a click command
+    """
+    module_name, _, attribute = import_path.partition(":")
+    command = getattr(importlib.import_module(module_name), attribute)
+    if not isinstance(command, click.Command):
+        raise TypeError(f"{import_path} is not a click command")
+    return command
+
+
+@dataclass(frozen=True)
+class LazyCommand:
+    """Static registration for a subcommand whose module is imported on dispatch.
+
+    Attributes:
+        name: Command name in the group
+        import_path: "<module>:<attribute>" of the click command
+        short_help: Help listing text (must match the command's own short help)
+        aliases: Alternative names, as declared with @alias on the command
+        hidden: Whether the command is hidden from help output
+    """
+
+    name: str
+    import_path: str
+    short_help: str
+    aliases: tuple[str, ...] = ()
+    hidden: bool = False
+
+    def load(self) -> click.Command:
+        """Import the module and return the command object."""
+        return load_command(self.import_path)
+
+    def placeholder(self) -> click.Command:
+        """Build an unimported stand-in carrying only help metadata."""
+        command = click.Command(self.name, help=self.short_help, hidden=self.hidden)
+        setattr(command, ALIAS_ATTR, list(self.aliases))
+        return command
+
+
+class LazyCommandGroup(click.Group):
+    """Click group whose subcommands are imported on first lookup."""
+
+    def __init__(
+        self, *args: Any, lazy_commands: tuple[LazyCommand, ...] = (), **kwargs: Any
+    ) -> None:
+        """Create the group.
+
+        Args:
+            *args: Positional arguments passed to click.Group
+            lazy_commands: Subcommands to register without importing them
+            **kwargs: Keyword arguments passed to click.Group
+        """
+        super().__init__(*args, **kwargs)
+        self._lazy: dict[str, LazyCommand] = {}
+        for spec in lazy_commands:
+            for name in (spec.name, *spec.aliases):
+                self._lazy[name] = spec
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List loaded and lazily registered command names, including aliases."""
+        return sorted({*self.commands, *self._lazy})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Get a command, importing its module if it isn't loaded yet."""
+        if cmd_name in self.commands:
+            return self.commands[cmd_name]
+        spec = self._lazy.get(cmd_name)
+        if spec is None:
+            return None
+
+        command = spec.load()
+        for name in (spec.name, *spec.aliases):
+            self.add_command(command, name=name)
+        return command
+
+    def get_help_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Get a command for help listings, without importing unloaded ones."""
+        if cmd_name in self.commands:
+            return self.commands[cmd_name]
+        spec = self._lazy.get(cmd_name)
+        if spec is None:
+            return None
+        return spec.placeholder()
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """Write the standard click command listing from help metadata."""
+        commands: list[tuple[str, click.Command]] = []
+        for subcommand in self.list_commands(ctx):
+            cmd = self.get_help_command(ctx, subcommand)
+            if cmd is None or cmd.hidden:
+                continue
+            commands.append((subcommand, cmd))
+
+        if not commands:
+            return
+        # Same column budget as click.Group.format_commands
+        limit = formatter.width - 6 - max(len(name) for name, _ in commands)
+        with formatter.section("Commands"):
+            formatter.write_dl([(name, cmd.get_short_help_str(limit)) for name, cmd in commands])
+
+    def shell_complete(self, ctx: click.Context, incomplete: str) -> list[CompletionItem]:
+        """Complete subcommand names from the static table, then options."""
+        results: list[CompletionItem] = []
+        for name in self.list_commands(ctx):
+            if not name.startswith(incomplete):
+                continue
+            command = self.get_help_command(ctx, name)
+            if command is None or command.hidden:
+                continue
+            results.append(CompletionItem(name, help=command.get_short_help_str()))
+        results.extend(click.Command.shell_complete(self, ctx, incomplete))
+        return results
+
+
+class LazyGroupedCommandGroup(LazyCommandGroup, GroupedCommandGroup):
+    """LazyCommandGroup with GroupedCommandGroup's sectioned help output."""
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """Format commands into GroupedCommandGroup's sections."""
+        GroupedCommandGroup.format_commands(self, ctx, formatter)
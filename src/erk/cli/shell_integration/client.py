@@ -0,0 +1,125 @@
+"""Client for the resident shell-integration daemon.
+
+The shell wrappers run `erk __shell <args>` on every navigation. When a
+daemon started with `erk admin shell-daemon start` is listening, the erk
+entry point forwards the request here before importing click or any
+command: argv, cwd and the environment go over a unix socket, and the
+daemon's captured stdout, stderr and exit code are replayed as if the
+command had run in this process.
+
+This module only uses the standard library so that forwarding costs
+little more than interpreter startup. When no daemon is reachable,
+forward_shell_request returns None and the caller runs the request
+in-process.
+
+Protocol: one JSON object per line in each direction.
+
+    request:  {"version": 1, "op": "shell", "args": [...], "cwd": "...",
+               "env": {...}, "isatty": true}
+    response: {"stdout": "...", "stderr": "...", "exit_code": 0}
+              or {"fallback": true} when the daemon can't serve the request
+"""
+
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Any
+
+PROTOCOL_VERSION = 1
+
+# Set to "0" to bypass a running daemon
+DAEMON_ENV_VAR = "ERK_SHELL_DAEMON"
+
+# Connecting to a live daemon is immediate; anything slower means it's wedged
+_CONNECT_TIMEOUT_SECONDS = 1.0
+
+
+def daemon_socket_path() -> Path:
+    """Per-user unix socket the shell-integration daemon listens on."""
+    return Path.home() / ".erk" / "daemon" / "shell.sock"
+
+
+def send_daemon_request(
+    request: dict[str, Any], *, timeout: float | None = None
+) -> dict[str, Any] | None:
+    """Send one request to the daemon and wait for its response.
+
+    Args:
+        request: Request object; "version" is filled in
+        timeout: Seconds to wait for the response (None waits indefinitely)
+
+    Returns:
+        The decoded response, or None if no daemon accepted the connection
+    """
+    socket_path = daemon_socket_path()
+    if not socket_path.exists():
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # Error boundary: a stale socket file or a daemon that exited between the
+    # existence check and connect means there is no daemon
+    try:
+        sock.settimeout(_CONNECT_TIMEOUT_SECONDS)
+        sock.connect(str(socket_path))
+    except OSError:
+        sock.close()
+        return None
+
+    with sock:
+        payload = json.dumps({**request, "version": PROTOCOL_VERSION}) + "\n"
+        sock.settimeout(timeout)
+        sock.sendall(payload.encode("utf-8"))
+        with sock.makefile("r", encoding="utf-8") as reader:
+            line = reader.readline()
+
+    if not line:
+        raise ConnectionError("erk shell daemon closed the connection without responding")
+    response = json.loads(line)
+    if not isinstance(response, dict):
+        raise ConnectionError("erk shell daemon sent a malformed response")
+    return response
+
+
+def forward_shell_request(args: list[str]) -> int | None:
+    """Run `erk __shell <args>` in the daemon, replaying its output here.
+
+    Args:
+        args: Arguments following `__shell`
+
+    Returns:
+        The exit code to exit with, or None if the request must run in-process
+        (no daemon, daemon disabled, or the daemon declined it)
+    """
+    if os.environ.get(DAEMON_ENV_VAR) == "0":
+        return None
+
+    # Error boundary: a deleted cwd is reported by the in-process path
+    try:
+        cwd = os.getcwd()
+    except FileNotFoundError:
+        return None
+
+    request = {
+        "op": "shell",
+        "args": args,
+        "cwd": cwd,
+        "env": dict(os.environ),
+        "isatty": sys.stderr.isatty(),
+    }
+    # Error boundary: once the request is sent the daemon may already have
+    # acted on it, so a broken response is reported rather than retried
+    # in-process (which could run a command like `wt create` twice)
+    try:
+        response = send_daemon_request(request)
+    except (OSError, ValueError) as e:
+        sys.stderr.write(f"Error: {e}\nRun 'erk admin shell-daemon stop' to disable the daemon.\n")
+        return 1
+
+    if response is None or response.get("fallback"):
+        return None
+
+    sys.stderr.write(response.get("stderr", ""))
+    sys.stdout.write(response.get("stdout", ""))
+    return int(response.get("exit_code", 1))
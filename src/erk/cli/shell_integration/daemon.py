@@ -0,0 +1,524 @@
+"""Resident per-user daemon that serves shell-integration requests.
+
+Each navigation through the shell wrappers (`erk co`, `erk up`, `erk down`,
+`erk wt goto`) otherwise starts a fresh interpreter, imports the command and
+its integrations and re-reads the repository's git state. ShellDaemon keeps
+a process warm on a unix socket in ~/.erk/daemon (see client.py for the
+protocol):
+
+- every shell-integration command module is imported once at startup
+- one GitReadCache is shared by all requests, so worktree lists, branch
+  lists and HEADs read by one navigation answer the next
+
+Requests are served one at a time. Each gets a fresh ErkContext built in the
+client's cwd and environment, so configuration and repo discovery are read
+exactly as they would be in-process. The request's stdout and stderr,
+including what git and gt subprocesses write to them, are captured and
+replayed by the client.
+
+Invalidation is by file watching through stat polling: before each request
+RepoWatch stamps the git files and directories the cached reads derive from,
+for every repository the daemon has served, and the shared cache is cleared
+when any stamp changed. Git updates refs, HEADs and the worktree list by
+renaming lock files into place, so a changed mtime or inode catches commits,
+checkouts, branch creation and deletion, and `git worktree add/remove` made
+outside the daemon. Changes the daemon makes itself go through CachingGit,
+which invalidates what they affect.
+
+The daemon exits after an idle timeout, when erk's own source files change
+(answering the request with a fallback so the client runs it in-process),
+and on `erk admin shell-daemon stop` or SIGTERM.
+"""
+
+import contextlib
+import importlib
+import io
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import traceback
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import erk_shared
+from erk_shared.git.layout import read_git_layout
+from erk_shared.integrations.time.abc import Time
+
+import erk
+from erk.cli.debug import debug_log
+from erk.cli.lazy_group import load_command
+from erk.cli.shell_integration.client import (
+    PROTOCOL_VERSION,
+    daemon_socket_path,
+    send_daemon_request,
+)
+from erk.cli.shell_integration.handler import (
+    SHELL_INTEGRATION_COMMANDS,
+    handle_shell_request,
+    write_shell_result,
+)
+from erk.cli.shell_utils import STALE_SCRIPT_MAX_AGE_SECONDS, cleanup_stale_scripts
+from erk.core.context import ErkContext, create_context
+from erk.core.git.caching import GitReadCache
+from erk.core.repo_discovery import RepoContext
+
+DEFAULT_IDLE_TIMEOUT_SECONDS = 3600
+
+# How often the daemon sweeps stale activation scripts, instead of per request
+_CLEANUP_INTERVAL_SECONDS = 600
+
+# How long `start` waits for a spawned daemon to answer, and how often it asks
+_START_TIMEOUT_SECONDS = 5.0
+_START_POLL_INTERVAL_SECONDS = 0.05
+
+# A client that connected must send its request promptly
+_REQUEST_READ_TIMEOUT_SECONDS = 10.0
+
+# Integrations a navigation builds, imported at startup with the commands
+_PRELOAD_MODULES = (
+    "erk.core.config_store",
+    "erk.core.git.caching",
+    "erk.core.script_writer",
+    "erk_shared.git.real",
+    "erk_shared.git.plumbing",
+    "erk_shared.integrations.graphite.real",
+    "erk_shared.integrations.graphite.snapshot",
+)
+
+# [mtime_ns, inode] of a watched path, or None when it doesn't exist
+PathStamp = tuple[int, int] | None
+
+
+def daemon_pid_path() -> Path:
+    """File holding the running daemon's process id, next to its socket."""
+    return daemon_socket_path().with_suffix(".pid")
+
+
+def _stamp(path: Path) -> PathStamp:
+    if not path.exists():
+        return None
+    stat = path.stat()
+    return (stat.st_mtime_ns, stat.st_ino)
+
+
+class RepoWatch:
+    """Stamps the git state that cached git reads are derived from.
+
+    Watched per repository:
+
+    - HEAD, packed-refs and config in the common git directory
+    - every directory under refs/ (loose ref updates rename into these)
+    - the worktrees/ directory and each linked worktree's HEAD
+    - reftable/, for repositories that store refs there
+    - pyproject.toml at the repository root ([tool.erk] trunk_branch)
+
+    Index and object writes are deliberately not watched: the cached reads
+    don't depend on them, and `git status` rewrites the index constantly.
+    """
+
+    def __init__(self) -> None:
+        self._repos: dict[Path, Path] = {}
+
+    def add(self, repo_root: Path) -> bool:
+        """Start watching a repository.
+
+        Returns:
+            False if the repository's git directory can't be located from
+            files (see read_git_layout), so its state can't be watched
+        """
+        if repo_root in self._repos:
+            return True
+        layout = read_git_layout(repo_root)
+        if layout is None:
+            return False
+        self._repos[repo_root] = layout.common_dir
+        return True
+
+    def fingerprint(self) -> dict[str, PathStamp]:
+        """Stamp every watched path."""
+        stamps: dict[str, PathStamp] = {}
+        for repo_root, common_dir in self._repos.items():
+            paths = [
+                repo_root / "pyproject.toml",
+                common_dir / "HEAD",
+                common_dir / "packed-refs",
+                common_dir / "config",
+                common_dir / "reftable",
+                common_dir / "worktrees",
+            ]
+            worktrees_dir = common_dir / "worktrees"
+            if worktrees_dir.is_dir():
+                paths.extend(entry / "HEAD" for entry in worktrees_dir.iterdir())
+            for dirpath, _, _ in os.walk(common_dir / "refs"):
+                paths.append(Path(dirpath))
+            for path in paths:
+                stamps[str(path)] = _stamp(path)
+        return stamps
+
+
+class _SourceWatch:
+    """Notices when erk's own source files change under a running daemon."""
+
+    def __init__(self) -> None:
+        self._roots = tuple(
+            str(Path(package.__file__).parent) for package in (erk, erk_shared) if package.__file__
+        )
+        self._stamps: dict[str, PathStamp] = {}
+
+    def changed(self) -> bool:
+        """Check loaded erk modules against the stamps first seen for them."""
+        for module in list(sys.modules.values()):
+            filename = getattr(module, "__file__", None)
+            if filename is None or not filename.startswith(self._roots):
+                continue
+            stamp = _stamp(Path(filename))
+            if filename not in self._stamps:
+                self._stamps[filename] = stamp
+            elif self._stamps[filename] != stamp:
+                return True
+        return False
+
+
+class _CapturedStream(io.TextIOWrapper):
+    """Captured output shared with the subprocesses a request starts.
+
+    The stream is backed by a temporary file whose descriptor stands in for
+    fd 1 or 2 while a request runs, so git and gt output reaches the client
+    in the order it was written, as it would reach the terminal in-process.
+
+    click strips colors from streams that aren't terminals; reporting the
+    client's isatty keeps styled messages styled.
+    """
+
+    def __init__(self, isatty: bool) -> None:
+        self._file = tempfile.TemporaryFile()
+        super().__init__(self._file, encoding="utf-8", write_through=True)
+        self._isatty = isatty
+
+    def isatty(self) -> bool:
+        return self._isatty
+
+    def write(self, s: str) -> int:
+        # Flush every write so it lands before any subprocess output that follows
+        written = super().write(s)
+        self.flush()
+        return written
+
+    def getvalue(self) -> str:
+        """Everything written, by this process or by subprocesses."""
+        self.flush()
+        self._file.seek(0)
+        return self._file.read().decode("utf-8", errors="replace")
+
+
+@contextlib.contextmanager
+def _redirect_fd(fd: int, stream: _CapturedStream) -> Iterator[None]:
+    """Point a file descriptor at a captured stream for subprocesses to inherit."""
+    saved = os.dup(fd)
+    os.dup2(stream.fileno(), fd)
+    try:
+        yield
+    finally:
+        os.dup2(saved, fd)
+        os.close(saved)
+
+
+class ShellDaemon:
+    """Serves `erk __shell` requests from a warm process."""
+
+    def __init__(self, socket_path: Path, *, idle_timeout: float, time: Time) -> None:
+        """Create a daemon.
+
+        Args:
+            socket_path: Unix socket to listen on
+            idle_timeout: Seconds without requests before the daemon exits
+            time: Clock for uptime, idle and cleanup intervals
+        """
+        self._socket_path = socket_path
+        self._idle_timeout = idle_timeout
+        self._time = time
+        self._git_cache = GitReadCache()
+        self._repo_watch = RepoWatch()
+        self._source_watch = _SourceWatch()
+        self._fingerprint: dict[str, PathStamp] = {}
+        self._started_at = self._time.monotonic()
+        self._last_request_at = self._started_at
+        self._last_cleanup = 0.0
+        self._requests = 0
+        self._stopping = False
+
+    @staticmethod
+    def preload() -> None:
+        """Import every shell-integration command and the integrations it builds."""
+        for import_path in sorted(set(SHELL_INTEGRATION_COMMANDS.values())):
+            load_command(import_path)
+        for module_name in _PRELOAD_MODULES:
+            importlib.import_module(module_name)
+
+    def serve(self) -> None:
+        """Listen until stopped, idle for idle_timeout, or erk's sources change."""
+        self._socket_path.parent.mkdir(parents=True, exist_ok=True)
+        # Only this user may connect: requests run commands as this user
+        self._socket_path.parent.chmod(0o700)
+        if self._socket_path.exists():
+            self._socket_path.unlink()
+
+        self.preload()
+        self._source_watch.changed()
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(str(self._socket_path))
+        self._socket_path.chmod(0o600)
+        server.listen()
+        pid_path = self._socket_path.with_suffix(".pid")
+        pid_path.write_text(f"{os.getpid()}\n", encoding="utf-8")
+        debug_log(f"Shell daemon: listening on {self._socket_path}")
+
+        try:
+            while not self._stopping:
+                if self.idle_seconds_left() <= 0:
+                    debug_log("Shell daemon: idle timeout reached")
+                    break
+                server.settimeout(self.idle_seconds_left())
+                # Error boundary: accept() times out when no client connects
+                # before the idle deadline, which is checked again above
+                try:
+                    conn, _ = server.accept()
+                except TimeoutError:
+                    continue
+                with conn:
+                    self._serve_connection(conn)
+                self._last_request_at = self._time.monotonic()
+                self._sweep_stale_scripts()
+        except KeyboardInterrupt:
+            # SIGINT, or SIGTERM when the caller routes it here (see `run`)
+            debug_log("Shell daemon: interrupted")
+        finally:
+            server.close()
+            self._socket_path.unlink(missing_ok=True)
+            pid_path.unlink(missing_ok=True)
+
+    def idle_seconds_left(self) -> float:
+        """Seconds until the daemon exits if no request arrives (<= 0 once idle)."""
+        return self._idle_timeout - (self._time.monotonic() - self._last_request_at)
+
+    def handle_request(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Answer one decoded request.
+
+        Args:
+            request: Request object (see client.py)
+
+        Returns:
+            Response object
+        """
+        if request.get("version") != PROTOCOL_VERSION:
+            return {"fallback": True}
+
+        op = request.get("op")
+        if op == "status":
+            return {
+                "pid": os.getpid(),
+                "uptime_seconds": int(self._time.monotonic() - self._started_at),
+                "requests": self._requests,
+                "git_cache": self._git_cache.format_stats(),
+            }
+        if op == "stop":
+            self._stopping = True
+            return {"stopped": True}
+        if op != "shell":
+            return {"fallback": True}
+
+        if self._source_watch.changed():
+            # The running code is out of date: let the client run the request
+            # with the new code and exit so the next start picks it up
+            debug_log("Shell daemon: erk sources changed, exiting")
+            self._stopping = True
+            return {"fallback": True}
+
+        cwd = Path(request["cwd"])
+        if not cwd.is_dir():
+            return {"fallback": True}
+        return self._run_shell_request(
+            [str(arg) for arg in request["args"]],
+            cwd,
+            {str(key): str(value) for key, value in request["env"].items()},
+            isatty=bool(request.get("isatty")),
+        )
+
+    def _serve_connection(self, conn: socket.socket) -> None:
+        conn.settimeout(_REQUEST_READ_TIMEOUT_SECONDS)
+        # Error boundary: a misbehaving client must not take the daemon down
+        try:
+            with conn.makefile("r", encoding="utf-8") as reader:
+                line = reader.readline()
+            request = json.loads(line)
+        except (OSError, ValueError):
+            return
+        if not isinstance(request, dict):
+            return
+
+        response = self.handle_request(request)
+        # Error boundary: the client may have gone away (e.g. Ctrl-C)
+        try:
+            conn.settimeout(None)
+            conn.sendall((json.dumps(response) + "\n").encode("utf-8"))
+        except OSError:
+            return
+
+    def _run_shell_request(
+        self, args: list[str], cwd: Path, env: dict[str, str], *, isatty: bool
+    ) -> dict[str, Any]:
+        self._requests += 1
+        fingerprint = self._repo_watch.fingerprint()
+        if fingerprint != self._fingerprint:
+            self._git_cache.clear()
+            self._fingerprint = fingerprint
+
+        saved_env = dict(os.environ)
+        saved_cwd = os.getcwd()
+        os.environ.clear()
+        os.environ.update(env)
+        os.chdir(cwd)
+        # Subprocesses inherit the client's cwd and environment from the
+        # process, and write to fds 1 and 2, which are captured alongside
+        # Python-level output
+        with _CapturedStream(isatty=False) as stdout, _CapturedStream(isatty=isatty) as stderr:
+            try:
+                with (
+                    _redirect_fd(1, stdout),
+                    _redirect_fd(2, stderr),
+                    contextlib.redirect_stdout(stdout),
+                    contextlib.redirect_stderr(stderr),
+                ):
+                    exit_code = self._dispatch(args)
+            finally:
+                os.chdir(saved_cwd)
+                os.environ.clear()
+                os.environ.update(saved_env)
+            return {
+                "stdout": stdout.getvalue(),
+                "stderr": stderr.getvalue(),
+                "exit_code": exit_code,
+            }
+
+    def _dispatch(self, args: list[str]) -> int:
+        ctx: ErkContext | None = None
+        # Error boundary: one failing request must not take the daemon down;
+        # report it the way an in-process crash would be
+        try:
+            ctx = create_context(dry_run=False, git_cache=self._git_cache)
+            result = handle_shell_request(ctx, tuple(args), cleanup_scripts=False)
+            write_shell_result(result)
+            exit_code = result.exit_code
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except Exception:
+            sys.stderr.write(traceback.format_exc())
+            exit_code = 1
+
+        if ctx is not None and not self._watch_repo(ctx):
+            # Reads of a repository that can't be watched can't be reused
+            self._git_cache.clear()
+        return exit_code
+
+    def _watch_repo(self, ctx: ErkContext) -> bool:
+        resolved = ctx.resolved_dependencies()
+        if "git" not in resolved:
+            return True
+        if "repo" not in resolved or not isinstance(ctx.repo, RepoContext):
+            return False
+        return self._repo_watch.add(ctx.repo.root)
+
+    def _sweep_stale_scripts(self) -> None:
+        now = self._time.monotonic()
+        if now - self._last_cleanup < _CLEANUP_INTERVAL_SECONDS:
+            return
+        self._last_cleanup = now
+        cleanup_stale_scripts(max_age_seconds=STALE_SCRIPT_MAX_AGE_SECONDS)
+
+
+def daemon_status() -> dict[str, Any] | None:
+    """Ask the running daemon for its status.
+
+    Returns:
+        Status fields, or None if no daemon is running
+    """
+    # Error boundary: a wedged daemon counts as not running
+    try:
+        return send_daemon_request({"op": "status"}, timeout=_START_TIMEOUT_SECONDS)
+    except (OSError, ValueError):
+        return None
+
+
+def start_daemon(*, idle_timeout: int, time: Time) -> dict[str, Any] | None:
+    """Spawn a detached daemon and wait until it answers.
+
+    Args:
+        idle_timeout: Seconds without requests before the daemon exits
+        time: Clock for the start deadline and the polling interval
+
+    Returns:
+        The new daemon's status, or None if it didn't come up in time
+    """
+    subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "erk",
+            "admin",
+            "shell-daemon",
+            "run",
+            "--idle-timeout",
+            str(idle_timeout),
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + _START_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        status = daemon_status()
+        if status is not None:
+            return status
+        time.sleep(_START_POLL_INTERVAL_SECONDS)
+    return None
+
+
+def stop_daemon() -> bool:
+    """Stop the running daemon.
+
+    Asks the daemon to exit, or signals the process in the pid file if it
+    doesn't answer.
+
+    Returns:
+        True if a daemon was running
+    """
+    # Error boundary: a wedged daemon is stopped through its pid instead
+    try:
+        response = send_daemon_request({"op": "stop"}, timeout=_START_TIMEOUT_SECONDS)
+    except (OSError, ValueError):
+        response = None
+    if response is not None:
+        return True
+
+    # Without a socket the pid file is left over from a daemon that already
+    # exited, and its pid may have been reused
+    pid_path = daemon_pid_path()
+    if not pid_path.exists() or not daemon_socket_path().exists():
+        pid_path.unlink(missing_ok=True)
+        return False
+    pid = int(pid_path.read_text(encoding="utf-8").strip())
+    pid_path.unlink()
+    daemon_socket_path().unlink()
+    # Error boundary: the process may already be gone
+    try:
+        os.kill(pid, signal.SIGTERM)
+    except ProcessLookupError:
+        return False
+    return True
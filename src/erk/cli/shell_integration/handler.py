@@ -4,49 +4,43 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Final
 
-from click import Command
 from click.testing import CliRunner
-from erk_shared.output.output import user_output
+from erk_shared.output.output import machine_output, user_output
 
-from erk.cli.commands.checkout import checkout_cmd
-from erk.cli.commands.down import down_cmd
-from erk.cli.commands.implement import implement
-from erk.cli.commands.pr import pr_group
 from erk.cli.commands.prepare_cwd_recovery import generate_recovery_script
-from erk.cli.commands.stack.consolidate_cmd import consolidate_stack
-from erk.cli.commands.up import up_cmd
-from erk.cli.commands.wt.create_cmd import create_wt
-from erk.cli.commands.wt.goto_cmd import goto_wt
 from erk.cli.debug import debug_log
+from erk.cli.lazy_group import load_command
 from erk.cli.shell_utils import (
     STALE_SCRIPT_MAX_AGE_SECONDS,
     cleanup_stale_scripts,
 )
-from erk.core.context import create_context
+from erk.core.context import ErkContext
 
 PASSTHROUGH_MARKER: Final[str] = "__ERK_PASSTHROUGH__"
 PASSTHROUGH_COMMANDS: Final[set[str]] = {"sync"}
 
-# Commands that support shell integration (directory switching)
+# Commands that support shell integration (directory switching), as
+# "<module>:<attribute>" import paths so that only the invoked command's
+# module is imported.
 # Uses compound keys for subcommands (e.g., "wt create" instead of just "create")
 # Also supports legacy top-level aliases for backward compatibility
-SHELL_INTEGRATION_COMMANDS: Final[dict[str, Command]] = {
+SHELL_INTEGRATION_COMMANDS: Final[dict[str, str]] = {
     # Top-level commands
-    "checkout": checkout_cmd,
-    "co": checkout_cmd,  # Alias
-    "up": up_cmd,
-    "down": down_cmd,
-    "implement": implement,
-    "pr": pr_group,
+    "checkout": "erk.cli.commands.checkout:checkout_cmd",
+    "co": "erk.cli.commands.checkout:checkout_cmd",  # Alias
+    "up": "erk.cli.commands.up:up_cmd",
+    "down": "erk.cli.commands.down:down_cmd",
+    "implement": "erk.cli.commands.implement:implement",
+    "pr": "erk.cli.commands.pr:pr_group",
     # Legacy top-level aliases (for backward compatibility)
-    "create": create_wt,
-    "goto": goto_wt,
-    "consolidate": consolidate_stack,
+    "create": "erk.cli.commands.wt.create_cmd:create_wt",
+    "goto": "erk.cli.commands.wt.goto_cmd:goto_wt",
+    "consolidate": "erk.cli.commands.stack.consolidate_cmd:consolidate_stack",
     # Subcommands under wt
-    "wt create": create_wt,
-    "wt goto": goto_wt,
+    "wt create": "erk.cli.commands.wt.create_cmd:create_wt",
+    "wt goto": "erk.cli.commands.wt.goto_cmd:goto_wt",
     # Subcommands under stack
-    "stack consolidate": consolidate_stack,
+    "stack consolidate": "erk.cli.commands.stack.consolidate_cmd:consolidate_stack",
 }
 
 
@@ -59,7 +53,9 @@ class ShellIntegrationResult:
     exit_code: int
 
 
-def _invoke_hidden_command(command_name: str, args: tuple[str, ...]) -> ShellIntegrationResult:
+def _invoke_hidden_command(
+    ctx: ErkContext, command_name: str, args: tuple[str, ...], *, cleanup_scripts: bool
+) -> ShellIntegrationResult:
     """Invoke a command with --script flag for shell integration.
 
     If args contain help flags or explicit --script, passthrough to regular command.
@@ -70,11 +66,12 @@ def _invoke_hidden_command(command_name: str, args: tuple[str, ...]) -> ShellInt
     if "-h" in args or "--help" in args or "--script" in args or "--dry-run" in args:
         return ShellIntegrationResult(passthrough=True, script=None, exit_code=0)
 
-    command = SHELL_INTEGRATION_COMMANDS.get(command_name)
-    if command is None:
+    import_path = SHELL_INTEGRATION_COMMANDS.get(command_name)
+    if import_path is None:
         if command_name in PASSTHROUGH_COMMANDS:
-            return _build_passthrough_script(command_name, args)
+            return _build_passthrough_script(ctx, command_name, args)
         return ShellIntegrationResult(passthrough=True, script=None, exit_code=0)
+    command = load_command(import_path)
 
     # Add --script flag to get activation script
     script_args = list(args) + ["--script"]
@@ -82,13 +79,15 @@ def _invoke_hidden_command(command_name: str, args: tuple[str, ...]) -> ShellInt
     debug_log(f"Handler: Invoking {command_name} with args: {script_args}")
 
     # Clean up stale scripts before running (opportunistic cleanup)
-    cleanup_stale_scripts(max_age_seconds=STALE_SCRIPT_MAX_AGE_SECONDS)
+    if cleanup_scripts:
+        cleanup_stale_scripts(max_age_seconds=STALE_SCRIPT_MAX_AGE_SECONDS)
 
     runner = CliRunner()
     result = runner.invoke(
         command,
         script_args,
-        obj=create_context(dry_run=False, script=True),
+        # Reuse the context the erk group already built, with diagnostics suppressed
+        obj=ctx.for_script(),
         standalone_mode=False,
     )
 
@@ -121,8 +120,17 @@ def _invoke_hidden_command(command_name: str, args: tuple[str, ...]) -> ShellInt
     return ShellIntegrationResult(passthrough=False, script=script_path, exit_code=exit_code)
 
 
-def handle_shell_request(args: tuple[str, ...]) -> ShellIntegrationResult:
-    """Dispatch shell integration handling based on the original CLI invocation."""
+def handle_shell_request(
+    ctx: ErkContext, args: tuple[str, ...], *, cleanup_scripts: bool = True
+) -> ShellIntegrationResult:
+    """Dispatch shell integration handling based on the original CLI invocation.
+
+    Args:
+        ctx: Context for the invoked command
+        args: Arguments following `erk __shell`
+        cleanup_scripts: Sweep stale activation scripts before running the
+            command (the resident daemon sweeps on its own schedule instead)
+    """
     if len(args) == 0:
         return ShellIntegrationResult(passthrough=True, script=None, exit_code=0)
 
@@ -130,18 +138,30 @@ def handle_shell_request(args: tuple[str, ...]) -> ShellIntegrationResult:
     if len(args) >= 2:
         compound_name = f"{args[0]} {args[1]}"
         if compound_name in SHELL_INTEGRATION_COMMANDS:
-            return _invoke_hidden_command(compound_name, tuple(args[2:]))
+            return _invoke_hidden_command(
+                ctx, compound_name, tuple(args[2:]), cleanup_scripts=cleanup_scripts
+            )
 
     # Fall back to single command
     command_name = args[0]
     command_args = args[1:] if len(args) > 1 else ()
-    return _invoke_hidden_command(command_name, command_args)
+    return _invoke_hidden_command(ctx, command_name, command_args, cleanup_scripts=cleanup_scripts)
+
+
+def write_shell_result(result: ShellIntegrationResult) -> None:
+    """Write a result to stdout in the form the shell wrappers read."""
+    if result.passthrough:
+        machine_output(PASSTHROUGH_MARKER)
+        return
+    if result.script:
+        machine_output(result.script, nl=False)
 
 
-def _build_passthrough_script(command_name: str, args: tuple[str, ...]) -> ShellIntegrationResult:
+def _build_passthrough_script(
+    ctx: ErkContext, command_name: str, args: tuple[str, ...]
+) -> ShellIntegrationResult:
     """Create a passthrough script tailored for the caller's shell."""
     shell_name = os.environ.get("ERK_SHELL", "bash").lower()
-    ctx = create_context(dry_run=False)
     recovery_path = generate_recovery_script(ctx)
 
     script_content = _render_passthrough_script(shell_name, command_name, args, recovery_path)
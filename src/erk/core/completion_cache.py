@@ -0,0 +1,287 @@
+"""Per-repository cache of shell completion candidates.
+
+Completing `erk co <TAB>` or `erk wt goto <TAB>` used to start the whole CLI
+and run `git worktree list` and `git branch` on every keypress. The
+candidates only change when the repository's refs or worktree list change,
+so they are kept in ~/.erk/repos/<repo>/completion.json:
+
+- worktree names (as complete_worktree_names offers them, "root" first)
+- branch names (local and remote, remote prefix stripped)
+- recent plan issue numbers and titles, recorded by `erk plan list`
+
+Worktree and branch candidates are stored with a fingerprint of the files
+git keeps them in (the refs/heads and refs/remotes directories,
+packed-refs and the worktree administrative directories), read without
+running git. A reader only uses them while the fingerprint still matches;
+plan numbers are kept until the next listing replaces them.
+
+This module is imported by the completion fast path before the CLI, so it
+only depends on the standard library and erk_shared.git.layout.
+"""
+
+import json
+import os
+import tomllib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+from erk_shared.git.layout import read_git_layout
+
+if TYPE_CHECKING:
+    from erk_shared.git.abc import Git
+
+COMPLETION_CACHE_FILENAME = "completion.json"
+COMPLETION_CACHE_FORMAT_VERSION = 1
+
+# Plans recorded per repository, most recent listing first
+MAX_CACHED_PLANS = 50
+
+CandidateKind = Literal["worktrees", "branches", "plans"]
+
+
+@dataclass(frozen=True)
+class CompletionCandidate:
+    """A completion value with optional help text (shown by zsh and fish)."""
+
+    value: str
+    help: str | None = None
+
+
+def read_completion_fingerprint(common_dir: Path) -> dict[str, list[int] | None] | None:
+    """Stamp the files worktree and branch candidates are derived from.
+
+    Args:
+        common_dir: Git directory shared by all worktrees
+
+    Returns:
+        Stamps keyed by path relative to common_dir, or None if the refs
+        aren't stored as files (reftable) and candidates can't be cached
+    """
+    if not (common_dir / "refs").is_dir() or (common_dir / "reftable").exists():
+        return None
+
+    paths = [common_dir / "packed-refs", common_dir / "worktrees"]
+    worktrees_dir = common_dir / "worktrees"
+    if worktrees_dir.is_dir():
+        paths.extend(entry / "gitdir" for entry in worktrees_dir.iterdir())
+    for refs_dir in (common_dir / "refs" / "heads", common_dir / "refs" / "remotes"):
+        for dirpath, _, _ in os.walk(refs_dir):
+            paths.append(Path(dirpath))
+
+    stamps: dict[str, list[int] | None] = {}
+    for path in paths:
+        if path.exists():
+            stat = path.stat()
+            stamps[str(path.relative_to(common_dir))] = [stat.st_mtime_ns, stat.st_ino]
+        else:
+            stamps[str(path.relative_to(common_dir))] = None
+    return stamps
+
+
+def worktree_candidates(worktree_paths: list[tuple[Path, bool]]) -> list[str]:
+    """Build worktree name candidates: "root", then every linked worktree's name.
+
+    Args:
+        worktree_paths: (path, is_root) of each worktree, in git's order
+    """
+    return ["root", *(path.name for path, is_root in worktree_paths if not is_root)]
+
+
+def branch_candidates(local_branches: list[str], remote_branches: list[str]) -> list[str]:
+    """Build sorted branch candidates with remote prefixes stripped.
+
+    'origin/feature' becomes 'feature'; names present both locally and
+    remotely appear once.
+    """
+    names = set(local_branches)
+    for remote_branch in remote_branches:
+        if "/" in remote_branch:
+            names.add(remote_branch.split("/", 1)[1])
+        else:
+            names.add(remote_branch)
+    return sorted(names)
+
+
+def read_completion_cache(cache_path: Path) -> dict[str, Any] | None:
+    """Read a completion cache file.
+
+    Returns:
+        The cached data, or None if missing, corrupt or from another version
+    """
+    if not cache_path.is_file():
+        return None
+
+    # Error boundary: a corrupt or concurrently replaced cache is a miss
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    if not isinstance(data, dict) or data.get("version") != COMPLETION_CACHE_FORMAT_VERSION:
+        return None
+    return data
+
+
+def _write_completion_cache(cache_path: Path, data: dict[str, Any]) -> None:
+    content = json.dumps({**data, "version": COMPLETION_CACHE_FORMAT_VERSION})
+    # Error boundary: the cache is an optimization; an unwritable metadata
+    # directory must not break commands or completion
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(content, encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        return
+
+
+def cached_sets(cache_path: Path, common_dir: Path) -> tuple[list[str], list[str]] | None:
+    """Get cached worktree and branch candidates if the repository hasn't changed.
+
+    Returns:
+        (worktrees, branches), or None if missing or stale
+    """
+    data = read_completion_cache(cache_path)
+    if data is None or "sets" not in data:
+        return None
+    fingerprint = read_completion_fingerprint(common_dir)
+    if fingerprint is None or data["sets"].get("fingerprint") != fingerprint:
+        return None
+    return data["sets"]["worktrees"], data["sets"]["branches"]
+
+
+def refresh_completion_sets(
+    git: "Git", repo_root: Path, cache_path: Path | None
+) -> tuple[list[str], list[str]]:
+    """Read worktree and branch candidates from git and store them.
+
+    Nothing is stored without a cache file or when the repository's refs
+    can't be fingerprinted.
+
+    Args:
+        git: Git used to list worktrees and branches
+        repo_root: Repository root directory
+        cache_path: Completion cache file of the repository, if caching
+
+    Returns:
+        (worktrees, branches)
+    """
+    fingerprint = None
+    if cache_path is not None:
+        common_dir = git.get_git_common_dir(repo_root)
+        # Stamped before reading, so a change while reading makes the entry stale
+        if common_dir is not None:
+            fingerprint = read_completion_fingerprint(common_dir)
+
+    worktrees = worktree_candidates(
+        [(worktree.path, worktree.is_root) for worktree in git.list_worktrees(repo_root)]
+    )
+    branches = branch_candidates(
+        git.list_local_branches(repo_root), git.list_remote_branches(repo_root)
+    )
+
+    if cache_path is not None and fingerprint is not None:
+        data = read_completion_cache(cache_path) or {}
+        data["sets"] = {"fingerprint": fingerprint, "worktrees": worktrees, "branches": branches}
+        _write_completion_cache(cache_path, data)
+    return worktrees, branches
+
+
+def load_or_refresh_completion_sets(
+    git: "Git", repo_root: Path, cache_path: Path | None
+) -> tuple[list[str], list[str]]:
+    """Get worktree and branch candidates, from the cache while it is current.
+
+    Without a cache file (tests, no erk metadata) candidates are read from git.
+    """
+    if cache_path is not None:
+        common_dir = git.get_git_common_dir(repo_root)
+        sets = cached_sets(cache_path, common_dir) if common_dir is not None else None
+        if sets is not None:
+            return sets
+    return refresh_completion_sets(git, repo_root, cache_path)
+
+
+def refresh_stale_completion_sets(git: "Git", repo_root: Path, cache_path: Path) -> None:
+    """Refresh cached candidates after a command changed branches or worktrees.
+
+    Only repositories whose cache exists (completion has been used there)
+    are refreshed, and only when the fingerprint no longer matches.
+    """
+    if not cache_path.is_file():
+        return
+    common_dir = git.get_git_common_dir(repo_root)
+    if common_dir is None or cached_sets(cache_path, common_dir) is not None:
+        return
+    refresh_completion_sets(git, repo_root, cache_path)
+
+
+def record_completion_plans(cache_path: Path, plans: list[tuple[int, str]]) -> None:
+    """Store recently listed plans as completion candidates.
+
+    Args:
+        cache_path: Completion cache file of the repository
+        plans: (issue number, title) of each listed plan
+    """
+    data = read_completion_cache(cache_path) or {}
+    data["plans"] = [[number, title] for number, title in plans[:MAX_CACHED_PLANS]]
+    _write_completion_cache(cache_path, data)
+
+
+def cached_plans(cache_path: Path) -> list[CompletionCandidate]:
+    """Get recorded plan numbers as candidates, titles as help text."""
+    data = read_completion_cache(cache_path)
+    if data is None:
+        return []
+    return [CompletionCandidate(str(number), title) for number, title in data.get("plans", [])]
+
+
+def _read_erk_root() -> Path | None:
+    config_path = Path.home() / ".erk" / "config.toml"
+    if not config_path.is_file():
+        return None
+
+    # Error boundary: a malformed config is reported by the full CLI
+    try:
+        data = tomllib.loads(config_path.read_text(encoding="utf-8"))
+    except (OSError, tomllib.TOMLDecodeError):
+        return None
+
+    erk_root = data.get("erk_root")
+    if not isinstance(erk_root, str):
+        return None
+    return Path(erk_root).expanduser().resolve()
+
+
+def load_cached_candidates(cwd: Path, kind: CandidateKind) -> list[CompletionCandidate] | None:
+    """Get candidates for the repository containing cwd without running git.
+
+    Locates the repository and its erk metadata directory the way repo
+    discovery does, from the .git layout and ~/.erk/config.toml.
+
+    Args:
+        cwd: Directory completion was requested from
+        kind: Which candidates to return
+
+    Returns:
+        Candidates, or None if they aren't cached or are stale
+    """
+    layout = read_git_layout(cwd)
+    if layout is None:
+        return None
+    erk_root = _read_erk_root()
+    if erk_root is None:
+        return None
+
+    repo_root = layout.common_dir.parent.resolve()
+    cache_path = erk_root / "repos" / repo_root.name / COMPLETION_CACHE_FILENAME
+    if kind == "plans":
+        return cached_plans(cache_path)
+
+    sets = cached_sets(cache_path, layout.common_dir)
+    if sets is None:
+        return None
+    worktrees, branches = sets
+    values = worktrees if kind == "worktrees" else branches
+    return [CompletionCandidate(value) for value in values]
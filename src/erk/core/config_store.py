@@ -10,6 +10,14 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
 
+from erk_shared.integrations.parallel.real import DEFAULT_MAX_WORKERS
+
+# Values accepted for GlobalConfig.github_backend
+GITHUB_BACKENDS = ("gh", "http")
+
+# Values accepted for GlobalConfig.git_backend
+GIT_BACKENDS = ("git", "plumbing")
+
 
 @dataclass(frozen=True)
 class GlobalConfig:
@@ -23,6 +31,9 @@ class GlobalConfig:
     use_graphite: bool
     shell_setup_complete: bool
     show_pr_info: bool
+    github_backend: str = "gh"  # "gh" (gh CLI subprocesses) or "http" (native API client)
+    git_backend: str = "git"  # "git" (git subprocesses) or "plumbing" (read .git files directly)
+    parallel_workers: int = DEFAULT_MAX_WORKERS  # Max concurrent tasks of parallel fan-outs
 
 
 class ConfigStore(ABC):
@@ -101,6 +112,9 @@ class RealConfigStore(ConfigStore):
             use_graphite=bool(data.get("use_graphite", False)),
             shell_setup_complete=bool(data.get("shell_setup_complete", False)),
             show_pr_info=bool(data.get("show_pr_info", True)),
+            github_backend=str(data.get("github_backend", "gh")),
+            git_backend=str(data.get("git_backend", "git")),
+            parallel_workers=int(data.get("parallel_workers", DEFAULT_MAX_WORKERS)),
         )
 
     def save(self, config: GlobalConfig) -> None:
@@ -155,6 +169,9 @@ erk_root = "{config.erk_root}"
 use_graphite = {str(config.use_graphite).lower()}
 shell_setup_complete = {str(config.shell_setup_complete).lower()}
 show_pr_info = {str(config.show_pr_info).lower()}
+github_backend = "{config.github_backend}"
+git_backend = "{config.git_backend}"
+parallel_workers = {config.parallel_workers}
 """
 
         try:
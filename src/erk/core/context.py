@@ -1,44 +1,43 @@
 """Application context with dependency injection."""
 
+import dataclasses
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
-import tomlkit
 from erk_shared.git.abc import Git
-from erk_shared.git.real import RealGit
 from erk_shared.github.abc import GitHub
-from erk_shared.github.issues import DryRunGitHubIssues, GitHubIssues, RealGitHubIssues
+from erk_shared.github.issues.abc import GitHubIssues
+from erk_shared.github.types import RepoIdentity
 from erk_shared.integrations.graphite.abc import Graphite
-from erk_shared.integrations.graphite.dry_run import DryRunGraphite
-from erk_shared.integrations.graphite.real import RealGraphite
+from erk_shared.integrations.parallel.abc import ParallelTaskRunner
 from erk_shared.integrations.time.abc import Time
-from erk_shared.integrations.time.real import RealTime
 from erk_shared.output.output import user_output
 
 from erk.cli.config import LoadedConfig, load_config
-from erk.core.claude_executor import ClaudeExecutor, RealClaudeExecutor
-from erk.core.completion import Completion, RealCompletion
-from erk.core.config_store import (
-    ConfigStore,
-    GlobalConfig,
-    RealConfigStore,
-)
-from erk.core.git.dry_run import DryRunGit
-from erk.core.github.dry_run import DryRunGitHub
-from erk.core.github.real import RealGitHub
-from erk.core.plan_store.github import GitHubPlanStore
+from erk.core.claude_executor import ClaudeExecutor
+from erk.core.completion import Completion
+from erk.core.config_store import ConfigStore, GlobalConfig
+from erk.core.git.caching import GitReadCache
 from erk.core.plan_store.store import PlanStore
+from erk.core.provider import Provider
 from erk.core.repo_discovery import (
     NoRepoSentinel,
     RepoContext,
     discover_repo_or_sentinel,
     ensure_erk_metadata_dir,
 )
-from erk.core.script_writer import RealScriptWriter, ScriptWriter
-from erk.core.services.plan_list_service import PlanListService
-from erk.core.shell import RealShell, Shell
-from erk.core.user_feedback import InteractiveFeedback, SuppressedFeedback, UserFeedback
+from erk.core.script_writer import ScriptWriter
+from erk.core.shell import Shell
+from erk.core.trunk_cache import TrunkBranchResolver
+from erk.core.user_feedback import SuppressedFeedback, UserFeedback
+
+if TYPE_CHECKING:
+    from erk_shared.github.rate_budget import GitHubRateBudget
+    from erk_shared.github.response_cache import GitHubResponseCache
+
+    from erk.core.services.plan_list_service import PlanListService
 
 
 @dataclass(frozen=True)
@@ -48,38 +47,214 @@ class ErkContext:
     Created at CLI entry point and threaded through the application.
     Frozen to prevent accidental modification at runtime.
 
+    Dependencies are held as Providers and built the first time the
+    same-named property is read, so a command only constructs (and imports)
+    the integrations it actually uses. Construct contexts with
+    create_context(), ErkContext.minimal() or ErkContext.for_test().
+
     Note: global_config may be None only during init command before config is created.
     All other commands should have a valid GlobalConfig.
     """
 
-    git: Git
-    github: GitHub
-    issues: GitHubIssues
-    plan_store: PlanStore
-    graphite: Graphite
-    shell: Shell
-    claude_executor: ClaudeExecutor
-    completion: Completion
-    time: Time
-    config_store: ConfigStore
-    script_writer: ScriptWriter
-    feedback: UserFeedback
-    plan_list_service: PlanListService
+    _git: Provider[Git]
+    _github: Provider[GitHub]
+    _issues: Provider[GitHubIssues]
+    _plan_store: Provider[PlanStore]
+    _graphite: Provider[Graphite]
+    _shell: Provider[Shell]
+    _claude_executor: Provider[ClaudeExecutor]
+    _completion: Provider[Completion]
+    _time: Provider[Time]
+    _config_store: Provider[ConfigStore]
+    _script_writer: Provider[ScriptWriter]
+    _feedback: Provider[UserFeedback]
+    _parallel_runner: Provider[ParallelTaskRunner]
+    _plan_list_service: Provider["PlanListService"]
+    _github_cache: Provider["GitHubResponseCache | None"]
+    _github_budget: Provider["GitHubRateBudget | None"]
+    _git_cache: Provider[GitReadCache | None]
+    _trunk_resolver: Provider[TrunkBranchResolver | None]
+    _completion_cache_path: Provider[Path | None]
+    _global_config: Provider[GlobalConfig | None]
+    _local_config: Provider[LoadedConfig]
+    _repo: Provider[RepoContext | NoRepoSentinel]
     cwd: Path  # Current working directory at CLI invocation
-    global_config: GlobalConfig | None
-    local_config: LoadedConfig
-    repo: RepoContext | NoRepoSentinel
     dry_run: bool
 
+    @property
+    def git(self) -> Git:
+        """Git integration."""
+        return self._git.get()
+
+    @property
+    def github(self) -> GitHub:
+        """GitHub integration."""
+        return self._github.get()
+
+    @property
+    def issues(self) -> GitHubIssues:
+        """GitHub issues integration."""
+        return self._issues.get()
+
+    @property
+    def plan_store(self) -> PlanStore:
+        """Plan storage backed by GitHub issues."""
+        return self._plan_store.get()
+
+    @property
+    def graphite(self) -> Graphite:
+        """Graphite integration."""
+        return self._graphite.get()
+
+    @property
+    def shell(self) -> Shell:
+        """Shell detection and tool lookup."""
+        return self._shell.get()
+
+    @property
+    def claude_executor(self) -> ClaudeExecutor:
+        """Claude CLI executor."""
+        return self._claude_executor.get()
+
+    @property
+    def completion(self) -> Completion:
+        """Shell completion script generation."""
+        return self._completion.get()
+
+    @property
+    def time(self) -> Time:
+        """Clock and sleep."""
+        return self._time.get()
+
+    @property
+    def config_store(self) -> ConfigStore:
+        """Global config storage."""
+        return self._config_store.get()
+
+    @property
+    def script_writer(self) -> ScriptWriter:
+        """Activation script writer."""
+        return self._script_writer.get()
+
+    @property
+    def feedback(self) -> UserFeedback:
+        """User-facing diagnostics output."""
+        return self._feedback.get()
+
+    @property
+    def parallel_runner(self) -> ParallelTaskRunner:
+        """Worker pool shared by this invocation's parallel fan-outs."""
+        return self._parallel_runner.get()
+
+    @property
+    def plan_list_service(self) -> "PlanListService":
+        """Combined plan listing queries."""
+        return self._plan_list_service.get()
+
+    @property
+    def github_cache(self) -> "GitHubResponseCache | None":
+        """GitHub response cache; None outside a repo and in tests."""
+        return self._github_cache.get()
+
+    @property
+    def github_budget(self) -> "GitHubRateBudget | None":
+        """GitHub rate-limit budget shared by the integrations; None in tests."""
+        return self._github_budget.get()
+
+    @property
+    def git_cache(self) -> GitReadCache | None:
+        """Per-invocation git read cache; None in tests."""
+        return self._git_cache.get()
+
+    @property
+    def trunk_resolver(self) -> TrunkBranchResolver | None:
+        """Persisted trunk branch resolution; None outside a repo and in tests."""
+        return self._trunk_resolver.get()
+
+    @property
+    def completion_cache_path(self) -> Path | None:
+        """Shell completion candidate cache; None outside a repo and in tests."""
+        return self._completion_cache_path.get()
+
+    @property
+    def global_config(self) -> GlobalConfig | None:
+        """Global configuration; None only before `erk init` creates it."""
+        return self._global_config.get()
+
+    @property
+    def local_config(self) -> LoadedConfig:
+        """Repository configuration (defaults outside a repo)."""
+        return self._local_config.get()
+
+    @property
+    def repo(self) -> RepoContext | NoRepoSentinel:
+        """The repository containing cwd, discovered on first access."""
+        return self._repo.get()
+
+    def with_global_config(self, global_config: GlobalConfig) -> "ErkContext":
+        """Copy of this context using a newly created global config."""
+        return dataclasses.replace(self, _global_config=Provider.of(global_config))
+
+    def for_script(self) -> "ErkContext":
+        """Copy of this context with diagnostics suppressed for shell integration."""
+        return dataclasses.replace(self, _feedback=Provider.of(SuppressedFeedback()))
+
+    def resolved_dependencies(self) -> list[str]:
+        """Names of the dependencies built so far, in field order."""
+        names: list[str] = []
+        for field in dataclasses.fields(self):
+            value = getattr(self, field.name)
+            if isinstance(value, Provider) and value.resolved:
+                names.append(field.name.removeprefix("_"))
+        return names
+
+    def cache_stats(self) -> list[str]:
+        """Statistics lines for the caches this invocation actually used."""
+        stats: list[str] = []
+        if self._github_cache.resolved and self.github_cache is not None:
+            stats.append(self.github_cache.format_stats())
+        if self._git.resolved and self.git_cache is not None:
+            stats.append(self.git_cache.format_stats())
+        return stats
+
     @property
     def trunk_branch(self) -> str | None:
-        """Get the trunk branch name from git detection.
+        """Get the trunk branch name.
+
+        Returns None if not in a repository, otherwise see get_trunk_branch.
+        """
+        if isinstance(self.repo, NoRepoSentinel):
+            return None
+        return self.get_trunk_branch(self.repo.root)
+
+    def get_trunk_branch(self, repo_root: Path) -> str:
+        """Get the trunk branch of a repository.
+
+        Commands look trunk up through here rather than through git, so a
+        configured `[tool.erk] trunk_branch` applies everywhere. Uses the
+        trunk_resolver when one is attached, and git detection when not
+        (test contexts, whose FakeGit is configured with the trunk instead).
 
-        Returns None if not in a repository, otherwise uses git to detect trunk.
+        Args:
+            repo_root: Repository root directory
+
+        Returns:
+            Trunk branch name
+        """
+        if self.trunk_resolver is not None:
+            return self.trunk_resolver.resolve(self.git, repo_root)
+        return self.git.get_trunk_branch(repo_root)
+
+    @property
+    def repo_identity(self) -> RepoIdentity | None:
+        """Get the GitHub owner/name of the current repository.
+
+        Returns None if not in a repository or if the identity couldn't be
+        resolved from the git remote or the per-repo cache.
         """
         if isinstance(self.repo, NoRepoSentinel):
             return None
-        return self.git.get_trunk_branch(self.repo.root)
+        return self.repo.identity
 
     @staticmethod
     def minimal(git: Git, cwd: Path, dry_run: bool = False) -> "ErkContext":
@@ -97,27 +272,6 @@ class ErkContext:
             ErkContext with git configured and other dependencies using test defaults
 
         Example:
-            Before (7 lines):
-            >>> from erk.core.git.fake import FakeGit
-            >>> from erk.core.github.fake import FakeGitHub
-            >>> from erk_shared.integrations.graphite.fake import FakeGraphite
-            >>> from tests.fakes.shell import FakeShell
-            >>> ctx = ErkContext(
-            ...     git=git,
-            ...     github=FakeGitHub(),
-            ...     graphite=FakeGraphite(),
-            ...     shell=FakeShell(),
-            ...     cwd=cwd,
-            ...     global_config=None,
-            ...     local_config=LoadedConfig(
-            ...         env={}, post_create_commands=[], post_create_shell=None
-            ...     ),
-            ...     repo=NoRepoSentinel(),
-            ...     dry_run=False,
-            ...     trunk_branch=None,
-            ... )
-
-            After (1 line):
             >>> ctx = ErkContext.minimal(git, cwd)
 
         Note:
@@ -129,6 +283,7 @@ class ErkContext:
         from erk_shared.integrations.time.fake import FakeTime
         from tests.fakes.claude_executor import FakeClaudeExecutor
         from tests.fakes.completion import FakeCompletion
+        from tests.fakes.parallel_task_runner import SerialParallelTaskRunner
         from tests.fakes.script_writer import FakeScriptWriter
         from tests.fakes.shell import FakeShell
         from tests.fakes.user_feedback import FakeUserFeedback
@@ -136,27 +291,36 @@ class ErkContext:
         from erk.core.config_store import FakeConfigStore
         from erk.core.github.fake import FakeGitHub
         from erk.core.plan_store.fake import FakePlanStore
+        from erk.core.services.plan_list_service import PlanListService
 
         fake_github = FakeGitHub()
         fake_issues = FakeGitHubIssues()
         return ErkContext(
-            git=git,
-            github=fake_github,
-            issues=fake_issues,
-            plan_store=FakePlanStore(),
-            graphite=FakeGraphite(),
-            shell=FakeShell(),
-            claude_executor=FakeClaudeExecutor(),
-            completion=FakeCompletion(),
-            time=FakeTime(),
-            config_store=FakeConfigStore(config=None),
-            script_writer=FakeScriptWriter(),
-            feedback=FakeUserFeedback(),
-            plan_list_service=PlanListService(fake_github, fake_issues),
+            _git=Provider.of(git),
+            _github=Provider.of(fake_github),
+            _issues=Provider.of(fake_issues),
+            _plan_store=Provider.of(FakePlanStore()),
+            _graphite=Provider.of(FakeGraphite()),
+            _shell=Provider.of(FakeShell()),
+            _claude_executor=Provider.of(FakeClaudeExecutor()),
+            _completion=Provider.of(FakeCompletion()),
+            _time=Provider.of(FakeTime()),
+            _config_store=Provider.of(FakeConfigStore(config=None)),
+            _script_writer=Provider.of(FakeScriptWriter()),
+            _feedback=Provider.of(FakeUserFeedback()),
+            _parallel_runner=Provider.of(SerialParallelTaskRunner()),
+            _plan_list_service=Provider.of(PlanListService(fake_github, fake_issues)),
+            _github_cache=Provider.of(None),
+            _github_budget=Provider.of(None),
+            _git_cache=Provider.of(None),
+            _trunk_resolver=Provider.of(None),
+            _completion_cache_path=Provider.of(None),
+            _global_config=Provider.of(None),
+            _local_config=Provider.of(
+                LoadedConfig(env={}, post_create_commands=[], post_create_shell=None)
+            ),
+            _repo=Provider.of(NoRepoSentinel()),
             cwd=cwd,
-            global_config=None,
-            local_config=LoadedConfig(env={}, post_create_commands=[], post_create_shell=None),
-            repo=NoRepoSentinel(),
             dry_run=dry_run,
         )
 
@@ -174,7 +338,13 @@ class ErkContext:
         config_store: ConfigStore | None = None,
         script_writer: ScriptWriter | None = None,
         feedback: UserFeedback | None = None,
-        plan_list_service: PlanListService | None = None,
+        parallel_runner: ParallelTaskRunner | None = None,
+        plan_list_service: "PlanListService | None" = None,
+        github_cache: "GitHubResponseCache | None" = None,
+        github_budget: "GitHubRateBudget | None" = None,
+        git_cache: GitReadCache | None = None,
+        trunk_resolver: TrunkBranchResolver | None = None,
+        completion_cache_path: Path | None = None,
         cwd: Path | None = None,
         global_config: GlobalConfig | None = None,
         local_config: LoadedConfig | None = None,
@@ -203,6 +373,16 @@ class ErkContext:
                           If None, creates empty FakeScriptWriter.
             feedback: Optional UserFeedback implementation.
                         If None, creates FakeUserFeedback.
+            parallel_runner: Optional ParallelTaskRunner. If None, creates a
+                             SerialParallelTaskRunner (tasks really run, inline).
+            github_cache: Optional GitHubResponseCache. If None, no response cache
+                          is attached (github/issues are used as given).
+            github_budget: Optional GitHubRateBudget. If None, no usage is recorded.
+            git_cache: Optional GitReadCache shared with a CachingGit passed as git.
+            trunk_resolver: Optional TrunkBranchResolver. If None, trunk lookups
+                            ask git directly and ignore [tool.erk] trunk_branch.
+            completion_cache_path: Optional completion cache file. If None,
+                                   completion candidates are read from git.
             cwd: Optional current working directory. If None, uses Path("/test/default/cwd").
             global_config: Optional GlobalConfig. If None, uses test defaults.
             local_config: Optional LoadedConfig. If None, uses empty defaults.
@@ -231,20 +411,25 @@ class ErkContext:
             For simple cases that only need git, use ErkContext.minimal()
             which is more concise.
         """
-        from erk_shared.github.issues import FakeGitHubIssues
+        from erk_shared.github.issues import DryRunGitHubIssues, FakeGitHubIssues
+        from erk_shared.integrations.graphite.dry_run import DryRunGraphite
         from erk_shared.integrations.graphite.fake import FakeGraphite
         from erk_shared.integrations.time.fake import FakeTime
         from tests.fakes.claude_executor import FakeClaudeExecutor
         from tests.fakes.completion import FakeCompletion
+        from tests.fakes.parallel_task_runner import SerialParallelTaskRunner
         from tests.fakes.script_writer import FakeScriptWriter
         from tests.fakes.shell import FakeShell
         from tests.fakes.user_feedback import FakeUserFeedback
         from tests.test_utils.paths import sentinel_path
 
         from erk.core.config_store import FakeConfigStore
+        from erk.core.git.dry_run import DryRunGit
         from erk.core.git.fake import FakeGit
+        from erk.core.github.dry_run import DryRunGitHub
         from erk.core.github.fake import FakeGitHub
         from erk.core.plan_store.fake import FakePlanStore
+        from erk.core.services.plan_list_service import PlanListService
 
         if git is None:
             git = FakeGit()
@@ -279,6 +464,9 @@ class ErkContext:
         if feedback is None:
             feedback = FakeUserFeedback()
 
+        if parallel_runner is None:
+            parallel_runner = SerialParallelTaskRunner()
+
         if plan_list_service is None:
             plan_list_service = PlanListService(github, issues)
 
@@ -307,23 +495,29 @@ class ErkContext:
             issues = DryRunGitHubIssues(issues)
 
         return ErkContext(
-            git=git,
-            github=github,
-            issues=issues,
-            plan_store=plan_store,
-            graphite=graphite,
-            shell=shell,
-            claude_executor=claude_executor,
-            completion=completion,
-            time=time,
-            config_store=config_store,
-            script_writer=script_writer,
-            feedback=feedback,
-            plan_list_service=plan_list_service,
+            _git=Provider.of(git),
+            _github=Provider.of(github),
+            _issues=Provider.of(issues),
+            _plan_store=Provider.of(plan_store),
+            _graphite=Provider.of(graphite),
+            _shell=Provider.of(shell),
+            _claude_executor=Provider.of(claude_executor),
+            _completion=Provider.of(completion),
+            _time=Provider.of(time),
+            _config_store=Provider.of(config_store),
+            _script_writer=Provider.of(script_writer),
+            _feedback=Provider.of(feedback),
+            _parallel_runner=Provider.of(parallel_runner),
+            _plan_list_service=Provider.of(plan_list_service),
+            _github_cache=Provider.of(github_cache),
+            _github_budget=Provider.of(github_budget),
+            _git_cache=Provider.of(git_cache),
+            _trunk_resolver=Provider.of(trunk_resolver),
+            _completion_cache_path=Provider.of(completion_cache_path),
+            _global_config=Provider.of(global_config),
+            _local_config=Provider.of(local_config),
+            _repo=Provider.of(repo),
             cwd=cwd or sentinel_path(),
-            global_config=global_config,
-            local_config=local_config,
-            repo=repo,
             dry_run=dry_run,
         )
 
@@ -339,6 +533,9 @@ def write_trunk_to_pyproject(repo_root: Path, trunk: str, git: Git | None = None
         trunk: Trunk branch name to configure
         git: Optional Git interface for path checking (uses .exists() if None)
     """
+    # Imported here: only `erk config set trunk-branch` needs tomlkit
+    import tomlkit
+
     pyproject_path = repo_root / "pyproject.toml"
 
     # Check existence using git if available (for test compatibility)
@@ -394,7 +591,9 @@ def safe_cwd() -> tuple[Path | None, str | None]:
         )
 
 
-def create_context(*, dry_run: bool, script: bool = False) -> ErkContext:
+def create_context(
+    *, dry_run: bool, script: bool = False, git_cache: GitReadCache | None = None
+) -> ErkContext:
     """Create production context with real implementations.
 
     Called at CLI entry point to create the context for the entire
@@ -405,6 +604,8 @@ def create_context(*, dry_run: bool, script: bool = False) -> ErkContext:
                  print intended actions without executing them
         script: If True, use SuppressedFeedback to suppress diagnostic output
                 for shell integration mode (default False)
+        git_cache: Git read cache to share with other contexts (the shell
+                daemon keeps one across requests); a fresh one by default
 
     Returns:
         ErkContext with real implementations, wrapped in dry-run
@@ -427,74 +628,335 @@ def create_context(*, dry_run: bool, script: bool = False) -> ErkContext:
 
     cwd = cwd_result
 
-    # 2. Create global config store
-    config_store = RealConfigStore()
+    # 2. Wire every dependency as a Provider; nothing below is built (or
+    # imported) until a command first reads it from the context
+    config_store: Provider[ConfigStore] = Provider(_create_config_store)
+    global_config: Provider[GlobalConfig | None] = Provider(
+        lambda: _load_global_config(config_store.get())
+    )
+    time: Provider[Time] = Provider(_create_time)
 
-    # 3. Load global config (no deps) - None if not exists (for init command)
-    global_config: GlobalConfig | None
-    if config_store.exists():
-        global_config = config_store.load()
+    # Repeated git reads within this invocation are answered from memory
+    read_cache: Provider[GitReadCache | None] = (
+        Provider(GitReadCache) if git_cache is None else Provider.of(git_cache)
+    )
+    undecorated_git: Provider[Git] = Provider(
+        lambda: _create_git(global_config.get(), read_cache.get())
+    )
+    git: Provider[Git] = Provider(lambda: _apply_dry_run_git(undecorated_git.get(), dry_run))
+
+    # Repo discovery only needs cwd, erk_root and git. If global_config is
+    # None (init command), use a placeholder erk_root
+    repo: Provider[RepoContext | NoRepoSentinel] = Provider(
+        lambda: _discover_repo(cwd, global_config.get(), undecorated_git.get())
+    )
+    local_config: Provider[LoadedConfig] = Provider(lambda: _load_local_config(repo.get()))
+    trunk_resolver: Provider[TrunkBranchResolver | None] = Provider(
+        lambda: _create_trunk_resolver(repo.get())
+    )
+    completion_cache_path: Provider[Path | None] = Provider(
+        lambda: _completion_cache_path(repo.get())
+    )
+
+    # GitHub integrations share one identity resolver, HTTP client, response
+    # cache, rate-limit budget and the worker pool; plan services use them
+    # without dry-run wrappers
+    github_cache: Provider[GitHubResponseCache | None] = Provider(
+        lambda: _create_github_cache(repo.get(), time.get())
+    )
+    github_budget: Provider[GitHubRateBudget | None] = Provider(
+        lambda: _create_github_budget(time.get())
+    )
+    parallel_runner: Provider[ParallelTaskRunner] = Provider(
+        lambda: _create_parallel_runner(global_config.get(), time.get())
+    )
+    github_pair: Provider[tuple[GitHub, GitHubIssues]] = Provider(
+        lambda: _create_github_integrations(
+            global_config.get(),
+            repo.get(),
+            time.get(),
+            github_cache.get(),
+            parallel_runner.get(),
+            github_budget.get(),
+        )
+    )
+    github: Provider[GitHub] = Provider(
+        lambda: _apply_dry_run_github(github_pair.get()[0], dry_run)
+    )
+    issues: Provider[GitHubIssues] = Provider(
+        lambda: _apply_dry_run_issues(github_pair.get()[1], dry_run)
+    )
+    plan_store: Provider[PlanStore] = Provider(lambda: _create_plan_store(github_pair.get()[1]))
+    plan_list_service: Provider[PlanListService] = Provider(
+        lambda: _create_plan_list_service(*github_pair.get())
+    )
+    graphite: Provider[Graphite] = Provider(lambda: _create_graphite(repo.get(), dry_run))
+
+    # 3. Choose feedback implementation based on mode
+    feedback: Provider[UserFeedback] = Provider(
+        lambda: SuppressedFeedback() if script else _create_interactive_feedback()
+    )
+
+    # 4. Create context with all providers
+    return ErkContext(
+        _git=git,
+        _github=github,
+        _issues=issues,
+        _plan_store=plan_store,
+        _graphite=graphite,
+        _shell=Provider(_create_shell),
+        _claude_executor=Provider(_create_claude_executor),
+        _completion=Provider(_create_completion),
+        _time=time,
+        _config_store=config_store,
+        _script_writer=Provider(_create_script_writer),
+        _feedback=feedback,
+        _parallel_runner=parallel_runner,
+        _plan_list_service=plan_list_service,
+        _github_cache=github_cache,
+        _github_budget=github_budget,
+        _git_cache=read_cache,
+        _trunk_resolver=trunk_resolver,
+        _completion_cache_path=completion_cache_path,
+        _global_config=global_config,
+        _local_config=local_config,
+        _repo=repo,
+        cwd=cwd,
+        dry_run=dry_run,
+    )
+
+
+# Factories for create_context. Implementations are imported inside each
+# factory so that importing erk.core.context doesn't load every integration.
+
+
+def _create_config_store() -> ConfigStore:
+    from erk.core.config_store import RealConfigStore
+
+    return RealConfigStore()
+
+
+def _load_global_config(config_store: ConfigStore) -> GlobalConfig | None:
+    # None only for the init command, before the config exists
+    if not config_store.exists():
+        return None
+    return config_store.load()
+
+
+def _create_time() -> Time:
+    from erk_shared.integrations.time.real import RealTime
+
+    return RealTime()
+
+
+def _create_parallel_runner(global_config: GlobalConfig | None, time: Time) -> ParallelTaskRunner:
+    from erk_shared.integrations.parallel.real import RealParallelTaskRunner
+
+    if global_config is None:
+        return RealParallelTaskRunner(time=time)
+    return RealParallelTaskRunner(max_workers=global_config.parallel_workers, time=time)
+
+
+def _create_git(global_config: GlobalConfig | None, git_cache: GitReadCache | None) -> Git:
+    from erk.core.git.caching import CachingGit
+
+    git: Git
+    if global_config is not None and global_config.git_backend == "plumbing":
+        from erk_shared.git.plumbing import PlumbingGit
+
+        git = PlumbingGit()
     else:
-        # For init command only: config doesn't exist yet
-        global_config = None
-
-    # 4. Create integration classes (need git for repo discovery)
-    # Create time first so it can be injected into other classes
-    time: Time = RealTime()
-    git: Git = RealGit()
-    graphite: Graphite = RealGraphite()
-    github: GitHub = RealGitHub(time)
-    issues: GitHubIssues = RealGitHubIssues()
-    plan_store: PlanStore = GitHubPlanStore(issues)
-    plan_list_service: PlanListService = PlanListService(github, issues)
-
-    # 5. Discover repo (only needs cwd, erk_root, git)
-    # If global_config is None, use placeholder path for repo discovery
+        from erk_shared.git.real import RealGit
+
+        git = RealGit()
+    if git_cache is None:
+        return git
+    return CachingGit(git, git_cache)
+
+
+def _apply_dry_run_git(git: Git, dry_run: bool) -> Git:
+    if not dry_run:
+        return git
+    from erk.core.git.dry_run import DryRunGit
+
+    return DryRunGit(git)
+
+
+def _discover_repo(
+    cwd: Path, global_config: GlobalConfig | None, git: Git
+) -> RepoContext | NoRepoSentinel:
     erk_root = global_config.erk_root if global_config else Path.home() / "worktrees"
     repo = discover_repo_or_sentinel(cwd, erk_root, git)
+    if isinstance(repo, RepoContext):
+        ensure_erk_metadata_dir(repo)
+    return repo
+
+
+def _load_local_config(repo: RepoContext | NoRepoSentinel) -> LoadedConfig:
+    if isinstance(repo, NoRepoSentinel):
+        return LoadedConfig(env={}, post_create_commands=[], post_create_shell=None)
+    return load_config(repo.repo_dir)
+
+
+def _create_trunk_resolver(repo: RepoContext | NoRepoSentinel) -> TrunkBranchResolver | None:
+    if isinstance(repo, NoRepoSentinel):
+        return None
+    return TrunkBranchResolver(repo.trunk_cache_path)
+
+
+def _completion_cache_path(repo: RepoContext | NoRepoSentinel) -> Path | None:
+    if isinstance(repo, NoRepoSentinel):
+        return None
+    return repo.completion_cache_path
+
+
+def _create_github_cache(
+    repo: RepoContext | NoRepoSentinel, time: Time
+) -> "GitHubResponseCache | None":
+    # The response cache lives in the per-repo erk metadata directory
+    if isinstance(repo, NoRepoSentinel):
+        return None
+    from erk_shared.github.response_cache import CacheMode, GitHubResponseCache
+
+    # Reads are opt-in: only the read-only listing commands enable them through
+    # apply_github_cache_flags(). Every other command still invalidates entries
+    # after its writes, but never acts on a cached PR or run state.
+    cache = GitHubResponseCache(repo.repo_dir / "cache" / "github", time)
+    cache.set_mode(CacheMode.DISABLED)
+    return cache
+
+
+def _create_github_budget(time: Time) -> "GitHubRateBudget | None":
+    # GitHub limits are per user, so the usage log is per user too
+    from erk_shared.github.rate_budget import GitHubBudgetLog, GitHubRateBudget
+
+    log = GitHubBudgetLog(Path.home() / ".erk" / "github-budget.jsonl", time)
+    return GitHubRateBudget(time, log)
+
+
+def _create_github_integrations(
+    global_config: GlobalConfig | None,
+    repo: RepoContext | NoRepoSentinel,
+    time: Time,
+    github_cache: "GitHubResponseCache | None",
+    runner: ParallelTaskRunner,
+    budget: "GitHubRateBudget | None",
+) -> tuple[GitHub, GitHubIssues]:
+    from erk_shared.github.http_client import GitHubHttpClient, resolve_github_token
+    from erk_shared.github.issues import (
+        CachingGitHubIssues,
+        HttpGitHubIssues,
+        RealGitHubIssues,
+    )
+    from erk_shared.github.repo_identity import RepoIdentityResolver
+
+    from erk.core.github.caching import CachingGitHub
+    from erk.core.github.http import HttpGitHub
+    from erk.core.github.real import RealGitHub
 
-    # 6. Load local config (or defaults if no repo)
+    # GitHub owner/name is resolved once here and shared by every GraphQL query;
+    # the resolver falls back to gh (and persists the answer) only when needed
     if isinstance(repo, NoRepoSentinel):
-        local_config = LoadedConfig(env={}, post_create_commands=[], post_create_shell=None)
+        identity_resolver = RepoIdentityResolver(identity=None, cache_path=None)
     else:
-        repo_dir = ensure_erk_metadata_dir(repo)
-        local_config = load_config(repo_dir)
+        identity_resolver = RepoIdentityResolver(
+            identity=repo.identity, cache_path=repo.identity_cache_path
+        )
 
-    # 7. Choose feedback implementation based on mode
-    feedback: UserFeedback
-    if script:
-        feedback = SuppressedFeedback()  # Suppress diagnostics
+    github: GitHub
+    issues: GitHubIssues
+    github_token = None
+    if global_config is not None and global_config.github_backend == "http":
+        github_token = resolve_github_token()
+    if github_token is not None:
+        # One pooled keep-alive client shared by both integrations
+        http_client = GitHubHttpClient(github_token, budget=budget)
+        github = HttpGitHub(time, http_client, identity_resolver, runner, budget)
+        issues = HttpGitHubIssues(http_client, identity_resolver, runner, budget)
     else:
-        feedback = InteractiveFeedback()  # Show all messages
+        github = RealGitHub(time, identity_resolver, runner, budget)
+        issues = RealGitHubIssues(identity_resolver, runner, budget)
 
-    # 8. Apply dry-run wrappers if needed
-    if dry_run:
-        git = DryRunGit(git)
-        graphite = DryRunGraphite(graphite)
-        github = DryRunGitHub(github)
-        issues = DryRunGitHubIssues(issues)
+    if github_cache is not None:
+        github = CachingGitHub(github, github_cache)
+        issues = CachingGitHubIssues(issues, github_cache)
+    return github, issues
 
-    # 9. Create context with all values
-    return ErkContext(
-        git=git,
-        github=github,
-        issues=issues,
-        plan_store=plan_store,
-        graphite=graphite,
-        shell=RealShell(),
-        claude_executor=RealClaudeExecutor(),
-        completion=RealCompletion(),
-        time=time,
-        config_store=RealConfigStore(),
-        script_writer=RealScriptWriter(),
-        feedback=feedback,
-        plan_list_service=plan_list_service,
-        cwd=cwd,
-        global_config=global_config,
-        local_config=local_config,
-        repo=repo,
-        dry_run=dry_run,
-    )
+
+def _apply_dry_run_github(github: GitHub, dry_run: bool) -> GitHub:
+    if not dry_run:
+        return github
+    from erk.core.github.dry_run import DryRunGitHub
+
+    return DryRunGitHub(github)
+
+
+def _apply_dry_run_issues(issues: GitHubIssues, dry_run: bool) -> GitHubIssues:
+    if not dry_run:
+        return issues
+    from erk_shared.github.issues import DryRunGitHubIssues
+
+    return DryRunGitHubIssues(issues)
+
+
+def _create_plan_store(issues: GitHubIssues) -> PlanStore:
+    from erk.core.plan_store.github import GitHubPlanStore
+
+    return GitHubPlanStore(issues)
+
+
+def _create_plan_list_service(github: GitHub, issues: GitHubIssues) -> "PlanListService":
+    from erk.core.services.plan_list_service import PlanListService
+
+    return PlanListService(github, issues)
+
+
+def _create_graphite(repo: RepoContext | NoRepoSentinel, dry_run: bool) -> Graphite:
+    from erk_shared.integrations.graphite.real import RealGraphite
+
+    graphite: Graphite
+    if isinstance(repo, NoRepoSentinel):
+        graphite = RealGraphite()
+    else:
+        # Graphite metadata snapshot lives in the per-repo erk metadata directory
+        from erk_shared.integrations.graphite.snapshot import GraphiteMetadataSnapshot
+
+        graphite = RealGraphite(GraphiteMetadataSnapshot(repo.repo_dir / "cache" / "graphite"))
+    if not dry_run:
+        return graphite
+    from erk_shared.integrations.graphite.dry_run import DryRunGraphite
+
+    return DryRunGraphite(graphite)
+
+
+def _create_interactive_feedback() -> UserFeedback:
+    from erk.core.user_feedback import InteractiveFeedback
+
+    return InteractiveFeedback()
+
+
+def _create_shell() -> Shell:
+    from erk.core.shell import RealShell
+
+    return RealShell()
+
+
+def _create_claude_executor() -> ClaudeExecutor:
+    from erk.core.claude_executor import RealClaudeExecutor
+
+    return RealClaudeExecutor()
+
+
+def _create_completion() -> Completion:
+    from erk.core.completion import RealCompletion
+
+    return RealCompletion()
+
+
+def _create_script_writer() -> ScriptWriter:
+    from erk.core.script_writer import RealScriptWriter
+
+    return RealScriptWriter()
 
 
 def regenerate_context(existing_ctx: ErkContext) -> ErkContext:
@@ -0,0 +1,483 @@
+"""Per-invocation memoizing Git wrapper.
+
+A single erk command asks the same git questions many times: list_worktrees
+backs find_current_worktree, is_branch_checked_out, find_worktree_for_branch
+and the related-worktree lookups, and get_current_branch is asked by the
+status orchestrator and by every collector. CachingGit answers repeated
+reads from memory for the lifetime of one ErkContext.
+
+Only reads whose answer can change solely through git are memoized. Reads
+of working-tree state (file status, cleanliness, ahead/behind, recent
+commits) and filesystem checks always go to the wrapped implementation,
+since the command itself may edit files between calls. Mutating operations
+delegate and then drop exactly the cached answers they can change.
+"""
+
+import threading
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+from typing import cast
+
+from erk_shared.git.abc import BranchSyncInfo, Git, WorktreeInfo
+
+# Reads answered from a worktree's HEAD or the worktree list
+_WORKTREE_OPERATIONS = (
+    "list_worktrees",
+    "get_current_branch",
+    "is_branch_checked_out",
+    "find_worktree_for_branch",
+)
+
+# Reads that depend on which local branches exist
+_BRANCH_LIST_OPERATIONS = (
+    "list_local_branches",
+    "detect_default_branch",
+    "get_trunk_branch",
+    "get_all_branch_sync_info",
+)
+
+# Reads that depend on remote-tracking refs
+_REMOTE_OPERATIONS = (
+    "list_remote_branches",
+    "get_all_branch_sync_info",
+)
+
+_MISSING = object()
+
+
+class GitReadCache:
+    """In-memory store of git read results with hit/miss counters.
+
+    Keys are (operation, arguments). The cache lives as long as the
+    ErkContext that owns it; nothing is persisted.
+
+    Thread-safe: ParallelTaskRunner workers (e.g. the status collectors) read
+    through the same CachingGit. Reads run outside the lock, so a result
+    fetched while an invalidation happened isn't stored.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str, tuple[object, ...]], object] = {}
+        self._hits: Counter[str] = Counter()
+        self._misses: Counter[str] = Counter()
+        self._invalidations = 0
+        # Bumped by every invalidate/clear, to detect ones that raced a fetch
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get_or_fetch[T](
+        self, operation: str, args: tuple[object, ...], fetch: Callable[[], T]
+    ) -> T:
+        """Return the cached result for a read, fetching and storing it on a miss.
+
+        Args:
+            operation: Git method name
+            args: Hashable method arguments
+            fetch: Performs the read on a miss
+
+        Returns:
+            The (possibly cached) result
+        """
+        key = (operation, args)
+        with self._lock:
+            cached = self._entries.get(key, _MISSING)
+            if cached is not _MISSING:
+                self._hits[operation] += 1
+                return cast(T, cached)
+            self._misses[operation] += 1
+            generation = self._generation
+
+        result = fetch()
+        with self._lock:
+            if self._generation == generation:
+                self._entries[key] = result
+        return result
+
+    def invalidate(
+        self,
+        operations: tuple[str, ...],
+        matches: Callable[[tuple[object, ...]], bool] | None = None,
+    ) -> None:
+        """Drop cached results of the given operations.
+
+        Args:
+            operations: Git method names whose results to drop
+            matches: Only drop entries whose arguments satisfy this predicate;
+                all entries of the operations when None
+        """
+        with self._lock:
+            self._generation += 1
+            stale = [
+                key
+                for key in self._entries
+                if key[0] in operations and (matches is None or matches(key[1]))
+            ]
+            for key in stale:
+                del self._entries[key]
+            self._invalidations += len(stale)
+
+    def clear(self) -> None:
+        """Drop every cached result.
+
+        For callers that change git state outside the Git interface (e.g. by
+        running `gt create`).
+        """
+        with self._lock:
+            self._generation += 1
+            self._invalidations += len(self._entries)
+            self._entries.clear()
+
+    def call_counts(self) -> dict[str, tuple[int, int]]:
+        """Get (hits, misses) per operation."""
+        with self._lock:
+            operations = sorted(set(self._hits) | set(self._misses))
+            return {op: (self._hits[op], self._misses[op]) for op in operations}
+
+    def format_stats(self) -> str:
+        """Format counters as a single line for debug output."""
+        counts = ", ".join(
+            f"{op} {hits}/{hits + misses}" for op, (hits, misses) in self.call_counts().items()
+        )
+        with self._lock:
+            total_hits = sum(self._hits.values())
+            total_misses = sum(self._misses.values())
+            invalidations = self._invalidations
+        return (
+            f"git read cache: {total_hits} hits, {total_misses} misses, "
+            f"{invalidations} invalidations (hits/calls: {counts or 'none'})"
+        )
+
+
+def _moves_head(branch: object) -> bool:
+    """Whether a get_branch_head argument names something relative to HEAD."""
+    return isinstance(branch, str) and "HEAD" in branch
+
+
+class CachingGit(Git):
+    """Wrapper that memoizes git reads for the lifetime of one ErkContext.
+
+    Usage:
+        cache = GitReadCache()
+        git = CachingGit(RealGit(), cache)
+
+        # Dry-run composes on top as usual
+        git = DryRunGit(git)
+    """
+
+    def __init__(self, wrapped: Git, cache: GitReadCache) -> None:
+        """Create a caching wrapper around a Git implementation.
+
+        Args:
+            wrapped: The Git implementation to wrap
+            cache: Read cache (exposed on ErkContext for debug stats)
+        """
+        self._wrapped = wrapped
+        self._cache = cache
+
+    # Invalidation helpers
+
+    def _invalidate_worktrees(self) -> None:
+        self._cache.invalidate(_WORKTREE_OPERATIONS)
+        self._cache.invalidate(("get_branch_head",), lambda args: _moves_head(args[1]))
+
+    def _invalidate_branches(self, names: set[str]) -> None:
+        self._cache.invalidate(_BRANCH_LIST_OPERATIONS)
+        self._cache.invalidate(
+            ("get_branch_head",), lambda args: args[1] in names or _moves_head(args[1])
+        )
+        self._cache.invalidate(
+            ("get_branch_heads",),
+            lambda args: isinstance(args[1], frozenset) and not names.isdisjoint(args[1]),
+        )
+
+    def _invalidate_all_heads(self) -> None:
+        self._cache.invalidate(("get_branch_head", "get_branch_heads", "get_all_branch_sync_info"))
+
+    def _invalidate_remote(self, remote: str, branch: str) -> None:
+        self._cache.invalidate(_REMOTE_OPERATIONS)
+        self._cache.invalidate(
+            ("branch_exists_on_remote",), lambda args: args[1:] == (remote, branch)
+        )
+        remote_names = {f"{remote}/{branch}", f"refs/remotes/{remote}/{branch}"}
+        self._cache.invalidate(("get_branch_head",), lambda args: args[1] in remote_names)
+
+    def _invalidate_issues(self, branch: str) -> None:
+        self._cache.invalidate(("get_branch_issue",), lambda args: args[1] == branch)
+        self._cache.invalidate(("get_all_branch_issues",))
+
+    # Memoized read operations
+
+    def list_worktrees(self, repo_root: Path) -> list[WorktreeInfo]:
+        """List all worktrees (memoized)."""
+        return list(
+            self._cache.get_or_fetch(
+                "list_worktrees", (repo_root,), lambda: self._wrapped.list_worktrees(repo_root)
+            )
+        )
+
+    def get_current_branch(self, cwd: Path) -> str | None:
+        """Get current branch (memoized)."""
+        return self._cache.get_or_fetch(
+            "get_current_branch", (cwd,), lambda: self._wrapped.get_current_branch(cwd)
+        )
+
+    def detect_default_branch(self, repo_root: Path, configured: str | None = None) -> str:
+        """Detect default branch (memoized)."""
+        return self._cache.get_or_fetch(
+            "detect_default_branch",
+            (repo_root, configured),
+            lambda: self._wrapped.detect_default_branch(repo_root, configured),
+        )
+
+    def get_trunk_branch(self, repo_root: Path) -> str:
+        """Get trunk branch (memoized)."""
+        return self._cache.get_or_fetch(
+            "get_trunk_branch", (repo_root,), lambda: self._wrapped.get_trunk_branch(repo_root)
+        )
+
+    def list_local_branches(self, repo_root: Path) -> list[str]:
+        """List local branches (memoized)."""
+        return list(
+            self._cache.get_or_fetch(
+                "list_local_branches",
+                (repo_root,),
+                lambda: self._wrapped.list_local_branches(repo_root),
+            )
+        )
+
+    def list_remote_branches(self, repo_root: Path) -> list[str]:
+        """List remote branches (memoized)."""
+        return list(
+            self._cache.get_or_fetch(
+                "list_remote_branches",
+                (repo_root,),
+                lambda: self._wrapped.list_remote_branches(repo_root),
+            )
+        )
+
+    def get_git_common_dir(self, cwd: Path) -> Path | None:
+        """Get git common directory (memoized)."""
+        return self._cache.get_or_fetch(
+            "get_git_common_dir", (cwd,), lambda: self._wrapped.get_git_common_dir(cwd)
+        )
+
+    def is_branch_checked_out(self, repo_root: Path, branch: str) -> Path | None:
+        """Check if branch is checked out (memoized)."""
+        return self._cache.get_or_fetch(
+            "is_branch_checked_out",
+            (repo_root, branch),
+            lambda: self._wrapped.is_branch_checked_out(repo_root, branch),
+        )
+
+    def find_worktree_for_branch(self, repo_root: Path, branch: str) -> Path | None:
+        """Find worktree for branch (memoized)."""
+        return self._cache.get_or_fetch(
+            "find_worktree_for_branch",
+            (repo_root, branch),
+            lambda: self._wrapped.find_worktree_for_branch(repo_root, branch),
+        )
+
+    def get_branch_head(self, repo_root: Path, branch: str) -> str | None:
+        """Get branch head (memoized)."""
+        return self._cache.get_or_fetch(
+            "get_branch_head",
+            (repo_root, branch),
+            lambda: self._wrapped.get_branch_head(repo_root, branch),
+        )
+
+    def get_branch_heads(self, repo_root: Path, branches: list[str]) -> dict[str, str]:
+        """Get branch heads (memoized)."""
+        return dict(
+            self._cache.get_or_fetch(
+                "get_branch_heads",
+                (repo_root, frozenset(branches)),
+                lambda: self._wrapped.get_branch_heads(repo_root, branches),
+            )
+        )
+
+    def get_commit_message(self, repo_root: Path, commit_sha: str) -> str | None:
+        """Get commit message (memoized; commits are immutable)."""
+        return self._cache.get_or_fetch(
+            "get_commit_message",
+            (repo_root, commit_sha),
+            lambda: self._wrapped.get_commit_message(repo_root, commit_sha),
+        )
+
+    def get_all_branch_sync_info(self, repo_root: Path) -> dict[str, BranchSyncInfo]:
+        """Get all branch sync info (memoized)."""
+        return dict(
+            self._cache.get_or_fetch(
+                "get_all_branch_sync_info",
+                (repo_root,),
+                lambda: self._wrapped.get_all_branch_sync_info(repo_root),
+            )
+        )
+
+    def branch_exists_on_remote(self, repo_root: Path, remote: str, branch: str) -> bool:
+        """Check if branch exists on remote (memoized)."""
+        return self._cache.get_or_fetch(
+            "branch_exists_on_remote",
+            (repo_root, remote, branch),
+            lambda: self._wrapped.branch_exists_on_remote(repo_root, remote, branch),
+        )
+
+    def get_branch_issue(self, repo_root: Path, branch: str) -> int | None:
+        """Get branch issue (memoized)."""
+        return self._cache.get_or_fetch(
+            "get_branch_issue",
+            (repo_root, branch),
+            lambda: self._wrapped.get_branch_issue(repo_root, branch),
+        )
+
+    def get_all_branch_issues(self, repo_root: Path) -> dict[str, int]:
+        """Get all branch issues (memoized)."""
+        return dict(
+            self._cache.get_or_fetch(
+                "get_all_branch_issues",
+                (repo_root,),
+                lambda: self._wrapped.get_all_branch_issues(repo_root),
+            )
+        )
+
+    # Uncached reads: working-tree and filesystem state the command may change itself
+
+    def has_staged_changes(self, repo_root: Path) -> bool:
+        """Check for staged changes (not memoized)."""
+        return self._wrapped.has_staged_changes(repo_root)
+
+    def has_uncommitted_changes(self, cwd: Path) -> bool:
+        """Check for uncommitted changes (not memoized)."""
+        return self._wrapped.has_uncommitted_changes(cwd)
+
+    def is_worktree_clean(self, worktree_path: Path) -> bool:
+        """Check if worktree is clean (not memoized)."""
+        return self._wrapped.is_worktree_clean(worktree_path)
+
+    def get_file_status(self, cwd: Path) -> tuple[list[str], list[str], list[str]]:
+        """Get file status (not memoized)."""
+        return self._wrapped.get_file_status(cwd)
+
+    def get_ahead_behind(self, cwd: Path, branch: str) -> tuple[int, int]:
+        """Get ahead/behind counts (not memoized)."""
+        return self._wrapped.get_ahead_behind(cwd, branch)
+
+    def get_recent_commits(self, cwd: Path, *, limit: int = 5) -> list[dict[str, str]]:
+        """Get recent commits (not memoized)."""
+        return self._wrapped.get_recent_commits(cwd, limit=limit)
+
+    def path_exists(self, path: Path) -> bool:
+        """Check if path exists (not memoized)."""
+        return self._wrapped.path_exists(path)
+
+    def is_dir(self, path: Path) -> bool:
+        """Check if path is directory (not memoized)."""
+        return self._wrapped.is_dir(path)
+
+    def safe_chdir(self, path: Path) -> bool:
+        """Change directory (delegates to wrapped)."""
+        return self._wrapped.safe_chdir(path)
+
+    # Mutating operations: delegate, then invalidate what they change
+
+    def create_tracking_branch(self, repo_root: Path, branch: str, remote_ref: str) -> None:
+        """Create tracking branch and invalidate branch reads."""
+        self._wrapped.create_tracking_branch(repo_root, branch, remote_ref)
+        self._invalidate_branches({branch})
+
+    def add_worktree(
+        self,
+        repo_root: Path,
+        path: Path,
+        *,
+        branch: str | None,
+        ref: str | None,
+        create_branch: bool,
+    ) -> None:
+        """Add worktree and invalidate worktree (and new branch) reads."""
+        self._wrapped.add_worktree(
+            repo_root, path, branch=branch, ref=ref, create_branch=create_branch
+        )
+        self._invalidate_worktrees()
+        if create_branch and branch is not None:
+            self._invalidate_branches({branch})
+
+    def move_worktree(self, repo_root: Path, old_path: Path, new_path: Path) -> None:
+        """Move worktree and invalidate worktree reads."""
+        self._wrapped.move_worktree(repo_root, old_path, new_path)
+        self._invalidate_worktrees()
+
+    def remove_worktree(self, repo_root: Path, path: Path, *, force: bool) -> None:
+        """Remove worktree and invalidate worktree reads."""
+        self._wrapped.remove_worktree(repo_root, path, force=force)
+        self._invalidate_worktrees()
+
+    def prune_worktrees(self, repo_root: Path) -> None:
+        """Prune worktrees and invalidate worktree reads."""
+        self._wrapped.prune_worktrees(repo_root)
+        self._invalidate_worktrees()
+
+    def checkout_branch(self, cwd: Path, branch: str) -> None:
+        """Checkout branch and invalidate worktree reads."""
+        self._wrapped.checkout_branch(cwd, branch)
+        self._invalidate_worktrees()
+
+    def checkout_detached(self, cwd: Path, ref: str) -> None:
+        """Checkout detached HEAD and invalidate worktree reads."""
+        self._wrapped.checkout_detached(cwd, ref)
+        self._invalidate_worktrees()
+
+    def create_branch(self, cwd: Path, branch_name: str, start_point: str) -> None:
+        """Create branch and invalidate reads of that branch."""
+        self._wrapped.create_branch(cwd, branch_name, start_point)
+        self._invalidate_branches({branch_name})
+
+    def delete_branch(self, cwd: Path, branch_name: str, *, force: bool) -> None:
+        """Delete branch and invalidate reads of that branch and its config."""
+        self._wrapped.delete_branch(cwd, branch_name, force=force)
+        self._invalidate_branches({branch_name})
+        self._invalidate_issues(branch_name)
+
+    def delete_branch_with_graphite(self, repo_root: Path, branch: str, *, force: bool) -> None:
+        """Delete branch with graphite and invalidate reads of that branch."""
+        self._wrapped.delete_branch_with_graphite(repo_root, branch, force=force)
+        self._invalidate_branches({branch})
+        self._invalidate_issues(branch)
+
+    def fetch_branch(self, repo_root: Path, remote: str, branch: str) -> None:
+        """Fetch branch and invalidate its remote-tracking reads."""
+        self._wrapped.fetch_branch(repo_root, remote, branch)
+        self._invalidate_remote(remote, branch)
+
+    def pull_branch(self, repo_root: Path, remote: str, branch: str, *, ff_only: bool) -> None:
+        """Pull branch and invalidate head and remote-tracking reads."""
+        self._wrapped.pull_branch(repo_root, remote, branch, ff_only=ff_only)
+        # The branch checked out at repo_root moved; which one isn't known here
+        self._invalidate_all_heads()
+        self._invalidate_remote(remote, branch)
+
+    def set_branch_issue(self, repo_root: Path, branch: str, issue_number: int) -> None:
+        """Set branch issue and invalidate issue reads for that branch."""
+        self._wrapped.set_branch_issue(repo_root, branch, issue_number)
+        self._invalidate_issues(branch)
+
+    def fetch_pr_ref(self, repo_root: Path, remote: str, pr_number: int, local_branch: str) -> None:
+        """Fetch PR ref into a local branch and invalidate reads of that branch."""
+        self._wrapped.fetch_pr_ref(repo_root, remote, pr_number, local_branch)
+        self._invalidate_branches({local_branch})
+
+    def stage_files(self, cwd: Path, paths: list[str]) -> None:
+        """Stage files (affects only uncached working-tree reads)."""
+        self._wrapped.stage_files(cwd, paths)
+
+    def commit(self, cwd: Path, message: str) -> None:
+        """Commit and invalidate head reads."""
+        self._wrapped.commit(cwd, message)
+        self._invalidate_all_heads()
+
+    def push_to_remote(
+        self, cwd: Path, remote: str, branch: str, *, set_upstream: bool = False
+    ) -> None:
+        """Push and invalidate remote reads for the branch."""
+        self._wrapped.push_to_remote(cwd, remote, branch, set_upstream=set_upstream)
+        self._invalidate_remote(remote, branch)
@@ -169,6 +169,10 @@ class DryRunGit(Git):
         """Get branch head commit SHA (read-only, delegates to wrapped)."""
         return self._wrapped.get_branch_head(repo_root, branch)
 
+    def get_branch_heads(self, repo_root: Path, branches: list[str]) -> dict[str, str]:
+        """Get branch head commit SHAs (read-only, delegates to wrapped)."""
+        return self._wrapped.get_branch_heads(repo_root, branches)
+
     def get_commit_message(self, repo_root: Path, commit_sha: str) -> str | None:
         """Get commit message (read-only, delegates to wrapped)."""
         return self._wrapped.get_commit_message(repo_root, commit_sha)
@@ -213,6 +217,10 @@ class DryRunGit(Git):
         """Get branch issue (read-only, delegates to wrapped)."""
         return self._wrapped.get_branch_issue(repo_root, branch)
 
+    def get_all_branch_issues(self, repo_root: Path) -> dict[str, int]:
+        """Get all branch issues (read-only, delegates to wrapped)."""
+        return self._wrapped.get_all_branch_issues(repo_root)
+
     def fetch_pr_ref(self, repo_root: Path, remote: str, pr_number: int, local_branch: str) -> None:
         """No-op for fetching PR ref in dry-run mode."""
         # Do nothing - prevents actual fetch execution
@@ -375,6 +375,14 @@ class FakeGit(Git):
         """Get the commit SHA at the head of a branch."""
         return self._branch_heads.get(branch)
 
+    def get_branch_heads(self, repo_root: Path, branches: list[str]) -> dict[str, str]:
+        """Get commit SHAs for many branches at once."""
+        return {
+            branch: self._branch_heads[branch]
+            for branch in branches
+            if branch in self._branch_heads
+        }
+
     def get_commit_message(self, repo_root: Path, commit_sha: str) -> str | None:
         """Get the commit message for a given commit SHA."""
         return self._commit_messages.get(commit_sha)
@@ -613,6 +621,10 @@ class FakeGit(Git):
         """Get branch-issue association from fake storage."""
         return self._branch_issues.get(branch)
 
+    def get_all_branch_issues(self, repo_root: Path) -> dict[str, int]:
+        """Get all branch issue numbers."""
+        return self._branch_issues.copy()
+
     def fetch_pr_ref(self, repo_root: Path, remote: str, pr_number: int, local_branch: str) -> None:
         """Record PR ref fetch in fake storage (mutates internal state).
 
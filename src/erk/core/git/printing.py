@@ -187,6 +187,10 @@ class PrintingGit(PrintingBase, Git):
         """Get branch head (read-only, no printing)."""
         return self._wrapped.get_branch_head(repo_root, branch)
 
+    def get_branch_heads(self, repo_root: Path, branches: list[str]) -> dict[str, str]:
+        """Get branch heads (read-only, no printing)."""
+        return self._wrapped.get_branch_heads(repo_root, branches)
+
     def get_commit_message(self, repo_root: Path, commit_sha: str) -> str | None:
         """Get commit message (read-only, no printing)."""
         return self._wrapped.get_commit_message(repo_root, commit_sha)
@@ -204,6 +208,10 @@ class PrintingGit(PrintingBase, Git):
         """Get branch issue (read-only, no printing)."""
         return self._wrapped.get_branch_issue(repo_root, branch)
 
+    def get_all_branch_issues(self, repo_root: Path) -> dict[str, int]:
+        """Get all branch issues (read-only, no printing)."""
+        return self._wrapped.get_all_branch_issues(repo_root)
+
     def fetch_pr_ref(self, repo_root: Path, remote: str, pr_number: int, local_branch: str) -> None:
         """Fetch PR ref with printed output."""
         self._emit(self._format_command(f"git fetch {remote} pull/{pr_number}/head:{local_branch}"))
@@ -0,0 +1,329 @@
+"""Caching wrapper for GitHub operations."""
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from erk_shared.github.abc import GitHub
+from erk_shared.github.response_cache import (
+    CacheDataClass,
+    GitHubResponseCache,
+    decode_pull_request,
+    decode_workflow_run,
+    encode_pull_request,
+    encode_workflow_run,
+)
+from erk_shared.github.types import (
+    PRCheckoutInfo,
+    PRInfo,
+    PRMergeability,
+    PullRequestInfo,
+    WorkflowRun,
+)
+
+
+class CachingGitHub(GitHub):
+    """Wrapper that serves listing reads from a GitHubResponseCache.
+
+    Read operations used by `erk plan list`, `erk run list` and `erk status` are
+    looked up in the cache and stored on miss. Write operations delegate to the
+    wrapped implementation and then invalidate the affected data class.
+
+    Reads that guard a subsequent mutation (PR status, base branch, mergeability,
+    checkout info) and polling operations always go to the wrapped implementation.
+
+    Empty results are never stored: RealGitHub degrades to empty results when gh
+    is unavailable, and caching that would hide the recovery for a full TTL.
+
+    Usage:
+        cache = GitHubResponseCache(repo_dir / "cache" / "github", RealTime())
+        github = CachingGitHub(RealGitHub(time), cache)
+
+        # Dry-run composes on top as usual
+        github = DryRunGitHub(github)
+    """
+
+    def __init__(self, wrapped: GitHub, cache: GitHubResponseCache) -> None:
+        """Create a caching wrapper around a GitHub implementation.
+
+        Args:
+            wrapped: The GitHub implementation to wrap
+            cache: Response cache shared with the GitHubIssues wrapper
+        """
+        self._wrapped = wrapped
+        self._cache = cache
+
+    def _cached[T](
+        self,
+        data_class: CacheDataClass,
+        repo_root: Path,
+        operation: str,
+        params: dict[str, Any],
+        *,
+        fetch: Callable[[], T],
+        encode: Callable[[T], Any],
+        decode: Callable[[Any], T],
+    ) -> T:
+        entry = self._cache.get(data_class, repo_root, operation, params)
+        if entry is not None:
+            return decode(entry.payload)
+
+        result = fetch()
+        self._cache.put(data_class, repo_root, operation, params, encode(result))
+        return result
+
+    # Cached read operations
+
+    def get_prs_for_repo(
+        self, repo_root: Path, *, include_checks: bool
+    ) -> dict[str, PullRequestInfo]:
+        """Get PRs for repository, served from cache when fresh."""
+        return self._cached(
+            "pr_state",
+            repo_root,
+            "get_prs_for_repo",
+            {"include_checks": include_checks},
+            fetch=lambda: self._wrapped.get_prs_for_repo(repo_root, include_checks=include_checks),
+            encode=_encode_prs_by_branch,
+            decode=_decode_prs_by_branch,
+        )
+
+    def fetch_pr_titles_batch(
+        self, prs: dict[str, PullRequestInfo], repo_root: Path
+    ) -> dict[str, PullRequestInfo]:
+        """Fetch PR titles, served from cache when fresh."""
+        return self._cached(
+            "pr_state",
+            repo_root,
+            "fetch_pr_titles_batch",
+            _batch_params(prs),
+            fetch=lambda: self._wrapped.fetch_pr_titles_batch(prs, repo_root),
+            encode=_encode_prs_by_branch,
+            decode=_decode_prs_by_branch,
+        )
+
+    def enrich_prs_with_ci_status_batch(
+        self, prs: dict[str, PullRequestInfo], repo_root: Path
+    ) -> dict[str, PullRequestInfo]:
+        """Enrich PRs with CI status, served from cache when fresh."""
+        return self._cached(
+            "pr_state",
+            repo_root,
+            "enrich_prs_with_ci_status_batch",
+            _batch_params(prs),
+            fetch=lambda: self._wrapped.enrich_prs_with_ci_status_batch(prs, repo_root),
+            encode=_encode_prs_by_branch,
+            decode=_decode_prs_by_branch,
+        )
+
+    def get_prs_linked_to_issues(
+        self, repo_root: Path, issue_numbers: list[int]
+    ) -> dict[int, list[PullRequestInfo]]:
+        """Get PRs linked to issues, served from cache when fresh."""
+        return self._cached(
+            "pr_state",
+            repo_root,
+            "get_prs_linked_to_issues",
+            {"issue_numbers": sorted(issue_numbers)},
+            fetch=lambda: self._wrapped.get_prs_linked_to_issues(repo_root, issue_numbers),
+            encode=lambda linkages: {
+                str(number): [encode_pull_request(pr) for pr in prs]
+                for number, prs in linkages.items()
+            },
+            decode=lambda data: {
+                int(number): [decode_pull_request(pr) for pr in prs] for number, prs in data.items()
+            },
+        )
+
+    def list_workflow_runs(
+        self, repo_root: Path, workflow: str, limit: int = 50
+    ) -> list[WorkflowRun]:
+        """List workflow runs, served from cache when fresh."""
+        return self._cached(
+            "workflow_runs",
+            repo_root,
+            "list_workflow_runs",
+            {"workflow": workflow, "limit": limit},
+            fetch=lambda: self._wrapped.list_workflow_runs(repo_root, workflow, limit),
+            encode=lambda runs: [encode_workflow_run(run) for run in runs],
+            decode=lambda data: [decode_workflow_run(run) for run in data],
+        )
+
+    def get_workflow_run(self, repo_root: Path, run_id: str) -> WorkflowRun | None:
+        """Get workflow run, served from cache when fresh."""
+        return self._cached(
+            "workflow_runs",
+            repo_root,
+            "get_workflow_run",
+            {"run_id": run_id},
+            fetch=lambda: self._wrapped.get_workflow_run(repo_root, run_id),
+            encode=lambda run: encode_workflow_run(run) if run is not None else None,
+            decode=decode_workflow_run,
+        )
+
+    def get_workflow_runs_by_branches(
+        self, repo_root: Path, workflow: str, branches: list[str]
+    ) -> dict[str, WorkflowRun | None]:
+        """Get workflow runs by branches, served from cache when fresh."""
+        return self._cached(
+            "workflow_runs",
+            repo_root,
+            "get_workflow_runs_by_branches",
+            {"workflow": workflow, "branches": sorted(branches)},
+            fetch=lambda: self._wrapped.get_workflow_runs_by_branches(
+                repo_root, workflow, branches
+            ),
+            encode=_encode_runs_by_key,
+            decode=_decode_runs_by_key,
+        )
+
+    def get_workflow_runs_batch(
+        self, repo_root: Path, run_ids: list[str]
+    ) -> dict[str, WorkflowRun | None]:
+        """Get workflow runs by ID, fetching only the runs missing from the cache.
+
+        Runs are cached individually (sharing entries with get_workflow_run) so
+        adding one plan to a list doesn't invalidate every other plan's run.
+        """
+        if not run_ids:
+            return {}
+
+        result: dict[str, WorkflowRun | None] = {}
+        missing: list[str] = []
+        for run_id in run_ids:
+            entry = self._cache.get(
+                "workflow_runs", repo_root, "get_workflow_run", {"run_id": run_id}
+            )
+            if entry is not None:
+                result[run_id] = decode_workflow_run(entry.payload)
+            else:
+                missing.append(run_id)
+
+        if missing:
+            fetched = self._wrapped.get_workflow_runs_batch(repo_root, missing)
+            for run_id, run in fetched.items():
+                result[run_id] = run
+                if run is not None:
+                    self._cache.put(
+                        "workflow_runs",
+                        repo_root,
+                        "get_workflow_run",
+                        {"run_id": run_id},
+                        encode_workflow_run(run),
+                    )
+
+        return result
+
+    # Uncached read operations
+
+    def get_pr_status(self, repo_root: Path, branch: str, *, debug: bool) -> PRInfo:
+        """Get PR status for branch (guards submit and navigation, never cached)."""
+        return self._wrapped.get_pr_status(repo_root, branch, debug=debug)
+
+    def get_pr_base_branch(self, repo_root: Path, pr_number: int) -> str | None:
+        """Get PR base branch (guards mutations, never cached)."""
+        return self._wrapped.get_pr_base_branch(repo_root, pr_number)
+
+    def get_pr_mergeability(self, repo_root: Path, pr_number: int) -> PRMergeability | None:
+        """Get PR mergeability (guards mutations, never cached)."""
+        return self._wrapped.get_pr_mergeability(repo_root, pr_number)
+
+    def find_workflow_run(self, repo_root: Path, run_id: str) -> WorkflowRun | None:
+        """Look up workflow run (decides whether a watched run exists, never cached)."""
+        return self._wrapped.find_workflow_run(repo_root, run_id)
+
+    def get_run_logs(self, repo_root: Path, run_id: str) -> str:
+        """Get run logs (large and rarely repeated, never cached)."""
+        return self._wrapped.get_run_logs(repo_root, run_id)
+
+    def poll_for_workflow_run(
+        self,
+        repo_root: Path,
+        workflow: str,
+        branch_name: str,
+        timeout: int = 30,
+        poll_interval: int = 2,
+    ) -> str | None:
+        """Poll for workflow run (polling must observe live state, never cached)."""
+        return self._wrapped.poll_for_workflow_run(
+            repo_root, workflow, branch_name, timeout, poll_interval
+        )
+
+    def get_pr_checkout_info(self, repo_root: Path, pr_number: int) -> PRCheckoutInfo | None:
+        """Get PR checkout info (guards checkout, never cached)."""
+        return self._wrapped.get_pr_checkout_info(repo_root, pr_number)
+
+    def check_auth_status(self) -> tuple[bool, str | None, str | None]:
+        """Check auth status (not repository data, never cached)."""
+        return self._wrapped.check_auth_status()
+
+    # Write operations: delegate, then invalidate the affected data class
+
+    def update_pr_base_branch(self, repo_root: Path, pr_number: int, new_base: str) -> None:
+        """Update PR base branch and invalidate cached PR state."""
+        self._wrapped.update_pr_base_branch(repo_root, pr_number, new_base)
+        self._cache.invalidate("pr_state")
+
+    def update_pr_body(self, repo_root: Path, pr_number: int, body: str) -> None:
+        """Update PR body and invalidate cached PR state."""
+        self._wrapped.update_pr_body(repo_root, pr_number, body)
+        self._cache.invalidate("pr_state")
+
+    def merge_pr(
+        self,
+        repo_root: Path,
+        pr_number: int,
+        *,
+        squash: bool = True,
+        verbose: bool = False,
+    ) -> None:
+        """Merge PR and invalidate cached PR state."""
+        self._wrapped.merge_pr(repo_root, pr_number, squash=squash, verbose=verbose)
+        self._cache.invalidate("pr_state")
+
+    def trigger_workflow(
+        self,
+        repo_root: Path,
+        workflow: str,
+        inputs: dict[str, str],
+        ref: str | None = None,
+    ) -> str:
+        """Trigger workflow and invalidate cached workflow runs."""
+        run_id = self._wrapped.trigger_workflow(repo_root, workflow, inputs, ref)
+        self._cache.invalidate("workflow_runs")
+        return run_id
+
+    def create_pr(
+        self,
+        repo_root: Path,
+        branch: str,
+        title: str,
+        body: str,
+        base: str | None = None,
+        *,
+        draft: bool = False,
+    ) -> int:
+        """Create PR and invalidate cached PR state."""
+        pr_number = self._wrapped.create_pr(repo_root, branch, title, body, base, draft=draft)
+        self._cache.invalidate("pr_state")
+        return pr_number
+
+
+def _batch_params(prs: dict[str, PullRequestInfo]) -> dict[str, Any]:
+    return {"prs": sorted([branch, pr.number] for branch, pr in prs.items())}
+
+
+def _encode_prs_by_branch(prs: dict[str, PullRequestInfo]) -> dict[str, Any]:
+    return {branch: encode_pull_request(pr) for branch, pr in prs.items()}
+
+
+def _decode_prs_by_branch(data: dict[str, Any]) -> dict[str, PullRequestInfo]:
+    return {branch: decode_pull_request(pr) for branch, pr in data.items()}
+
+
+def _encode_runs_by_key(runs: dict[str, WorkflowRun | None]) -> dict[str, Any]:
+    return {key: encode_workflow_run(run) if run is not None else None for key, run in runs.items()}
+
+
+def _decode_runs_by_key(data: dict[str, Any]) -> dict[str, WorkflowRun | None]:
+    return {key: decode_workflow_run(run) if run is not None else None for key, run in data.items()}
@@ -125,6 +125,10 @@ class DryRunGitHub(GitHub):
         """Delegate read operation to wrapped implementation."""
         return self._wrapped.get_workflow_run(repo_root, run_id)
 
+    def find_workflow_run(self, repo_root: Path, run_id: str) -> WorkflowRun | None:
+        """Delegate read operation to wrapped implementation."""
+        return self._wrapped.find_workflow_run(repo_root, run_id)
+
     def get_run_logs(self, repo_root: Path, run_id: str) -> str:
         """Delegate read operation to wrapped implementation."""
         return self._wrapped.get_run_logs(repo_root, run_id)
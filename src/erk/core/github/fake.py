@@ -303,6 +303,13 @@ class FakeGitHub(GitHub):
                 return run
         return None
 
+    def find_workflow_run(self, repo_root: Path, run_id: str) -> WorkflowRun | None:
+        """Look up a workflow run by ID (returns pre-configured data).
+
+        The fake's lookups never fail, so this matches get_workflow_run.
+        """
+        return self.get_workflow_run(repo_root, run_id)
+
     def get_run_logs(self, repo_root: Path, run_id: str) -> str:
         """Return pre-configured log string for run_id.
 
@@ -0,0 +1,337 @@
+"""GitHub operations over the GitHub HTTP API."""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from erk_shared.github.http_client import GitHubHttpClient, GitHubHttpError
+from erk_shared.github.rate_budget import GitHubRateBudget
+from erk_shared.github.repo_identity import RepoIdentityResolver
+from erk_shared.github.types import PRCheckoutInfo, PRInfo, PRMergeability, PRState, WorkflowRun
+from erk_shared.integrations.parallel.abc import ParallelTaskRunner
+from erk_shared.integrations.time.abc import Time
+from erk_shared.output.output import user_output
+
+from erk.cli.debug import debug_log
+from erk.core.github.real import RealGitHub
+
+
+class HttpGitHub(RealGitHub):
+    """GitHub operations over pooled keep-alive HTTP instead of one gh process per call.
+
+    Selected with `github_backend = "http"` in ~/.erk/config.toml. Operations on
+    the `erk submit` / plan listing hot paths are sent as REST or GraphQL requests
+    on a shared GitHubHttpClient. The remaining operations (PR listing with check
+    rollups, run logs, branch-based run polling) are inherited from RealGitHub and
+    still use gh.
+
+    Failures raise GitHubHttpError (a RuntimeError), so the error boundaries and
+    degraded return values match RealGitHub exactly.
+    """
+
+    def __init__(
+        self,
+        time: Time,
+        client: GitHubHttpClient,
+        identity_resolver: RepoIdentityResolver,
+        runner: ParallelTaskRunner | None = None,
+        budget: GitHubRateBudget | None = None,
+    ) -> None:
+        """Initialize HttpGitHub.
+
+        Args:
+            time: Time abstraction for sleep operations
+            client: HTTP client shared with the GitHubIssues implementation
+            identity_resolver: Source of the repository owner/name for API paths
+            runner: Worker pool for calls that are fanned out per item
+            budget: Rate-limit budget shared with the client
+        """
+        super().__init__(time, identity_resolver, runner, budget)
+        self._client = client
+        self._default_branches: dict[Path, str] = {}
+
+    def _repo_path(self, repo_root: Path) -> str:
+        identity = self._identity_resolver.resolve(repo_root)
+        return f"/repos/{identity.owner}/{identity.name}"
+
+    def _get_default_branch(self, repo_root: Path) -> str:
+        """Get the repository default branch (what gh uses when no base/ref is given).
+
+        Raises:
+            GitHubHttpError: If the request fails or the response has no default branch
+        """
+        if repo_root in self._default_branches:
+            return self._default_branches[repo_root]
+
+        data = self._client.request("GET", self._repo_path(repo_root))
+        default_branch = data.get("default_branch")
+        if not isinstance(default_branch, str) or not default_branch:
+            msg = f"GitHub returned no default branch for {self._repo_path(repo_root)}"
+            raise GitHubHttpError(msg, status=None)
+        self._default_branches[repo_root] = default_branch
+        return default_branch
+
+    def _send_graphql(self, query: str, repo_root: Path) -> dict[str, Any]:
+        """Send a GraphQL query over the shared HTTP connection."""
+        return self._client.graphql(query)
+
+    def get_pr_status(self, repo_root: Path, branch: str, *, debug: bool) -> PRInfo:
+        """Get PR status for a specific branch via the REST API."""
+        identity_path = self._repo_path(repo_root)
+        owner = self._identity_resolver.resolve(repo_root).owner
+        if debug:
+            user_output(f"GET {identity_path}/pulls?head={owner}:{branch}&state=all")
+
+        # Error boundary: match RealGitHub, which degrades to NONE on any failure
+        try:
+            data = self._client.request(
+                "GET",
+                f"{identity_path}/pulls",
+                query={"head": f"{owner}:{branch}", "state": "all", "per_page": 1},
+            )
+        except GitHubHttpError:
+            return PRInfo("NONE", None, None)
+
+        if not data:
+            return PRInfo("NONE", None, None)
+        pr = data[0]
+        return PRInfo(_rest_pr_state(pr), pr["number"], pr["title"])
+
+    def get_pr_base_branch(self, repo_root: Path, pr_number: int) -> str | None:
+        """Get current base branch of a PR via the REST API."""
+        # Error boundary: match RealGitHub, which returns None on any failure
+        try:
+            data = self._client.request("GET", f"{self._repo_path(repo_root)}/pulls/{pr_number}")
+        except GitHubHttpError:
+            return None
+        return data["base"]["ref"]
+
+    def update_pr_base_branch(self, repo_root: Path, pr_number: int, new_base: str) -> None:
+        """Update base branch of a PR via the REST API.
+
+        Failures are skipped, matching RealGitHub; callers validate preconditions.
+        """
+        # Error boundary: graceful degradation, see RealGitHub.update_pr_base_branch
+        try:
+            self._client.request(
+                "PATCH",
+                f"{self._repo_path(repo_root)}/pulls/{pr_number}",
+                body={"base": new_base},
+            )
+        except GitHubHttpError:
+            pass
+
+    def update_pr_body(self, repo_root: Path, pr_number: int, body: str) -> None:
+        """Update body of a PR via the REST API.
+
+        Failures are skipped, matching RealGitHub; callers validate preconditions.
+        """
+        # Error boundary: graceful degradation, see RealGitHub.update_pr_body
+        try:
+            self._client.request(
+                "PATCH",
+                f"{self._repo_path(repo_root)}/pulls/{pr_number}",
+                body={"body": body},
+            )
+        except GitHubHttpError:
+            pass
+
+    def get_pr_mergeability(self, repo_root: Path, pr_number: int) -> PRMergeability | None:
+        """Get PR mergeability via the REST API, in gh's GraphQL vocabulary."""
+        # Error boundary: match RealGitHub, which returns None on any failure
+        try:
+            data = self._client.request("GET", f"{self._repo_path(repo_root)}/pulls/{pr_number}")
+        except GitHubHttpError:
+            return None
+
+        mergeable = data.get("mergeable")
+        if mergeable is True:
+            mergeable_str = "MERGEABLE"
+        elif mergeable is False:
+            mergeable_str = "CONFLICTING"
+        else:
+            mergeable_str = "UNKNOWN"
+        merge_state = data.get("mergeable_state") or "unknown"
+        return PRMergeability(mergeable=mergeable_str, merge_state_status=merge_state.upper())
+
+    def get_pr_checkout_info(self, repo_root: Path, pr_number: int) -> PRCheckoutInfo | None:
+        """Get PR details needed for checkout via the REST API."""
+        # Error boundary: match RealGitHub, which returns None on any failure
+        try:
+            data = self._client.request("GET", f"{self._repo_path(repo_root)}/pulls/{pr_number}")
+        except GitHubHttpError:
+            return None
+
+        head_repo = data["head"].get("repo")
+        base_repo = data["base"].get("repo")
+        # A deleted fork has no head repo; treat it as cross-repository
+        is_cross_repository = (
+            head_repo is None
+            or base_repo is None
+            or head_repo["full_name"] != base_repo["full_name"]
+        )
+        return PRCheckoutInfo(
+            number=data["number"],
+            head_ref_name=data["head"]["ref"],
+            is_cross_repository=is_cross_repository,
+            state=_rest_pr_state(data),
+        )
+
+    def merge_pr(
+        self,
+        repo_root: Path,
+        pr_number: int,
+        *,
+        squash: bool = True,
+        verbose: bool = False,
+    ) -> None:
+        """Merge a pull request via the REST API."""
+        data = self._client.request(
+            "PUT",
+            f"{self._repo_path(repo_root)}/pulls/{pr_number}/merge",
+            body={"merge_method": "squash" if squash else "merge"},
+        )
+        if verbose and data and data.get("message"):
+            user_output(data["message"])
+
+    def create_pr(
+        self,
+        repo_root: Path,
+        branch: str,
+        title: str,
+        body: str,
+        base: str | None = None,
+        *,
+        draft: bool = False,
+    ) -> int:
+        """Create a pull request via the REST API.
+
+        Returns:
+            PR number
+        """
+        data = self._client.request(
+            "POST",
+            f"{self._repo_path(repo_root)}/pulls",
+            body={
+                "head": branch,
+                "base": base if base is not None else self._get_default_branch(repo_root),
+                "title": title,
+                "body": body,
+                "draft": draft,
+            },
+        )
+        return data["number"]
+
+    def _dispatch_workflow(
+        self,
+        repo_root: Path,
+        workflow: str,
+        inputs: dict[str, str],
+        ref: str | None,
+    ) -> None:
+        """Dispatch a workflow run via the REST API."""
+        dispatch_ref = ref if ref else self._get_default_branch(repo_root)
+        debug_log(f"trigger_workflow: POST dispatches for {workflow} at {dispatch_ref}")
+        self._client.request(
+            "POST",
+            f"{self._repo_path(repo_root)}/actions/workflows/{workflow}/dispatches",
+            body={"ref": dispatch_ref, "inputs": inputs},
+        )
+
+    def _list_recent_dispatch_runs(self, repo_root: Path, workflow: str) -> list[dict[str, Any]]:
+        """List the 10 most recent runs of a workflow, shaped like gh run list output."""
+        runs = self._fetch_workflow_runs(repo_root, workflow, limit=10)
+        return [
+            {
+                "databaseId": run["id"],
+                "status": run["status"],
+                "conclusion": run.get("conclusion"),
+                "displayTitle": run.get("display_title", ""),
+            }
+            for run in runs
+        ]
+
+    def _fetch_workflow_runs(
+        self, repo_root: Path, workflow: str, *, limit: int
+    ) -> list[dict[str, Any]]:
+        data = self._client.request(
+            "GET",
+            f"{self._repo_path(repo_root)}/actions/workflows/{workflow}/runs",
+            query={"per_page": min(limit, 100)},
+        )
+        return data["workflow_runs"][:limit]
+
+    def list_workflow_runs(
+        self, repo_root: Path, workflow: str, limit: int = 50
+    ) -> list[WorkflowRun]:
+        """List workflow runs for a specific workflow via the REST API."""
+        # Error boundary: match RealGitHub, which returns [] on any failure
+        try:
+            runs = self._fetch_workflow_runs(repo_root, workflow, limit=limit)
+        except GitHubHttpError:
+            return []
+        return [_parse_rest_workflow_run(run) for run in runs]
+
+    def get_workflow_run(self, repo_root: Path, run_id: str) -> WorkflowRun | None:
+        """Get details for a specific workflow run via the REST API."""
+        # Error boundary: match RealGitHub, which returns None on any failure (e.g. 404)
+        try:
+            data = self._client.request(
+                "GET", f"{self._repo_path(repo_root)}/actions/runs/{run_id}"
+            )
+        except GitHubHttpError:
+            return None
+        return _parse_rest_workflow_run(data)
+
+    def find_workflow_run(self, repo_root: Path, run_id: str) -> WorkflowRun | None:
+        """Look up a workflow run via the REST API; None only on HTTP 404."""
+        # Error boundary: only the response status tells a missing run apart
+        try:
+            data = self._client.request(
+                "GET", f"{self._repo_path(repo_root)}/actions/runs/{run_id}"
+            )
+        except GitHubHttpError as e:
+            if e.status == 404:
+                return None
+            raise
+        return _parse_rest_workflow_run(data)
+
+    def check_auth_status(self) -> tuple[bool, str | None, str | None]:
+        """Check authentication by asking the API who the token belongs to.
+
+        Returns:
+            Tuple of (is_authenticated, username, hostname)
+        """
+        # Error boundary: an invalid or expired token is only detectable by asking
+        try:
+            data = self._client.request("GET", "/user")
+        except GitHubHttpError:
+            return (False, None, None)
+        return (True, data["login"], "github.com")
+
+
+def _rest_pr_state(pr: dict[str, Any]) -> PRState:
+    """Map a REST pull request to gh's state vocabulary (OPEN, CLOSED, MERGED)."""
+    if pr.get("merged_at"):
+        return "MERGED"
+    if pr["state"] == "open":
+        return "OPEN"
+    return "CLOSED"
+
+
+def _parse_rest_workflow_run(run: dict[str, Any]) -> WorkflowRun:
+    """Convert a REST API workflow run object into WorkflowRun."""
+    created_at = None
+    created_at_str = run.get("created_at")
+    if created_at_str:
+        created_at = datetime.fromisoformat(created_at_str.replace("Z", "+00:00"))
+
+    return WorkflowRun(
+        run_id=str(run["id"]),
+        status=run["status"],
+        conclusion=run.get("conclusion"),
+        branch=run["head_branch"],
+        head_sha=run["head_sha"],
+        display_title=run.get("display_title"),
+        created_at=created_at,
+    )
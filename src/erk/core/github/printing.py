@@ -73,6 +73,10 @@ class PrintingGitHub(PrintingBase, GitHub):
         """Get workflow run details (read-only, no printing)."""
         return self._wrapped.get_workflow_run(repo_root, run_id)
 
+    def find_workflow_run(self, repo_root: Path, run_id: str) -> WorkflowRun | None:
+        """Look up workflow run (read-only, no printing)."""
+        return self._wrapped.find_workflow_run(repo_root, run_id)
+
     def get_run_logs(self, repo_root: Path, run_id: str) -> str:
         """Get run logs (read-only, no printing)."""
         return self._wrapped.get_run_logs(repo_root, run_id)
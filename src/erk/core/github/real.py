@@ -3,32 +3,62 @@
 import json
 import secrets
 import string
+from collections.abc import Callable
 from dataclasses import replace
 from datetime import UTC, datetime, timedelta
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 from erk_shared.github.abc import GitHub
+from erk_shared.github.graphql_batch import NestedConnection, run_graphql_batch
 from erk_shared.github.parsing import (
     _determine_checks_status,
+    closing_prs_timeline_selection,
     execute_gh_command,
+    parse_closing_prs,
     parse_gh_auth_status_output,
     parse_github_pr_list,
     parse_github_pr_status,
 )
+from erk_shared.github.rate_budget import GitHubRateBudget
+from erk_shared.github.repo_identity import RepoIdentityResolver
 from erk_shared.github.types import (
     PRCheckoutInfo,
     PRInfo,
     PRMergeability,
     PullRequestInfo,
+    RepoIdentity,
     WorkflowRun,
 )
+from erk_shared.integrations.parallel.abc import ParallelTaskRunner
+from erk_shared.integrations.parallel.real import RealParallelTaskRunner
 from erk_shared.integrations.time.abc import Time
 from erk_shared.output.output import user_output
 from erk_shared.subprocess_utils import run_subprocess_with_context
 
 from erk.cli.debug import debug_log
 
+# Deadline for each `gh run view` call of get_workflow_runs_batch()
+_WORKFLOW_RUN_TIMEOUT_SECONDS = 30.0
+
+# Aliased items per GraphQL query, sized to stay well inside GitHub's node
+# limits given the nested connections each item selects
+_CI_STATUS_CHUNK_SIZE = 50
+_TITLE_CHUNK_SIZE = 100
+_ISSUE_LINKAGE_CHUNK_SIZE = 50
+
+# Check contexts of a commit, shared by the CI status query and its later pages
+_CHECK_CONTEXT_FRAGMENT = """fragment CheckContextFields on StatusCheckRollupContext {
+  ... on StatusContext {
+    state
+  }
+  ... on CheckRun {
+    status
+    conclusion
+  }
+}"""
+
 
 class RealGitHub(GitHub):
     """Production implementation using gh CLI.
@@ -36,13 +66,45 @@ class RealGitHub(GitHub):
     All GitHub operations execute actual gh commands via subprocess.
     """
 
-    def __init__(self, time: Time):
+    def __init__(
+        self,
+        time: Time,
+        identity_resolver: RepoIdentityResolver | None = None,
+        runner: ParallelTaskRunner | None = None,
+        budget: GitHubRateBudget | None = None,
+    ):
         """Initialize RealGitHub.
 
         Args:
             time: Time abstraction for sleep operations
+            identity_resolver: Source of the repository owner/name for GraphQL
+                queries. If None, it is resolved via gh on first use.
+            runner: Worker pool for calls that are fanned out per item. If None,
+                a private pool is created.
+            budget: Rate-limit budget that GraphQL queries are recorded in and
+                batch queries are throttled by. If None, a private budget is used.
         """
         self._time = time
+        if identity_resolver is None:
+            identity_resolver = RepoIdentityResolver(identity=None, cache_path=None)
+        self._identity_resolver = identity_resolver
+        if runner is None:
+            runner = RealParallelTaskRunner(time=time)
+        self._runner = runner
+        if budget is None:
+            budget = GitHubRateBudget(time)
+        self._budget = budget
+
+    def _identity_for_prs(self, prs: dict[str, PullRequestInfo]) -> RepoIdentity:
+        """Get the repository identity for a batch query over known PRs.
+
+        Falls back to the owner/repo parsed from the first PR's URL when the
+        identity isn't known, which avoids a gh lookup.
+        """
+        if self._identity_resolver.identity is not None:
+            return self._identity_resolver.identity
+        first_pr = next(iter(prs.values()))
+        return RepoIdentity(owner=first_pr.owner, name=first_pr.repo)
 
     def get_prs_for_repo(
         self, repo_root: Path, *, include_checks: bool
@@ -199,19 +261,19 @@ class RealGitHub(GitHub):
         ):
             return None
 
-    def _build_batch_pr_query(self, pr_numbers: list[int], owner: str, repo: str) -> str:
+    def _build_batch_pr_query(self, pr_numbers: list[int], identity: RepoIdentity) -> str:
         """Build GraphQL query with aliases for multiple PRs using named fragments.
 
         Args:
             pr_numbers: List of PR numbers to query
-            owner: Repository owner
-            repo: Repository name
+            identity: Repository owner/name
 
         Returns:
             GraphQL query string
         """
         # Define the fragment once at the top of the query
-        fragment_definition = """fragment PRCICheckFields on PullRequest {
+        fragment_definition = (
+            """fragment PRCICheckFields on PullRequest {
   number
   title
   mergeable
@@ -222,21 +284,23 @@ class RealGitHub(GitHub):
         statusCheckRollup {
           state
           contexts(last: 100) {
+            pageInfo {
+              hasPreviousPage
+              startCursor
+            }
             nodes {
-              ... on StatusContext {
-                state
-              }
-              ... on CheckRun {
-                status
-                conclusion
-              }
+              ...CheckContextFields
             }
           }
         }
       }
     }
   }
-}"""
+}
+
+"""
+            + _CHECK_CONTEXT_FRAGMENT
+        )
 
         # Build aliased PR queries using the fragment spread
         pr_queries = []
@@ -250,14 +314,14 @@ class RealGitHub(GitHub):
         query = f"""{fragment_definition}
 
 query {{
-  repository(owner: "{owner}", name: "{repo}") {{
+  repository(owner: "{identity.owner}", name: "{identity.name}") {{
 {chr(10).join(pr_queries)}
   }}
 }}"""
         return query
 
     def _execute_batch_pr_query(self, query: str, repo_root: Path) -> dict[str, Any]:
-        """Execute batched GraphQL query via gh CLI.
+        """Execute batched GraphQL query, recording its cost in the rate-limit budget.
 
         Args:
             query: GraphQL query string
@@ -266,6 +330,10 @@ query {{
         Returns:
             Parsed JSON response
         """
+        return self._budget.run_graphql(query, lambda q: self._send_graphql(q, repo_root))
+
+    def _send_graphql(self, query: str, repo_root: Path) -> dict[str, Any]:
+        """Send a GraphQL query via gh CLI and parse the response."""
         cmd = ["gh", "api", "graphql", "-f", f"query={query}"]
         stdout = execute_gh_command(cmd, repo_root)
         return json.loads(stdout)
@@ -349,25 +417,34 @@ query {{
     ) -> dict[str, PullRequestInfo]:
         """Enrich PR information with CI check status and mergeability using batched GraphQL query.
 
-        Fetches both CI status and mergeability for all PRs in a single GraphQL API call,
-        dramatically improving performance over serial fetching.
+        Fetches both CI status and mergeability with aliased GraphQL queries of
+        up to 50 PRs each, run concurrently, dramatically improving performance
+        over serial fetching. PRs with more than 100 check contexts get their
+        remaining contexts from follow-up queries.
         """
         # Early exit for empty input
         if not prs:
             return {}
 
-        # Extract PR numbers and owner/repo from first PR
         pr_numbers = [pr.number for pr in prs.values()]
-        first_pr = next(iter(prs.values()))
-        owner = first_pr.owner
-        repo = first_pr.repo
-
-        # Build and execute batched GraphQL query
-        query = self._build_batch_pr_query(pr_numbers, owner, repo)
-        response = self._execute_batch_pr_query(query, repo_root)
-
-        # Extract repository data from response
-        repo_data = response["data"]["repository"]
+        identity = self._identity_for_prs(prs)
+
+        # Query in chunks, following check contexts past their last 100
+        repo_data = run_graphql_batch(
+            pr_numbers,
+            lambda chunk: self._build_batch_pr_query(chunk, identity),
+            lambda query: self._execute_batch_pr_query(query, repo_root),
+            runner=self._runner,
+            chunk_size=_CI_STATUS_CHUNK_SIZE,
+            budget=self._budget,
+            nested=NestedConnection(
+                path=("commits", "nodes", 0, "commit", "statusCheckRollup", "contexts"),
+                build_page_query=lambda cursors: _build_check_contexts_page_query(
+                    cursors, identity
+                ),
+                backward=True,
+            ),
+        )
 
         # Enrich each PR with CI status and mergeability
         enriched_prs = {}
@@ -396,7 +473,7 @@ query {{
     def fetch_pr_titles_batch(
         self, prs: dict[str, PullRequestInfo], repo_root: Path
     ) -> dict[str, PullRequestInfo]:
-        """Fetch PR titles for all PRs in a single batched GraphQL query.
+        """Fetch PR titles for all PRs with batched GraphQL queries.
 
         This is a lighter-weight alternative to enrich_prs_with_ci_status_batch
         that only fetches titles, not CI status or mergeability.
@@ -412,18 +489,18 @@ query {{
         if not prs:
             return {}
 
-        # Extract PR numbers and owner/repo from first PR
         pr_numbers = [pr.number for pr in prs.values()]
-        first_pr = next(iter(prs.values()))
-        owner = first_pr.owner
-        repo = first_pr.repo
-
-        # Build simplified GraphQL query for just titles
-        query = self._build_title_batch_query(pr_numbers, owner, repo)
-        response = self._execute_batch_pr_query(query, repo_root)
-
-        # Extract repository data from response
-        repo_data = response["data"]["repository"]
+        identity = self._identity_for_prs(prs)
+
+        # Build simplified GraphQL queries for just titles
+        repo_data = run_graphql_batch(
+            pr_numbers,
+            lambda chunk: self._build_title_batch_query(chunk, identity),
+            lambda query: self._execute_batch_pr_query(query, repo_root),
+            runner=self._runner,
+            chunk_size=_TITLE_CHUNK_SIZE,
+            budget=self._budget,
+        )
 
         # Enrich each PR with title
         enriched_prs = {}
@@ -441,13 +518,12 @@ query {{
 
         return enriched_prs
 
-    def _build_title_batch_query(self, pr_numbers: list[int], owner: str, repo: str) -> str:
+    def _build_title_batch_query(self, pr_numbers: list[int], identity: RepoIdentity) -> str:
         """Build GraphQL query to fetch just titles for multiple PRs.
 
         Args:
             pr_numbers: List of PR numbers to query
-            owner: Repository owner
-            repo: Repository name
+            identity: Repository owner/name
 
         Returns:
             GraphQL query string
@@ -463,7 +539,7 @@ query {{
 
         # Combine into single query
         query = f"""query {{
-  repository(owner: "{owner}", name: "{repo}") {{
+  repository(owner: "{identity.owner}", name: "{identity.name}") {{
 {chr(10).join(pr_queries)}
   }}
 }}"""
@@ -528,25 +604,8 @@ query {{
         distinct_id = self._generate_distinct_id()
         debug_log(f"trigger_workflow: workflow={workflow}, distinct_id={distinct_id}, ref={ref}")
 
-        cmd = ["gh", "workflow", "run", workflow]
-
-        # Add --ref flag if specified
-        if ref:
-            cmd.extend(["--ref", ref])
-
         # Add distinct_id to workflow inputs automatically
-        cmd.extend(["-f", f"distinct_id={distinct_id}"])
-
-        # Add caller-provided workflow inputs
-        for key, value in inputs.items():
-            cmd.extend(["-f", f"{key}={value}"])
-
-        debug_log(f"trigger_workflow: executing command: {' '.join(cmd)}")
-        run_subprocess_with_context(
-            cmd,
-            operation_context=f"trigger workflow '{workflow}'",
-            cwd=repo_root,
-        )
+        self._dispatch_workflow(repo_root, workflow, {"distinct_id": distinct_id, **inputs}, ref)
         debug_log("trigger_workflow: workflow triggered successfully")
 
         # Poll for the run by matching displayTitle containing the distinct ID
@@ -557,36 +616,9 @@ query {{
         for attempt in range(max_attempts):
             debug_log(f"trigger_workflow: polling attempt {attempt + 1}/{max_attempts}")
 
-            runs_cmd = [
-                "gh",
-                "run",
-                "list",
-                "--workflow",
-                workflow,
-                "--json",
-                "databaseId,status,conclusion,displayTitle",
-                "--limit",
-                "10",
-            ]
-
-            runs_result = run_subprocess_with_context(
-                runs_cmd,
-                operation_context=f"get run ID for workflow '{workflow}'",
-                cwd=repo_root,
-            )
-
-            runs_data = json.loads(runs_result.stdout)
+            runs_data = self._list_recent_dispatch_runs(repo_root, workflow)
             debug_log(f"trigger_workflow: found {len(runs_data)} runs")
 
-            # Validate response structure (must be a list)
-            if not isinstance(runs_data, list):
-                msg = (
-                    f"GitHub workflow '{workflow}' triggered but received invalid response format. "
-                    f"Expected JSON array, got: {type(runs_data).__name__}. "
-                    f"Raw output: {runs_result.stdout[:200]}"
-                )
-                raise RuntimeError(msg)
-
             # Empty list is valid - workflow hasn't appeared yet, continue polling
             if not runs_data:
                 # Continue to retry logic below
@@ -649,6 +681,76 @@ query {{
         debug_log(f"trigger_workflow: exhausted all attempts, error: {msg}")
         raise RuntimeError(msg)
 
+    def _dispatch_workflow(
+        self,
+        repo_root: Path,
+        workflow: str,
+        inputs: dict[str, str],
+        ref: str | None,
+    ) -> None:
+        """Dispatch a workflow run via gh CLI.
+
+        Args:
+            repo_root: Repository root path
+            workflow: Workflow file name
+            inputs: Complete workflow inputs (including distinct_id)
+            ref: Branch or tag to run workflow from (None for the default branch)
+        """
+        cmd = ["gh", "workflow", "run", workflow]
+
+        # Add --ref flag if specified
+        if ref:
+            cmd.extend(["--ref", ref])
+
+        for key, value in inputs.items():
+            cmd.extend(["-f", f"{key}={value}"])
+
+        debug_log(f"trigger_workflow: executing command: {' '.join(cmd)}")
+        run_subprocess_with_context(
+            cmd,
+            operation_context=f"trigger workflow '{workflow}'",
+            cwd=repo_root,
+        )
+
+    def _list_recent_dispatch_runs(self, repo_root: Path, workflow: str) -> list[dict[str, Any]]:
+        """List the 10 most recent runs of a workflow for dispatch correlation.
+
+        Returns:
+            Raw run dicts with databaseId, status, conclusion and displayTitle keys
+
+        Raises:
+            RuntimeError: If the command fails or returns a non-list response
+        """
+        runs_cmd = [
+            "gh",
+            "run",
+            "list",
+            "--workflow",
+            workflow,
+            "--json",
+            "databaseId,status,conclusion,displayTitle",
+            "--limit",
+            "10",
+        ]
+
+        runs_result = run_subprocess_with_context(
+            runs_cmd,
+            operation_context=f"get run ID for workflow '{workflow}'",
+            cwd=repo_root,
+        )
+
+        runs_data = json.loads(runs_result.stdout)
+
+        # Validate response structure (must be a list)
+        if not isinstance(runs_data, list):
+            msg = (
+                f"GitHub workflow '{workflow}' triggered but received invalid response format. "
+                f"Expected JSON array, got: {type(runs_data).__name__}. "
+                f"Raw output: {runs_result.stdout[:200]}"
+            )
+            raise RuntimeError(msg)
+        return runs_data
+
     def create_pr(
         self,
         repo_root: Path,
@@ -770,22 +872,42 @@ query {{
         and authentication status a priori without duplicating gh's logic.
         """
         try:
-            cmd = [
-                "gh",
-                "run",
-                "view",
-                run_id,
-                "--json",
-                "databaseId,status,conclusion,headBranch,headSha,displayTitle,createdAt",
-            ]
+            return self.find_workflow_run(repo_root, run_id)
+        except RuntimeError:
+            # gh not installed, not authenticated, or command failed
+            return None
 
+    def find_workflow_run(self, repo_root: Path, run_id: str) -> WorkflowRun | None:
+        """Look up a workflow run by ID with `gh run view`.
+
+        gh reports a missing run as an HTTP 404 in its error output; any other
+        failure is raised.
+        """
+        cmd = [
+            "gh",
+            "run",
+            "view",
+            run_id,
+            "--json",
+            "databaseId,status,conclusion,headBranch,headSha,displayTitle,createdAt",
+        ]
+        # Error boundary: gh only reports a missing run through its exit
+        # status and error output
+        try:
             result = run_subprocess_with_context(
                 cmd,
                 operation_context=f"get workflow run details for run {run_id}",
                 cwd=repo_root,
             )
+        except RuntimeError as e:
+            if "HTTP 404" in str(e):
+                return None
+            raise
+        except FileNotFoundError as e:
+            raise RuntimeError("gh is not installed") from e
 
-            # Parse JSON response
+        # Error boundary: json offers no way to validate a document before parsing
+        try:
             data = json.loads(result.stdout)
 
             # Parse created_at timestamp if present
@@ -803,10 +925,8 @@ query {{
                 display_title=data.get("displayTitle"),
                 created_at=created_at,
             )
-
-        except (RuntimeError, json.JSONDecodeError, KeyError, FileNotFoundError):
-            # gh not installed, not authenticated, or command failed (e.g., 404)
-            return None
+        except (json.JSONDecodeError, KeyError) as e:
+            raise RuntimeError(f"gh run view {run_id} returned unexpected output") from e
 
     def get_run_logs(self, repo_root: Path, run_id: str) -> str:
         """Get logs for a workflow run using gh CLI."""
@@ -831,35 +951,36 @@ query {{
             return {}
 
         try:
-            # Get owner/repo from first PR in repo (needed for GraphQL query)
-            # We query for ANY PR to extract owner/repo info
-            cmd = ["gh", "pr", "list", "--limit", "1", "--json", "url"]
-            stdout = execute_gh_command(cmd, repo_root)
-            pr_list = json.loads(stdout)
-
-            # If no PRs exist in repo, return empty dict
-            if not pr_list:
-                return {}
-
-            # Extract owner/repo from first PR URL
-            # Format: https://github.com/owner/repo/pull/123
-            pr_url = pr_list[0]["url"]
-            parts = pr_url.split("/")
-            owner = parts[-4]
-            repo = parts[-3]
-
-            # Build and execute GraphQL query to fetch all issues
-            query = self._build_issue_pr_linkage_query(issue_numbers, owner, repo)
-            response = self._execute_batch_pr_query(query, repo_root)
+            # GraphQL needs owner/name; normally known from the git remote already
+            identity = self._identity_resolver.resolve(repo_root)
+
+            # Query issue timelines in chunks, following cross-references past
+            # the first page
+            repo_data = run_graphql_batch(
+                issue_numbers,
+                lambda chunk: self._build_issue_pr_linkage_query(chunk, identity),
+                lambda query: self._execute_batch_pr_query(query, repo_root),
+                runner=self._runner,
+                chunk_size=_ISSUE_LINKAGE_CHUNK_SIZE,
+                budget=self._budget,
+                nested=NestedConnection(
+                    path=("timelineItems",),
+                    build_page_query=lambda cursors: _build_issue_timeline_page_query(
+                        cursors, identity
+                    ),
+                ),
+            )
 
             # Parse response and build inverse mapping
-            return self._parse_issue_pr_linkages(response, owner, repo)
+            return self._parse_issue_pr_linkages({"data": {"repository": repo_data}}, identity)
 
         except (RuntimeError, FileNotFoundError, json.JSONDecodeError, KeyError, IndexError):
             # gh not installed, not authenticated, or parsing failed
             return {}
 
-    def _build_issue_pr_linkage_query(self, issue_numbers: list[int], owner: str, repo: str) -> str:
+    def _build_issue_pr_linkage_query(
+        self, issue_numbers: list[int], identity: RepoIdentity
+    ) -> str:
         """Build GraphQL query to fetch PRs linked to issues via timeline.
 
         Uses CrossReferencedEvent on issue timelines to find PRs that will close
@@ -867,50 +988,30 @@ query {{
 
         Args:
             issue_numbers: List of issue numbers to query
-            owner: Repository owner
-            repo: Repository name
+            identity: Repository owner/name
 
         Returns:
             GraphQL query string
         """
         # Build aliased issue queries (following _build_workflow_runs_batch_query pattern)
-        issue_queries = []
-        for issue_num in issue_numbers:
-            issue_query = f"""    issue_{issue_num}: issue(number: {issue_num}) {{
-      timelineItems(itemTypes: [CROSS_REFERENCED_EVENT], first: 20) {{
-        nodes {{
-          ... on CrossReferencedEvent {{
-            willCloseTarget
-            source {{
-              ... on PullRequest {{
-                number
-                state
-                url
-                isDraft
-                title
-                createdAt
-                statusCheckRollup {{
-                  state
-                }}
-                mergeable
-              }}
-            }}
-          }}
-        }}
-      }}
+        timeline_selection = closing_prs_timeline_selection(after=None).replace("\n", "\n      ")
+        issue_queries = [
+            f"""    issue_{issue_num}: issue(number: {issue_num}) {{
+      {timeline_selection}
     }}"""
-            issue_queries.append(issue_query)
+            for issue_num in issue_numbers
+        ]
 
         # Combine into single query under repository context
         query = f"""query {{
-  repository(owner: "{owner}", name: "{repo}") {{
+  repository(owner: "{identity.owner}", name: "{identity.name}") {{
 {chr(10).join(issue_queries)}
   }}
 }}"""
         return query
 
     def _parse_issue_pr_linkages(
-        self, response: dict[str, Any], owner: str, repo: str
+        self, response: dict[str, Any], identity: RepoIdentity
     ) -> dict[int, list[PullRequestInfo]]:
         """Parse GraphQL response from issue timeline query.
 
@@ -919,8 +1020,7 @@ query {{
 
         Args:
             response: GraphQL response data
-            owner: Repository owner
-            repo: Repository name
+            identity: Repository owner/name
 
         Returns:
             Mapping of issue_number -> list of PRs sorted by created_at descending
@@ -937,76 +1037,10 @@ query {{
             # Extract issue number from alias
             issue_number = int(key.removeprefix("issue_"))
 
-            # Collect PRs with timestamps for sorting
-            prs_with_timestamps: list[tuple[PullRequestInfo, str]] = []
-
-            timeline_items = issue_data.get("timelineItems", {})
-            nodes = timeline_items.get("nodes", [])
-
-            for node in nodes:
-                if node is None:
-                    continue
-
-                # Filter to only closing PRs
-                if not node.get("willCloseTarget"):
-                    continue
-
-                source = node.get("source")
-                if source is None:
-                    continue
-
-                # Extract required PR fields
-                pr_number = source.get("number")
-                state = source.get("state")
-                url = source.get("url")
-
-                # Skip if essential fields are missing (source may be Issue, not PR)
-                if pr_number is None or state is None or url is None:
-                    continue
-
-                # Extract optional fields
-                is_draft = source.get("isDraft")
-                title = source.get("title")
-                created_at = source.get("createdAt")
-
-                # Parse checks status
-                checks_passing = None
-                status_rollup = source.get("statusCheckRollup")
-                if status_rollup is not None:
-                    rollup_state = status_rollup.get("state")
-                    if rollup_state == "SUCCESS":
-                        checks_passing = True
-                    elif rollup_state in ("FAILURE", "ERROR"):
-                        checks_passing = False
-
-                # Parse conflicts status
-                has_conflicts = None
-                mergeable = source.get("mergeable")
-                if mergeable == "CONFLICTING":
-                    has_conflicts = True
-                elif mergeable == "MERGEABLE":
-                    has_conflicts = False
-
-                pr_info = PullRequestInfo(
-                    number=pr_number,
-                    state=state,
-                    url=url,
-                    is_draft=is_draft if is_draft is not None else False,
-                    title=title,
-                    checks_passing=checks_passing,
-                    owner=owner,
-                    repo=repo,
-                    has_conflicts=has_conflicts,
-                )
-
-                # Store with timestamp for sorting
-                if created_at:
-                    prs_with_timestamps.append((pr_info, created_at))
-
-            # Sort by created_at descending and store
-            if prs_with_timestamps:
-                prs_with_timestamps.sort(key=lambda x: x[1], reverse=True)
-                result[issue_number] = [pr for pr, _ in prs_with_timestamps]
+            nodes = issue_data.get("timelineItems", {}).get("nodes", [])
+            prs = parse_closing_prs(nodes, identity)
+            if prs:
+                result[issue_number] = prs
 
         return result
 
@@ -1218,9 +1252,11 @@ query {{
     ) -> dict[str, WorkflowRun | None]:
         """Get details for multiple workflow runs by ID using REST API.
 
-        Note: Uses get_workflow_run() for each run ID. The previous GraphQL
-        implementation was broken because database IDs cannot be used directly
-        in GraphQL Global ID format (gid://github/WorkflowRun/{db_id}).
+        Note: Uses get_workflow_run() for each run ID, run concurrently on the
+        worker pool. The previous GraphQL implementation was broken because
+        database IDs cannot be used directly in GraphQL Global ID format
+        (gid://github/WorkflowRun/{db_id}). Runs whose lookup fails or misses
+        its deadline map to None.
 
         Note: Uses try/except as an acceptable error boundary for handling gh CLI
         availability and authentication. We cannot reliably check gh installation
@@ -1231,10 +1267,16 @@ query {{
             return {}
 
         # Use get_workflow_run() for each ID (REST API via gh run view)
-        result: dict[str, WorkflowRun | None] = {}
+        tasks: dict[str, Callable[[], object]] = {
+            run_id: partial(self.get_workflow_run, repo_root, run_id) for run_id in run_ids
+        }
+        results = self._runner.run_parallel(tasks, _WORKFLOW_RUN_TIMEOUT_SECONDS)
+
+        runs: dict[str, WorkflowRun | None] = {}
         for run_id in run_ids:
-            result[run_id] = self.get_workflow_run(repo_root, run_id)
-        return result
+            run = results[run_id]
+            runs[run_id] = run if isinstance(run, WorkflowRun) else None
+        return runs
 
     def check_auth_status(self) -> tuple[bool, str | None, str | None]:
         """Check GitHub CLI authentication status.
@@ -1260,3 +1302,54 @@ query {{
 
         output = result.stdout + result.stderr
         return parse_gh_auth_status_output(output)
+
+
+def _build_check_contexts_page_query(cursors: dict[str, str], identity: RepoIdentity) -> str:
+    """Build a query for the check contexts preceding each cursor, keyed by PR alias."""
+    pr_queries = []
+    for alias, cursor in cursors.items():
+        pr_num = int(alias.removeprefix("pr_"))
+        pr_queries.append(f"""    {alias}: pullRequest(number: {pr_num}) {{
+      commits(last: 1) {{
+        nodes {{
+          commit {{
+            statusCheckRollup {{
+              contexts(last: 100, before: {json.dumps(cursor)}) {{
+                pageInfo {{
+                  hasPreviousPage
+                  startCursor
+                }}
+                nodes {{
+                  ...CheckContextFields
+                }}
+              }}
+            }}
+          }}
+        }}
+      }}
+    }}""")
+
+    return f"""{_CHECK_CONTEXT_FRAGMENT}
+
+query {{
+  repository(owner: "{identity.owner}", name: "{identity.name}") {{
+{chr(10).join(pr_queries)}
+  }}
+}}"""
+
+
+def _build_issue_timeline_page_query(cursors: dict[str, str], identity: RepoIdentity) -> str:
+    """Build a query for the cross-references following each cursor, keyed by issue alias."""
+    issue_queries = []
+    for alias, cursor in cursors.items():
+        issue_num = int(alias.removeprefix("issue_"))
+        timeline_selection = closing_prs_timeline_selection(after=cursor).replace("\n", "\n      ")
+        issue_queries.append(f"""    {alias}: issue(number: {issue_num}) {{
+      {timeline_selection}
+    }}""")
+
+    return f"""query {{
+  repository(owner: "{identity.owner}", name: "{identity.name}") {{
+{chr(10).join(issue_queries)}
+  }}
+}}"""
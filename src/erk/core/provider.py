@@ -0,0 +1,49 @@
+"""Lazily resolved dependencies for ErkContext."""
+
+import threading
+from collections.abc import Callable
+from typing import cast
+
+
+class Provider[T]:
+    """A dependency built by a factory the first time it is used.
+
+    create_context wires every integration as a Provider so that a command
+    only pays for (and only imports) the integrations it actually touches.
+    The factory runs at most once, even when ParallelTaskRunner workers
+    first touch the dependency concurrently; later calls return the same
+    object.
+    """
+
+    def __init__(self, factory: Callable[[], T]) -> None:
+        """Create a provider.
+
+        Args:
+            factory: Builds the dependency; called on first get()
+        """
+        self._factory = factory
+        self._resolved = False
+        self._value: T | None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def of[V](value: V) -> "Provider[V]":
+        """Create an already-resolved provider for an existing object."""
+        provider: Provider[V] = Provider(lambda: value)
+        provider.get()
+        return provider
+
+    @property
+    def resolved(self) -> bool:
+        """Whether the dependency has been built."""
+        return self._resolved
+
+    def get(self) -> T:
+        """Get the dependency, building it on first use."""
+        if not self._resolved:
+            with self._lock:
+                if not self._resolved:
+                    self._value = self._factory()
+                    self._resolved = True
+        # T may itself include None, so _value can't be narrowed here
+        return cast(T, self._value)
@@ -9,6 +9,20 @@ from pathlib import Path
 
 from erk_shared.git.abc import Git
 from erk_shared.git.real import RealGit
+from erk_shared.github.repo_identity import (
+    load_cached_repo_identity,
+    parse_github_remote_url,
+    read_git_remote_url,
+)
+from erk_shared.github.types import RepoIdentity
+
+from erk.core.completion_cache import COMPLETION_CACHE_FILENAME
+
+# Per-repo cache of an owner/name that had to be resolved via gh
+REPO_IDENTITY_CACHE_FILENAME = "repo-identity.json"
+
+# Per-repo persisted trunk branch resolution (see erk.core.trunk_cache)
+TRUNK_CACHE_FILENAME = "trunk.json"
 
 
 @dataclass(frozen=True)
@@ -19,6 +33,22 @@ class RepoContext:
     repo_name: str
     repo_dir: Path  # ~/.erk/repos/<repo-name>
     worktrees_dir: Path  # ~/.erk/repos/<repo-name>/worktrees
+    identity: RepoIdentity | None = None  # GitHub owner/name, None if not resolvable offline
+
+    @property
+    def identity_cache_path(self) -> Path:
+        """Path of the per-repo cache for an identity resolved via gh."""
+        return self.repo_dir / REPO_IDENTITY_CACHE_FILENAME
+
+    @property
+    def trunk_cache_path(self) -> Path:
+        """Path of the per-repo persisted trunk branch resolution."""
+        return self.repo_dir / TRUNK_CACHE_FILENAME
+
+    @property
+    def completion_cache_path(self) -> Path:
+        """Path of the per-repo shell completion candidate cache."""
+        return self.repo_dir / COMPLETION_CACHE_FILENAME
 
 
 @dataclass(frozen=True)
@@ -71,9 +101,10 @@ def discover_repo_or_sentinel(
 
             if ops.is_dir(git_path):
                 root = parent
+                git_common_dir = git_path
                 break
 
-    if root is None:
+    if root is None or git_common_dir is None:
         return NoRepoSentinel(message="Not inside a git repository (no .git found up the tree)")
 
     repo_name = root.name
@@ -81,10 +112,36 @@ def discover_repo_or_sentinel(
     worktrees_dir = repo_dir / "worktrees"
 
     return RepoContext(
-        root=root, repo_name=repo_name, repo_dir=repo_dir, worktrees_dir=worktrees_dir
+        root=root,
+        repo_name=repo_name,
+        repo_dir=repo_dir,
+        worktrees_dir=worktrees_dir,
+        identity=_discover_repo_identity(ops, git_common_dir, repo_dir),
     )
 
 
+def _discover_repo_identity(ops: Git, git_common_dir: Path, repo_dir: Path) -> RepoIdentity | None:
+    """Resolve GitHub owner/name from the origin remote without running gh or git.
+
+    Falls back to the per-repo cache written when a previous invocation had to
+    ask gh (see RepoIdentityResolver). Returns None if neither source knows it.
+
+    Existence is checked through git ops so fake-backed tests never touch the
+    real filesystem.
+    """
+    if ops.path_exists(git_common_dir / "config"):
+        remote_url = read_git_remote_url(git_common_dir)
+        if remote_url is not None:
+            identity = parse_github_remote_url(remote_url)
+            if identity is not None:
+                return identity
+
+    cache_path = repo_dir / REPO_IDENTITY_CACHE_FILENAME
+    if not ops.path_exists(cache_path):
+        return None
+    return load_cached_repo_identity(cache_path)
+
+
 def ensure_erk_metadata_dir(repo: RepoContext) -> Path:
     """Ensure the erk metadata directory and worktrees subdirectory exist.
 
@@ -7,12 +7,13 @@ Schema Version 2 Optimization:
 - Eliminates comments fetch (worktree_name now in issue body)
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
 
 from erk_shared.github.abc import GitHub
 from erk_shared.github.issues import GitHubIssues, IssueInfo
-from erk_shared.github.metadata import extract_plan_header_dispatch_info
+from erk_shared.github.metadata import PlanHeader, parse_plan_header
 from erk_shared.github.types import PullRequestInfo, WorkflowRun
 
 
@@ -24,11 +25,13 @@ class PlanListData:
         issues: List of IssueInfo objects
         pr_linkages: Mapping of issue_number -> list of PRs that close that issue
         workflow_runs: Mapping of issue_number -> most relevant WorkflowRun
+        plan_headers: Mapping of issue_number -> parsed plan-header block
     """
 
     issues: list[IssueInfo]
     pr_linkages: dict[int, list[PullRequestInfo]]
     workflow_runs: dict[int, WorkflowRun | None]
+    plan_headers: dict[int, PlanHeader] = field(default_factory=dict)
 
 
 class PlanListService:
@@ -38,8 +41,9 @@ class PlanListService:
     needed for plan listing.
 
     Schema Version 2 Only:
+    - Issues and their closing PRs come from one paginated GraphQL query
     - Issues have last_dispatched_run_id in body metadata
-    - Uses get_workflow_runs_batch(run_ids) for single GraphQL query
+    - Uses get_workflow_runs_batch(run_ids) for the dispatched runs
     - Extracts worktree_name from issue body (no comments needed)
     """
 
@@ -52,6 +56,25 @@ class PlanListService:
         """
         self._github = github
         self._github_issues = github_issues
+        # Parsed plan headers by (issue number, updated_at), so each revision
+        # of an issue body is parsed once however often it is listed
+        self._plan_headers: dict[tuple[int, datetime], PlanHeader] = {}
+
+    def get_plan_header(self, issue: IssueInfo) -> PlanHeader:
+        """Get the parsed plan-header block of an issue.
+
+        Args:
+            issue: Issue whose body holds the plan-header block
+
+        Returns:
+            PlanHeader, memoized per issue number and updated_at
+        """
+        key = (issue.number, issue.updated_at)
+        header = self._plan_headers.get(key)
+        if header is None:
+            header = parse_plan_header(issue.body)
+            self._plan_headers[key] = header
+        return header
 
     def get_plan_list_data(
         self,
@@ -65,8 +88,9 @@ class PlanListService:
         """Batch fetch all data needed for plan listing.
 
         Schema Version 2 Only:
+        - Fetches issues with their closing PRs via list_issues_with_linked_prs()
         - Extracts last_dispatched_run_id from issue body (plan-header block)
-        - Uses get_workflow_runs_batch() for single GraphQL query
+        - Uses get_workflow_runs_batch() to fetch the dispatched runs concurrently
         - Extracts worktree_name from issue body (no comments needed)
 
         Args:
@@ -80,28 +104,31 @@ class PlanListService:
         Returns:
             PlanListData containing issues, PR linkages, and workflow runs
         """
-        # Fetch issues using GitHubIssues integration
-        issues = self._github_issues.list_issues(repo_root, labels=labels, state=state, limit=limit)
-
-        # Extract issue numbers for batch operations
-        issue_numbers = [issue.number for issue in issues]
+        # Fetch issues and their closing PRs in one paginated GraphQL query
+        listing = self._github_issues.list_issues_with_linked_prs(
+            repo_root,
+            labels=labels,
+            state=state,
+            limit=limit,
+            include_linked_prs=not skip_pr_linkages,
+        )
+        issues = listing.issues
+        pr_linkages = listing.pr_linkages
 
-        # Conditionally fetch PR linkages (skip for performance when not needed)
-        pr_linkages: dict[int, list[PullRequestInfo]] = {}
-        if not skip_pr_linkages:
-            pr_linkages = self._github.get_prs_linked_to_issues(repo_root, issue_numbers)
+        # Parse each plan-header block once for every consumer of the listing
+        plan_headers = {issue.number: self.get_plan_header(issue) for issue in issues}
 
         # Conditionally fetch workflow runs (skip for performance when not needed)
         workflow_runs: dict[int, WorkflowRun | None] = {}
         if not skip_workflow_runs:
             # Collect all run IDs and build mapping back to issue numbers
             run_id_to_issue: dict[str, int] = {}
-            for issue in issues:
-                run_id, _ = extract_plan_header_dispatch_info(issue.body)
+            for issue_number, header in plan_headers.items():
+                run_id = header.last_dispatched_run_id
                 if run_id is not None:
-                    run_id_to_issue[run_id] = issue.number
+                    run_id_to_issue[run_id] = issue_number
 
-            # Batch fetch all workflow runs in single GraphQL query
+            # Batch fetch all dispatched workflow runs
             if run_id_to_issue:
                 run_ids = list(run_id_to_issue.keys())
                 runs_by_id = self._github.get_workflow_runs_batch(repo_root, run_ids)
@@ -115,4 +142,5 @@ class PlanListService:
             issues=issues,
             pr_linkages=pr_linkages,
             workflow_runs=workflow_runs,
+            plan_headers=plan_headers,
         )
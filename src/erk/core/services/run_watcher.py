@@ -0,0 +1,262 @@
+"""Watch many GitHub Actions workflow runs together until they complete.
+
+A single watcher tracks any number of run IDs and branches, instead of one
+fixed-interval polling loop per run:
+
+- each tick makes one list_workflow_runs() request covering every target
+  still running (run IDs too old to appear in the listing are looked up
+  with one get_workflow_runs_batch() call)
+- the last observed state of every target is kept in memory, and each
+  change is reported as a RunTransition as soon as it is seen
+- ticks back off exponentially, with jitter, while nothing changes and
+  return to the initial interval when something does
+- run IDs GitHub reports as nonexistent, and branches with no matching run
+  by their deadline, are dropped and reported in not_found instead of being
+  polled forever
+"""
+
+import random
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from erk_shared.github.abc import GitHub
+from erk_shared.github.types import WorkflowRun
+from erk_shared.integrations.time.abc import Time
+
+from erk.cli.debug import debug_log
+
+_INITIAL_INTERVAL_SECONDS = 2.0
+_MAX_INTERVAL_SECONDS = 30.0
+_BACKOFF_FACTOR = 2.0
+# Each delay is randomized by up to this fraction so concurrent watchers
+# (several `erk submit --wait` in different terminals) don't tick in lockstep
+_JITTER_FRACTION = 0.2
+
+# Runs fetched per tick; dispatched runs are normally among the most recent
+_LIST_LIMIT = 100
+
+# Seconds a watched branch may go without a matching run before it is dropped;
+# dispatched runs normally appear within seconds
+_BRANCH_DEADLINE_SECONDS = 300.0
+
+
+@dataclass(frozen=True)
+class RunTransition:
+    """A change in the observed state of a watched target.
+
+    Attributes:
+        target: Watched run ID or branch name
+        run: The run as now observed
+        previous: The run as previously observed, or None when first seen
+        observed_at: When the change was seen
+    """
+
+    target: str
+    run: WorkflowRun
+    previous: WorkflowRun | None
+    observed_at: datetime
+
+    @property
+    def is_completed(self) -> bool:
+        """Whether the run has finished (with any conclusion)."""
+        return self.run.status == "completed"
+
+
+class WorkflowRunWatcher:
+    """Tracks the runs of one workflow for a set of run IDs and branches."""
+
+    def __init__(
+        self,
+        github: GitHub,
+        time: Time,
+        repo_root: Path,
+        workflow: str,
+        *,
+        initial_interval: float = _INITIAL_INTERVAL_SECONDS,
+        max_interval: float = _MAX_INTERVAL_SECONDS,
+        branch_deadline: float = _BRANCH_DEADLINE_SECONDS,
+    ) -> None:
+        """Create a watcher with no targets.
+
+        Args:
+            github: GitHub integration the runs are fetched with
+            time: Time abstraction for sleeps and transition timestamps
+            repo_root: Repository root directory
+            workflow: Workflow filename (e.g., "dispatch-erk-queue.yml")
+            initial_interval: Seconds between ticks after a change
+            max_interval: Upper bound for the backed-off interval
+            branch_deadline: Seconds after watch_branch() to wait for a matching run
+        """
+        self._github = github
+        self._time = time
+        self._repo_root = repo_root
+        self._workflow = workflow
+        self._initial_interval = initial_interval
+        self._max_interval = max_interval
+        self._branch_deadline = timedelta(seconds=branch_deadline)
+        self._run_ids: list[str] = []
+        # Branch -> only runs created at or after this time count
+        self._branches: dict[str, datetime | None] = {}
+        # Branch -> dropped if no matching run has been seen by this time
+        self._branch_deadlines: dict[str, datetime] = {}
+        self._latest: dict[str, WorkflowRun] = {}
+        self._not_found: list[str] = []
+
+    def watch_run(self, run_id: str) -> None:
+        """Track a run by its ID."""
+        if run_id not in self._run_ids:
+            self._run_ids.append(run_id)
+
+    def watch_branch(self, branch: str, *, created_after: datetime | None = None) -> None:
+        """Track the newest run of the workflow on a branch.
+
+        Args:
+            branch: Head branch of the run
+            created_after: Ignore runs created before this time (e.g. runs from
+                an earlier submission of the same branch)
+        """
+        self._branches[branch] = created_after
+        self._branch_deadlines[branch] = self._time.now() + self._branch_deadline
+
+    @property
+    def targets(self) -> list[str]:
+        """Watched run IDs and branches, in the order they were added."""
+        return [*self._run_ids, *self._branches]
+
+    @property
+    def runs(self) -> dict[str, WorkflowRun | None]:
+        """Last observed run of every target (None until first seen)."""
+        return {target: self._latest.get(target) for target in self.targets}
+
+    @property
+    def not_found(self) -> list[str]:
+        """Targets dropped because no run was found for them.
+
+        A run ID is dropped when GitHub reports that it doesn't exist; a branch
+        when no matching run appears before its deadline.
+        """
+        return list(self._not_found)
+
+    @property
+    def finished(self) -> bool:
+        """Whether the run of every target has completed."""
+        return all(run is not None and run.status == "completed" for run in self.runs.values())
+
+    def poll(self) -> list[RunTransition]:
+        """Fetch the current state of every unfinished target once.
+
+        Returns:
+            Targets whose run was seen for the first time or changed status,
+            conclusion or (for branches) run ID
+        """
+        pending_ids = [run_id for run_id in self._run_ids if not self._is_completed(run_id)]
+        pending_branches = [branch for branch in self._branches if not self._is_completed(branch)]
+        if not pending_ids and not pending_branches:
+            return []
+
+        listed = self._github.list_workflow_runs(self._repo_root, self._workflow, _LIST_LIMIT)
+        by_id = {run.run_id: run for run in listed}
+
+        observed: dict[str, WorkflowRun | None] = {
+            run_id: by_id.get(run_id) for run_id in pending_ids
+        }
+        missing = [run_id for run_id, run in observed.items() if run is None]
+        if missing:
+            observed.update(self._github.get_workflow_runs_batch(self._repo_root, missing))
+        # The batch maps failed lookups to None too; a run ID is only dropped
+        # once GitHub confirms it doesn't exist. A failed lookup raises and
+        # fails the tick, which watch() retries.
+        unknown: list[str] = []
+        for run_id in pending_ids:
+            if observed[run_id] is None and run_id not in self._latest:
+                observed[run_id] = self._github.find_workflow_run(self._repo_root, run_id)
+                if observed[run_id] is None:
+                    unknown.append(run_id)
+
+        for branch in pending_branches:
+            # list_workflow_runs is newest first
+            observed[branch] = next(
+                (run for run in listed if self._matches_branch(run, branch)), None
+            )
+
+        now = self._time.now()
+        transitions: list[RunTransition] = []
+        for target, run in observed.items():
+            if run is None:
+                if target in unknown or self._branch_expired(target, now):
+                    self._drop(target)
+                continue
+            previous = self._latest.get(target)
+            if previous is not None and _same_state(previous, run):
+                continue
+            self._latest[target] = run
+            transitions.append(RunTransition(target, run, previous, now))
+        return transitions
+
+    def watch(self, timeout: float | None = None) -> Iterator[RunTransition]:
+        """Yield transitions as they are seen, until every target completes.
+
+        Args:
+            timeout: Seconds to watch before giving up, or None to watch until done
+
+        Yields:
+            Each RunTransition, in the order it was observed
+        """
+        deadline = None if timeout is None else self._time.now() + timedelta(seconds=timeout)
+        interval = self._initial_interval
+        while True:
+            # Error boundary: a failed tick (network, rate limit) is retried
+            # after the next backoff instead of ending the watch
+            try:
+                transitions = self.poll()
+            except RuntimeError as e:
+                debug_log(f"WorkflowRunWatcher: poll failed: {e}")
+                transitions = []
+
+            yield from transitions
+            if self.finished:
+                return
+
+            if transitions:
+                interval = self._initial_interval
+            else:
+                interval = min(interval * _BACKOFF_FACTOR, self._max_interval)
+            delay = interval * (1 + random.uniform(-_JITTER_FRACTION, _JITTER_FRACTION))
+            if deadline is not None:
+                remaining = (deadline - self._time.now()).total_seconds()
+                if remaining <= 0:
+                    return
+                delay = min(delay, remaining)
+            self._time.sleep(delay)
+
+    def _branch_expired(self, target: str, now: datetime) -> bool:
+        if target not in self._branches or target in self._latest:
+            return False
+        return now >= self._branch_deadlines[target]
+
+    def _drop(self, target: str) -> None:
+        debug_log(f"WorkflowRunWatcher: no run found for {target}, dropping it")
+        if target in self._branches:
+            del self._branches[target]
+            del self._branch_deadlines[target]
+        else:
+            self._run_ids.remove(target)
+        self._not_found.append(target)
+
+    def _is_completed(self, target: str) -> bool:
+        run = self._latest.get(target)
+        return run is not None and run.status == "completed"
+
+    def _matches_branch(self, run: WorkflowRun, branch: str) -> bool:
+        if run.branch != branch:
+            return False
+        created_after = self._branches[branch]
+        if created_after is None:
+            return True
+        return run.created_at is not None and run.created_at >= created_after
+
+
+def _same_state(a: WorkflowRun, b: WorkflowRun) -> bool:
+    return a.run_id == b.run_id and a.status == b.status and a.conclusion == b.conclusion
@@ -0,0 +1,188 @@
+"""Per-repository persisted trunk branch resolution.
+
+Detecting trunk costs up to three `git` processes (symbolic-ref for
+origin/HEAD, then show-ref probes for main and master), and navigation,
+consolidate and stack commands ask for it several times per run. The answer
+only changes when one of its inputs does:
+
+- `refs/remotes/origin/HEAD`, which git stores as a loose symbolic ref
+- whether the `main`/`master` fallback branches exist
+- `[tool.erk] trunk_branch` in the repository's pyproject.toml
+
+TrunkBranchResolver resolves trunk at most once per context and persists the
+answer in ~/.erk/repos/<repo>/trunk.json together with a fingerprint of those
+inputs, read straight from the .git directory. A later invocation reuses the
+answer while the fingerprint matches. Repositories whose refs can't be read
+from files (see read_git_layout, reftable) are resolved through git every
+time. `erk admin refresh-trunk` forces re-detection.
+"""
+
+import json
+import os
+import tomllib
+from pathlib import Path
+from typing import Any
+
+from erk_shared.git.abc import Git
+from erk_shared.git.layout import read_git_layout
+from erk_shared.git.plumbing import GitRefReader
+
+TRUNK_CACHE_FORMAT_VERSION = 1
+
+# Local branches get_trunk_branch falls back to when origin/HEAD is unset
+_FALLBACK_TRUNKS = ("main", "master")
+
+
+def read_configured_trunk(repo_root: Path) -> str | None:
+    """Read `[tool.erk] trunk_branch` from the repository's pyproject.toml.
+
+    Returns:
+        The configured branch, or None if pyproject.toml or the key is missing
+    """
+    pyproject_path = repo_root / "pyproject.toml"
+    if not pyproject_path.is_file():
+        return None
+
+    # Error boundary: a malformed pyproject.toml means no erk configuration
+    try:
+        data = tomllib.loads(pyproject_path.read_text(encoding="utf-8"))
+    except tomllib.TOMLDecodeError:
+        return None
+
+    trunk = data.get("tool", {}).get("erk", {}).get("trunk_branch")
+    if not isinstance(trunk, str) or not trunk:
+        return None
+    return trunk
+
+
+def read_trunk_fingerprint(repo_root: Path) -> dict[str, Any] | None:
+    """Fingerprint the inputs trunk detection depends on, without running git.
+
+    Args:
+        repo_root: Repository root directory
+
+    Returns:
+        JSON-serializable fingerprint, or None if the refs can't be read from
+        files and trunk must be resolved through git
+    """
+    layout = read_git_layout(repo_root)
+    if layout is None:
+        return None
+    reader = GitRefReader(layout.common_dir)
+    if not reader.supported:
+        return None
+
+    origin_head_file = layout.common_dir / "refs" / "remotes" / "origin" / "HEAD"
+    origin_head = (
+        origin_head_file.read_text(encoding="utf-8").strip() if origin_head_file.is_file() else None
+    )
+
+    pyproject_path = repo_root / "pyproject.toml"
+    pyproject_stamp: list[int] | None = None
+    if pyproject_path.is_file():
+        stat = pyproject_path.stat()
+        pyproject_stamp = [stat.st_mtime_ns, stat.st_size]
+
+    return {
+        "origin_head": origin_head,
+        "local_trunks": [
+            name
+            for name in _FALLBACK_TRUNKS
+            if reader.resolve_ref(f"refs/heads/{name}") is not None
+        ],
+        "pyproject": pyproject_stamp,
+    }
+
+
+def _read_cache(cache_path: Path) -> dict[str, Any] | None:
+    if not cache_path.is_file():
+        return None
+
+    # Error boundary: a corrupt or hand-edited cache is a miss
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    if not isinstance(data, dict) or data.get("version") != TRUNK_CACHE_FORMAT_VERSION:
+        return None
+    if not isinstance(data.get("trunk"), str):
+        return None
+    return data
+
+
+def _write_cache(cache_path: Path, fingerprint: dict[str, Any], trunk: str) -> None:
+    content = json.dumps(
+        {"version": TRUNK_CACHE_FORMAT_VERSION, "fingerprint": fingerprint, "trunk": trunk}
+    )
+    # Error boundary: the cache is an optimization; an unwritable metadata
+    # directory must not break commands
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(content, encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        return
+
+
+class TrunkBranchResolver:
+    """Resolves a repository's trunk branch once and persists it across invocations.
+
+    A configured `[tool.erk] trunk_branch` wins; otherwise trunk is detected
+    with Git.get_trunk_branch.
+    """
+
+    def __init__(self, cache_path: Path | None) -> None:
+        """Create a resolver.
+
+        Args:
+            cache_path: Where to persist the resolved trunk (None to only
+                memoize it in memory)
+        """
+        self._cache_path = cache_path
+        self._resolved: dict[Path, str] = {}
+
+    def resolve(self, git: Git, repo_root: Path) -> str:
+        """Get the trunk branch, reusing the persisted answer if its inputs are unchanged.
+
+        Args:
+            git: Git used to detect trunk on a miss
+            repo_root: Repository root directory
+
+        Returns:
+            Trunk branch name
+        """
+        trunk = self._resolved.get(repo_root)
+        if trunk is not None:
+            return trunk
+
+        fingerprint = read_trunk_fingerprint(repo_root)
+        if fingerprint is not None and self._cache_path is not None:
+            cached = _read_cache(self._cache_path)
+            if cached is not None and cached.get("fingerprint") == fingerprint:
+                trunk = cached["trunk"]
+                self._resolved[repo_root] = trunk
+                return trunk
+
+        return self._detect(git, repo_root, fingerprint)
+
+    def refresh(self, git: Git, repo_root: Path) -> str:
+        """Re-detect the trunk branch, ignoring and replacing the persisted answer.
+
+        Args:
+            git: Git used to detect trunk
+            repo_root: Repository root directory
+
+        Returns:
+            Trunk branch name
+        """
+        return self._detect(git, repo_root, read_trunk_fingerprint(repo_root))
+
+    def _detect(self, git: Git, repo_root: Path, fingerprint: dict[str, Any] | None) -> str:
+        configured = read_configured_trunk(repo_root)
+        trunk = configured if configured is not None else git.get_trunk_branch(repo_root)
+        if fingerprint is not None and self._cache_path is not None:
+            _write_cache(self._cache_path, fingerprint, trunk)
+        self._resolved[repo_root] = trunk
+        return trunk
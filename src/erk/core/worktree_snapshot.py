@@ -0,0 +1,115 @@
+"""Batched collection of per-worktree plan/issue data.
+
+Commands that show the issue linked to each worktree used to look it up one
+worktree at a time: stat .impl/plan.md, read .impl/issue.json, then fall back
+to `git rev-parse` and `git config branch.<name>.issue`. With many worktrees
+that is dozens of git processes. WorktreeSnapshot gathers the same data up
+front with one `git config --get-regexp` call and one parallel pass over the
+worktrees' .impl/issue.json files.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from erk_shared.git.abc import Git, WorktreeInfo
+from erk_shared.impl_folder import IssueReference, read_issue_reference
+
+# Reading issue.json is I/O bound; a small pool hides filesystem latency
+# without spawning a thread per worktree on large repos.
+_MAX_READ_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class WorktreeSnapshot:
+    """Issue links for every worktree of a repository, collected in one pass.
+
+    Attributes:
+        worktrees: Worktrees the snapshot was collected for, in git's order
+        issue_refs: Issue reference from .impl/issue.json, keyed by worktree path
+        branch_issues: Issue number from git config, keyed by branch name
+    """
+
+    worktrees: list[WorktreeInfo]
+    issue_refs: dict[Path, IssueReference]
+    branch_issues: dict[str, int]
+
+    def impl_issue(self, worktree_path: Path, branch: str | None) -> tuple[str | None, str | None]:
+        """Get the issue linked to a worktree.
+
+        Prefers .impl/issue.json, then falls back to the branch's git config
+        entry (which has no URL).
+
+        Args:
+            worktree_path: Path to the worktree directory
+            branch: Branch checked out in the worktree, or None if detached
+
+        Returns:
+            Tuple of (issue number formatted as "#{number}", issue URL),
+            or (None, None) if no issue is linked
+        """
+        issue_ref = self.issue_refs.get(worktree_path)
+        if issue_ref is not None:
+            return f"#{issue_ref.issue_number}", issue_ref.issue_url
+
+        if branch is not None:
+            issue_number = self.branch_issues.get(branch)
+            if issue_number is not None:
+                return f"#{issue_number}", None
+
+        return None, None
+
+    def worktree_by_issue(self) -> dict[int, str]:
+        """Map issue numbers from .impl/issue.json to worktree directory names.
+
+        If several worktrees reference the same issue, the first one in
+        git's worktree order wins.
+        """
+        result: dict[int, str] = {}
+        for worktree in self.worktrees:
+            issue_ref = self.issue_refs.get(worktree.path)
+            if issue_ref is None:
+                continue
+            if issue_ref.issue_number not in result:
+                result[issue_ref.issue_number] = worktree.path.name
+        return result
+
+
+def collect_worktree_snapshot(
+    git: Git, repo_root: Path, worktrees: list[WorktreeInfo] | None = None
+) -> WorktreeSnapshot:
+    """Collect issue links for every worktree of a repository.
+
+    Args:
+        git: Git operations
+        repo_root: Repository root
+        worktrees: Worktrees to inspect; listed from git when None
+
+    Returns:
+        WorktreeSnapshot covering the given worktrees
+    """
+    if worktrees is None:
+        worktrees = git.list_worktrees(repo_root)
+
+    branch_issues = git.get_all_branch_issues(repo_root)
+
+    def read_ref(worktree: WorktreeInfo) -> IssueReference | None:
+        impl_dir = worktree.path / ".impl"
+        if not git.path_exists(impl_dir / "issue.json"):
+            return None
+        return read_issue_reference(impl_dir)
+
+    issue_refs: dict[Path, IssueReference] = {}
+    if worktrees:
+        workers = min(_MAX_READ_WORKERS, len(worktrees))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            refs = list(executor.map(read_ref, worktrees))
+        for worktree, issue_ref in zip(worktrees, refs, strict=True):
+            if issue_ref is not None:
+                issue_refs[worktree.path] = issue_ref
+
+    return WorktreeSnapshot(
+        worktrees=list(worktrees),
+        issue_refs=issue_refs,
+        branch_issues=branch_issues,
+    )
@@ -5,4 +5,5 @@ Import from submodules:
 - models.status_data: StatusData, GitStatus, etc.
 - collectors: StatusCollector, GitStatusCollector, etc.
 - renderers.simple: SimpleRenderer
+- renderers.table: TableRenderer
 """
@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+from erk_shared.github.types import PullRequestInfo
+
 from erk.core.context import ErkContext
 from erk.status.collectors.base import StatusCollector
 from erk.status.models.status_data import PullRequestStatus
@@ -62,20 +64,32 @@ class GitHubPRCollector(StatusCollector):
         if pr is None:
             return None
 
-        # Determine if ready to merge
-        ready_to_merge = (
-            pr.state == "OPEN"
-            and not pr.is_draft
-            and (pr.checks_passing is True or pr.checks_passing is None)
-        )
-
-        return PullRequestStatus(
-            number=pr.number,
-            title=None,  # Title not available in PullRequestInfo
-            state=pr.state,
-            is_draft=pr.is_draft,
-            url=pr.url,
-            checks_passing=pr.checks_passing,
-            reviews=None,  # Reviews not available in PullRequestInfo
-            ready_to_merge=ready_to_merge,
-        )
+        return pull_request_status(pr)
+
+
+def pull_request_status(pr: PullRequestInfo) -> PullRequestStatus:
+    """Build the status view of a pull request.
+
+    Args:
+        pr: Pull request information from Graphite's cache or GitHub
+
+    Returns:
+        PullRequestStatus for display
+    """
+    # Determine if ready to merge
+    ready_to_merge = (
+        pr.state == "OPEN"
+        and not pr.is_draft
+        and (pr.checks_passing is True or pr.checks_passing is None)
+    )
+
+    return PullRequestStatus(
+        number=pr.number,
+        title=None,  # Title not available in PullRequestInfo
+        state=pr.state,
+        is_draft=pr.is_draft,
+        url=pr.url,
+        checks_passing=pr.checks_passing,
+        reviews=None,  # Reviews not available in PullRequestInfo
+        ready_to_merge=ready_to_merge,
+    )
@@ -55,26 +55,38 @@ class GraphiteStackCollector(StatusCollector):
         if stack is None:
             return None
 
-        # Find current branch position in stack
-        if branch not in stack:
-            return None
+        return stack_position_for_branch(stack, branch)
+
+
+def stack_position_for_branch(stack: list[str], branch: str) -> StackPosition | None:
+    """Locate a branch within its Graphite stack.
+
+    Args:
+        stack: Linear stack from trunk to leaf, as returned by get_branch_stack
+        branch: Branch to locate
+
+    Returns:
+        StackPosition for the branch or None if it isn't part of the stack
+    """
+    if branch not in stack:
+        return None
 
-        current_idx = stack.index(branch)
+    current_idx = stack.index(branch)
 
-        # Determine parent and children
-        parent_branch = stack[current_idx - 1] if current_idx > 0 else None
+    # Determine parent and children
+    parent_branch = stack[current_idx - 1] if current_idx > 0 else None
 
-        children_branches = []
-        if current_idx < len(stack) - 1:
-            children_branches.append(stack[current_idx + 1])
+    children_branches = []
+    if current_idx < len(stack) - 1:
+        children_branches.append(stack[current_idx + 1])
 
-        # Check if this is trunk
-        is_trunk = current_idx == 0
+    # Check if this is trunk
+    is_trunk = current_idx == 0
 
-        return StackPosition(
-            stack=stack,
-            current_branch=branch,
-            parent_branch=parent_branch,
-            children_branches=children_branches,
-            is_trunk=is_trunk,
-        )
+    return StackPosition(
+        stack=stack,
+        current_branch=branch,
+        parent_branch=parent_branch,
+        children_branches=children_branches,
+        is_trunk=is_trunk,
+    )
@@ -4,14 +4,31 @@ import logging
 from collections.abc import Callable
 from pathlib import Path
 
+from erk_shared.git.abc import BranchSyncInfo, WorktreeInfo
+from erk_shared.github.types import PullRequestInfo
 from erk_shared.integrations.parallel.abc import ParallelTaskRunner
 
 from erk.core.context import ErkContext
 from erk.status.collectors.base import StatusCollector
-from erk.status.models.status_data import StatusData, WorktreeDisplayInfo
+from erk.status.collectors.github import pull_request_status
+from erk.status.collectors.graphite import stack_position_for_branch
+from erk.status.models.status_data import (
+    DependencyStatus,
+    EnvironmentStatus,
+    GitStatus,
+    PlanStatus,
+    PullRequestStatus,
+    StackPosition,
+    StatusData,
+    WorktreeDisplayInfo,
+)
 
 logger = logging.getLogger(__name__)
 
+# Collectors whose sections collect_all_status builds from repository-wide
+# data fetched once, instead of running them per worktree
+_SHARED_COLLECTORS = frozenset({"git", "stack", "pr"})
+
 
 class StatusOrchestrator:
     """Coordinates all status collectors and assembles final data.
@@ -73,15 +90,6 @@ class StatusOrchestrator:
 
         # Assemble StatusData - cast results to expected types
         # Results are either the correct type or None (from collector failures)
-        from erk.status.models.status_data import (
-            DependencyStatus,
-            EnvironmentStatus,
-            GitStatus,
-            PlanStatus,
-            PullRequestStatus,
-            StackPosition,
-        )
-
         git_result = results.get("git")
         stack_result = results.get("stack")
         pr_result = results.get("pr")
@@ -100,6 +108,120 @@ class StatusOrchestrator:
             related_worktrees=related_worktrees,
         )
 
+    def collect_all_status(self, ctx: ErkContext, repo_root: Path) -> list[StatusData]:
+        """Collect status for every worktree of the repository in one pass.
+
+        Data the worktrees share is fetched once instead of per worktree:
+        ahead/behind counts from a single for-each-ref, stacks from one
+        Graphite branch graph, and PRs from one `gh pr list` plus one batched
+        GraphQL CI enrichment. Those fetches run on the runner together with
+        the per-worktree work: file status and the collectors without a
+        shared source (e.g. plan).
+
+        Sections follow the configured collectors: git, stack and pr are only
+        built when that collector is available. Recent commits are not
+        collected, and related worktrees are left empty since every worktree
+        is part of the result.
+
+        Args:
+            ctx: Erk context with operations
+            repo_root: Path to repository root
+
+        Returns:
+            StatusData per worktree, root worktree first, then by name
+        """
+        worktrees = ctx.git.list_worktrees(repo_root)
+        root_worktrees = [wt for wt in worktrees if wt.path == repo_root]
+        other_worktrees = sorted(
+            (wt for wt in worktrees if wt.path != repo_root), key=lambda wt: wt.path.name
+        )
+        worktrees = root_worktrees + other_worktrees
+        branches = [wt.branch for wt in worktrees if wt.branch is not None]
+
+        shared = {
+            collector.name
+            for collector in self.collectors
+            if collector.name in _SHARED_COLLECTORS and collector.is_available(ctx, repo_root)
+        }
+        per_worktree_collectors = [
+            collector for collector in self.collectors if collector.name not in _SHARED_COLLECTORS
+        ]
+
+        # Shared fetches go first so they start while per-worktree tasks queue
+        tasks: dict[str, Callable[[], object]] = {}
+        if "git" in shared:
+            tasks["sync"] = lambda: ctx.git.get_all_branch_sync_info(repo_root)
+        if "stack" in shared:
+            tasks["stack"] = lambda: {
+                branch: ctx.graphite.get_branch_stack(ctx.git, repo_root, branch)
+                for branch in branches
+            }
+        if "pr" in shared:
+            tasks["pr"] = lambda: _fetch_prs_for_branches(ctx, repo_root, branches)
+
+        for wt in worktrees:
+            if "git" in shared and wt.branch is not None and wt.path.exists():
+
+                def make_status_task(path: Path = wt.path) -> Callable[[], object]:
+                    return lambda: ctx.git.get_file_status(path)
+
+                tasks[f"git:{wt.path}"] = make_status_task()
+            for collector in per_worktree_collectors:
+                if collector.is_available(ctx, wt.path):
+
+                    def make_collector_task(
+                        c: StatusCollector = collector, path: Path = wt.path
+                    ) -> Callable[[], object]:
+                        return lambda: c.collect(ctx, path, repo_root)
+
+                    tasks[f"{collector.name}:{wt.path}"] = make_collector_task()
+
+        results = self.runner.run_parallel(tasks, self.timeout_seconds)
+
+        sync_result = results.get("sync")
+        sync_info: dict[str, BranchSyncInfo] = sync_result if isinstance(sync_result, dict) else {}
+        stack_result = results.get("stack")
+        stacks: dict[str, list[str] | None] = stack_result if isinstance(stack_result, dict) else {}
+        pr_result = results.get("pr")
+        prs: dict[str, PullRequestInfo] = pr_result if isinstance(pr_result, dict) else {}
+
+        statuses: list[StatusData] = []
+        for wt in worktrees:
+            is_root = wt.path == repo_root
+            worktree_info = WorktreeDisplayInfo(
+                name="root" if is_root else wt.path.name,
+                path=wt.path,
+                branch=wt.branch,
+                is_root=is_root,
+            )
+            stack_position = None
+            pr_status = None
+            if wt.branch is not None:
+                stack = stacks.get(wt.branch)
+                if stack is not None:
+                    stack_position = stack_position_for_branch(stack, wt.branch)
+                pr = prs.get(wt.branch)
+                if pr is not None:
+                    pr_status = pull_request_status(pr)
+
+            env_result = results.get(f"environment:{wt.path}")
+            deps_result = results.get(f"dependencies:{wt.path}")
+            plan_result = results.get(f"plan:{wt.path}")
+            statuses.append(
+                StatusData(
+                    worktree_info=worktree_info,
+                    git_status=_git_status_from_batch(wt, results.get(f"git:{wt.path}"), sync_info),
+                    stack_position=stack_position,
+                    pr_status=pr_status,
+                    environment=env_result if isinstance(env_result, EnvironmentStatus) else None,
+                    dependencies=deps_result if isinstance(deps_result, DependencyStatus) else None,
+                    plan=plan_result if isinstance(plan_result, PlanStatus) else None,
+                    related_worktrees=[],
+                )
+            )
+
+        return statuses
+
     def _get_worktree_info(
         self, ctx: ErkContext, worktree_path: Path, repo_root: Path
     ) -> WorktreeDisplayInfo:
@@ -168,3 +290,54 @@ class StatusOrchestrator:
             )
 
         return related
+
+
+def _fetch_prs_for_branches(
+    ctx: ErkContext, repo_root: Path, branches: list[str]
+) -> dict[str, PullRequestInfo]:
+    """Fetch PRs for the given branches with one list call and one CI enrichment.
+
+    Args:
+        ctx: Erk context
+        repo_root: Path to repository root
+        branches: Branches checked out in worktrees
+
+    Returns:
+        Mapping of branch name to PR, for branches that have one
+    """
+    all_prs = ctx.github.get_prs_for_repo(repo_root, include_checks=False)
+    prs = {branch: all_prs[branch] for branch in branches if branch in all_prs}
+    if not prs:
+        return {}
+    return ctx.github.enrich_prs_with_ci_status_batch(prs, repo_root)
+
+
+def _git_status_from_batch(
+    wt: WorktreeInfo, file_status: object | None, sync_info: dict[str, BranchSyncInfo]
+) -> GitStatus | None:
+    """Assemble a worktree's git status from its file status and the shared sync info.
+
+    Args:
+        wt: Worktree
+        file_status: Result of the worktree's get_file_status task, None if it
+            failed, timed out or wasn't run
+        sync_info: Sync info for all local branches
+
+    Returns:
+        GitStatus without recent commits, or None if unavailable
+    """
+    if wt.branch is None or not isinstance(file_status, tuple):
+        return None
+
+    staged, modified, untracked = file_status
+    sync = sync_info.get(wt.branch)
+    return GitStatus(
+        branch=wt.branch,
+        clean=len(staged) == 0 and len(modified) == 0 and len(untracked) == 0,
+        ahead=sync.ahead if sync is not None else 0,
+        behind=sync.behind if sync is not None else 0,
+        staged_files=staged,
+        modified_files=modified,
+        untracked_files=untracked,
+        recent_commits=[],
+    )
@@ -2,4 +2,5 @@
 
 Import from submodules:
 - simple: SimpleRenderer
+- table: TableRenderer
 """
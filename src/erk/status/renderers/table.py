@@ -0,0 +1,139 @@
+"""Table renderer for the status of all worktrees."""
+
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+from erk.status.models.status_data import (
+    GitStatus,
+    PlanStatus,
+    PullRequestStatus,
+    StackPosition,
+    StatusData,
+)
+
+
+class TableRenderer:
+    """Renders the status of many worktrees as one table, one row per worktree."""
+
+    def render(self, statuses: list[StatusData], *, current_path: Path | None) -> None:
+        """Render status data to stderr.
+
+        Args:
+            statuses: Status of each worktree, in display order
+            current_path: Worktree containing the cwd, marked in the table
+        """
+        table = Table(show_header=True, header_style="bold", box=None)
+        table.add_column("worktree", style="cyan", no_wrap=True)
+        table.add_column("branch", style="yellow", no_wrap=True)
+        table.add_column("changes", no_wrap=True)
+        table.add_column("sync", no_wrap=True)
+        table.add_column("stack", no_wrap=True)
+        table.add_column("pr", no_wrap=True)
+        table.add_column("plan", no_wrap=True)
+
+        for status in statuses:
+            info = status.worktree_info
+            name = f"[green bold]{info.name}[/green bold]" if info.is_root else info.name
+            if info.path == current_path:
+                name += " ← (cwd)"
+
+            table.add_row(
+                name,
+                info.branch if info.branch is not None else "-",
+                _format_changes(status.git_status),
+                _format_sync(status.git_status),
+                _format_stack(status.stack_position),
+                _format_pr(status.pr_status),
+                _format_plan(status.plan),
+            )
+
+        # Output table to stderr (consistent with user_output convention)
+        console = Console(stderr=True, force_terminal=True)
+        console.print(table)
+
+
+def _format_changes(git_status: GitStatus | None) -> str:
+    """Format working tree changes: "clean" or counts like "+2 ~1 ?3".
+
+    + counts staged, ~ modified and ? untracked files.
+    """
+    if git_status is None:
+        return "-"
+    if git_status.clean:
+        return "[green]clean[/green]"
+
+    parts = []
+    if git_status.staged_files:
+        parts.append(f"[green]+{len(git_status.staged_files)}[/green]")
+    if git_status.modified_files:
+        parts.append(f"[yellow]~{len(git_status.modified_files)}[/yellow]")
+    if git_status.untracked_files:
+        parts.append(f"[red]?{len(git_status.untracked_files)}[/red]")
+    return " ".join(parts)
+
+
+def _format_sync(git_status: GitStatus | None) -> str:
+    """Format ahead/behind status: "current", "3↑", "2↓", "3↑ 2↓", or "-"."""
+    if git_status is None:
+        return "-"
+    if git_status.ahead == 0 and git_status.behind == 0:
+        return "current"
+
+    parts = []
+    if git_status.ahead > 0:
+        parts.append(f"{git_status.ahead}↑")
+    if git_status.behind > 0:
+        parts.append(f"{git_status.behind}↓")
+    return " ".join(parts)
+
+
+def _format_stack(stack_position: StackPosition | None) -> str:
+    """Format stack position: "trunk", or position above trunk like "2/3"."""
+    if stack_position is None:
+        return "-"
+    if stack_position.is_trunk:
+        return "trunk"
+
+    position = stack_position.stack.index(stack_position.current_branch)
+    return f"{position}/{len(stack_position.stack) - 1}"
+
+
+def _format_pr(pr_status: PullRequestStatus | None) -> str:
+    """Format PR cell: emoji + clickable #number, or "-"."""
+    if pr_status is None:
+        return "-"
+
+    if pr_status.is_draft:
+        emoji = "🚧"
+    elif pr_status.state == "MERGED":
+        emoji = "🎉"
+    elif pr_status.state == "CLOSED":
+        emoji = "⛔"
+    elif pr_status.checks_passing is True:
+        emoji = "✅"
+    elif pr_status.checks_passing is False:
+        emoji = "❌"
+    else:
+        emoji = "👀"
+
+    return f"{emoji} [link={pr_status.url}]#{pr_status.number}[/link]"
+
+
+def _format_plan(plan: PlanStatus | None) -> str:
+    """Format plan cell: linked issue and completion, e.g. "#42 60%", or "-"."""
+    if plan is None or not plan.exists:
+        return "-"
+
+    parts = []
+    if plan.issue_number is not None:
+        issue_text = f"#{plan.issue_number}"
+        if plan.issue_url:
+            issue_text = f"[link={plan.issue_url}]{issue_text}[/link]"
+        parts.append(issue_text)
+    if plan.completion_percentage is not None:
+        parts.append(f"{plan.completion_percentage}%")
+    if not parts:
+        return "plan"
+    return " ".join(parts)
@@ -0,0 +1,72 @@
+"""Tests for admin github-budget command."""
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from click.testing import CliRunner
+from erk_shared.github.rate_budget import BudgetUsage, GitHubBudgetLog, GitHubRateBudget
+from erk_shared.integrations.time.fake import FakeTime
+
+from erk.cli.cli import cli
+from erk.cli.commands.admin import admin_group
+from erk.core.context import ErkContext
+
+_NOW = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+
+
+def _usage(command: str, points: int, recorded_at: datetime) -> BudgetUsage:
+    return BudgetUsage(
+        command=command,
+        recorded_at=recorded_at,
+        graphql_queries=1,
+        graphql_points=points,
+        rest_requests=0,
+        secondary_limit_hits=0,
+        graphql_remaining=4200,
+        graphql_limit=5000,
+        graphql_reset_at=_NOW + timedelta(minutes=30),
+    )
+
+
+def test_usage_is_summarized_per_command(tmp_path: Path) -> None:
+    time = FakeTime(_NOW)
+    log = GitHubBudgetLog(tmp_path / "github-budget.jsonl", time)
+    log.append(_usage("plan list", 40, _NOW - timedelta(days=2)))
+    log.append(_usage("wt list", 2, _NOW - timedelta(hours=3)))
+    log.append(_usage("plan list", 12, _NOW - timedelta(hours=2)))
+    log.append(_usage("plan list", 8, _NOW - timedelta(hours=1)))
+    ctx = ErkContext.for_test(time=time, github_budget=GitHubRateBudget(time, log))
+
+    result = CliRunner().invoke(admin_group, ["github-budget"], obj=ctx, catch_exceptions=False)
+
+    assert result.exit_code == 0
+    lines = result.output.splitlines()
+    plan_row = next(line for line in lines if "plan list" in line)
+    assert plan_row.split()[-5:] == ["2", "2", "20", "0", "-"]
+    assert lines.index(plan_row) < next(i for i, line in enumerate(lines) if "wt list" in line)
+    assert "4200/5000 points left" in result.output
+
+
+def test_no_usage_recorded(tmp_path: Path) -> None:
+    time = FakeTime(_NOW)
+    log = GitHubBudgetLog(tmp_path / "github-budget.jsonl", time)
+    ctx = ErkContext.for_test(time=time, github_budget=GitHubRateBudget(time, log))
+
+    result = CliRunner().invoke(admin_group, ["github-budget"], obj=ctx, catch_exceptions=False)
+
+    assert result.exit_code == 0
+    assert "No GitHub API usage recorded in the last day" in result.output
+
+
+def test_invocation_is_logged_under_its_subcommand_path(tmp_path: Path) -> None:
+    time = FakeTime(_NOW)
+    log = GitHubBudgetLog(tmp_path / "github-budget.jsonl", time)
+    budget = GitHubRateBudget(time, log)
+    budget.record_rest(limit=5000, remaining=4999, reset_at=_NOW + timedelta(hours=1))
+    ctx = ErkContext.for_test(time=time, github_budget=budget)
+
+    result = CliRunner().invoke(cli, ["admin", "github-budget"], obj=ctx, catch_exceptions=False)
+
+    assert result.exit_code == 0
+    entries = log.read(since=_NOW - timedelta(days=1))
+    assert [entry.command for entry in entries] == ["admin github-budget"]
@@ -6,6 +6,7 @@ from click.testing import CliRunner
 from erk_shared.github.issues import FakeGitHubIssues, IssueInfo
 
 from erk.cli.cli import cli
+from erk.core.completion_cache import cached_plans
 from erk.core.plan_store.types import Plan, PlanState
 from tests.test_utils.context_builders import build_workspace_test_context
 from tests.test_utils.env_helpers import erk_inmem_env, erk_isolated_fs_env
@@ -1147,8 +1148,6 @@ def test_list_plans_pr_column_open_pr() -> None:
     """Test PR column displays open PR with 👀 emoji."""
     from erk_shared.github.types import PullRequestInfo
 
-    from erk.core.github.fake import FakeGitHub
-
     # Arrange
     plan = Plan(
         plan_identifier="100",
@@ -1177,9 +1176,8 @@ def test_list_plans_pr_column_open_pr() -> None:
 
     runner = CliRunner()
     with erk_inmem_env(runner) as env:
-        issues = FakeGitHubIssues(issues={100: plan_to_issue(plan)})
-        github = FakeGitHub(pr_issue_linkages={100: [pr]})
-        ctx = build_workspace_test_context(env, issues=issues, github=github)
+        issues = FakeGitHubIssues(issues={100: plan_to_issue(plan)}, pr_linkages={100: [pr]})
+        ctx = build_workspace_test_context(env, issues=issues)
 
         # Act - Use --prs flag to show PR columns
         result = runner.invoke(cli, ["list", "--prs"], obj=ctx)
@@ -1196,8 +1194,6 @@ def test_list_plans_pr_column_draft_pr() -> None:
     """Test PR column displays draft PR with 🚧 emoji."""
     from erk_shared.github.types import PullRequestInfo
 
-    from erk.core.github.fake import FakeGitHub
-
     # Arrange
     plan = Plan(
         plan_identifier="101",
@@ -1226,9 +1222,8 @@ def test_list_plans_pr_column_draft_pr() -> None:
 
     runner = CliRunner()
     with erk_inmem_env(runner) as env:
-        issues = FakeGitHubIssues(issues={101: plan_to_issue(plan)})
-        github = FakeGitHub(pr_issue_linkages={101: [pr]})
-        ctx = build_workspace_test_context(env, issues=issues, github=github)
+        issues = FakeGitHubIssues(issues={101: plan_to_issue(plan)}, pr_linkages={101: [pr]})
+        ctx = build_workspace_test_context(env, issues=issues)
 
         # Act - Use --prs flag to show PR columns
         result = runner.invoke(cli, ["list", "--prs"], obj=ctx)
@@ -1245,8 +1240,6 @@ def test_list_plans_pr_column_merged_pr() -> None:
     """Test PR column displays merged PR with 🎉 emoji."""
     from erk_shared.github.types import PullRequestInfo
 
-    from erk.core.github.fake import FakeGitHub
-
     # Arrange
     plan = Plan(
         plan_identifier="102",
@@ -1275,9 +1268,8 @@ def test_list_plans_pr_column_merged_pr() -> None:
 
     runner = CliRunner()
     with erk_inmem_env(runner) as env:
-        issues = FakeGitHubIssues(issues={102: plan_to_issue(plan)})
-        github = FakeGitHub(pr_issue_linkages={102: [pr]})
-        ctx = build_workspace_test_context(env, issues=issues, github=github)
+        issues = FakeGitHubIssues(issues={102: plan_to_issue(plan)}, pr_linkages={102: [pr]})
+        ctx = build_workspace_test_context(env, issues=issues)
 
         # Act - Use --prs flag to show PR columns
         result = runner.invoke(cli, ["list", "--prs"], obj=ctx)
@@ -1294,8 +1286,6 @@ def test_list_plans_pr_column_closed_pr() -> None:
     """Test PR column displays closed PR with ⛔ emoji."""
     from erk_shared.github.types import PullRequestInfo
 
-    from erk.core.github.fake import FakeGitHub
-
     # Arrange
     plan = Plan(
         plan_identifier="103",
@@ -1324,9 +1314,8 @@ def test_list_plans_pr_column_closed_pr() -> None:
 
     runner = CliRunner()
     with erk_inmem_env(runner) as env:
-        issues = FakeGitHubIssues(issues={103: plan_to_issue(plan)})
-        github = FakeGitHub(pr_issue_linkages={103: [pr]})
-        ctx = build_workspace_test_context(env, issues=issues, github=github)
+        issues = FakeGitHubIssues(issues={103: plan_to_issue(plan)}, pr_linkages={103: [pr]})
+        ctx = build_workspace_test_context(env, issues=issues)
 
         # Act - Use --prs flag to show PR columns
         result = runner.invoke(cli, ["list", "--prs"], obj=ctx)
@@ -1343,8 +1332,6 @@ def test_list_plans_pr_column_with_conflicts() -> None:
     """Test PR column shows conflict indicator 💥 for open/draft PRs with conflicts."""
     from erk_shared.github.types import PullRequestInfo
 
-    from erk.core.github.fake import FakeGitHub
-
     # Arrange
     plan = Plan(
         plan_identifier="104",
@@ -1373,9 +1360,8 @@ def test_list_plans_pr_column_with_conflicts() -> None:
 
     runner = CliRunner()
     with erk_inmem_env(runner) as env:
-        issues = FakeGitHubIssues(issues={104: plan_to_issue(plan)})
-        github = FakeGitHub(pr_issue_linkages={104: [pr]})
-        ctx = build_workspace_test_context(env, issues=issues, github=github)
+        issues = FakeGitHubIssues(issues={104: plan_to_issue(plan)}, pr_linkages={104: [pr]})
+        ctx = build_workspace_test_context(env, issues=issues)
 
         # Act - Use --prs flag to show PR columns
         result = runner.invoke(cli, ["list", "--prs"], obj=ctx)
@@ -1392,8 +1378,6 @@ def test_list_plans_pr_column_multiple_prs_prefers_open() -> None:
     """Test PR column shows most recent open PR when multiple PRs exist."""
     from erk_shared.github.types import PullRequestInfo
 
-    from erk.core.github.fake import FakeGitHub
-
     # Arrange
     plan = Plan(
         plan_identifier="105",
@@ -1436,10 +1420,11 @@ def test_list_plans_pr_column_multiple_prs_prefers_open() -> None:
 
     runner = CliRunner()
     with erk_inmem_env(runner) as env:
-        issues = FakeGitHubIssues(issues={105: plan_to_issue(plan)})
         # PRs already sorted by created_at descending
-        github = FakeGitHub(pr_issue_linkages={105: [open_pr, closed_pr]})
-        ctx = build_workspace_test_context(env, issues=issues, github=github)
+        issues = FakeGitHubIssues(
+            issues={105: plan_to_issue(plan)}, pr_linkages={105: [open_pr, closed_pr]}
+        )
+        ctx = build_workspace_test_context(env, issues=issues)
 
         # Act - Use --prs flag to show PR columns
         result = runner.invoke(cli, ["list", "--prs"], obj=ctx)
@@ -1485,3 +1470,49 @@ def test_list_plans_pr_column_no_pr_linked() -> None:
         assert "🚧" not in result.output
         assert "🎉" not in result.output
         assert "⛔" not in result.output
+
+
+def test_list_plans_records_open_plans_for_completion() -> None:
+    """Unfiltered listings record open plans as shell completion candidates."""
+    # Arrange
+    open_plan = Plan(
+        plan_identifier="1",
+        title="Open plan",
+        body="",
+        state=PlanState.OPEN,
+        url="https://github.com/owner/repo/issues/1",
+        labels=["erk-plan"],
+        assignees=[],
+        created_at=datetime(2024, 1, 1, tzinfo=UTC),
+        updated_at=datetime(2024, 1, 1, tzinfo=UTC),
+        metadata={},
+    )
+    closed_plan = Plan(
+        plan_identifier="2",
+        title="Closed plan",
+        body="",
+        state=PlanState.CLOSED,
+        url="https://github.com/owner/repo/issues/2",
+        labels=["erk-plan"],
+        assignees=[],
+        created_at=datetime(2024, 1, 2, tzinfo=UTC),
+        updated_at=datetime(2024, 1, 2, tzinfo=UTC),
+        metadata={},
+    )
+
+    runner = CliRunner()
+    with erk_isolated_fs_env(runner) as env:
+        issues = FakeGitHubIssues(
+            issues={1: plan_to_issue(open_plan), 2: plan_to_issue(closed_plan)}
+        )
+        cache_path = env.cwd.parent / "completion.json"
+        ctx = build_workspace_test_context(env, issues=issues, completion_cache_path=cache_path)
+
+        # Act
+        result = runner.invoke(cli, ["list"], obj=ctx)
+        filtered = runner.invoke(cli, ["list", "--label", "other"], obj=ctx)
+
+        # Assert
+        assert result.exit_code == 0
+        assert filtered.exit_code == 0
+        assert [(c.value, c.help) for c in cached_plans(cache_path)] == [("1", "Open plan")]
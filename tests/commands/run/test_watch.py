@@ -0,0 +1,87 @@
+"""CLI tests for erk run watch command."""
+
+from pathlib import Path
+
+from click.testing import CliRunner
+from erk_shared.git.abc import WorktreeInfo
+from erk_shared.github.types import WorkflowRun
+
+from erk.cli.commands.run.watch_cmd import watch_runs
+from erk.core.git.fake import FakeGit
+from erk.core.github.fake import FakeGitHub
+from tests.fakes.context import create_test_context
+
+
+def _context(tmp_path: Path, runs: list[WorkflowRun]):
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir()
+    (repo_root / ".git").mkdir()
+    git_ops = FakeGit(
+        worktrees={repo_root: [WorktreeInfo(path=repo_root, branch="main")]},
+        current_branches={repo_root: "main"},
+        git_common_dirs={repo_root: repo_root / ".git"},
+    )
+    return create_test_context(git=git_ops, github=FakeGitHub(workflow_runs=runs), cwd=repo_root)
+
+
+def _run(run_id: str, status: str, conclusion: str | None) -> WorkflowRun:
+    return WorkflowRun(
+        run_id=run_id,
+        status=status,
+        conclusion=conclusion,
+        branch="master",
+        head_sha="abc123",
+        display_title="42:abc123",
+    )
+
+
+def test_watch_reports_completed_runs(tmp_path: Path) -> None:
+    ctx = _context(tmp_path, [_run("111", "completed", "success")])
+
+    result = CliRunner().invoke(watch_runs, ["111"], obj=ctx, catch_exceptions=False)
+
+    assert result.exit_code == 0, result.output
+    assert "#42 run 111" in result.output
+    assert "success" in result.output
+
+
+def test_watch_fails_when_a_run_fails(tmp_path: Path) -> None:
+    ctx = _context(
+        tmp_path, [_run("111", "completed", "success"), _run("222", "completed", "failure")]
+    )
+
+    result = CliRunner().invoke(watch_runs, ["111", "222"], obj=ctx, catch_exceptions=False)
+
+    assert result.exit_code == 1
+    assert "failure" in result.output
+
+
+def test_watch_without_targets_and_no_active_runs(tmp_path: Path) -> None:
+    ctx = _context(tmp_path, [_run("111", "completed", "success")])
+
+    result = CliRunner().invoke(watch_runs, [], obj=ctx, catch_exceptions=False)
+
+    assert result.exit_code == 0
+    assert "No queued or running workflow runs" in result.output
+
+
+def test_watch_times_out(tmp_path: Path) -> None:
+    ctx = _context(tmp_path, [_run("111", "in_progress", None)])
+
+    result = CliRunner().invoke(
+        watch_runs, ["111", "--timeout", "30"], obj=ctx, catch_exceptions=False
+    )
+
+    assert result.exit_code == 1
+    assert "running" in result.output
+    assert "Timed out" in result.output
+
+
+def test_watch_reports_unknown_run_ids(tmp_path: Path) -> None:
+    ctx = _context(tmp_path, [_run("111", "completed", "success")])
+
+    result = CliRunner().invoke(watch_runs, ["111", "999"], obj=ctx, catch_exceptions=False)
+
+    assert result.exit_code == 1
+    assert "No workflow run found for: 999" in result.output
+    assert "Timed out" not in result.output
@@ -524,3 +524,39 @@ def test_config_get_post_create_invalid_key_format() -> None:
         assert result.exit_code == 1
         assert "Error:" in result.output
         assert "Invalid key" in result.output
+
+
+def test_config_set_git_backend() -> None:
+    """Test that config set git_backend saves the value and rejects unknown backends."""
+    runner = CliRunner()
+    with erk_inmem_env(runner) as env:
+        test_ctx = env.build_context(git=FakeGit(git_common_dirs={env.cwd: env.git_dir}))
+
+        result = runner.invoke(cli, ["config", "set", "git_backend", "plumbing"], obj=test_ctx)
+
+        assert result.exit_code == 0, result.output
+        assert test_ctx.config_store.load().git_backend == "plumbing"
+
+        result = runner.invoke(cli, ["config", "set", "git_backend", "libgit2"], obj=test_ctx)
+
+        assert result.exit_code == 1
+        assert "Invalid git_backend: libgit2" in result.output
+        assert test_ctx.config_store.load().git_backend == "plumbing"
+
+
+def test_config_set_parallel_workers() -> None:
+    """Test that config set parallel_workers saves the value and rejects non-positive counts."""
+    runner = CliRunner()
+    with erk_inmem_env(runner) as env:
+        test_ctx = env.build_context(git=FakeGit(git_common_dirs={env.cwd: env.git_dir}))
+
+        result = runner.invoke(cli, ["config", "set", "parallel_workers", "3"], obj=test_ctx)
+
+        assert result.exit_code == 0, result.output
+        assert test_ctx.config_store.load().parallel_workers == 3
+
+        result = runner.invoke(cli, ["config", "set", "parallel_workers", "0"], obj=test_ctx)
+
+        assert result.exit_code == 1
+        assert "Invalid parallel_workers: 0" in result.output
+        assert test_ctx.config_store.load().parallel_workers == 3
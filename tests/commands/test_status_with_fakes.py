@@ -168,6 +168,37 @@ def test_status_cmd_displays_all_collector_sections(tmp_path: Path) -> None:
     assert "Implementation:" in result.output or "Feature Plan" in result.output
 
 
+def test_status_cmd_all_shows_every_worktree(tmp_path: Path) -> None:
+    """Test status --all renders one table row per worktree (CLI layer)."""
+    scenario = (
+        WorktreeScenario(tmp_path)
+        .with_main_branch()
+        .with_feature_branch("feature-a")
+        .with_feature_branch("feature-b")
+        .with_pr("feature-a", number=123, checks_passing=True)
+        .with_graphite_stack(["main", "feature-a"])
+        .build()
+    )
+
+    runner = CliRunner()
+    original_dir = os.getcwd()
+    os.chdir(scenario.repo_root)
+
+    try:
+        result = runner.invoke(status_cmd, ["--all"], obj=scenario.ctx, catch_exceptions=False)
+    finally:
+        os.chdir(original_dir)
+
+    assert result.exit_code == 0
+    assert "root" in result.output
+    assert "feature-a" in result.output
+    assert "feature-b" in result.output
+    assert "#123" in result.output
+    assert "Git Status:" not in result.output
+    # PRs for all worktrees come from a single listing
+    assert len(scenario.github.get_prs_for_repo_calls) == 1
+
+
 def test_status_cmd_not_in_git_repo(tmp_path: Path) -> None:
     """Test status command fails when not in a git repository (error handling)."""
     # Arrange
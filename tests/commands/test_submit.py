@@ -5,6 +5,7 @@ from pathlib import Path
 
 from click.testing import CliRunner
 from erk_shared.github.issues import FakeGitHubIssues, IssueInfo
+from erk_shared.github.types import WorkflowRun
 from erk_shared.naming import derive_branch_name_with_date
 from erk_shared.plan_store.fake import FakePlanStore
 from erk_shared.plan_store.types import Plan, PlanState
@@ -14,6 +15,7 @@ from erk.core.context import ErkContext
 from erk.core.git.fake import FakeGit
 from erk.core.github.fake import FakeGitHub
 from erk.core.repo_discovery import RepoContext
+from erk.core.trunk_cache import TrunkBranchResolver
 
 
 def test_submit_creates_branch_and_draft_pr(tmp_path: Path) -> None:
@@ -111,6 +113,64 @@ def test_submit_creates_branch_and_draft_pr(tmp_path: Path) -> None:
     assert expected_branch in fake_git._deleted_branches
 
 
+def test_submit_bases_branch_on_configured_trunk(tmp_path: Path) -> None:
+    """A [tool.erk] trunk_branch override is the base of the branch and PR."""
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir()
+    (repo_root / "pyproject.toml").write_text(
+        '[tool.erk]\ntrunk_branch = "develop"\n', encoding="utf-8"
+    )
+
+    now = datetime.now(UTC)
+    issue = IssueInfo(
+        number=123,
+        title="Implement feature X",
+        body="# Plan",
+        state="OPEN",
+        url="https://github.com/test-owner/test-repo/issues/123",
+        labels=[ERK_PLAN_LABEL],
+        assignees=[],
+        created_at=now,
+        updated_at=now,
+    )
+    plan = Plan(
+        plan_identifier="123",
+        title="Implement feature X",
+        body="# Plan",
+        state=PlanState.OPEN,
+        url="https://github.com/test-owner/test-repo/issues/123",
+        labels=[ERK_PLAN_LABEL],
+        assignees=[],
+        created_at=now,
+        updated_at=now,
+        metadata={},
+    )
+    fake_git = FakeGit(current_branches={repo_root: "main"}, trunk_branches={repo_root: "master"})
+    fake_github = FakeGitHub()
+    repo_dir = tmp_path / ".erk" / "repos" / "test-repo"
+    ctx = ErkContext.for_test(
+        cwd=repo_root,
+        git=fake_git,
+        github=fake_github,
+        issues=FakeGitHubIssues(issues={123: issue}),
+        plan_store=FakePlanStore(plans={"123": plan}),
+        trunk_resolver=TrunkBranchResolver(cache_path=None),
+        repo=RepoContext(
+            root=repo_root,
+            repo_name="test-repo",
+            repo_dir=repo_dir,
+            worktrees_dir=repo_dir / "worktrees",
+        ),
+    )
+
+    result = CliRunner().invoke(submit_cmd, ["123"], obj=ctx)
+
+    assert result.exit_code == 0, result.output
+    assert fake_git.fetched_branches == [("origin", "develop")]
+    _, _, _, base, _ = fake_github.created_prs[0]
+    assert base == "develop"
+
+
 def test_submit_skips_branch_creation_when_exists(tmp_path: Path) -> None:
     """Test submit skips branch/PR creation when branch already exists on remote."""
     repo_root = tmp_path / "repo"
@@ -520,3 +580,71 @@ def test_submit_strips_plan_markers_from_pr_title(tmp_path: Path) -> None:
     pr_number, updated_body = fake_github.updated_pr_bodies[0]
     assert pr_number == 999  # FakeGitHub returns 999 for created PRs
     assert "erk pr checkout 999" in updated_body
+
+
+def test_submit_wait_streams_run_until_completed(tmp_path: Path) -> None:
+    """Test submit --wait watches the triggered run and reports its outcome."""
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir()
+
+    now = datetime.now(UTC)
+    issue = IssueInfo(
+        number=123,
+        title="Implement feature X",
+        body="# Plan\n\nImplementation details...",
+        state="OPEN",
+        url="https://github.com/test-owner/test-repo/issues/123",
+        labels=[ERK_PLAN_LABEL],
+        assignees=[],
+        created_at=now,
+        updated_at=now,
+    )
+    plan = Plan(
+        plan_identifier="123",
+        title="Implement feature X",
+        body="# Plan\n\nImplementation details...",
+        state=PlanState.OPEN,
+        url="https://github.com/test-owner/test-repo/issues/123",
+        labels=[ERK_PLAN_LABEL],
+        assignees=[],
+        created_at=now,
+        updated_at=now,
+        metadata={},
+    )
+    # FakeGitHub.trigger_workflow() returns "1234567890"
+    fake_github = FakeGitHub(
+        workflow_runs=[
+            WorkflowRun(
+                run_id="1234567890",
+                status="completed",
+                conclusion="failure",
+                branch="master",
+                head_sha="abc123",
+                display_title="123:abc123",
+            )
+        ]
+    )
+
+    repo_dir = tmp_path / ".erk" / "repos" / "test-repo"
+    repo = RepoContext(
+        root=repo_root,
+        repo_name="test-repo",
+        repo_dir=repo_dir,
+        worktrees_dir=repo_dir / "worktrees",
+    )
+    ctx = ErkContext.for_test(
+        cwd=repo_root,
+        git=FakeGit(current_branches={repo_root: "main"}, trunk_branches={repo_root: "master"}),
+        github=fake_github,
+        issues=FakeGitHubIssues(issues={123: issue}),
+        plan_store=FakePlanStore(plans={"123": plan}),
+        repo=repo,
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(submit_cmd, ["123", "--wait"], obj=ctx)
+
+    assert result.exit_code == 1, result.output
+    assert "Issue submitted successfully!" in result.output
+    assert "#123 run 1234567890" in result.output
+    assert "failure" in result.output
@@ -12,6 +12,7 @@ from erk.cli.cli import cli
 from erk.cli.config import LoadedConfig
 from erk.core.git.fake import FakeGit
 from erk.core.repo_discovery import RepoContext
+from erk.core.trunk_cache import TrunkBranchResolver
 from tests.test_utils.env_helpers import erk_inmem_env, erk_isolated_fs_env
 
 
@@ -1671,3 +1672,21 @@ def test_create_error_message_suggests_wt_create() -> None:
         assert result.exit_code == 1
         # Should mention --branch as a valid option
         assert "--branch" in result.output
+
+
+def test_create_rejects_configured_trunk_name() -> None:
+    """A [tool.erk] trunk_branch override is the trunk wt create refuses."""
+    runner = CliRunner()
+    with erk_isolated_fs_env(runner) as env:
+        (env.cwd / "pyproject.toml").write_text(
+            '[tool.erk]\ntrunk_branch = "develop"\n', encoding="utf-8"
+        )
+        git_ops = FakeGit(git_common_dirs={env.cwd: env.git_dir}, trunk_branches={env.cwd: "main"})
+
+        test_ctx = env.build_context(
+            git=git_ops, trunk_resolver=TrunkBranchResolver(cache_path=None)
+        )
+
+        result = runner.invoke(cli, ["wt", "create", "develop"], obj=test_ctx)
+        assert result.exit_code == 1
+        assert '"develop" cannot be used as a worktree name' in result.output
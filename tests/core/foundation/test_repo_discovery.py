@@ -0,0 +1,64 @@
+"""Tests for repository discovery, including offline GitHub identity resolution."""
+
+from pathlib import Path
+
+from erk_shared.github.repo_identity import save_cached_repo_identity
+from erk_shared.github.types import RepoIdentity
+
+from erk.core.git.fake import FakeGit
+from erk.core.repo_discovery import NoRepoSentinel, RepoContext, discover_repo_or_sentinel
+
+
+def _write_origin(git_dir: Path, url: str) -> None:
+    git_dir.mkdir(parents=True, exist_ok=True)
+    (git_dir / "config").write_text(f'[remote "origin"]\n\turl = {url}\n', encoding="utf-8")
+
+
+def test_discover_parses_identity_from_origin_remote(tmp_path: Path) -> None:
+    repo_root = tmp_path / "erk"
+    _write_origin(repo_root / ".git", "git@github.com:dagster-io/erk.git")
+    git = FakeGit(
+        git_common_dirs={repo_root: repo_root / ".git"},
+        existing_paths={repo_root, repo_root / ".git" / "config"},
+    )
+
+    repo = discover_repo_or_sentinel(repo_root, tmp_path / "erks", git)
+
+    assert isinstance(repo, RepoContext)
+    assert repo.identity == RepoIdentity(owner="dagster-io", name="erk")
+
+
+def test_discover_uses_cache_for_unparseable_remote(tmp_path: Path) -> None:
+    repo_root = tmp_path / "erk"
+    erk_root = tmp_path / "erks"
+    _write_origin(repo_root / ".git", "git@work-alias:dagster-io/erk.git")
+    cache_path = erk_root / "repos" / "erk" / "repo-identity.json"
+    cached = RepoIdentity(owner="dagster-io", name="erk")
+    save_cached_repo_identity(cache_path, cached)
+    git = FakeGit(
+        git_common_dirs={repo_root: repo_root / ".git"},
+        existing_paths={repo_root, repo_root / ".git" / "config", cache_path},
+    )
+
+    repo = discover_repo_or_sentinel(repo_root, erk_root, git)
+
+    assert isinstance(repo, RepoContext)
+    assert repo.identity == cached
+    assert repo.identity_cache_path == cache_path
+
+
+def test_discover_identity_none_without_remote_or_cache(tmp_path: Path) -> None:
+    repo_root = tmp_path / "erk"
+    (repo_root / ".git").mkdir(parents=True)
+    git = FakeGit(git_common_dirs={repo_root: repo_root / ".git"}, existing_paths={repo_root})
+
+    repo = discover_repo_or_sentinel(repo_root, tmp_path / "erks", git)
+
+    assert isinstance(repo, RepoContext)
+    assert repo.identity is None
+
+
+def test_discover_outside_repo_returns_sentinel(tmp_path: Path) -> None:
+    git = FakeGit(existing_paths={tmp_path})
+
+    assert isinstance(discover_repo_or_sentinel(tmp_path, tmp_path / "erks", git), NoRepoSentinel)
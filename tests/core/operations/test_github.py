@@ -2,6 +2,7 @@
 
 import pytest
 from erk_shared.github.parsing import _parse_github_pr_url
+from erk_shared.github.types import RepoIdentity
 from erk_shared.integrations.time.fake import FakeTime
 
 from erk.core.github.real import RealGitHub
@@ -105,7 +106,7 @@ def test_build_batch_pr_query_has_contexts_nodes_wrapper() -> None:
     """
     ops = RealGitHub(FakeTime())
 
-    query = ops._build_batch_pr_query([123], "owner", "repo")
+    query = ops._build_batch_pr_query([123], RepoIdentity(owner="owner", name="repo"))
 
     # Critical: contexts must have nodes wrapper (in the fragment definition)
     assert "contexts(last: 100) {" in query
@@ -126,7 +127,9 @@ def test_build_batch_pr_query_structure() -> None:
     """Test that GraphQL query has correct overall structure with named fragments."""
     ops = RealGitHub(FakeTime())
 
-    query = ops._build_batch_pr_query([123, 456], "test-owner", "test-repo")
+    query = ops._build_batch_pr_query(
+        [123, 456], RepoIdentity(owner="test-owner", name="test-repo")
+    )
 
     # Validate fragment definition is present
     assert "fragment PRCICheckFields on PullRequest {" in query
@@ -162,7 +165,7 @@ def test_build_batch_pr_query_multiple_prs() -> None:
     ops = RealGitHub(FakeTime())
 
     pr_numbers = [100, 200, 300]
-    query = ops._build_batch_pr_query(pr_numbers, "owner", "repo")
+    query = ops._build_batch_pr_query(pr_numbers, RepoIdentity(owner="owner", name="repo"))
 
     # Each PR should have a unique alias
     for pr_num in pr_numbers:
@@ -300,7 +303,9 @@ def test_build_title_batch_query_structure() -> None:
     """Test that title query has correct structure with only number and title fields."""
     ops = RealGitHub(FakeTime())
 
-    query = ops._build_title_batch_query([123, 456], "test-owner", "test-repo")
+    query = ops._build_title_batch_query(
+        [123, 456], RepoIdentity(owner="test-owner", name="test-repo")
+    )
 
     # Validate basic GraphQL syntax
     assert "query {" in query
@@ -499,7 +504,9 @@ def test_build_issue_pr_linkage_query_structure() -> None:
     """Test that issue-PR linkage query uses timeline API with CrossReferencedEvent."""
     ops = RealGitHub(FakeTime())
 
-    query = ops._build_issue_pr_linkage_query([100, 200], "test-owner", "test-repo")
+    query = ops._build_issue_pr_linkage_query(
+        [100, 200], RepoIdentity(owner="test-owner", name="test-repo")
+    )
 
     # Validate basic GraphQL syntax
     assert "query {" in query
@@ -559,7 +566,7 @@ def test_parse_issue_pr_linkages_with_single_pr() -> None:
         }
     }
 
-    result = ops._parse_issue_pr_linkages(response, "owner", "repo")
+    result = ops._parse_issue_pr_linkages(response, RepoIdentity(owner="owner", name="repo"))
 
     # Should have one issue with one PR
     assert 100 in result
@@ -619,7 +626,7 @@ def test_parse_issue_pr_linkages_with_multiple_prs() -> None:
         }
     }
 
-    result = ops._parse_issue_pr_linkages(response, "owner", "repo")
+    result = ops._parse_issue_pr_linkages(response, RepoIdentity(owner="owner", name="repo"))
 
     # Should have one issue with two PRs, sorted by created_at descending
     assert 100 in result
@@ -684,7 +691,7 @@ def test_parse_issue_pr_linkages_with_pr_linking_multiple_issues() -> None:
         }
     }
 
-    result = ops._parse_issue_pr_linkages(response, "owner", "repo")
+    result = ops._parse_issue_pr_linkages(response, RepoIdentity(owner="owner", name="repo"))
 
     # Should have two issues, each with the same PR
     assert 100 in result
@@ -714,7 +721,7 @@ def test_parse_issue_pr_linkages_handles_empty_timeline() -> None:
         }
     }
 
-    result = ops._parse_issue_pr_linkages(response, "owner", "repo")
+    result = ops._parse_issue_pr_linkages(response, RepoIdentity(owner="owner", name="repo"))
 
     # Issue with no PRs should not appear in result
     assert 100 not in result
@@ -757,7 +764,7 @@ def test_parse_issue_pr_linkages_handles_null_nodes() -> None:
         }
     }
 
-    result = ops._parse_issue_pr_linkages(response, "owner", "repo")
+    result = ops._parse_issue_pr_linkages(response, RepoIdentity(owner="owner", name="repo"))
 
     # Should skip null nodes and process valid ones
     assert 100 in result
@@ -796,7 +803,7 @@ def test_parse_issue_pr_linkages_handles_missing_optional_fields() -> None:
         }
     }
 
-    result = ops._parse_issue_pr_linkages(response, "owner", "repo")
+    result = ops._parse_issue_pr_linkages(response, RepoIdentity(owner="owner", name="repo"))
 
     # Should handle missing fields gracefully
     assert 100 in result
@@ -852,7 +859,7 @@ def test_parse_issue_pr_linkages_filters_non_closing_prs() -> None:
         }
     }
 
-    result = ops._parse_issue_pr_linkages(response, "owner", "repo")
+    result = ops._parse_issue_pr_linkages(response, RepoIdentity(owner="owner", name="repo"))
 
     # Should only include the closing PR
     assert 100 in result
@@ -892,7 +899,7 @@ def test_parse_issue_pr_linkages_handles_issue_not_found() -> None:
         }
     }
 
-    result = ops._parse_issue_pr_linkages(response, "owner", "repo")
+    result = ops._parse_issue_pr_linkages(response, RepoIdentity(owner="owner", name="repo"))
 
     # Non-existent issue should be skipped
     assert 100 not in result
@@ -4,7 +4,7 @@ import subprocess
 from pathlib import Path
 
 import pytest
-from erk_shared.github.types import PullRequestInfo
+from erk_shared.github.types import PullRequestInfo, RepoIdentity
 from erk_shared.integrations.time.fake import FakeTime
 from pytest import MonkeyPatch
 
@@ -249,7 +249,7 @@ def test_build_batch_pr_query_includes_mergeability():
     owner = "test-owner"
     repo = "test-repo"
 
-    query = github_ops._build_batch_pr_query(pr_numbers, owner, repo)
+    query = github_ops._build_batch_pr_query(pr_numbers, RepoIdentity(owner=owner, name=repo))
 
     # Verify query contains fragment definition with both CI and mergeability fields
     assert "fragment PRCICheckFields on PullRequest" in query
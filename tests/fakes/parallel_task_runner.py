@@ -91,3 +91,52 @@ class FakeParallelTaskRunner(ParallelTaskRunner):
 
         # Return pre-configured results (None for any task not configured)
         return {task_name: self._results.get(task_name) for task_name in tasks}
+
+    def format_timings(self) -> list[str]:
+        """Return no timings; the fake doesn't run tasks."""
+        return []
+
+
+class SerialParallelTaskRunner(ParallelTaskRunner):
+    """Runs tasks one after another in the calling thread.
+
+    The default runner of test contexts: tasks really run (collectors see
+    the fakes they were given) without starting a worker pool. Timeouts are
+    not enforced; a task that raises returns None, as with the real runner.
+    """
+
+    def __init__(self) -> None:
+        """Create a runner that has run no tasks."""
+        self._ran_tasks: list[str] = []
+
+    @property
+    def ran_tasks(self) -> list[str]:
+        """Get names of the tasks run so far, in order."""
+        return list(self._ran_tasks)
+
+    def run_parallel(
+        self, tasks: dict[str, Callable[[], object]], timeout_per_task: float
+    ) -> dict[str, object | None]:
+        """Run each task in turn.
+
+        Args:
+            tasks: Dictionary mapping task names to callables
+            timeout_per_task: Timeout value (ignored)
+
+        Returns:
+            Task results (None for tasks that raised)
+        """
+        results: dict[str, object | None] = {}
+        for name, task in tasks.items():
+            self._ran_tasks.append(name)
+            # Error boundary: a failing task degrades to None, as in
+            # RealParallelTaskRunner
+            try:
+                results[name] = task()
+            except Exception:
+                results[name] = None
+        return results
+
+    def format_timings(self) -> list[str]:
+        """Return no timings; tasks run inline."""
+        return []
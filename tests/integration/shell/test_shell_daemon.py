@@ -0,0 +1,247 @@
+"""Tests for the resident shell-integration daemon and its client."""
+
+import subprocess
+import sys
+import tempfile
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from erk_shared.integrations.time.fake import FakeTime
+
+from erk.cli.shell_integration import daemon as daemon_module
+from erk.cli.shell_integration.client import (
+    PROTOCOL_VERSION,
+    daemon_socket_path,
+    forward_shell_request,
+    send_daemon_request,
+)
+from erk.cli.shell_integration.daemon import RepoWatch, ShellDaemon, start_daemon
+from erk.cli.shell_integration.handler import ShellIntegrationResult
+
+
+def _git(cwd: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _init_repo(path: Path) -> Path:
+    path.mkdir()
+    _git(path, "init", "-b", "main")
+    _git(path, "commit", "--allow-empty", "-m", "init")
+    return path
+
+
+def _configure_erk(home: Path) -> None:
+    """Write the global config a navigation needs under a temporary home."""
+    config_dir = home / ".erk"
+    config_dir.mkdir(parents=True, exist_ok=True)
+    (config_dir / "config.toml").write_text(
+        f'erk_root = "{home / "erks"}"\nuse_graphite = false\n', encoding="utf-8"
+    )
+
+
+def _navigate(repo: Path, *args: str) -> tuple[int, Path | None]:
+    """Forward `erk __shell <args>` from repo, returning the exit code and script."""
+    response = send_daemon_request(
+        {"op": "shell", "args": list(args), "cwd": str(repo), "env": {}, "isatty": False}
+    )
+    assert response is not None
+    stdout = response["stdout"].strip()
+    if response["exit_code"] != 0 or not stdout.startswith("/"):
+        return response["exit_code"], None
+    return response["exit_code"], Path(stdout)
+
+
+@pytest.fixture
+def running_daemon(monkeypatch: pytest.MonkeyPatch) -> Iterator[ShellDaemon]:
+    """A daemon serving on the per-user socket under a temporary home."""
+    # Unix socket paths are limited to ~100 bytes, which pytest's tmp_path
+    # can exceed on macOS
+    with tempfile.TemporaryDirectory(dir="/tmp") as home:
+        monkeypatch.setattr("pathlib.Path.home", lambda: Path(home))
+        monkeypatch.delenv("ERK_SHELL_DAEMON", raising=False)
+        daemon = ShellDaemon(daemon_socket_path(), idle_timeout=30, time=FakeTime())
+        thread = threading.Thread(target=daemon.serve, daemon=True)
+        thread.start()
+        for _ in range(500):
+            if send_daemon_request({"op": "status"}) is not None:
+                break
+            thread.join(0.01)
+
+        yield daemon
+
+        send_daemon_request({"op": "stop"})
+        thread.join(5)
+        assert not daemon_socket_path().exists()
+
+
+def test_forward_without_daemon_runs_in_process(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """With no socket the client declines and the request runs in-process."""
+    monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
+
+    assert forward_shell_request(["up"]) is None
+
+
+def test_forward_replays_daemon_output(
+    running_daemon: ShellDaemon,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """A forwarded request prints what `erk __shell` would have printed."""
+    monkeypatch.chdir(tmp_path)
+
+    exit_code = forward_shell_request(["up", "--help"])
+
+    assert exit_code == 0
+    assert capsys.readouterr().out == "__ERK_PASSTHROUGH__\n"
+    # The daemon restores its own environment after serving the request
+    assert Path.cwd() == tmp_path
+
+
+def test_daemon_can_be_bypassed(
+    running_daemon: ShellDaemon, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """ERK_SHELL_DAEMON=0 skips a running daemon."""
+    monkeypatch.setenv("ERK_SHELL_DAEMON", "0")
+
+    assert forward_shell_request(["up"]) is None
+
+
+def test_protocol_mismatch_falls_back(running_daemon: ShellDaemon) -> None:
+    """A client speaking another protocol version is told to run in-process."""
+    request = {"version": PROTOCOL_VERSION + 1, "op": "shell", "args": ["up"], "cwd": "/"}
+
+    assert running_daemon.handle_request(request) == {"fallback": True}
+
+
+def test_idle_daemon_exits_without_accepting(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Once the idle timeout has passed on the daemon's clock, serve() returns."""
+    with tempfile.TemporaryDirectory(dir="/tmp") as home:
+        monkeypatch.setattr("pathlib.Path.home", lambda: Path(home))
+        time = FakeTime()
+        daemon = ShellDaemon(daemon_socket_path(), idle_timeout=30, time=time)
+        assert daemon.idle_seconds_left() == 30
+
+        time.sleep(30)
+        daemon.serve()
+
+        assert daemon.idle_seconds_left() <= 0
+        assert not daemon_socket_path().exists()
+
+
+def test_start_daemon_gives_up_at_deadline(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A daemon that never answers is polled until the start deadline, then reported."""
+    spawned: list[list[str]] = []
+    monkeypatch.setattr(
+        daemon_module.subprocess, "Popen", lambda args, **kwargs: spawned.append(args)
+    )
+    with tempfile.TemporaryDirectory(dir="/tmp") as home:
+        monkeypatch.setattr("pathlib.Path.home", lambda: Path(home))
+        time = FakeTime()
+
+        assert start_daemon(idle_timeout=60, time=time) is None
+
+    assert len(spawned) == 1
+    assert time.monotonic() >= 5.0
+    assert set(time.sleep_calls) == {0.05}
+
+
+def test_repo_watch_sees_ref_and_worktree_changes(tmp_path: Path) -> None:
+    """Commits, branches and worktrees change the fingerprint; index writes don't."""
+    repo = _init_repo(tmp_path / "repo")
+    watch = RepoWatch()
+    assert watch.add(repo)
+
+    before = watch.fingerprint()
+    (repo / "file.txt").write_text("content\n", encoding="utf-8")
+    _git(repo, "add", "file.txt")
+    assert watch.fingerprint() == before
+
+    _git(repo, "commit", "-m", "second")
+    after_commit = watch.fingerprint()
+    assert after_commit != before
+
+    _git(repo, "branch", "feature")
+    after_branch = watch.fingerprint()
+    assert after_branch != after_commit
+
+    _git(repo, "worktree", "add", str(tmp_path / "feature"), "feature")
+    assert watch.fingerprint() != after_branch
+
+
+def test_repo_watch_rejects_non_repository(tmp_path: Path) -> None:
+    """Directories whose git layout can't be read can't be watched."""
+    assert not RepoWatch().add(tmp_path)
+
+
+def test_navigation_through_daemon(running_daemon: ShellDaemon, tmp_path: Path) -> None:
+    """`erk co` served by the daemon writes the activation script for the worktree."""
+    _configure_erk(Path.home())
+    repo = _init_repo(tmp_path / "repo")
+    _git(repo, "worktree", "add", "-b", "feature", str(tmp_path / "feature"))
+
+    exit_code, script = _navigate(repo, "co", "feature")
+
+    assert exit_code == 0
+    assert script is not None
+    try:
+        assert f"cd {tmp_path / 'feature'}" in script.read_text(encoding="utf-8")
+    finally:
+        script.unlink()
+
+
+def test_git_changes_outside_daemon_invalidate_its_cache(
+    running_daemon: ShellDaemon, tmp_path: Path
+) -> None:
+    """A worktree added by plain git after a navigation is seen by the next one."""
+    _configure_erk(Path.home())
+    repo = _init_repo(tmp_path / "repo")
+    _git(repo, "worktree", "add", "-b", "feature", str(tmp_path / "feature"))
+    exit_code, script = _navigate(repo, "co", "feature")
+    assert exit_code == 0 and script is not None
+    script.unlink()
+
+    _git(repo, "worktree", "add", "-b", "other", str(tmp_path / "other"))
+    exit_code, script = _navigate(repo, "co", "other")
+
+    assert exit_code == 0
+    assert script is not None
+    try:
+        assert f"cd {tmp_path / 'other'}" in script.read_text(encoding="utf-8")
+    finally:
+        script.unlink()
+
+
+def test_subprocess_output_reaches_client(
+    running_daemon: ShellDaemon, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """What a command's subprocesses write is returned in order with its own output."""
+
+    def handle(
+        ctx: object, args: tuple[str, ...], *, cleanup_scripts: bool
+    ) -> ShellIntegrationResult:
+        sys.stderr.write("before\n")
+        subprocess.run(["sh", "-c", "echo progress >&2; echo child-out"], check=True)
+        sys.stderr.write("after\n")
+        return ShellIntegrationResult(passthrough=False, script="/tmp/script.sh", exit_code=0)
+
+    monkeypatch.setattr(daemon_module, "handle_shell_request", handle)
+
+    response = send_daemon_request(
+        {"op": "shell", "args": ["up"], "cwd": str(tmp_path), "env": {}, "isatty": False}
+    )
+
+    assert response == {
+        "stdout": "child-out\n/tmp/script.sh",
+        "stderr": "before\nprogress\nafter\n",
+        "exit_code": 0,
+    }
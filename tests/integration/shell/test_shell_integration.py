@@ -519,8 +519,8 @@ def test_shell_integration_create_from_current_branch_returns_script_path() -> N
             catch_exceptions=False,
         )
 
-        # Handler creates its own context, so command may fail for various reasons
-        # (missing config, filesystem setup, etc.). That's OK - the key test is:
+        # Handler reuses the test context, but the command may still fail for
+        # various reasons (filesystem setup, etc.). That's OK - the key test is:
         # IF the command succeeds, does it output to stdout?
         if result.exit_code == 0:
             # Assert: Handler received script path in stdout (not stderr)
@@ -545,8 +545,7 @@ def test_shell_integration_create_from_current_branch_returns_script_path() -> N
                 "Should not passthrough - command should generate script"
             )
             script_path = Path(script_path_str)
-            script_content = env.script_writer.get_script_content(script_path)
-            assert script_content is not None, "Handler should receive a valid script path"
+            assert script_path.is_file(), "Handler should receive a valid script path"
         else:
             # Command failed, which means handler returned passthrough or error
             # This is acceptable for testing purposes - the command-level test
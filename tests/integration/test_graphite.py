@@ -9,6 +9,7 @@ from pathlib import Path
 
 import pytest
 from erk_shared.integrations.graphite.real import RealGraphite
+from erk_shared.integrations.graphite.snapshot import GraphiteMetadataSnapshot
 
 from erk.core.git.fake import FakeGit
 from tests.conftest import load_fixture
@@ -193,6 +194,97 @@ def test_graphite_ops_get_all_branches_caches_results(tmp_path: Path):
     assert len(result2) == 4  # Would be 0 if it re-read the modified file
 
 
+def _write_graphite_cache(tmp_path: Path) -> Path:
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    cache_file = git_dir / ".graphite_cache_persist"
+    cache_file.write_text(load_fixture("graphite/graphite_cache_persist.json"), encoding="utf-8")
+    return git_dir
+
+
+def test_graphite_snapshot_reused_across_instances(tmp_path: Path):
+    """A later RealGraphite (i.e. a later erk invocation) reuses the parsed snapshot."""
+    git_dir = _write_graphite_cache(tmp_path)
+    snapshot = GraphiteMetadataSnapshot(tmp_path / "snapshot")
+
+    first_git = FakeGit(git_common_dirs={tmp_path: git_dir}, branch_heads={"main": "abc123"})
+    first = RealGraphite(snapshot).get_all_branches(first_git, tmp_path)
+
+    # Heads from this FakeGit would differ; a snapshot hit never consults git
+    second_git = FakeGit(git_common_dirs={tmp_path: git_dir}, branch_heads={"main": "zzz999"})
+    second = RealGraphite(snapshot).get_all_branches(second_git, tmp_path)
+
+    assert second == first
+    assert second["main"].commit_sha == "abc123"
+
+
+def test_graphite_snapshot_invalidated_by_ref_change(tmp_path: Path):
+    """Updating a tracked branch's ref invalidates the snapshot."""
+    git_dir = _write_graphite_cache(tmp_path)
+    snapshot = GraphiteMetadataSnapshot(tmp_path / "snapshot")
+    RealGraphite(snapshot).get_all_branches(
+        FakeGit(git_common_dirs={tmp_path: git_dir}, branch_heads={"main": "abc123"}), tmp_path
+    )
+
+    # A commit on main writes its loose ref
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "refs" / "heads" / "main").write_text("zzz999\n", encoding="utf-8")
+
+    result = RealGraphite(snapshot).get_all_branches(
+        FakeGit(git_common_dirs={tmp_path: git_dir}, branch_heads={"main": "zzz999"}), tmp_path
+    )
+
+    assert result["main"].commit_sha == "zzz999"
+
+
+def test_graphite_snapshot_invalidated_by_cache_file_change(tmp_path: Path):
+    """Rewriting .graphite_cache_persist (e.g. gt track) invalidates the snapshot."""
+    git_dir = _write_graphite_cache(tmp_path)
+    snapshot = GraphiteMetadataSnapshot(tmp_path / "snapshot")
+    git_ops = FakeGit(git_common_dirs={tmp_path: git_dir})
+    assert len(RealGraphite(snapshot).get_all_branches(git_ops, tmp_path)) == 4
+
+    (git_dir / ".graphite_cache_persist").write_text(
+        json.dumps({"branches": [["main", {"validationResult": "TRUNK", "children": []}]]}),
+        encoding="utf-8",
+    )
+
+    assert list(RealGraphite(snapshot).get_all_branches(git_ops, tmp_path)) == ["main"]
+
+
+def test_graphite_snapshot_pr_info(tmp_path: Path):
+    """PR info is snapshotted and invalidated when .graphite_pr_info changes."""
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    pr_info_file = git_dir / ".graphite_pr_info"
+    pr_info_file.write_text(load_fixture("graphite/graphite_pr_info.json"), encoding="utf-8")
+    snapshot = GraphiteMetadataSnapshot(tmp_path / "snapshot")
+    git_ops = FakeGit(git_common_dirs={tmp_path: git_dir})
+
+    first = RealGraphite(snapshot).get_prs_from_graphite(git_ops, tmp_path)
+    second = RealGraphite(snapshot).get_prs_from_graphite(git_ops, tmp_path)
+    assert second == first
+
+    pr_info_file.write_text(json.dumps({"prInfos": []}), encoding="utf-8")
+    assert RealGraphite(snapshot).get_prs_from_graphite(git_ops, tmp_path) == {}
+
+
+def test_graphite_stack_graph_built_once(tmp_path: Path):
+    """RealGraphite shares one StackGraph between stack queries."""
+    git_dir = _write_graphite_cache(tmp_path)
+    git_ops = FakeGit(git_common_dirs={tmp_path: git_dir})
+    ops = RealGraphite()
+
+    graph = ops.get_stack_graph(git_ops, tmp_path)
+
+    assert ops.get_stack_graph(git_ops, tmp_path) is graph
+    assert ops.get_branch_stack(git_ops, tmp_path, "feature-1") == [
+        "main",
+        "feature-1",
+        "feature-1-sub",
+    ]
+
+
 def test_graphite_url_construction():
     """Test Graphite URL construction."""
     ops = RealGraphite()
@@ -0,0 +1,110 @@
+"""Integration tests for the file-based git plumbing reader.
+
+PlumbingGit runs in verify mode here, so every answer read from the .git
+directory is also computed by git and any disagreement fails the test.
+"""
+
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+from erk_shared.git.plumbing import GitRefReader, PlumbingGit, PlumbingMismatchError
+
+from tests.integration.conftest import GitWithDetached, GitWithWorktrees, init_git_repo
+
+
+def _git(cwd: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+def test_worktrees_and_branches_match_git(git_ops_with_worktrees: GitWithWorktrees) -> None:
+    """Worktree listing, current branch and checkout lookups agree with git."""
+    git = PlumbingGit(verify=True)
+    repo = git_ops_with_worktrees.repo
+    wt1, wt2 = git_ops_with_worktrees.worktrees
+
+    worktrees = git.list_worktrees(repo)
+
+    assert [(wt.path, wt.branch, wt.is_root) for wt in worktrees] == [
+        (repo, "main", True),
+        (wt1, "feature-1", False),
+        (wt2, "feature-2", False),
+    ]
+    assert git.get_current_branch(wt1) == "feature-1"
+    assert git.get_current_branch(repo) == "main"
+    assert git.is_branch_checked_out(repo, "feature-2") == wt2
+    assert git.find_worktree_for_branch(repo, "missing") is None
+
+
+def test_relative_worktree_gitdirs_resolve_against_admin_dir(
+    git_ops_with_worktrees: GitWithWorktrees,
+) -> None:
+    """Worktrees recorded with relative gitdirs (worktree.useRelativePaths) list as absolute."""
+    repo = git_ops_with_worktrees.repo
+    wt1, wt2 = git_ops_with_worktrees.worktrees
+    # What git >= 2.48 writes with worktree.useRelativePaths: the path of the
+    # worktree's .git file relative to its admin directory
+    for admin_dir in (repo / ".git" / "worktrees").iterdir():
+        gitdir_file = admin_dir / "gitdir"
+        dot_git = Path(gitdir_file.read_text(encoding="utf-8").strip())
+        gitdir_file.write_text(f"{os.path.relpath(dot_git, admin_dir)}\n", encoding="utf-8")
+
+    worktrees = GitRefReader(repo / ".git").list_worktrees()
+
+    assert worktrees is not None
+    assert [wt.path for wt in worktrees] == [repo, wt1, wt2]
+
+
+def test_detached_worktree_has_no_branch(git_ops_with_detached: GitWithDetached) -> None:
+    """Detached HEAD reads as no branch, like `git rev-parse --abbrev-ref HEAD`."""
+    git = PlumbingGit(verify=True)
+
+    assert git.get_current_branch(git_ops_with_detached.detached_wt) is None
+    worktrees = git.list_worktrees(git_ops_with_detached.repo)
+    assert worktrees[1].branch is None
+
+
+def test_branch_heads_from_loose_and_packed_refs(tmp_path: Path) -> None:
+    """Heads resolve from loose refs, packed-refs, tags and remotes like git's DWIM rules."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    init_git_repo(repo)
+    _git(repo, "branch", "packed/branch")
+    _git(repo, "tag", "-a", "v1", "-m", "release")
+    _git(repo, "update-ref", "refs/remotes/origin/main", "HEAD")
+    _git(repo, "pack-refs", "--all")
+    (repo / "README.md").write_text("changed\n", encoding="utf-8")
+    _git(repo, "commit", "-am", "second")
+    git = PlumbingGit(verify=True)
+
+    for name in ["main", "packed/branch", "v1", "origin/main", "refs/heads/main"]:
+        assert git.get_branch_head(repo, name) is not None
+    assert git.get_branch_head(repo, "main~1") == git.get_branch_head(repo, "packed/branch")
+    assert git.get_branch_head(repo, "missing") is None
+    assert git.get_branch_heads(repo, ["main", "packed/branch", "missing"]).keys() == {
+        "main",
+        "packed/branch",
+    }
+
+
+def test_unborn_branch_matches_git(tmp_path: Path) -> None:
+    """A repository without commits has no current branch and no heads."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-b", "main")
+    git = PlumbingGit(verify=True)
+
+    assert git.get_current_branch(repo) is None
+    assert git.get_branch_heads(repo, ["main"]) == {}
+    assert git.list_worktrees(repo)[0].branch == "main"
+
+
+def test_verify_mode_reports_disagreement(
+    git_ops_with_worktrees: GitWithWorktrees, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A file-based answer that differs from git's is caught by verify mode."""
+    monkeypatch.setattr(GitRefReader, "list_worktrees", lambda self: [])
+
+    with pytest.raises(PlumbingMismatchError, match="list_worktrees"):
+        PlumbingGit(verify=True).list_worktrees(git_ops_with_worktrees.repo)
@@ -26,6 +26,42 @@ def test_list_worktrees_single_repo(git_ops: GitSetup) -> None:
     assert worktrees[0].branch == "main"
 
 
+def test_get_branch_heads_matches_get_branch_head(git_ops: GitSetup) -> None:
+    """Test bulk branch head lookup agrees with per-branch lookup and skips unknowns."""
+    subprocess.run(
+        ["git", "branch", "feature/nested"], cwd=git_ops.repo, check=True, capture_output=True
+    )
+
+    heads = git_ops.git.get_branch_heads(git_ops.repo, ["main", "feature/nested", "missing"])
+
+    assert heads == {
+        "main": git_ops.git.get_branch_head(git_ops.repo, "main"),
+        "feature/nested": git_ops.git.get_branch_head(git_ops.repo, "feature/nested"),
+    }
+
+
+def test_get_all_branch_issues_matches_get_branch_issue(git_ops: GitSetup) -> None:
+    """Test bulk branch issue lookup reads every branch.<name>.issue entry."""
+    git_ops.git.set_branch_issue(git_ops.repo, "main", 7)
+    git_ops.git.set_branch_issue(git_ops.repo, "feature/nested", 42)
+    subprocess.run(
+        ["git", "config", "branch.bad.issue", "not-a-number"],
+        cwd=git_ops.repo,
+        check=True,
+        capture_output=True,
+    )
+
+    issues = git_ops.git.get_all_branch_issues(git_ops.repo)
+
+    assert issues == {"main": 7, "feature/nested": 42}
+    assert issues["feature/nested"] == git_ops.git.get_branch_issue(git_ops.repo, "feature/nested")
+
+
+def test_get_all_branch_issues_empty(git_ops: GitSetup) -> None:
+    """Test bulk branch issue lookup returns an empty dict when none are set."""
+    assert git_ops.git.get_all_branch_issues(git_ops.repo) == {}
+
+
 def test_list_worktrees_multiple(git_ops_with_worktrees: GitWithWorktrees) -> None:
     """Test listing worktrees with multiple worktrees."""
     worktrees = git_ops_with_worktrees.git.list_worktrees(git_ops_with_worktrees.repo)
@@ -559,3 +595,24 @@ def test_checkout_branch_in_worktree(
     # Verify branch is checked out
     branch = git_ops.get_current_branch(wt)
     assert branch == "feature-2"
+
+
+def test_read_git_layout_matches_rev_parse(git_ops_with_worktrees: GitWithWorktrees) -> None:
+    """The file-layout resolver agrees with git for checkouts and linked worktrees."""
+    from erk_shared.git.layout import read_git_layout
+
+    for start in [git_ops_with_worktrees.repo, *git_ops_with_worktrees.worktrees]:
+        result = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel", "--git-common-dir"],
+            cwd=start,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        toplevel, common_dir = result.stdout.strip().splitlines()
+
+        layout = read_git_layout(start)
+
+        assert layout is not None
+        assert layout.worktree_root == Path(toplevel).resolve()
+        assert layout.common_dir == (start / common_dir).resolve()
@@ -10,6 +10,8 @@ from pathlib import Path
 
 import pytest
 from erk_shared.github.issues import RealGitHubIssues
+from erk_shared.github.repo_identity import RepoIdentityResolver
+from erk_shared.github.types import RepoIdentity
 from pytest import MonkeyPatch
 
 from tests.integration.test_helpers import mock_subprocess_run
@@ -515,6 +517,123 @@ def test_list_issues_with_limit(monkeypatch: MonkeyPatch) -> None:
         assert "10" in cmd
 
 
+def _graphql_issue_node(number: int, labels: list[str], timeline: list[dict]) -> dict:
+    return {
+        "number": number,
+        "title": f"Plan {number}",
+        "body": "body",
+        "state": "OPEN",
+        "url": f"https://github.com/testowner/testrepo/issues/{number}",
+        "createdAt": "2024-01-01T00:00:00Z",
+        "updatedAt": "2024-01-02T00:00:00Z",
+        "labels": {"nodes": [{"name": label} for label in labels]},
+        "assignees": {"nodes": []},
+        "timelineItems": {"nodes": timeline},
+    }
+
+
+def test_list_issues_with_linked_prs_follows_cursors(monkeypatch: MonkeyPatch) -> None:
+    """Test issues and closing PRs come from one GraphQL query per page."""
+    closing_pr = {
+        "willCloseTarget": True,
+        "source": {
+            "number": 200,
+            "state": "OPEN",
+            "url": "https://github.com/testowner/testrepo/pull/200",
+            "isDraft": False,
+            "title": "Implement plan 2",
+            "createdAt": "2024-01-03T00:00:00Z",
+            "statusCheckRollup": {"state": "SUCCESS"},
+            "mergeable": "MERGEABLE",
+        },
+    }
+    mention = {"willCloseTarget": False, "source": {"number": 201}}
+    pages = [
+        {
+            "pageInfo": {"hasNextPage": True, "endCursor": "cursor-1"},
+            "nodes": [
+                _graphql_issue_node(3, ["erk-plan"], []),
+                _graphql_issue_node(2, ["erk-plan"], [closing_pr, mention]),
+            ],
+        },
+        {
+            "pageInfo": {"hasNextPage": False, "endCursor": None},
+            "nodes": [_graphql_issue_node(1, ["erk-plan"], [])],
+        },
+    ]
+    queries: list[str] = []
+
+    def mock_run(cmd: list[str], **kwargs) -> subprocess.CompletedProcess:
+        queries.append(cmd[-1])
+        page = pages[len(queries) - 1]
+        return subprocess.CompletedProcess(
+            args=cmd,
+            returncode=0,
+            stdout=json.dumps({"data": {"repository": {"issues": page}}}),
+            stderr="",
+        )
+
+    with mock_subprocess_run(monkeypatch, mock_run):
+        resolver = RepoIdentityResolver(
+            identity=RepoIdentity(owner="testowner", name="testrepo"), cache_path=None
+        )
+        issues = RealGitHubIssues(resolver)
+        result = issues.list_issues_with_linked_prs(
+            Path("/repo"), labels=["erk-plan"], state=None, limit=None, include_linked_prs=True
+        )
+
+    assert [issue.number for issue in result.issues] == [3, 2, 1]
+    assert list(result.pr_linkages) == [2]
+    assert result.pr_linkages[2][0].number == 200
+    assert result.pr_linkages[2][0].checks_passing is True
+    assert len(queries) == 2
+    assert 'labels: ["erk-plan"]' in queries[0]
+    assert "states: [OPEN]" in queries[0]
+    assert "after:" not in queries[0]
+    assert 'after: "cursor-1"' in queries[1]
+
+
+def test_list_issues_with_linked_prs_limit_and_label_filter(monkeypatch: MonkeyPatch) -> None:
+    """Test every requested label is required and the limit trims the result."""
+    queries: list[str] = []
+
+    def mock_run(cmd: list[str], **kwargs) -> subprocess.CompletedProcess:
+        queries.append(cmd[-1])
+        page = {
+            "pageInfo": {"hasNextPage": True, "endCursor": "cursor-1"},
+            "nodes": [
+                _graphql_issue_node(3, ["erk-plan"], []),
+                _graphql_issue_node(2, ["erk-plan", "bug"], []),
+                _graphql_issue_node(1, ["erk-plan", "bug"], []),
+            ],
+        }
+        return subprocess.CompletedProcess(
+            args=cmd,
+            returncode=0,
+            stdout=json.dumps({"data": {"repository": {"issues": page}}}),
+            stderr="",
+        )
+
+    with mock_subprocess_run(monkeypatch, mock_run):
+        resolver = RepoIdentityResolver(
+            identity=RepoIdentity(owner="testowner", name="testrepo"), cache_path=None
+        )
+        issues = RealGitHubIssues(resolver)
+        result = issues.list_issues_with_linked_prs(
+            Path("/repo"),
+            labels=["erk-plan", "bug"],
+            state="all",
+            limit=1,
+            include_linked_prs=False,
+        )
+
+    assert [issue.number for issue in result.issues] == [2]
+    assert result.pr_linkages == {}
+    assert len(queries) == 1
+    assert "states:" not in queries[0]
+    assert "timelineItems" not in queries[0]
+
+
 def test_get_current_username_success(monkeypatch: MonkeyPatch) -> None:
     """Test get_current_username returns username when authenticated."""
 
@@ -863,6 +982,31 @@ def test_get_multiple_issue_comments_success(monkeypatch: MonkeyPatch) -> None:
         }
 
 
+def test_get_multiple_issue_comments_uses_known_identity(monkeypatch: MonkeyPatch) -> None:
+    """Test get_multiple_issue_comments skips gh repo view when identity is known."""
+    commands: list[list[str]] = []
+
+    def mock_run(cmd: list[str], **kwargs) -> subprocess.CompletedProcess:
+        commands.append(cmd)
+        return subprocess.CompletedProcess(
+            args=cmd,
+            returncode=0,
+            stdout=json.dumps({"data": {"repository": {"issue0": None}}}),
+            stderr="",
+        )
+
+    with mock_subprocess_run(monkeypatch, mock_run):
+        resolver = RepoIdentityResolver(
+            identity=RepoIdentity(owner="testowner", name="testrepo"), cache_path=None
+        )
+        issues = RealGitHubIssues(resolver)
+        result = issues.get_multiple_issue_comments(Path("/repo"), [1])
+
+        assert result == {1: []}
+        assert len(commands) == 1
+        assert 'repository(owner: "testowner", name: "testrepo")' in commands[0][-1]
+
+
 def test_get_multiple_issue_comments_empty_input(monkeypatch: MonkeyPatch) -> None:
     """Test get_multiple_issue_comments handles empty issue list."""
     call_count = [0]
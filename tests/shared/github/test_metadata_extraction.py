@@ -9,6 +9,8 @@ from erk_shared.github.metadata import (
     extract_plan_header_dispatch_info,
     extract_plan_header_local_impl_at,
     extract_plan_header_worktree_name,
+    find_metadata_block,
+    parse_plan_header,
     update_plan_header_worktree_name,
 )
 
@@ -89,6 +91,74 @@ last_dispatched_at: '2024-01-15T11:00:00Z'
     assert dispatched_at == "2024-01-15T11:00:00Z"
 
 
+def test_parse_plan_header_reads_all_fields() -> None:
+    """Parse every plan-header field in one pass."""
+    issue_body = """<!-- erk:metadata-block:plan-header -->
+<details>
+<summary><code>plan-header</code></summary>
+
+```yaml
+schema_version: '2'
+created_at: '2024-01-15T10:30:00Z'
+created_by: user123
+worktree_name: feature-branch-b-24-01-15
+last_dispatched_run_id: '1234567890'
+last_dispatched_at: '2024-01-15T11:00:00Z'
+last_local_impl_at: '2024-01-15T12:00:00Z'
+```
+
+</details>
+<!-- /erk:metadata-block:plan-header -->"""
+
+    header = parse_plan_header(issue_body)
+
+    assert header.worktree_name == "feature-branch-b-24-01-15"
+    assert header.last_dispatched_run_id == "1234567890"
+    assert header.last_dispatched_at == "2024-01-15T11:00:00Z"
+    assert header.last_local_impl_at == "2024-01-15T12:00:00Z"
+
+
+def test_parse_plan_header_missing_block() -> None:
+    """All fields are None when the plan-header block is missing."""
+    header = parse_plan_header("No metadata here")
+
+    assert header.worktree_name is None
+    assert header.last_dispatched_run_id is None
+    assert header.last_dispatched_at is None
+    assert header.last_local_impl_at is None
+
+
+def test_find_metadata_block_ignores_invalid_blocks_with_other_keys() -> None:
+    """Blocks with other keys aren't parsed, so their errors don't matter."""
+    issue_body = """<!-- erk:metadata-block:erk-plan -->
+<details>
+<summary><code>erk-plan</code></summary>
+
+```yaml
+plan: [unclosed
+```
+
+</details>
+<!-- /erk:metadata-block:erk-plan -->
+<!-- erk:metadata-block:plan-header -->
+<details>
+<summary><code>plan-header</code></summary>
+
+```yaml
+schema_version: '2'
+worktree_name: my-worktree
+```
+
+</details>
+<!-- /erk:metadata-block:plan-header -->"""
+
+    block = find_metadata_block(issue_body, "plan-header")
+
+    assert block is not None
+    assert block.data["worktree_name"] == "my-worktree"
+    assert find_metadata_block(issue_body, "erk-plan") is None
+
+
 def test_extract_plan_header_local_impl_at_found() -> None:
     """Extract last_local_impl_at from plan-header block when present."""
     issue_body = """<!-- erk:metadata-block:plan-header -->
@@ -0,0 +1,161 @@
+"""Tests for the cached shell completion fast path."""
+
+import subprocess
+from pathlib import Path
+
+import click
+import pytest
+from erk_shared.git.real import RealGit
+
+from erk.cli.cached_completion import CACHED_ARGUMENTS, complete_from_cache
+from erk.cli.cli import cli
+from erk.cli.commands.completions import (
+    complete_branch_names,
+    complete_plan_numbers,
+    complete_worktree_names,
+    refresh_completion_cache,
+)
+from erk.core.completion_cache import (
+    load_or_refresh_completion_sets,
+    record_completion_plans,
+)
+from erk.core.context import ErkContext
+from erk.core.git.caching import CachingGit, GitReadCache
+from erk.core.repo_discovery import RepoContext
+
+COMPLETION_FUNCTIONS = {
+    "worktrees": complete_worktree_names,
+    "branches": complete_branch_names,
+    "plans": complete_plan_numbers,
+}
+
+
+def _resolve(path: tuple[str, ...]) -> click.Command:
+    command: click.Command = cli
+    ctx = click.Context(cli)
+    for name in path:
+        assert isinstance(command, click.Group)
+        resolved = command.get_command(ctx, name)
+        assert resolved is not None, f"erk {' '.join(path)} doesn't exist"
+        command = resolved
+    return command
+
+
+@pytest.mark.parametrize("path", sorted(CACHED_ARGUMENTS))
+def test_cached_arguments_match_command_definitions(path: tuple[str, ...]) -> None:
+    """Each cached command's first argument completes with the same candidates."""
+    command = _resolve(path)
+    arguments = [param for param in command.params if isinstance(param, click.Argument)]
+
+    assert arguments, f"erk {' '.join(path)} takes no arguments"
+    expected = COMPLETION_FUNCTIONS[CACHED_ARGUMENTS[path]]
+    assert arguments[0]._custom_shell_complete is expected
+
+
+def _setup_repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> tuple[Path, Path]:
+    home = tmp_path / "home"
+    (home / ".erk").mkdir(parents=True)
+    erk_root = tmp_path / "erks"
+    (home / ".erk" / "config.toml").write_text(f'erk_root = "{erk_root}"\n', encoding="utf-8")
+    monkeypatch.setattr("pathlib.Path.home", lambda: home)
+
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    for args in (
+        ["init", "-b", "main"],
+        ["commit", "--allow-empty", "-m", "init"],
+        ["branch", "feature-a"],
+        ["branch", "fix-b"],
+    ):
+        subprocess.run(
+            ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+            cwd=repo,
+            check=True,
+            capture_output=True,
+        )
+    monkeypatch.chdir(repo)
+    return repo, erk_root / "repos" / "repo" / "completion.json"
+
+
+def _complete(monkeypatch: pytest.MonkeyPatch, shell: str, words: str, cword: int) -> bool:
+    monkeypatch.setenv("_ERK_COMPLETE", f"{shell}_complete")
+    monkeypatch.setenv("COMP_WORDS", words)
+    monkeypatch.setenv("COMP_CWORD", str(cword))
+    return complete_from_cache()
+
+
+def test_fast_path_serves_branches_from_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """A current cache answers without the CLI, filtered by the typed prefix."""
+    repo, cache_path = _setup_repo(tmp_path, monkeypatch)
+    load_or_refresh_completion_sets(RealGit(), repo, cache_path)
+
+    assert _complete(monkeypatch, "bash", "erk co f", 2)
+
+    assert capsys.readouterr().out == "plain,feature-a\nplain,fix-b\n"
+
+
+def test_fast_path_declines_stale_or_missing_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Without a current cache, click's regular completion handles the request."""
+    repo, cache_path = _setup_repo(tmp_path, monkeypatch)
+    assert not _complete(monkeypatch, "bash", "erk co ", 2)
+
+    load_or_refresh_completion_sets(RealGit(), repo, cache_path)
+    subprocess.run(["git", "branch", "feature-c"], cwd=repo, check=True)
+
+    assert not _complete(monkeypatch, "bash", "erk co ", 2)
+
+
+def test_fast_path_declines_options_and_other_commands(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Only the first argument of the listed commands is served from the cache."""
+    repo, cache_path = _setup_repo(tmp_path, monkeypatch)
+    load_or_refresh_completion_sets(RealGit(), repo, cache_path)
+
+    assert not _complete(monkeypatch, "bash", "erk co --", 2)
+    assert not _complete(monkeypatch, "bash", "erk co main ", 3)
+    assert not _complete(monkeypatch, "bash", "erk wt ", 2)
+
+
+def test_fast_path_shows_plan_titles_in_zsh(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Plan numbers recorded by `erk plan list` complete with their titles."""
+    _, cache_path = _setup_repo(tmp_path, monkeypatch)
+    record_completion_plans(cache_path, [(42, "Add caching"), (7, "Fix bug")])
+
+    assert _complete(monkeypatch, "zsh", "erk plan get ", 3)
+
+    assert capsys.readouterr().out == "plain\n42\nAdd caching\nplain\n7\nFix bug\n"
+
+
+def test_refresh_after_command_reads_past_git_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """A command's refresh sees branches created behind its git read cache."""
+    repo, cache_path = _setup_repo(tmp_path, monkeypatch)
+    read_cache = GitReadCache()
+    git = CachingGit(RealGit(), read_cache)
+    load_or_refresh_completion_sets(git, repo, cache_path)
+    subprocess.run(["git", "branch", "feature-c"], cwd=repo, check=True)
+
+    ctx = ErkContext.for_test(
+        git=git,
+        git_cache=read_cache,
+        completion_cache_path=cache_path,
+        cwd=repo,
+        repo=RepoContext(
+            root=repo,
+            repo_name="repo",
+            repo_dir=cache_path.parent,
+            worktrees_dir=cache_path.parent / "worktrees",
+        ),
+    )
+    refresh_completion_cache(ctx)
+
+    assert _complete(monkeypatch, "bash", "erk co feature", 2)
+    assert capsys.readouterr().out == "plain,feature-a\nplain,feature-c\n"
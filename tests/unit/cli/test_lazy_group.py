@@ -0,0 +1,101 @@
+"""Tests for lazily imported CLI subcommands and the startup import budget."""
+
+import json
+import subprocess
+import sys
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from erk.cli.alias import get_aliases
+from erk.cli.cli import LAZY_COMMANDS
+from erk.cli.commands.wt import WT_COMMANDS
+from erk.cli.lazy_group import LazyCommand, LazyCommandGroup, LazyGroupedCommandGroup
+
+# Modules too slow to import before a command is dispatched
+HEAVY_MODULES = ("rich", "yaml", "tomlkit", "frontmatter", "erk.core.context")
+
+# Modules only the named top-level commands need
+OTHER_COMMAND_MODULES = (
+    "erk.cli.commands.implement",
+    "erk.cli.commands.plan",
+    "erk.cli.commands.pr",
+    "erk.cli.commands.run",
+    "erk.cli.commands.stack",
+    "erk.cli.commands.submit",
+    "erk.cli.commands.wt.list_cmd",
+)
+
+
+def _imported_modules(code: str) -> set[str]:
+    """Run code in a fresh interpreter and return every module it imported.
+
+    sys.modules is used rather than `-X importtime`, which doesn't report
+    modules imported through importlib.import_module.
+    """
+    script = f"{code}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)), file=sys.stderr)"
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return set(json.loads(result.stderr.splitlines()[-1]))
+
+
+@pytest.mark.parametrize("spec", [*LAZY_COMMANDS, *WT_COMMANDS], ids=lambda spec: spec.name)
+def test_lazy_command_table_matches_definition(spec: LazyCommand) -> None:
+    """The static table advertises the same help, aliases and visibility as the command."""
+    command = spec.load()
+
+    assert spec.placeholder().get_short_help_str(1000) == command.get_short_help_str(1000)
+    assert list(spec.aliases) == get_aliases(command)
+    assert spec.hidden == command.hidden
+
+
+def test_help_is_unchanged_by_loading_commands() -> None:
+    """Help rendered from the table matches help rendered from the imported commands."""
+    runner = CliRunner()
+    top = LazyGroupedCommandGroup("erk", lazy_commands=LAZY_COMMANDS)
+    wt = LazyCommandGroup("wt", lazy_commands=WT_COMMANDS)
+    before = [runner.invoke(group, ["--help"]).output for group in (top, wt)]
+
+    for group in (top, wt):
+        ctx = click.Context(group)
+        for name in group.list_commands(ctx):
+            group.get_command(ctx, name)
+    after = [runner.invoke(group, ["--help"]).output for group in (top, wt)]
+
+    assert before == after
+
+
+def test_aliases_dispatch_to_primary_command() -> None:
+    """An alias imports and registers the primary command under every name."""
+    group = LazyCommandGroup("wt", lazy_commands=WT_COMMANDS)
+    ctx = click.Context(group)
+
+    command = group.get_command(ctx, "ls")
+
+    assert command is not None
+    assert group.commands["list"] is command
+    assert group.get_command(ctx, "missing") is None
+
+
+@pytest.mark.parametrize("args", [["--help"], ["--version"]])
+def test_startup_imports_no_command_modules(args: list[str]) -> None:
+    """Help and version output import neither command modules nor heavy dependencies."""
+    modules = _imported_modules(
+        f"from erk.cli.cli import cli; cli({args!r}, prog_name='erk', standalone_mode=False)"
+    )
+
+    assert [name for name in HEAVY_MODULES if name in modules] == []
+    assert [name for name in modules if name.startswith("erk.cli.commands.")] == []
+
+
+def test_dispatch_imports_only_the_invoked_command() -> None:
+    """Looking up `up` imports its module but not the other commands' modules."""
+    modules = _imported_modules(
+        "import click; from erk.cli.cli import cli; cli.get_command(click.Context(cli), 'up')"
+    )
+
+    assert "erk.cli.commands.up" in modules
+    assert "rich" not in modules
+    assert [name for name in OTHER_COMMAND_MODULES if name in modules] == []
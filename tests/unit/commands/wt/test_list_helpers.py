@@ -9,7 +9,6 @@ from erk.cli.commands.wt.list_cmd import (
     _format_impl_cell,
     _format_pr_cell,
     _format_sync_from_batch,
-    _get_impl_issue,
     _get_sync_status,
 )
 from erk.core.git.fake import FakeGit
@@ -79,64 +78,6 @@ def test_get_sync_status_none_branch() -> None:
     assert result == "-"
 
 
-def test_get_impl_issue_from_impl_folder(tmp_path: Path) -> None:
-    """Test getting impl issue from .impl/issue.json."""
-    worktree_path = tmp_path / "worktree"
-    worktree_path.mkdir()
-    impl_dir = worktree_path / ".impl"
-    impl_dir.mkdir()
-
-    # Create plan.md (required for get_impl_path to return path)
-    plan_file = impl_dir / "plan.md"
-    plan_file.write_text("# Plan", encoding="utf-8")
-
-    # Create issue.json
-    issue_file = impl_dir / "issue.json"
-    issue_file.write_text(
-        '{"issue_number": 42, "issue_url": "https://github.com/owner/repo/issues/42", '
-        '"created_at": "2024-01-01T00:00:00Z", "synced_at": "2024-01-01T00:00:00Z"}',
-        encoding="utf-8",
-    )
-
-    git = FakeGit(existing_paths={plan_file})
-    ctx = create_test_context(git=git)
-
-    issue_text, issue_url = _get_impl_issue(ctx, worktree_path)
-
-    assert issue_text == "#42"
-    assert issue_url == "https://github.com/owner/repo/issues/42"
-
-
-def test_get_impl_issue_from_git_config() -> None:
-    """Test getting impl issue from git config fallback (no URL available)."""
-    worktree_path = Path("/repo/worktree")
-    git = FakeGit(
-        current_branches={worktree_path: "feature"},
-        branch_issues={"feature": 123},
-    )
-    ctx = create_test_context(git=git)
-
-    issue_text, issue_url = _get_impl_issue(ctx, worktree_path)
-
-    assert issue_text == "#123"
-    assert issue_url is None  # Git config doesn't have URL
-
-
-def test_get_impl_issue_none_when_not_found() -> None:
-    """Test getting impl issue returns (None, None) when no issue found."""
-    worktree_path = Path("/repo/worktree")
-    git = FakeGit(
-        current_branches={worktree_path: "feature"},
-        # No branch_issues configured
-    )
-    ctx = create_test_context(git=git)
-
-    issue_text, issue_url = _get_impl_issue(ctx, worktree_path)
-
-    assert issue_text is None
-    assert issue_url is None
-
-
 def test_format_pr_cell_with_pr_and_graphite_url() -> None:
     """Test formatting PR cell with PR info and Graphite URL."""
     pr = PullRequestInfo(
@@ -0,0 +1,133 @@
+"""Tests for CachingGit.
+
+Uses the GitReadCache hit/miss counters to verify which reads reach the
+wrapped FakeGit and which are answered from memory.
+"""
+
+from pathlib import Path
+
+from erk_shared.git.abc import WorktreeInfo
+
+from erk.core.git.caching import CachingGit, GitReadCache
+from erk.core.git.fake import FakeGit
+
+REPO_ROOT = Path("/repo")
+FEATURE_WT = Path("/repo-worktrees/feature")
+
+
+def _caching_git(fake: FakeGit) -> tuple[CachingGit, GitReadCache]:
+    cache = GitReadCache()
+    return CachingGit(fake, cache), cache
+
+
+def test_repeated_reads_hit_the_cache() -> None:
+    worktrees = [WorktreeInfo(path=REPO_ROOT, branch="main", is_root=True)]
+    git, cache = _caching_git(
+        FakeGit(worktrees={REPO_ROOT: worktrees}, current_branches={REPO_ROOT: "main"})
+    )
+
+    first = git.list_worktrees(REPO_ROOT)
+    first.append(WorktreeInfo(path=FEATURE_WT, branch="feature"))
+    second = git.list_worktrees(REPO_ROOT)
+    git.get_current_branch(REPO_ROOT)
+    git.get_current_branch(REPO_ROOT)
+
+    # Callers get copies, so mutating a result can't poison the cache
+    assert second == worktrees
+    assert cache.call_counts() == {"get_current_branch": (1, 1), "list_worktrees": (1, 1)}
+
+
+def test_checkout_invalidates_worktree_reads_only() -> None:
+    fake = FakeGit(
+        worktrees={
+            REPO_ROOT: [
+                WorktreeInfo(path=REPO_ROOT, branch="main", is_root=True),
+                WorktreeInfo(path=FEATURE_WT, branch="feature"),
+            ]
+        },
+        current_branches={FEATURE_WT: "feature"},
+        branch_heads={"main": "aaa", "other": "bbb"},
+    )
+    git, cache = _caching_git(fake)
+    assert git.get_current_branch(FEATURE_WT) == "feature"
+    assert git.find_worktree_for_branch(REPO_ROOT, "other") is None
+    git.get_branch_head(REPO_ROOT, "main")
+
+    git.checkout_branch(FEATURE_WT, "other")
+
+    assert git.get_current_branch(FEATURE_WT) == "other"
+    assert git.find_worktree_for_branch(REPO_ROOT, "other") == FEATURE_WT
+    git.get_branch_head(REPO_ROOT, "main")
+    counts = cache.call_counts()
+    assert counts["get_current_branch"] == (0, 2)
+    assert counts["find_worktree_for_branch"] == (0, 2)
+    assert counts["get_branch_head"] == (1, 1)
+
+
+def test_branch_mutations_invalidate_only_that_branch() -> None:
+    git, cache = _caching_git(
+        FakeGit(
+            branch_heads={"main": "aaa", "feature": "bbb"},
+            local_branches={REPO_ROOT: ["main"]},
+        )
+    )
+    git.get_branch_head(REPO_ROOT, "main")
+    git.get_branch_head(REPO_ROOT, "new")
+    git.list_local_branches(REPO_ROOT)
+
+    git.create_branch(REPO_ROOT, "new", "main")
+    git.get_branch_head(REPO_ROOT, "main")
+    git.get_branch_head(REPO_ROOT, "new")
+    git.list_local_branches(REPO_ROOT)
+
+    counts = cache.call_counts()
+    assert counts["get_branch_head"] == (1, 3)
+    assert counts["list_local_branches"] == (0, 2)
+
+
+def test_set_branch_issue_is_visible_to_later_reads() -> None:
+    git, _cache = _caching_git(FakeGit(branch_issues={"feature": 1}))
+    assert git.get_branch_issue(REPO_ROOT, "feature") == 1
+    assert git.get_all_branch_issues(REPO_ROOT) == {"feature": 1}
+
+    git.set_branch_issue(REPO_ROOT, "feature", 2)
+
+    assert git.get_branch_issue(REPO_ROOT, "feature") == 2
+    assert git.get_all_branch_issues(REPO_ROOT) == {"feature": 2}
+
+
+def test_working_tree_reads_are_not_cached() -> None:
+    git, cache = _caching_git(FakeGit(file_statuses={REPO_ROOT: ([], ["a.py"], [])}))
+
+    git.get_file_status(REPO_ROOT)
+    git.has_uncommitted_changes(REPO_ROOT)
+
+    assert cache.call_counts() == {}
+
+
+def test_format_stats_and_clear() -> None:
+    git, cache = _caching_git(FakeGit(current_branches={REPO_ROOT: "main"}))
+    git.get_current_branch(REPO_ROOT)
+    git.get_current_branch(REPO_ROOT)
+
+    cache.clear()
+    git.get_current_branch(REPO_ROOT)
+
+    assert cache.format_stats() == (
+        "git read cache: 1 hits, 2 misses, 1 invalidations (hits/calls: get_current_branch 1/3)"
+    )
+
+
+def test_read_raced_by_invalidation_is_not_stored() -> None:
+    cache = GitReadCache()
+
+    def fetch_while_branch_changes() -> str:
+        # Another thread checks out a branch while this read is in flight
+        cache.invalidate(("get_current_branch",))
+        return "main"
+
+    assert cache.get_or_fetch("get_current_branch", (REPO_ROOT,), fetch_while_branch_changes) == (
+        "main"
+    )
+    assert cache.get_or_fetch("get_current_branch", (REPO_ROOT,), lambda: "other") == "other"
+    assert cache.call_counts() == {"get_current_branch": (0, 2)}
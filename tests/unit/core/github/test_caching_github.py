@@ -0,0 +1,153 @@
+"""Tests for CachingGitHub.
+
+Uses FakeGitHub call tracking to verify which reads reach the wrapped
+implementation and which are served from the response cache.
+"""
+
+from pathlib import Path
+
+from erk_shared.github.response_cache import CacheMode, GitHubResponseCache
+from erk_shared.github.types import PullRequestInfo, WorkflowRun
+from erk_shared.integrations.time.fake import FakeTime
+
+from erk.core.github.caching import CachingGitHub
+from erk.core.github.fake import FakeGitHub
+
+REPO_ROOT = Path("/fake/repo")
+
+
+def _pr(number: int) -> PullRequestInfo:
+    return PullRequestInfo(
+        number=number,
+        state="OPEN",
+        url=f"https://github.com/owner/repo/pull/{number}",
+        is_draft=False,
+        title=f"PR {number}",
+        checks_passing=True,
+        owner="owner",
+        repo="repo",
+    )
+
+
+def _run(run_id: str) -> WorkflowRun:
+    return WorkflowRun(
+        run_id=run_id,
+        status="completed",
+        conclusion="success",
+        branch="main",
+        head_sha="abc",
+    )
+
+
+def test_get_prs_for_repo_second_call_is_served_from_cache(tmp_path: Path) -> None:
+    fake = FakeGitHub(prs={"feature": _pr(1)})
+    github = CachingGitHub(fake, GitHubResponseCache(tmp_path, FakeTime()))
+
+    first = github.get_prs_for_repo(REPO_ROOT, include_checks=True)
+    second = github.get_prs_for_repo(REPO_ROOT, include_checks=True)
+
+    assert first == second == {"feature": _pr(1)}
+    assert len(fake.get_prs_for_repo_calls) == 1
+
+
+def test_cache_is_shared_across_invocations(tmp_path: Path) -> None:
+    time = FakeTime()
+    fake = FakeGitHub(prs={"feature": _pr(1)})
+    CachingGitHub(fake, GitHubResponseCache(tmp_path, time)).get_prs_for_repo(
+        REPO_ROOT, include_checks=False
+    )
+
+    # A fresh wrapper and cache instance models the next erk invocation
+    other_fake = FakeGitHub()
+    result = CachingGitHub(other_fake, GitHubResponseCache(tmp_path, time)).get_prs_for_repo(
+        REPO_ROOT, include_checks=False
+    )
+
+    assert result == {"feature": _pr(1)}
+    assert other_fake.get_prs_for_repo_calls == []
+
+
+def test_expired_entries_are_refetched(tmp_path: Path) -> None:
+    time = FakeTime()
+    fake = FakeGitHub(prs={"feature": _pr(1)})
+    github = CachingGitHub(fake, GitHubResponseCache(tmp_path, time))
+
+    github.get_prs_for_repo(REPO_ROOT, include_checks=True)
+    time.sleep(120.0)
+    github.get_prs_for_repo(REPO_ROOT, include_checks=True)
+
+    assert len(fake.get_prs_for_repo_calls) == 2
+
+
+def test_empty_results_are_not_cached(tmp_path: Path) -> None:
+    fake = FakeGitHub()
+    github = CachingGitHub(fake, GitHubResponseCache(tmp_path, FakeTime()))
+
+    github.get_prs_for_repo(REPO_ROOT, include_checks=True)
+    github.get_prs_for_repo(REPO_ROOT, include_checks=True)
+
+    assert len(fake.get_prs_for_repo_calls) == 2
+
+
+def test_pr_writes_invalidate_cached_pr_state(tmp_path: Path) -> None:
+    fake = FakeGitHub(prs={"feature": _pr(1)})
+    github = CachingGitHub(fake, GitHubResponseCache(tmp_path, FakeTime()))
+
+    github.get_prs_for_repo(REPO_ROOT, include_checks=True)
+    github.update_pr_body(REPO_ROOT, 1, "new body")
+    github.get_prs_for_repo(REPO_ROOT, include_checks=True)
+
+    assert len(fake.get_prs_for_repo_calls) == 2
+
+
+def test_refresh_mode_refetches(tmp_path: Path) -> None:
+    fake = FakeGitHub(prs={"feature": _pr(1)})
+    cache = GitHubResponseCache(tmp_path, FakeTime())
+    github = CachingGitHub(fake, cache)
+
+    github.get_prs_for_repo(REPO_ROOT, include_checks=True)
+    cache.set_mode(CacheMode.REFRESH)
+    github.get_prs_for_repo(REPO_ROOT, include_checks=True)
+
+    assert len(fake.get_prs_for_repo_calls) == 2
+
+
+def test_get_pr_status_is_never_served_from_cache(tmp_path: Path) -> None:
+    # Submit and navigation act on the answer, so it must never be stale
+    time = FakeTime()
+    CachingGitHub(
+        FakeGitHub(prs={"feature": _pr(1)}), GitHubResponseCache(tmp_path, time)
+    ).get_pr_status(REPO_ROOT, "feature", debug=False)
+
+    # The PR has since been closed; the next invocation must see that
+    closed = FakeGitHub(pr_statuses={"feature": ("CLOSED", 1, "PR 1")})
+    result = CachingGitHub(closed, GitHubResponseCache(tmp_path, time)).get_pr_status(
+        REPO_ROOT, "feature", debug=False
+    )
+
+    assert result.state == "CLOSED"
+
+
+def test_get_prs_linked_to_issues_round_trips_int_keys(tmp_path: Path) -> None:
+    fake = FakeGitHub(pr_issue_linkages={42: [_pr(7)]})
+    github = CachingGitHub(fake, GitHubResponseCache(tmp_path, FakeTime()))
+
+    fetched = github.get_prs_linked_to_issues(REPO_ROOT, [42])
+    cached = github.get_prs_linked_to_issues(REPO_ROOT, [42])
+
+    assert cached == fetched == {42: [_pr(7)]}
+
+
+def test_get_workflow_runs_batch_only_fetches_missing_runs(tmp_path: Path) -> None:
+    time = FakeTime()
+    CachingGitHub(
+        FakeGitHub(workflow_runs=[_run("1")]), GitHubResponseCache(tmp_path, time)
+    ).get_workflow_runs_batch(REPO_ROOT, ["1"])
+
+    # Run "1" now only exists in the cache; run "2" only in the fake
+    github = CachingGitHub(
+        FakeGitHub(workflow_runs=[_run("2")]), GitHubResponseCache(tmp_path, time)
+    )
+    result = github.get_workflow_runs_batch(REPO_ROOT, ["1", "2", "3"])
+
+    assert result == {"1": _run("1"), "2": _run("2"), "3": None}
@@ -0,0 +1,303 @@
+"""Tests for HttpGitHub against a local stub server."""
+
+import json
+import re
+import threading
+from collections.abc import Callable, Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from erk_shared.github.http_client import GitHubHttpClient
+from erk_shared.github.repo_identity import RepoIdentityResolver
+from erk_shared.github.types import PRInfo, PullRequestInfo, RepoIdentity
+from erk_shared.integrations.time.fake import FakeTime
+
+from erk.core.github.http import HttpGitHub
+
+
+class _StubServer:
+    """Serves canned JSON responses keyed by (method, path) and records requests.
+
+    A route may also be a function of the request body returning the response.
+    """
+
+    def __init__(self) -> None:
+        self.routes: dict[tuple[str, str], tuple[int, Any] | Callable[[Any], tuple[int, Any]]] = {}
+        self.requests: list[tuple[str, str, dict[str, list[str]], Any]] = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _handle(self) -> None:
+                parts = urlsplit(self.path)
+                length = int(self.headers.get("Content-Length", "0"))
+                body = json.loads(self.rfile.read(length)) if length else None
+                stub.requests.append((self.command, parts.path, parse_qs(parts.query), body))
+
+                route = stub.routes.get((self.command, parts.path), (404, {"message": "Not Found"}))
+                status, payload = route(body) if callable(route) else route
+                data = json.dumps(payload).encode() if payload is not None else b""
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = _handle
+            do_POST = _handle
+            do_PATCH = _handle
+            do_PUT = _handle
+
+            def log_message(self, format: str, *args: object) -> None:
+                return
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        host, port = self._server.server_address[:2]
+        self.url = f"http://{host}:{port}"
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def stub() -> Iterator[_StubServer]:
+    server = _StubServer()
+    yield server
+    server.stop()
+
+
+def _github(stub: _StubServer) -> tuple[HttpGitHub, GitHubHttpClient]:
+    client = GitHubHttpClient("token", api_url=stub.url)
+    resolver = RepoIdentityResolver(identity=RepoIdentity("owner", "repo"), cache_path=None)
+    return HttpGitHub(FakeTime(), client, resolver), client
+
+
+def _pr(number: int, *, state: str = "open", merged: bool = False) -> dict[str, Any]:
+    return {
+        "number": number,
+        "title": f"PR {number}",
+        "state": state,
+        "merged_at": "2024-01-01T00:00:00Z" if merged else None,
+        "mergeable": True,
+        "mergeable_state": "clean",
+        "head": {"ref": "feature", "repo": {"full_name": "owner/repo"}},
+        "base": {"ref": "main", "repo": {"full_name": "owner/repo"}},
+    }
+
+
+def test_get_pr_status_queries_by_head_branch(stub: _StubServer) -> None:
+    """get_pr_status filters pulls by owner:branch."""
+    stub.routes[("GET", "/repos/owner/repo/pulls")] = (200, [_pr(12)])
+    github, _ = _github(stub)
+
+    result = github.get_pr_status(Path("/repo"), "feature", debug=False)
+
+    assert result == PRInfo("OPEN", 12, "PR 12")
+    assert stub.requests[0][2]["head"] == ["owner:feature"]
+
+
+def test_get_pr_status_maps_merged_pr(stub: _StubServer) -> None:
+    """A closed PR with merged_at is reported as MERGED, like gh."""
+    stub.routes[("GET", "/repos/owner/repo/pulls")] = (
+        200,
+        [_pr(12, state="closed", merged=True)],
+    )
+    github, _ = _github(stub)
+
+    assert github.get_pr_status(Path("/repo"), "feature", debug=False).state == "MERGED"
+
+
+def test_get_pr_status_without_pr_returns_none_state(stub: _StubServer) -> None:
+    """No matching PR yields the NONE sentinel."""
+    stub.routes[("GET", "/repos/owner/repo/pulls")] = (200, [])
+    github, _ = _github(stub)
+
+    assert github.get_pr_status(Path("/repo"), "feature", debug=False) == PRInfo("NONE", None, None)
+
+
+def test_get_pr_mergeability_uses_graphql_vocabulary(stub: _StubServer) -> None:
+    """REST mergeable fields are mapped onto gh's GraphQL values."""
+    stub.routes[("GET", "/repos/owner/repo/pulls/5")] = (200, _pr(5))
+    github, _ = _github(stub)
+
+    result = github.get_pr_mergeability(Path("/repo"), 5)
+
+    assert result is not None
+    assert result.mergeable == "MERGEABLE"
+    assert result.merge_state_status == "CLEAN"
+
+
+def test_get_pr_base_branch_error_returns_none(stub: _StubServer) -> None:
+    """API failures degrade to None, matching the gh backend."""
+    github, _ = _github(stub)
+
+    assert github.get_pr_base_branch(Path("/repo"), 999) is None
+
+
+def test_create_pr_defaults_base_to_default_branch(stub: _StubServer) -> None:
+    """Without an explicit base, the repository default branch is used."""
+    stub.routes[("GET", "/repos/owner/repo")] = (200, {"default_branch": "trunk"})
+    stub.routes[("POST", "/repos/owner/repo/pulls")] = (201, {"number": 77})
+    github, _ = _github(stub)
+
+    number = github.create_pr(Path("/repo"), "feature", "Title", "Body", draft=True)
+
+    assert number == 77
+    assert stub.requests[-1][3] == {
+        "head": "feature",
+        "base": "trunk",
+        "title": "Title",
+        "body": "Body",
+        "draft": True,
+    }
+
+
+def test_default_branch_is_resolved_per_repository(stub: _StubServer) -> None:
+    """The default branch is remembered per repo root, not per instance."""
+    stub.routes[("GET", "/repos/owner/repo")] = (200, {"default_branch": "trunk"})
+    stub.routes[("POST", "/repos/owner/repo/pulls")] = (201, {"number": 77})
+    github, _ = _github(stub)
+
+    github.create_pr(Path("/repo-a"), "feature", "Title", "Body")
+    github.create_pr(Path("/repo-a"), "other", "Title", "Body")
+    github.create_pr(Path("/repo-b"), "feature", "Title", "Body")
+
+    repo_gets = [r for r in stub.requests if r[:2] == ("GET", "/repos/owner/repo")]
+    assert len(repo_gets) == 2
+
+
+def test_get_workflow_run_parses_rest_run(stub: _StubServer) -> None:
+    """Workflow runs are converted into WorkflowRun."""
+    stub.routes[("GET", "/repos/owner/repo/actions/runs/123")] = (
+        200,
+        {
+            "id": 123,
+            "status": "completed",
+            "conclusion": "success",
+            "head_branch": "feature",
+            "head_sha": "abc123",
+            "display_title": "Implement plan",
+            "created_at": "2024-01-01T12:00:00Z",
+        },
+    )
+    github, _ = _github(stub)
+
+    run = github.get_workflow_run(Path("/repo"), "123")
+
+    assert run is not None
+    assert run.run_id == "123"
+    assert run.conclusion == "success"
+    assert run.display_title == "Implement plan"
+    assert run.created_at is not None
+
+
+def test_find_workflow_run_tells_missing_from_failed(stub: _StubServer) -> None:
+    """Only a 404 means the run doesn't exist; other errors raise."""
+    stub.routes[("GET", "/repos/owner/repo/actions/runs/502")] = (502, {"message": "Bad Gateway"})
+    github, _ = _github(stub)
+
+    assert github.find_workflow_run(Path("/repo"), "404") is None
+    with pytest.raises(RuntimeError, match="Bad Gateway"):
+        github.find_workflow_run(Path("/repo"), "502")
+    assert github.get_workflow_run(Path("/repo"), "502") is None
+
+
+def test_operations_share_one_connection(stub: _StubServer) -> None:
+    """Consecutive calls reuse a single pooled connection."""
+    stub.routes[("GET", "/repos/owner/repo/pulls/5")] = (200, _pr(5))
+    stub.routes[("PATCH", "/repos/owner/repo/pulls/5")] = (200, _pr(5))
+    github, client = _github(stub)
+
+    github.get_pr_base_branch(Path("/repo"), 5)
+    github.update_pr_base_branch(Path("/repo"), 5, "develop")
+    github.get_pr_checkout_info(Path("/repo"), 5)
+
+    assert client.requests_sent == 3
+    assert client.connections_opened == 1
+
+
+def _ci_status_responder(context_counts: dict[int, int], failing: set[int]) -> Callable:
+    """Answer CI status queries for PRs with the given number of check contexts.
+
+    Contexts are numbered oldest first and their cursor is their index, so
+    `last: 100, before: N` returns contexts N-100..N-1. The oldest context of
+    PRs in failing has failed.
+    """
+    alias_pattern = re.compile(r"(pr_\d+): pullRequest\(number: (\d+)\)")
+    before_pattern = re.compile(r'before: "(\d+)"')
+
+    def respond(body: Any) -> tuple[int, Any]:
+        query = body["query"]
+        aliases = alias_pattern.findall(query)
+        cursors = [int(cursor) for cursor in before_pattern.findall(query)]
+        repository = {}
+        for index, (alias, number) in enumerate(aliases):
+            pr_number = int(number)
+            end = cursors[index] if cursors else context_counts[pr_number]
+            start = max(0, end - 100)
+            contexts = [
+                {
+                    "status": "COMPLETED",
+                    "conclusion": "FAILURE" if i == 0 and pr_number in failing else "SUCCESS",
+                }
+                for i in range(start, end)
+            ]
+            rollup = {
+                "state": "SUCCESS",
+                "contexts": {
+                    "pageInfo": {"hasPreviousPage": start > 0, "startCursor": str(start)},
+                    "nodes": contexts,
+                },
+            }
+            repository[alias] = {
+                "number": pr_number,
+                "title": f"PR {pr_number}",
+                "mergeable": "MERGEABLE",
+                "commits": {"nodes": [{"commit": {"statusCheckRollup": rollup}}]},
+            }
+        return 200, {"data": {"repository": repository}}
+
+    return respond
+
+
+def test_enrich_prs_with_ci_status_batch_chunks_2000_prs(stub: _StubServer) -> None:
+    """Thousands of PRs are queried in bounded chunks and nested contexts are paged."""
+    pr_numbers = range(1, 2001)
+    # Every 100th PR has 250 check contexts (three pages); every 200th fails
+    # only in its oldest context, which just the last page holds
+    context_counts = {number: 250 if number % 100 == 0 else 1 for number in pr_numbers}
+    failing = {number for number in pr_numbers if number % 200 == 0}
+    stub.routes[("POST", "/graphql")] = _ci_status_responder(context_counts, failing)
+    github, _ = _github(stub)
+    prs = {
+        f"branch-{number}": PullRequestInfo(
+            number=number,
+            state="OPEN",
+            url=f"https://github.com/owner/repo/pull/{number}",
+            is_draft=False,
+            title=None,
+            checks_passing=None,
+            owner="owner",
+            repo="repo",
+        )
+        for number in pr_numbers
+    }
+
+    result = github.enrich_prs_with_ci_status_batch(prs, Path("/repo"))
+
+    assert len(result) == 2000
+    assert all(pr.title == f"PR {pr.number}" for pr in result.values())
+    assert {pr.number for pr in result.values() if pr.checks_passing is False} == failing
+    assert all(pr.has_conflicts is False for pr in result.values())
+
+    queries = [request[3]["query"] for request in stub.requests]
+    alias_counts = [query.count(": pullRequest(number:") for query in queries]
+    assert max(alias_counts) <= 50
+    # 40 chunks, then two more pages of contexts for the 20 long-running PRs
+    assert len(queries) == 42
+    assert sum(alias_counts) == 2000 + 2 * 20
@@ -0,0 +1,142 @@
+"""Tests for the per-repository completion candidate cache."""
+
+import json
+import subprocess
+from pathlib import Path
+
+from erk_shared.git.real import RealGit
+
+from erk.core.completion_cache import (
+    MAX_CACHED_PLANS,
+    branch_candidates,
+    cached_plans,
+    load_or_refresh_completion_sets,
+    read_completion_fingerprint,
+    record_completion_plans,
+    refresh_stale_completion_sets,
+)
+from erk.core.git.fake import FakeGit
+
+
+class CountingGit(FakeGit):
+    """FakeGit that counts branch listings."""
+
+    def __init__(self, repo_root: Path, local_branches: list[str]) -> None:
+        super().__init__(
+            local_branches={repo_root: local_branches},
+            remote_branches={repo_root: []},
+            git_common_dirs={repo_root: repo_root / ".git"},
+        )
+        self.list_calls = 0
+
+    def list_local_branches(self, repo_root: Path) -> list[str]:
+        self.list_calls += 1
+        return super().list_local_branches(repo_root)
+
+
+def _make_repo(root: Path) -> Path:
+    (root / ".git" / "refs" / "heads").mkdir(parents=True)
+    (root / ".git" / "refs" / "heads" / "main").write_text("a" * 40 + "\n", encoding="utf-8")
+    return root
+
+
+def test_branch_candidates_strip_remote_and_deduplicate() -> None:
+    """Remote prefixes are stripped and names present in both appear once."""
+    assert branch_candidates(["main", "b"], ["origin/main", "upstream/c"]) == ["b", "c", "main"]
+
+
+def test_sets_cached_until_refs_change(tmp_path: Path) -> None:
+    """Candidates come from the cache until a branch is added."""
+    repo = _make_repo(tmp_path / "repo")
+    cache_path = tmp_path / "completion.json"
+    git = CountingGit(repo, ["main"])
+
+    assert load_or_refresh_completion_sets(git, repo, cache_path) == (["root"], ["main"])
+    assert load_or_refresh_completion_sets(git, repo, cache_path) == (["root"], ["main"])
+    assert git.list_calls == 1
+
+    (repo / ".git" / "refs" / "heads" / "feature").write_text("b" * 40 + "\n", encoding="utf-8")
+    git.create_tracking_branch(repo, "feature", "origin/feature")
+
+    assert load_or_refresh_completion_sets(git, repo, cache_path) == (
+        ["root"],
+        ["feature", "main"],
+    )
+    assert git.list_calls == 2
+
+
+def test_fingerprint_tracks_git_operations(tmp_path: Path) -> None:
+    """Branch creation, packing and worktree creation all change the fingerprint."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+
+    def git(*args: str) -> None:
+        subprocess.run(
+            ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+            cwd=repo,
+            check=True,
+            capture_output=True,
+        )
+
+    git("init", "-b", "main")
+    git("commit", "--allow-empty", "-m", "init")
+    common_dir = repo / ".git"
+
+    before = read_completion_fingerprint(common_dir)
+    git("branch", "feature/nested")
+    after_branch = read_completion_fingerprint(common_dir)
+    assert after_branch != before
+
+    git("pack-refs", "--all")
+    after_pack = read_completion_fingerprint(common_dir)
+    assert after_pack != after_branch
+
+    git("worktree", "add", str(tmp_path / "wt"), "feature/nested")
+    assert read_completion_fingerprint(common_dir) != after_pack
+
+    cache_path = tmp_path / "completion.json"
+    worktrees, branches = load_or_refresh_completion_sets(RealGit(), repo, cache_path)
+    assert worktrees == ["root", "wt"]
+    assert branches == ["feature/nested", "main"]
+
+
+def test_refresh_stale_only_touches_existing_caches(tmp_path: Path) -> None:
+    """Commands don't create caches for repositories never completed in."""
+    repo = _make_repo(tmp_path / "repo")
+    cache_path = tmp_path / "completion.json"
+    git = CountingGit(repo, ["main"])
+
+    refresh_stale_completion_sets(git, repo, cache_path)
+    assert not cache_path.exists()
+
+    load_or_refresh_completion_sets(git, repo, cache_path)
+    refresh_stale_completion_sets(git, repo, cache_path)
+    assert git.list_calls == 1
+
+
+def test_plans_survive_set_refresh_and_are_capped(tmp_path: Path) -> None:
+    """Recorded plans are kept when branch candidates are rewritten."""
+    repo = _make_repo(tmp_path / "repo")
+    cache_path = tmp_path / "completion.json"
+    plans = [(number, f"Plan {number}") for number in range(MAX_CACHED_PLANS + 10, 0, -1)]
+
+    record_completion_plans(cache_path, plans)
+    load_or_refresh_completion_sets(CountingGit(repo, ["main"]), repo, cache_path)
+
+    candidates = cached_plans(cache_path)
+    assert len(candidates) == MAX_CACHED_PLANS
+    assert (candidates[0].value, candidates[0].help) == ("60", "Plan 60")
+    assert "sets" in json.loads(cache_path.read_text(encoding="utf-8"))
+
+
+def test_corrupt_cache_is_a_miss(tmp_path: Path) -> None:
+    """An unreadable cache file is ignored and rewritten."""
+    repo = _make_repo(tmp_path / "repo")
+    cache_path = tmp_path / "completion.json"
+    cache_path.write_text("{not json", encoding="utf-8")
+
+    assert cached_plans(cache_path) == []
+    assert load_or_refresh_completion_sets(CountingGit(repo, ["main"]), repo, cache_path) == (
+        ["root"],
+        ["main"],
+    )
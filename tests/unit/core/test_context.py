@@ -1,9 +1,14 @@
 """Tests for context creation and regeneration."""
 
 import os
+import threading
 from pathlib import Path
 
+import pytest
+
 from erk.core.context import create_context, regenerate_context
+from erk.core.git.dry_run import DryRunGit
+from erk.core.provider import Provider
 
 
 def test_regenerate_context_updates_cwd(tmp_path: Path) -> None:
@@ -96,3 +101,64 @@ def test_regenerate_context_detects_deleted_directory(tmp_path: Path) -> None:
     finally:
         # Cleanup: restore original directory
         os.chdir(original_cwd)
+
+
+def test_provider_builds_once() -> None:
+    """A provider calls its factory on first get() and reuses the result."""
+    calls: list[int] = []
+
+    def build() -> int:
+        calls.append(1)
+        return len(calls)
+
+    provider = Provider(build)
+
+    assert not provider.resolved
+    assert provider.get() == 1
+    assert provider.get() == 1
+    assert provider.resolved
+    assert Provider.of("ready").resolved
+
+
+def test_provider_builds_once_across_threads() -> None:
+    """Threads that first get() concurrently share one built object."""
+    building = threading.Event()
+    release = threading.Event()
+    built: list[object] = []
+
+    def build() -> object:
+        building.set()
+        release.wait(5)
+        built.append(object())
+        return built[-1]
+
+    provider = Provider(build)
+    results: list[object] = []
+    threads = [threading.Thread(target=lambda: results.append(provider.get())) for _ in range(4)]
+    threads[0].start()
+    building.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(built) == 1
+    assert results == [built[0]] * 4
+
+
+def test_create_context_resolves_dependencies_on_first_use(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Dependencies are built when accessed, with dry-run wrapping applied then."""
+    monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
+
+    ctx = create_context(dry_run=True)
+    assert ctx.resolved_dependencies() == []
+
+    assert isinstance(ctx.git, DryRunGit)
+
+    resolved = ctx.resolved_dependencies()
+    assert "git" in resolved
+    assert "github" not in resolved
+    assert "graphite" not in resolved
@@ -0,0 +1,128 @@
+"""Tests for persisted trunk branch resolution."""
+
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from erk.cli.cli import cli
+from erk.core.context import ErkContext
+from erk.core.git.fake import FakeGit
+from erk.core.repo_discovery import RepoContext
+from erk.core.trunk_cache import TrunkBranchResolver, read_configured_trunk
+
+
+class CountingGit(FakeGit):
+    """FakeGit that counts trunk detections."""
+
+    def __init__(self, trunk_branches: dict[Path, str]) -> None:
+        super().__init__(trunk_branches=trunk_branches)
+        self.trunk_calls = 0
+
+    def get_trunk_branch(self, repo_root: Path) -> str:
+        self.trunk_calls += 1
+        return super().get_trunk_branch(repo_root)
+
+
+def _make_repo(root: Path, *, origin_head: str | None) -> Path:
+    git_dir = root / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n", encoding="utf-8")
+    (git_dir / "refs" / "heads" / "main").write_text("a" * 40 + "\n", encoding="utf-8")
+    if origin_head is not None:
+        _set_origin_head(root, origin_head)
+    return root
+
+
+def _set_origin_head(root: Path, branch: str) -> None:
+    remote_dir = root / ".git" / "refs" / "remotes" / "origin"
+    remote_dir.mkdir(parents=True, exist_ok=True)
+    (remote_dir / "HEAD").write_text(f"ref: refs/remotes/origin/{branch}\n", encoding="utf-8")
+
+
+def test_resolve_persists_across_resolvers(tmp_path: Path) -> None:
+    """A second invocation reuses the persisted trunk without asking git."""
+    repo_root = _make_repo(tmp_path / "repo", origin_head="main")
+    cache_path = tmp_path / "erk" / "trunk.json"
+    git = CountingGit(trunk_branches={repo_root: "main"})
+
+    resolver = TrunkBranchResolver(cache_path)
+    assert resolver.resolve(git, repo_root) == "main"
+    assert resolver.resolve(git, repo_root) == "main"
+    assert TrunkBranchResolver(cache_path).resolve(git, repo_root) == "main"
+
+    assert git.trunk_calls == 1
+    assert cache_path.exists()
+
+
+def test_origin_head_change_invalidates(tmp_path: Path) -> None:
+    """Moving origin/HEAD makes the next invocation re-detect trunk."""
+    repo_root = _make_repo(tmp_path / "repo", origin_head="main")
+    cache_path = tmp_path / "erk" / "trunk.json"
+    TrunkBranchResolver(cache_path).resolve(
+        CountingGit(trunk_branches={repo_root: "main"}), repo_root
+    )
+
+    _set_origin_head(repo_root, "develop")
+    git = CountingGit(trunk_branches={repo_root: "develop"})
+
+    assert TrunkBranchResolver(cache_path).resolve(git, repo_root) == "develop"
+    assert git.trunk_calls == 1
+
+
+def test_pyproject_setting_wins_and_invalidates(tmp_path: Path) -> None:
+    """[tool.erk] trunk_branch overrides detection, and editing it is noticed."""
+    repo_root = _make_repo(tmp_path / "repo", origin_head="main")
+    cache_path = tmp_path / "erk" / "trunk.json"
+    git = CountingGit(trunk_branches={repo_root: "main"})
+    assert TrunkBranchResolver(cache_path).resolve(git, repo_root) == "main"
+
+    (repo_root / "pyproject.toml").write_text(
+        '[tool.erk]\ntrunk_branch = "release"\n', encoding="utf-8"
+    )
+
+    assert read_configured_trunk(repo_root) == "release"
+    assert TrunkBranchResolver(cache_path).resolve(git, repo_root) == "release"
+
+
+def test_unreadable_layout_is_not_persisted(tmp_path: Path) -> None:
+    """Without a readable .git layout trunk comes from git and nothing is written."""
+    repo_root = tmp_path / "not-a-repo"
+    repo_root.mkdir()
+    cache_path = tmp_path / "erk" / "trunk.json"
+    git = CountingGit(trunk_branches={repo_root: "master"})
+
+    assert TrunkBranchResolver(cache_path).resolve(git, repo_root) == "master"
+    assert TrunkBranchResolver(cache_path).resolve(git, repo_root) == "master"
+
+    assert git.trunk_calls == 2
+    assert not cache_path.exists()
+
+
+def test_admin_refresh_trunk_replaces_cached_value(tmp_path: Path) -> None:
+    """erk admin refresh-trunk re-detects even when the fingerprint matches."""
+    repo_root = _make_repo(tmp_path / "repo", origin_head="main")
+    repo = RepoContext(
+        root=repo_root,
+        repo_name="repo",
+        repo_dir=tmp_path / "erk" / "repos" / "repo",
+        worktrees_dir=tmp_path / "erk" / "repos" / "repo" / "worktrees",
+    )
+    TrunkBranchResolver(repo.trunk_cache_path).resolve(
+        CountingGit(trunk_branches={repo_root: "stale"}), repo_root
+    )
+
+    git = FakeGit(
+        git_common_dirs={repo_root: repo_root / ".git"}, trunk_branches={repo_root: "main"}
+    )
+    ctx = ErkContext.for_test(
+        git=git,
+        cwd=repo_root,
+        repo=repo,
+        trunk_resolver=TrunkBranchResolver(repo.trunk_cache_path),
+    )
+
+    result = CliRunner().invoke(cli, ["admin", "refresh-trunk"], obj=ctx)
+
+    assert result.exit_code == 0, result.output
+    assert "main" in result.output
+    assert TrunkBranchResolver(repo.trunk_cache_path).resolve(git, repo_root) == "main"
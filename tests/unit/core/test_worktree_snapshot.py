@@ -0,0 +1,82 @@
+"""Unit tests for WorktreeSnapshot collection."""
+
+from pathlib import Path
+
+from erk_shared.git.abc import WorktreeInfo
+
+from erk.core.git.fake import FakeGit
+from erk.core.worktree_snapshot import WorktreeSnapshot, collect_worktree_snapshot
+
+
+def _write_issue_json(worktree_path: Path, issue_number: int) -> None:
+    impl_dir = worktree_path / ".impl"
+    impl_dir.mkdir(parents=True)
+    (impl_dir / "issue.json").write_text(
+        f'{{"issue_number": {issue_number}, '
+        f'"issue_url": "https://github.com/owner/repo/issues/{issue_number}", '
+        '"created_at": "2024-01-01T00:00:00Z", "synced_at": "2024-01-01T00:00:00Z"}',
+        encoding="utf-8",
+    )
+
+
+def test_collect_reads_issue_json_for_every_worktree(tmp_path: Path) -> None:
+    """Every worktree's .impl/issue.json is read, and worktrees without one are skipped."""
+    repo_root = tmp_path / "repo"
+    wt_a = tmp_path / "wt-a"
+    wt_b = tmp_path / "wt-b"
+    repo_root.mkdir()
+    wt_b.mkdir()
+    _write_issue_json(wt_a, 42)
+    worktrees = [
+        WorktreeInfo(path=repo_root, branch="main", is_root=True),
+        WorktreeInfo(path=wt_a, branch="feature-a"),
+        WorktreeInfo(path=wt_b, branch="feature-b"),
+    ]
+    git = FakeGit(worktrees={repo_root: worktrees})
+
+    snapshot = collect_worktree_snapshot(git, repo_root)
+
+    assert set(snapshot.issue_refs) == {wt_a}
+    assert snapshot.impl_issue(wt_a, "feature-a") == (
+        "#42",
+        "https://github.com/owner/repo/issues/42",
+    )
+
+
+def test_impl_issue_falls_back_to_branch_config() -> None:
+    """Branches without issue.json use the git config mapping, which has no URL."""
+    worktree_path = Path("/repo/worktree")
+    git = FakeGit(branch_issues={"feature": 123})
+
+    snapshot = collect_worktree_snapshot(git, Path("/repo"), [])
+
+    assert snapshot.impl_issue(worktree_path, "feature") == ("#123", None)
+
+
+def test_impl_issue_none_when_not_found() -> None:
+    """No issue.json and no config entry yields (None, None), including detached HEAD."""
+    snapshot = WorktreeSnapshot(worktrees=[], issue_refs={}, branch_issues={})
+
+    assert snapshot.impl_issue(Path("/repo/worktree"), "feature") == (None, None)
+    assert snapshot.impl_issue(Path("/repo/worktree"), None) == (None, None)
+
+
+def test_worktree_by_issue_keeps_first_worktree(tmp_path: Path) -> None:
+    """When several worktrees reference one issue, the first listed wins."""
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir()
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    other = tmp_path / "other"
+    _write_issue_json(first, 7)
+    _write_issue_json(second, 7)
+    _write_issue_json(other, 8)
+    worktrees = [
+        WorktreeInfo(path=first, branch="a"),
+        WorktreeInfo(path=second, branch="b"),
+        WorktreeInfo(path=other, branch="c"),
+    ]
+
+    snapshot = collect_worktree_snapshot(FakeGit(), repo_root, worktrees)
+
+    assert snapshot.worktree_by_issue() == {7: "first", 8: "other"}
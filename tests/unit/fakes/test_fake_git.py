@@ -301,6 +301,16 @@ def test_fake_gitops_get_branch_head() -> None:
     assert git_ops.get_branch_head(repo_root, "nonexistent") is None
 
 
+def test_fake_gitops_get_branch_heads() -> None:
+    """Test get_branch_heads returns only the requested branches that exist."""
+    repo_root = Path("/repo")
+    git_ops = FakeGit(branch_heads={"main": "abc123", "feature": "def456", "other": "fff000"})
+
+    heads = git_ops.get_branch_heads(repo_root, ["main", "feature", "nonexistent"])
+
+    assert heads == {"main": "abc123", "feature": "def456"}
+
+
 def test_fake_gitops_get_commit_message() -> None:
     """Test get_commit_message returns message from dict."""
     repo_root = Path("/repo")
@@ -521,6 +531,15 @@ def test_fake_git_set_branch_issue_multiple_branches() -> None:
     assert git_ops.get_branch_issue(Path("/repo"), "branch-3") == 30
 
 
+def test_fake_git_get_all_branch_issues() -> None:
+    """Test get_all_branch_issues returns configured and set associations."""
+    git_ops = FakeGit(branch_issues={"branch-1": 10})
+
+    git_ops.set_branch_issue(Path("/repo"), "branch-2", 20)
+
+    assert git_ops.get_all_branch_issues(Path("/repo")) == {"branch-1": 10, "branch-2": 20}
+
+
 def test_fake_git_set_branch_issue_overwrites() -> None:
     """Test set_branch_issue overwrites existing association."""
     git_ops = FakeGit()
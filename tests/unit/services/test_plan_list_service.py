@@ -1,6 +1,7 @@
 """Tests for PlanListService."""
 
-from datetime import UTC, datetime
+import dataclasses
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 import pytest
@@ -41,8 +42,8 @@ class TestPlanListService:
         assert result.issues[0].number == 42
         assert result.issues[0].title == "Test Plan"
 
-    def test_fetches_pr_linkages_from_github_integration(self) -> None:
-        """Service delegates PR linkage fetching to GitHub integration."""
+    def test_fetches_pr_linkages_with_issues(self) -> None:
+        """Service gets PR linkages from the same GitHubIssues query as the issues."""
         now = datetime.now(UTC)
         issue = IssueInfo(
             number=42,
@@ -65,8 +66,8 @@ class TestPlanListService:
             owner="owner",
             repo="repo",
         )
-        fake_issues = FakeGitHubIssues(issues={42: issue})
-        fake_github = FakeGitHub(pr_issue_linkages={42: [pr]})
+        fake_issues = FakeGitHubIssues(issues={42: issue}, pr_linkages={42: [pr]})
+        fake_github = FakeGitHub()
 
         service = PlanListService(fake_github, fake_issues)
         result = service.get_plan_list_data(
@@ -77,6 +78,42 @@ class TestPlanListService:
         assert 42 in result.pr_linkages
         assert result.pr_linkages[42][0].number == 123
 
+    def test_skip_pr_linkages_omits_linkages(self) -> None:
+        """Service leaves PR linkages out of the query when asked to skip them."""
+        now = datetime.now(UTC)
+        issue = IssueInfo(
+            number=42,
+            title="Test Plan",
+            body="",
+            state="OPEN",
+            url="https://github.com/owner/repo/issues/42",
+            labels=["erk-plan"],
+            assignees=[],
+            created_at=now,
+            updated_at=now,
+        )
+        pr = PullRequestInfo(
+            number=123,
+            state="OPEN",
+            url="https://github.com/owner/repo/pull/123",
+            is_draft=False,
+            title="PR Title",
+            checks_passing=True,
+            owner="owner",
+            repo="repo",
+        )
+        fake_issues = FakeGitHubIssues(issues={42: issue}, pr_linkages={42: [pr]})
+
+        service = PlanListService(FakeGitHub(), fake_issues)
+        result = service.get_plan_list_data(
+            repo_root=Path("/test/repo"),
+            labels=["erk-plan"],
+            skip_pr_linkages=True,
+        )
+
+        assert len(result.issues) == 1
+        assert result.pr_linkages == {}
+
     def test_empty_issues_returns_empty_data(self) -> None:
         """Service returns empty data when no issues match."""
         fake_issues = FakeGitHubIssues()
@@ -130,6 +167,51 @@ class TestPlanListService:
         assert len(result.issues) == 1
         assert result.issues[0].title == "Open Plan"
 
+    def test_plan_headers_parsed_once_per_issue_revision(self) -> None:
+        """Plan headers are memoized by issue number and updated_at."""
+        now = datetime.now(UTC)
+        body = """<!-- erk:metadata-block:plan-header -->
+<details>
+<summary><code>plan-header</code></summary>
+
+```yaml
+schema_version: '2'
+created_at: '2024-01-15T10:30:00Z'
+created_by: user123
+worktree_name: my-worktree
+last_dispatched_run_id: '555'
+```
+
+</details>
+<!-- /erk:metadata-block:plan-header -->"""
+        issue = IssueInfo(
+            number=42,
+            title="Test Plan",
+            body=body,
+            state="OPEN",
+            url="",
+            labels=["erk-plan"],
+            assignees=[],
+            created_at=now,
+            updated_at=now,
+        )
+        fake_issues = FakeGitHubIssues(issues={42: issue})
+        fake_github = FakeGitHub()
+
+        service = PlanListService(fake_github, fake_issues)
+        result = service.get_plan_list_data(
+            repo_root=Path("/test/repo"),
+            labels=["erk-plan"],
+        )
+
+        header = result.plan_headers[42]
+        assert header.worktree_name == "my-worktree"
+        assert header.last_dispatched_run_id == "555"
+        # Same revision reuses the parsed header, a new revision is parsed again
+        assert service.get_plan_header(issue) is header
+        edited = dataclasses.replace(issue, body="", updated_at=now + timedelta(minutes=1))
+        assert service.get_plan_header(edited).worktree_name is None
+
 
 class TestPlanListData:
     """Tests for PlanListData dataclass."""
@@ -0,0 +1,174 @@
+"""Tests for WorkflowRunWatcher."""
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from erk_shared.github.types import WorkflowRun
+from erk_shared.integrations.time.fake import FakeTime
+
+from erk.core.github.fake import FakeGitHub
+from erk.core.services.run_watcher import WorkflowRunWatcher
+
+_NOW = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+_REPO_ROOT = Path("/test/repo")
+
+
+def _run(run_id: str, status: str, conclusion: str | None = None, **kwargs) -> WorkflowRun:
+    return WorkflowRun(
+        run_id=run_id,
+        status=status,
+        conclusion=conclusion,
+        branch=kwargs.get("branch", "master"),
+        head_sha="abc123",
+        created_at=kwargs.get("created_at", _NOW),
+    )
+
+
+class _TickingGitHub(FakeGitHub):
+    """FakeGitHub whose run listing advances one snapshot per call."""
+
+    def __init__(
+        self, snapshots: list[list[WorkflowRun]], runs_by_id: list[WorkflowRun] | None = None
+    ) -> None:
+        super().__init__(workflow_runs=runs_by_id if runs_by_id is not None else snapshots[-1])
+        self._snapshots = snapshots
+        self.list_calls = 0
+
+    def list_workflow_runs(
+        self, repo_root: Path, workflow: str, limit: int = 50
+    ) -> list[WorkflowRun]:
+        snapshot = self._snapshots[min(self.list_calls, len(self._snapshots) - 1)]
+        self.list_calls += 1
+        return snapshot
+
+
+def test_streams_transitions_of_all_targets_with_one_listing_per_tick() -> None:
+    github = _TickingGitHub(
+        [
+            [_run("1", "queued"), _run("2", "queued")],
+            [_run("1", "in_progress"), _run("2", "queued")],
+            [_run("1", "in_progress"), _run("2", "queued")],
+            [_run("1", "completed", "success"), _run("2", "completed", "failure")],
+        ]
+    )
+    watcher = WorkflowRunWatcher(github, FakeTime(_NOW), _REPO_ROOT, "dispatch.yml")
+    watcher.watch_run("1")
+    watcher.watch_run("2")
+
+    transitions = [(t.target, t.run.status, t.run.conclusion) for t in watcher.watch()]
+
+    assert transitions == [
+        ("1", "queued", None),
+        ("2", "queued", None),
+        ("1", "in_progress", None),
+        ("1", "completed", "success"),
+        ("2", "completed", "failure"),
+    ]
+    assert github.list_calls == 4
+    assert watcher.finished
+
+
+def test_interval_backs_off_while_nothing_changes() -> None:
+    running = [_run("1", "in_progress")]
+    github = _TickingGitHub(
+        [running, running, running, running, [_run("1", "completed", "success")]]
+    )
+    time = FakeTime(_NOW)
+    watcher = WorkflowRunWatcher(
+        github, time, _REPO_ROOT, "dispatch.yml", initial_interval=2.0, max_interval=8.0
+    )
+    watcher.watch_run("1")
+
+    list(watcher.watch())
+
+    # 2s after the run is first seen, then 4s, 8s, capped at 8s; each with
+    # up to 20% jitter
+    expected = [2.0, 4.0, 8.0, 8.0]
+    assert len(time.sleep_calls) == len(expected)
+    for delay, base in zip(time.sleep_calls, expected, strict=True):
+        assert base * 0.8 <= delay <= base * 1.2
+
+
+def test_old_runs_are_fetched_by_id() -> None:
+    old_run = _run("1", "completed", "success")
+    github = _TickingGitHub([[]], runs_by_id=[old_run])
+    watcher = WorkflowRunWatcher(github, FakeTime(_NOW), _REPO_ROOT, "dispatch.yml")
+    watcher.watch_run("1")
+
+    assert [t.run for t in watcher.poll()] == [old_run]
+    assert watcher.finished
+
+
+def test_branch_ignores_runs_before_created_after() -> None:
+    earlier = _run("1", "completed", "failure", branch="feature", created_at=_NOW)
+    later = _run("2", "queued", branch="feature", created_at=_NOW + timedelta(minutes=1))
+    github = _TickingGitHub([[earlier], [later, earlier]])
+    watcher = WorkflowRunWatcher(github, FakeTime(_NOW), _REPO_ROOT, "dispatch.yml")
+    watcher.watch_branch("feature", created_after=_NOW + timedelta(seconds=30))
+
+    assert watcher.poll() == []
+    assert [t.run.run_id for t in watcher.poll()] == ["2"]
+    assert not watcher.finished
+
+
+def test_timeout_stops_watching() -> None:
+    github = _TickingGitHub([[_run("1", "in_progress")]])
+    time = FakeTime(_NOW)
+    watcher = WorkflowRunWatcher(github, time, _REPO_ROOT, "dispatch.yml")
+    watcher.watch_run("1")
+
+    transitions = list(watcher.watch(timeout=60))
+
+    assert len(transitions) == 1
+    assert not watcher.finished
+    assert time.now() == _NOW + timedelta(seconds=60)
+
+
+def test_unknown_run_ids_are_dropped_after_lookup() -> None:
+    github = _TickingGitHub([[_run("1", "in_progress")], [_run("1", "completed", "success")]])
+    watcher = WorkflowRunWatcher(github, FakeTime(_NOW), _REPO_ROOT, "dispatch.yml")
+    watcher.watch_run("1")
+    watcher.watch_run("404")
+
+    transitions = [t.target for t in watcher.watch()]
+
+    assert transitions == ["1", "1"]
+    assert watcher.not_found == ["404"]
+    assert watcher.targets == ["1"]
+    assert watcher.finished
+
+
+def test_branch_without_run_is_dropped_at_deadline() -> None:
+    github = _TickingGitHub([[]])
+    time = FakeTime(_NOW)
+    watcher = WorkflowRunWatcher(
+        github, time, _REPO_ROOT, "dispatch.yml", max_interval=8.0, branch_deadline=60.0
+    )
+    watcher.watch_branch("feature")
+
+    assert list(watcher.watch()) == []
+    assert watcher.not_found == ["feature"]
+    assert watcher.finished
+    assert _NOW + timedelta(seconds=60) <= time.now() <= _NOW + timedelta(seconds=70)
+
+
+def test_failed_lookup_is_retried_instead_of_dropping_the_run() -> None:
+    class _FlakyLookupGitHub(_TickingGitHub):
+        def __init__(self) -> None:
+            super().__init__([[], [_run("1", "completed", "success")]], runs_by_id=[])
+            self.find_calls = 0
+
+        def find_workflow_run(self, repo_root: Path, run_id: str) -> WorkflowRun | None:
+            self.find_calls += 1
+            raise RuntimeError("HTTP 502: Bad Gateway")
+
+    github = _FlakyLookupGitHub()
+    watcher = WorkflowRunWatcher(github, FakeTime(_NOW), _REPO_ROOT, "dispatch.yml")
+    watcher.watch_run("1")
+
+    transitions = [(t.target, t.run.status) for t in watcher.watch()]
+
+    assert transitions == [("1", "completed")]
+    assert github.find_calls == 1
+    assert watcher.not_found == []
+    assert watcher.finished
@@ -23,18 +23,24 @@ reliable while still validating the orchestrator's error handling logic.
 import time
 from pathlib import Path
 
-from erk_shared.git.abc import WorktreeInfo
+from erk_shared.git.abc import BranchSyncInfo, WorktreeInfo
+from erk_shared.integrations.graphite.fake import FakeGraphite
 from erk_shared.integrations.parallel.real import RealParallelTaskRunner
 
+from erk.core.config_store import GlobalConfig
 from erk.core.context import ErkContext
 from erk.core.git.fake import FakeGit
+from erk.core.github.fake import FakeGitHub
 from erk.status.collectors.base import StatusCollector
 from erk.status.collectors.git import GitStatusCollector
+from erk.status.collectors.github import GitHubPRCollector
+from erk.status.collectors.graphite import GraphiteStackCollector
 from erk.status.collectors.impl import PlanFileCollector
 from erk.status.models.status_data import GitStatus, PlanStatus
 from erk.status.orchestrator import StatusOrchestrator
 from tests.fakes.context import create_test_context
 from tests.fakes.parallel_task_runner import FakeParallelTaskRunner
+from tests.test_utils.builders import PullRequestInfoBuilder
 
 
 def test_orchestrator_collects_all_data(tmp_path: Path) -> None:
@@ -542,3 +548,121 @@ def test_orchestrator_multiple_collector_types(tmp_path: Path) -> None:
     assert status.git_status.branch == "test"
     assert status.plan is not None
     assert status.plan.exists is True
+
+
+def test_orchestrator_collect_all_status_shares_repository_data(tmp_path: Path) -> None:
+    """Test collect_all_status fetches PRs and sync info once for all worktrees."""
+    # Arrange
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir()
+    feature_a = tmp_path / "erks" / "feature-a"
+    feature_a.mkdir(parents=True)
+    feature_b = tmp_path / "erks" / "feature-b"
+    feature_b.mkdir(parents=True)
+    (feature_a / ".impl").mkdir()
+    (feature_a / ".impl" / "plan.md").write_text("# Plan A", encoding="utf-8")
+
+    git_ops = FakeGit(
+        worktrees={
+            repo_root: [
+                WorktreeInfo(path=feature_b, branch="feature-b"),
+                WorktreeInfo(path=repo_root, branch="main", is_root=True),
+                WorktreeInfo(path=feature_a, branch="feature-a"),
+            ]
+        },
+        file_statuses={
+            repo_root: ([], [], []),
+            feature_a: ([], ["a.py"], []),
+            feature_b: ([], [], ["new.py"]),
+        },
+        branch_sync_info={
+            "feature-a": BranchSyncInfo(
+                branch="feature-a", upstream="origin/feature-a", ahead=2, behind=1
+            ),
+        },
+    )
+    github = FakeGitHub(
+        prs={
+            "feature-a": PullRequestInfoBuilder(11, "feature-a").build(),
+            "unrelated": PullRequestInfoBuilder(12, "unrelated").build(),
+        }
+    )
+    graphite = FakeGraphite(stacks={"feature-a": ["main", "feature-a"]})
+    global_config = GlobalConfig(
+        erk_root=tmp_path / "erks",
+        use_graphite=True,
+        shell_setup_complete=False,
+        show_pr_info=True,
+    )
+    ctx = create_test_context(
+        git=git_ops, github=github, graphite=graphite, global_config=global_config
+    )
+
+    orchestrator = StatusOrchestrator(
+        [GitStatusCollector(), GraphiteStackCollector(), GitHubPRCollector(), PlanFileCollector()],
+        runner=RealParallelTaskRunner(),
+    )
+
+    # Act
+    statuses = orchestrator.collect_all_status(ctx, repo_root)
+
+    # Assert - root first, then by name
+    assert [s.worktree_info.name for s in statuses] == ["root", "feature-a", "feature-b"]
+    root, status_a, status_b = statuses
+
+    # One PR listing for the whole repository
+    assert github.get_prs_for_repo_calls == [(repo_root, False)]
+    assert status_a.pr_status is not None
+    assert status_a.pr_status.number == 11
+    assert status_b.pr_status is None
+
+    # Sync info from the batch, file status per worktree
+    assert status_a.git_status is not None
+    assert (status_a.git_status.ahead, status_a.git_status.behind) == (2, 1)
+    assert status_a.git_status.modified_files == ["a.py"]
+    assert status_b.git_status is not None
+    assert status_b.git_status.untracked_files == ["new.py"]
+    assert root.git_status is not None
+    assert root.git_status.clean
+
+    assert status_a.stack_position is not None
+    assert status_a.stack_position.parent_branch == "main"
+    assert status_a.plan is not None
+    assert status_a.plan.exists
+    assert status_b.plan is None
+    assert all(s.related_worktrees == [] for s in statuses)
+
+
+def test_orchestrator_collect_all_status_skips_disabled_sections(tmp_path: Path) -> None:
+    """Test collect_all_status skips GitHub and Graphite when they are disabled."""
+    # Arrange
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir()
+
+    git_ops = FakeGit(
+        worktrees={repo_root: [WorktreeInfo(path=repo_root, branch="main", is_root=True)]},
+        file_statuses={repo_root: ([], [], [])},
+    )
+    github = FakeGitHub()
+    global_config = GlobalConfig(
+        erk_root=tmp_path / "erks",
+        use_graphite=False,
+        shell_setup_complete=False,
+        show_pr_info=False,
+    )
+    ctx = create_test_context(git=git_ops, github=github, global_config=global_config)
+
+    orchestrator = StatusOrchestrator(
+        [GitStatusCollector(), GraphiteStackCollector(), GitHubPRCollector()],
+        runner=RealParallelTaskRunner(),
+    )
+
+    # Act
+    statuses = orchestrator.collect_all_status(ctx, repo_root)
+
+    # Assert
+    assert len(statuses) == 1
+    assert statuses[0].git_status is not None
+    assert statuses[0].stack_position is None
+    assert statuses[0].pr_status is None
+    assert github.get_prs_for_repo_calls == []
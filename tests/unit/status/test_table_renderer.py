@@ -0,0 +1,125 @@
+"""Unit tests for TableRenderer."""
+
+from pathlib import Path
+
+import click
+import pytest
+
+from erk.status.models.status_data import (
+    GitStatus,
+    PlanStatus,
+    PullRequestStatus,
+    StackPosition,
+    StatusData,
+    WorktreeDisplayInfo,
+)
+from erk.status.renderers.table import TableRenderer
+
+
+def _status(
+    worktree: WorktreeDisplayInfo,
+    *,
+    git_status: GitStatus | None = None,
+    stack_position: StackPosition | None = None,
+    pr_status: PullRequestStatus | None = None,
+    plan: PlanStatus | None = None,
+) -> StatusData:
+    return StatusData(
+        worktree_info=worktree,
+        git_status=git_status,
+        stack_position=stack_position,
+        pr_status=pr_status,
+        environment=None,
+        dependencies=None,
+        plan=plan,
+        related_worktrees=[],
+    )
+
+
+def test_table_renderer_shows_row_per_worktree(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test every worktree gets a row with its collected sections."""
+    repo_root = tmp_path / "repo"
+    feature = tmp_path / "erks" / "feature"
+    statuses = [
+        _status(
+            WorktreeDisplayInfo.root(repo_root),
+            git_status=GitStatus(
+                branch="main",
+                clean=True,
+                ahead=0,
+                behind=0,
+                staged_files=[],
+                modified_files=[],
+                untracked_files=[],
+                recent_commits=[],
+            ),
+        ),
+        _status(
+            WorktreeDisplayInfo.feature(feature, "feature"),
+            git_status=GitStatus(
+                branch="feature",
+                clean=False,
+                ahead=3,
+                behind=1,
+                staged_files=["a.py"],
+                modified_files=["b.py", "c.py"],
+                untracked_files=[],
+                recent_commits=[],
+            ),
+            stack_position=StackPosition(
+                stack=["main", "feature"],
+                current_branch="feature",
+                parent_branch="main",
+                children_branches=[],
+                is_trunk=False,
+            ),
+            pr_status=PullRequestStatus(
+                number=42,
+                title=None,
+                state="OPEN",
+                is_draft=False,
+                url="https://github.com/owner/repo/pull/42",
+                checks_passing=True,
+                reviews=None,
+                ready_to_merge=True,
+            ),
+            plan=PlanStatus(
+                exists=True,
+                path=feature / ".impl",
+                summary=None,
+                line_count=3,
+                first_lines=[],
+                progress_summary="3/5 steps completed",
+                format="folder",
+                completion_percentage=60,
+                issue_number=7,
+            ),
+        ),
+    ]
+
+    TableRenderer().render(statuses, current_path=feature)
+
+    output = click.unstyle(capsys.readouterr().err)
+    assert "root" in output
+    assert "clean" in output
+    assert "feature ← (cwd)" in output
+    assert "+1 ~2" in output
+    assert "3↑ 1↓" in output
+    assert "1/1" in output
+    assert "✅" in output and "#42" in output
+    assert "#7 60%" in output
+
+
+def test_table_renderer_missing_sections(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test sections that weren't collected render as "-"."""
+    statuses = [_status(WorktreeDisplayInfo.feature(tmp_path / "detached", "detached"))]
+
+    TableRenderer().render(statuses, current_path=None)
+
+    output = click.unstyle(capsys.readouterr().err)
+    row = output.splitlines()[-1].split()
+    assert row == ["detached", "detached", "-", "-", "-", "-", "-"]
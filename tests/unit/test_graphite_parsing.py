@@ -1,5 +1,7 @@
 """Unit tests for Graphite parsing functions with JSON fixtures."""
 
+import json
+
 from erk_shared.integrations.graphite.parsing import (
     _graphite_url_to_github_url,
     parse_graphite_cache,
@@ -12,7 +14,7 @@ from tests.conftest import load_fixture
 def test_parse_graphite_pr_info():
     """Test parsing Graphite PR info JSON."""
     json_data = load_fixture("graphite/graphite_pr_info.json")
-    result = parse_graphite_pr_info(json_data)
+    result = parse_graphite_pr_info(json.loads(json_data))
 
     assert len(result) == 3
 
@@ -45,7 +47,7 @@ def test_parse_graphite_pr_info():
 def test_parse_graphite_pr_info_empty():
     """Test parsing empty Graphite PR info."""
     json_data = load_fixture("graphite/graphite_empty.json")
-    result = parse_graphite_pr_info(json_data)
+    result = parse_graphite_pr_info(json.loads(json_data))
 
     assert result == {}
 
@@ -63,7 +65,7 @@ def test_parse_graphite_pr_info_malformed_url():
             }
         ]
     }"""
-    result = parse_graphite_pr_info(json_str)
+    result = parse_graphite_pr_info(json.loads(json_str))
     # Should skip PRs that can't be converted to valid GitHub URLs
     assert len(result) == 0
 
@@ -80,7 +82,7 @@ def test_parse_graphite_cache():
         "feature-2": "jkl012",
     }
 
-    result = parse_graphite_cache(json_data, git_branch_heads)
+    result = parse_graphite_cache(json.loads(json_data), git_branch_heads)
 
     assert len(result) == 4
 
@@ -123,7 +125,7 @@ def test_parse_graphite_cache_empty():
     """Test parsing empty Graphite cache."""
     json_str = '{"branches": []}'
     git_branch_heads = {}
-    result = parse_graphite_cache(json_str, git_branch_heads)
+    result = parse_graphite_cache(json.loads(json_str), git_branch_heads)
 
     assert result == {}
 
@@ -135,7 +137,7 @@ def test_parse_graphite_cache_missing_git_heads():
     # Empty git branch heads
     git_branch_heads = {}
 
-    result = parse_graphite_cache(json_data, git_branch_heads)
+    result = parse_graphite_cache(json.loads(json_data), git_branch_heads)
 
     assert len(result) == 4
     # All branches should have empty commit SHA
@@ -158,7 +160,7 @@ def test_parse_graphite_cache_invalid_data():
     }"""
 
     git_branch_heads = {"valid-branch": "abc123", "missing-fields": "def456"}
-    result = parse_graphite_cache(json_str, git_branch_heads)
+    result = parse_graphite_cache(json.loads(json_str), git_branch_heads)
 
     # Should have valid-branch and missing-fields (with defaults)
     assert len(result) == 2
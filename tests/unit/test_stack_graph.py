@@ -0,0 +1,119 @@
+"""Unit tests for StackGraph branch traversal."""
+
+from pathlib import Path
+
+from erk_shared.integrations.graphite.fake import FakeGraphite
+from erk_shared.integrations.graphite.stack_graph import StackGraph
+from erk_shared.integrations.graphite.types import BranchMetadata
+
+from erk.core.git.fake import FakeGit
+
+
+def _branches() -> dict[str, BranchMetadata]:
+    # main ─┬─ a ── a1 ── a2
+    #       │      └─ a1b
+    #       └─ b
+    return {
+        "main": BranchMetadata.trunk("main", children=["a", "b"], commit_sha="0"),
+        "a": BranchMetadata.branch("a", "main", children=["a1", "a1b"], commit_sha="1"),
+        "a1": BranchMetadata.branch("a1", "a", children=["a2"], commit_sha="2"),
+        "a1b": BranchMetadata.branch("a1b", "a", commit_sha="3"),
+        "a2": BranchMetadata.branch("a2", "a1", commit_sha="4"),
+        "b": BranchMetadata.branch("b", "main", commit_sha="5"),
+    }
+
+
+def test_stack_follows_ancestors_and_first_child_chain() -> None:
+    """stack() is trunk-to-branch plus the first-child chain to a leaf."""
+    graph = StackGraph(_branches())
+
+    assert graph.stack("main") == ["main", "a", "a1", "a2"]
+    assert graph.stack("a") == ["main", "a", "a1", "a2"]
+    assert graph.stack("a1b") == ["main", "a", "a1b"]
+    assert graph.stack("b") == ["main", "b"]
+    assert graph.stack("unknown") is None
+
+
+def test_adjacency_depth_and_root() -> None:
+    """Parent, children, depth and root lookups."""
+    graph = StackGraph(_branches())
+
+    assert graph.parent("a1") == "a"
+    assert graph.parent("main") is None
+    assert graph.children("a") == ["a1", "a1b"]
+    assert graph.children("unknown") == []
+    assert graph.depth("main") == 0
+    assert graph.depth("a2") == 3
+    assert graph.depth("unknown") is None
+    assert graph.root("a2") == "main"
+
+
+def test_ancestors_and_descendants() -> None:
+    """ancestors() is nearest-first; descendants() covers every branch below."""
+    graph = StackGraph(_branches())
+
+    assert graph.ancestors("a2") == ["a1", "a", "main"]
+    assert graph.ancestors("main") == []
+    assert graph.descendants("a") == ["a1", "a2", "a1b"]
+    assert graph.descendants("b") == []
+
+
+def test_in_same_stack() -> None:
+    """in_same_stack() checks membership in the branch's linear stack."""
+    graph = StackGraph(_branches())
+
+    assert graph.in_same_stack("a2", "a")
+    assert graph.in_same_stack("a2", "main")
+    assert not graph.in_same_stack("a2", "b")
+    assert not graph.in_same_stack("a2", "a1b")
+    assert not graph.in_same_stack("unknown", "main")
+
+
+def test_untracked_parent_and_child_are_cut() -> None:
+    """Links to untracked branches end traversal, as in get_branch_stack."""
+    graph = StackGraph(
+        {
+            "feat": BranchMetadata.branch("feat", "gone", children=["missing"], commit_sha="1"),
+        }
+    )
+
+    assert graph.stack("feat") == ["feat"]
+    assert graph.root("feat") == "feat"
+
+
+def test_cycle_in_metadata_terminates() -> None:
+    """Malformed cyclic metadata does not hang traversal."""
+    graph = StackGraph(
+        {
+            "x": BranchMetadata.branch("x", "y", children=["y"], commit_sha="1"),
+            "y": BranchMetadata.branch("y", "x", children=["x"], commit_sha="2"),
+        }
+    )
+
+    assert graph.depth("x") is not None
+    assert graph.stack("x") is not None
+
+
+def test_deep_stack_does_not_recurse() -> None:
+    """Stacks deeper than the recursion limit are handled iteratively."""
+    names = [f"b{i}" for i in range(3000)]
+    branches = {names[0]: BranchMetadata.trunk(names[0], children=[names[1]], commit_sha="0")}
+    for i in range(1, len(names)):
+        children = [names[i + 1]] if i + 1 < len(names) else []
+        branches[names[i]] = BranchMetadata.branch(
+            names[i], names[i - 1], children=children, commit_sha=str(i)
+        )
+
+    graph = StackGraph(branches)
+
+    assert graph.depth(names[-1]) == 2999
+    assert graph.stack(names[1500]) == names
+
+
+def test_graphite_get_stack_graph_matches_get_branch_stack() -> None:
+    """Graphite.get_stack_graph builds the graph from get_all_branches."""
+    graphite = FakeGraphite(branches=_branches())
+
+    graph = graphite.get_stack_graph(FakeGit(), Path("/repo"))
+
+    assert graph.stack("a1") == graphite.get_branch_stack(FakeGit(), Path("/repo"), "a1")